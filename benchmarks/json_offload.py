@@ -0,0 +1,89 @@
+"""Latency of small calls, one every 2 ms, while a large scroll is decoded and rendered.
+
+Runs the same workload with JSON offloading disabled and enabled, against a
+mocked Qdrant, and prints small-call latency percentiles for each:
+
+    python benchmarks/json_offload.py [--points 10000] [--dim 128]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.database.codec import JSONCodec
+from qdrant_mcp.database.evaluation import latency_summary
+
+
+def _client(codec: JSONCodec, big_body: bytes) -> QdrantDatabaseClient:
+    small_body = json.dumps({"result": {"count": 1}, "status": "ok"}).encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = big_body if request.url.path.endswith("/scroll") else small_body
+        return httpx.Response(200, content=body)
+
+    client = QdrantDatabaseClient(base_url="http://bench:6333", api_key="", codec=codec)
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+async def _run(codec: JSONCodec, big_body: bytes, small_calls: int) -> dict[str, float]:
+    client = _client(codec, big_body)
+    latencies: list[float] = []
+
+    async def small_call(start_at: float) -> None:
+        # Latency counts from the scheduled start, so event loop stalls that
+        # delay the call from starting are included
+        await asyncio.sleep(start_at - time.monotonic())
+        result = await client.post("/collections/docs/points/count", json={})
+        await client.codec.render(result)
+        latencies.append(time.monotonic() - start_at)
+
+    async def big_scroll() -> None:
+        result = await client.post("/collections/docs/points/scroll", json={})
+        await client.codec.render(result)
+
+    started = time.monotonic()
+    await asyncio.gather(
+        big_scroll(),
+        big_scroll(),
+        *(small_call(started + 0.002 * i) for i in range(small_calls)),
+    )
+    summary = latency_summary(latencies)
+    summary["total_ms"] = round(1000 * (time.monotonic() - started), 1)
+    codec.close()
+    return summary
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=10000)
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--small-calls", type=int, default=500)
+    args = parser.parse_args()
+
+    points = [
+        {"id": i, "payload": {"title": f"doc {i}"}, "vector": [i / 7] * args.dim}
+        for i in range(args.points)
+    ]
+    big_body = json.dumps({"result": {"points": points, "next_page_offset": None}}).encode()
+    print(f"scroll response: {len(big_body) / 1e6:.1f} MB, {args.small_calls} small calls")
+
+    for label, codec in [
+        ("baseline (no large call)", JSONCodec(threshold=0)),
+        ("inline", JSONCodec(threshold=0)),
+        ("thread pool", JSONCodec(threshold=1_000_000, executor="thread")),
+        ("process pool", JSONCodec(threshold=1_000_000, executor="process")),
+    ]:
+        body = b'{"result": {"points": []}}' if label.startswith("baseline") else big_body
+        print(f"{label:>24}: {asyncio.run(_run(codec, body, args.small_calls))}")
+
+
+if __name__ == "__main__":
+    main()
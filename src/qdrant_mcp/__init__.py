@@ -1,7 +1,16 @@
 """Qdrant MCP Server - Model Context Protocol server for Qdrant APIs."""
 
-__version__ = "0.1.0"
+from typing import Any
 
-from .server import serve
+__version__ = "0.1.0"
 
 __all__ = ["serve"]
+
+
+def __getattr__(name: str) -> Any:
+    # Imported on first access so that importing a submodule does not load the server
+    if name == "serve":
+        from .server import serve
+
+        return serve
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
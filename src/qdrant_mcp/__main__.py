@@ -1,6 +1,25 @@
 """Entry point for running qdrant-mcp as a module."""
 
+import argparse
+from typing import Optional
+
+from .config import QdrantConfig
 from .server import serve
+from .transport import TRANSPORTS
+
+
+def parse_config(argv: Optional[list[str]] = None) -> QdrantConfig:
+    """Build the configuration from the environment and command-line overrides."""
+    parser = argparse.ArgumentParser(
+        prog="python -m qdrant_mcp", description="Run the Qdrant MCP server."
+    )
+    parser.add_argument("--transport", choices=TRANSPORTS, help="default: QDRANT_TRANSPORT")
+    parser.add_argument("--host", dest="http_host", metavar="HOST", help="HTTP bind address")
+    parser.add_argument("--port", dest="http_port", metavar="PORT", type=int, help="HTTP port")
+    parser.add_argument("--path", dest="http_path", metavar="PATH", help="HTTP endpoint path")
+    args = vars(parser.parse_args(argv))
+    return QdrantConfig(**{key: value for key, value in args.items() if value is not None})
+
 
 if __name__ == "__main__":
-    serve()
+    serve(parse_config())
@@ -1,6 +1,6 @@
 """Configuration management for Qdrant MCP server."""
 
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -29,6 +29,93 @@ class QdrantConfig(BaseSettings):
     # Optional: Default account ID for cloud operations
     account_id: Optional[str] = None
 
+    # Transport: "stdio" (one session) or "http" (streamable HTTP and SSE, many sessions)
+    transport: Literal["stdio", "http"] = "stdio"
+    http_host: str = "127.0.0.1"
+    http_port: int = 8000
+    http_path: str = "/mcp"
+    # Bearer token required by the HTTP transport (mandatory for non-loopback hosts)
+    http_auth_token: Optional[str] = None
+
+    # Maximum number of tool calls executing at once, in total and per session
+    max_in_flight_tools: int = 64
+    max_in_flight_per_session: int = 16
+
+    # Background jobs (tool calls made with wait=false)
+    job_max_finished: int = 100
+    job_retention: float = 3600.0
+
+    # Deadline budgets per tool class (seconds), with per-tool overrides
+    deadline_read: float = 30.0
+    deadline_write: float = 120.0
+    deadline_long_running: float = 600.0
+    deadline_overrides: dict[str, float] = {}
+
+    # Database API circuit breaker
+    breaker_enabled: bool = True
+    breaker_per_collection: bool = False
+    breaker_failure_rate: float = 0.5
+    breaker_slow_call_seconds: float = 10.0
+    breaker_slow_call_rate: float = 0.5
+    breaker_window_size: int = 20
+    breaker_min_calls: int = 5
+    breaker_reset_timeout: float = 30.0
+
+    # Database API adaptive concurrency limits (AIMD)
+    limiter_enabled: bool = True
+    limiter_read_initial: int = 16
+    limiter_read_max: int = 128
+    limiter_write_initial: int = 4
+    limiter_write_max: int = 32
+    limiter_backoff: float = 0.7
+    limiter_latency_tolerance: float = 2.0
+
+    # Write-behind buffering of payload and vector updates (opt-in per collection)
+    write_behind_collections: list[str] = []
+    write_behind_max_ops: int = 100
+    write_behind_max_points: int = 1000
+    write_behind_max_delay: float = 1.0
+
+    # Payload index advisor
+    index_advisor_auto_create: bool = False
+    index_advisor_min_calls: int = 50
+    index_advisor_min_avg_latency: float = 0.1
+
+    # Decoding and rendering of large responses in a worker pool
+    json_offload_threshold: int = 1_000_000
+    json_offload_workers: int = 4
+    json_offload_executor: Literal["thread", "process"] = "process"
+
+    # Point count cache
+    count_cache_ttl: float = 30.0
+    count_cache_max_entries: int = 1024
+
+    # Vectors and large payload fields returned as MCP resource URIs
+    resources_enabled: bool = True
+    resource_inline_payload_bytes: int = 4096
+    resource_cache_max_entries: int = 1024
+    resource_cache_ttl: float = 300.0
+
+    # Vector sizes of collections, checked against uploaded vectors and used by resources
+    vector_size_cache_ttl: float = 300.0
+
+    # Content hash index for delta upserts
+    delta_index_path: str = "~/.cache/qdrant-fabric/delta-index.sqlite3"
+
+    # Open bulk-load sessions and the settings they restore, kept across restarts
+    bulk_load_state_path: str = "~/.cache/qdrant-fabric/bulk-loads.json"
+
+    # Default directory of downloaded collection snapshots
+    snapshot_dir: str = "~/.cache/qdrant-fabric/snapshots"
+
+    # Directory of search evaluation query files and reports
+    evaluation_dir: str = "~/.cache/qdrant-fabric/evaluations"
+
+    # Second Database API endpoint, usable as a migration source or target
+    remote_url: Optional[str] = None
+    remote_api_key: Optional[str] = None
+    migration_checkpoint_dir: str = "~/.cache/qdrant-fabric/migrations"
+
     def validate_cloud_config(self) -> bool:
         """Check if Cloud Management API is configured."""
         return self.cloud_api_key is not None
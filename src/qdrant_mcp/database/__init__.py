@@ -1,16 +1,79 @@
-"""Database API tools for Qdrant MCP server."""
+"""Database API tools for Qdrant MCP server.
 
-from .client import QdrantDatabaseClient
-from .collections import register_collection_tools
-from .health import register_health_tools
-from .index import register_index_tools
-from .payload import register_payload_tools
-from .points import register_point_tools
-from .search import register_search_tools
-from .vectors import register_vector_tools
+Names are imported from their modules on first access, so that importing one
+module of the package does not import every tool module.
+"""
+
+import importlib
+from typing import Any
+
+# Exported name -> module defining it
+_EXPORTS = {
+    "ArgumentError": "arguments",
+    "CircuitBreakerRegistry": "breaker",
+    "CircuitOpenError": "breaker",
+    "BulkLoadManager": "bulkload",
+    "bulk_load": "bulkload",
+    "register_bulk_load_tools": "bulkload",
+    "ShardTransferError": "cluster",
+    "register_cluster_tools": "cluster",
+    "PayloadIndexAdvisor": "advisor",
+    "register_advisor_tools": "advisor",
+    "QdrantDatabaseClient": "client",
+    "JSONCodec": "codec",
+    "AdaptiveLimiter": "limiter",
+    "ConcurrencyLimits": "limiter",
+    "VectorSizeCache": "collections",
+    "register_collection_tools": "collections",
+    "CountCache": "counts",
+    "ContentHashIndex": "delta",
+    "register_delta_tools": "delta",
+    "register_evaluation_tools": "evaluation",
+    "FilterError": "filters",
+    "canonical_filter": "filters",
+    "compile_filter": "filters",
+    "register_health_tools": "health",
+    "register_index_tools": "index",
+    "register_payload_tools": "payload",
+    "register_point_tools": "points",
+    "CollectionNotReadyError": "readiness",
+    "register_readiness_tools": "readiness",
+    "PointResources": "resources",
+    "register_point_resources": "resources",
+    "MigrationManager": "migration",
+    "register_migration_tools": "migration",
+    "register_search_tools": "search",
+    "SnapshotChecksumError": "snapshots",
+    "register_snapshot_tools": "snapshots",
+    "register_tuning_tools": "tuning",
+    "register_vector_tools": "vectors",
+    "WriteBehindManager": "writebuffer",
+    "register_write_buffer_tools": "writebuffer",
+}
 
 __all__ = [
     "QdrantDatabaseClient",
+    "JSONCodec",
+    "CircuitBreakerRegistry",
+    "CircuitOpenError",
+    "AdaptiveLimiter",
+    "ConcurrencyLimits",
+    "WriteBehindManager",
+    "ContentHashIndex",
+    "CountCache",
+    "CollectionNotReadyError",
+    "ShardTransferError",
+    "SnapshotChecksumError",
+    "BulkLoadManager",
+    "bulk_load",
+    "MigrationManager",
+    "PayloadIndexAdvisor",
+    "PointResources",
+    "ArgumentError",
+    "VectorSizeCache",
+    "FilterError",
+    "compile_filter",
+    "canonical_filter",
     "register_collection_tools",
     "register_point_tools",
     "register_search_tools",
@@ -18,4 +81,24 @@ __all__ = [
     "register_health_tools",
     "register_vector_tools",
     "register_index_tools",
+    "register_write_buffer_tools",
+    "register_delta_tools",
+    "register_advisor_tools",
+    "register_readiness_tools",
+    "register_bulk_load_tools",
+    "register_tuning_tools",
+    "register_evaluation_tools",
+    "register_cluster_tools",
+    "register_snapshot_tools",
+    "register_migration_tools",
+    "register_point_resources",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
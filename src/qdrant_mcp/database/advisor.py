@@ -0,0 +1,317 @@
+"""Payload index advisor for Qdrant Database API."""
+
+import asyncio
+import logging
+import re
+from collections import Counter
+from typing import Any, Optional
+
+from mcp.server import Server
+
+from ..deadline import detached
+from .client import QdrantDatabaseClient
+from .collections import get_collection
+from .index import create_field_index
+
+logger = logging.getLogger(__name__)
+
+# Request paths whose body filter is observed
+_FILTERED_PATH = re.compile(
+    r"^/collections/(?P<collection>[^/]+)/points/(?P<op>search|count|scroll|recommend)(?:/batch)?$"
+)
+_DATETIME = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+
+def _value_schema(value: Any) -> str:
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "float"
+    return "keyword"
+
+
+def _condition_schema(condition: dict[str, Any]) -> Optional[tuple[str, str]]:
+    """Infer (match type, payload schema type) for a field condition."""
+    match = condition.get("match")
+    if isinstance(match, dict):
+        for kind in ("text", "phrase", "text_any"):
+            if kind in match:
+                return kind, "text"
+        if "value" in match:
+            return "value", _value_schema(match["value"])
+        for kind in ("any", "except"):
+            values = match.get(kind)
+            if isinstance(values, list) and values:
+                return kind, _value_schema(values[0])
+        return None
+    bounds = condition.get("range")
+    if isinstance(bounds, dict):
+        values = [v for v in bounds.values() if v is not None]
+        if any(isinstance(v, str) and _DATETIME.match(v) for v in values):
+            return "range", "datetime"
+        if values and all(isinstance(v, int) and not isinstance(v, bool) for v in values):
+            return "range", "integer"
+        return "range", "float"
+    for geo in ("geo_bounding_box", "geo_radius", "geo_polygon"):
+        if geo in condition:
+            return geo, "geo"
+    # values_count, is_empty and is_null need no payload index of a particular type
+    return None
+
+
+def extract_conditions(filter_: Any, prefix: str = "") -> list[tuple[str, str, str]]:
+    """List the payload fields used by a filter.
+
+    Args:
+        filter_: Filter with must/should/must_not clauses (nested filters allowed)
+        prefix: Key prefix for conditions inside a nested filter
+
+    Returns:
+        (field key, match type, inferred schema type) per field condition
+    """
+    if not isinstance(filter_, dict):
+        return []
+    found: list[tuple[str, str, str]] = []
+    for clause in ("must", "should", "must_not"):
+        conditions = filter_.get(clause) or []
+        if isinstance(conditions, dict):
+            conditions = [conditions]
+        for condition in conditions:
+            if not isinstance(condition, dict):
+                continue
+            if "nested" in condition:
+                nested = condition["nested"]
+                found += extract_conditions(nested.get("filter"), f"{prefix}{nested.get('key')}[].")
+            elif any(c in condition for c in ("must", "should", "must_not")):
+                found += extract_conditions(condition, prefix)
+            elif "key" in condition:
+                inferred = _condition_schema(condition)
+                if inferred is not None:
+                    found.append((prefix + condition["key"], *inferred))
+    min_should = filter_.get("min_should")
+    if isinstance(min_should, dict):
+        found += extract_conditions({"should": min_should.get("conditions")}, prefix)
+    return found
+
+
+class _FieldStats:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.match_types: Counter[str] = Counter()
+        self.schemas: Counter[str] = Counter()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "total_latency": round(self.total_latency, 4),
+            "avg_latency": round(self.total_latency / self.calls, 4) if self.calls else 0.0,
+            "max_latency": round(self.max_latency, 4),
+            "match_types": dict(self.match_types),
+            "inferred_schema": self.schemas.most_common(1)[0][0] if self.schemas else None,
+        }
+
+
+class PayloadIndexAdvisor:
+    """Learns which payload fields are filtered on and recommends indexes for them.
+
+    Observes search, recommend, count and scroll requests made through the
+    client, and attributes each request's latency to the fields in its filter.
+    In auto-create mode, a field that reaches ``min_calls`` observations with
+    an average latency of at least ``min_avg_latency`` is indexed with its
+    inferred schema type, once.
+    """
+
+    def __init__(
+        self,
+        client: QdrantDatabaseClient,
+        auto_create: bool = False,
+        min_calls: int = 50,
+        min_avg_latency: float = 0.1,
+    ):
+        """Initialize payload index advisor.
+
+        Args:
+            client: Qdrant database client
+            auto_create: Create indexes automatically for costly unindexed fields
+            min_calls: Observations required before auto-creating an index
+            min_avg_latency: Average latency (seconds) required before auto-creating
+        """
+        self.client = client
+        self.auto_create = auto_create
+        self.min_calls = min_calls
+        self.min_avg_latency = min_avg_latency
+        self._stats: dict[str, dict[str, _FieldStats]] = {}
+        self._attempted: set[tuple[str, str]] = set()
+        self._tasks: set[asyncio.Task[Any]] = set()
+
+    def observe(self, method: str, path: str, body: Any, latency: float) -> None:
+        """Client request observer recording the filters of successful requests."""
+        found = _FILTERED_PATH.match(path)
+        if found is None or not isinstance(body, dict):
+            return
+        filters = [s.get("filter") for s in body.get("searches", []) if isinstance(s, dict)]
+        filters.append(body.get("filter"))
+        for filter_ in filters:
+            self.record(found["collection"], filter_, latency)
+
+    def record(self, collection_name: str, filter_: Any, latency: float) -> None:
+        """Attribute a filtered request's latency to the fields it filters on."""
+        fields = self._stats.setdefault(collection_name, {})
+        for key, match_type, schema in extract_conditions(filter_):
+            stats = fields.get(key)
+            if stats is None:
+                stats = fields[key] = _FieldStats()
+            stats.calls += 1
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
+            stats.match_types[match_type] += 1
+            stats.schemas[schema] += 1
+
+            if (
+                self.auto_create
+                and (collection_name, key) not in self._attempted
+                and stats.calls >= self.min_calls
+                and stats.total_latency / stats.calls >= self.min_avg_latency
+            ):
+                self._attempted.add((collection_name, key))
+                task = detached().run(
+                    asyncio.ensure_future, self._auto_create(collection_name, key)
+                )
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    async def _auto_create(self, collection_name: str, key: str) -> None:
+        try:
+            result = await self.apply(collection_name, fields=[key])
+            logger.info("Index advisor auto-created indexes on %s: %s", collection_name, result)
+        except Exception as e:
+            logger.warning("Index advisor failed to index %s.%s: %r", collection_name, key, e)
+
+    async def report(self, collection_name: str) -> dict[str, Any]:
+        """Rank observed filter fields by cost and flag those without a payload index.
+
+        Returns:
+            Unindexed fields (most costly first) and indexed fields with their stats
+        """
+        info = await get_collection(self.client, collection_name)
+        schema = info.get("result", {}).get("payload_schema", {})
+        fields = self._stats.get(collection_name, {})
+        ranked = sorted(fields.items(), key=lambda item: item[1].total_latency, reverse=True)
+        unindexed = [
+            {"field_name": key, **stats.snapshot()} for key, stats in ranked if key not in schema
+        ]
+        indexed = [
+            {"field_name": key, "index": schema[key], **stats.snapshot()}
+            for key, stats in ranked
+            if key in schema
+        ]
+        return {"collection_name": collection_name, "unindexed": unindexed, "indexed": indexed}
+
+    async def apply(
+        self,
+        collection_name: str,
+        fields: Optional[list[str]] = None,
+        dry_run: bool = False,
+    ) -> dict[str, Any]:
+        """Create payload indexes for unindexed observed fields using inferred schema types.
+
+        Args:
+            collection_name: Name of the collection
+            fields: Fields to index (default: all unindexed observed fields)
+            dry_run: Only report what would be created
+
+        Returns:
+            Field name -> schema type created (or planned)
+        """
+        report = await self.report(collection_name)
+        planned = {
+            entry["field_name"]: entry["inferred_schema"]
+            for entry in report["unindexed"]
+            if entry["inferred_schema"] and (fields is None or entry["field_name"] in fields)
+        }
+        if not dry_run:
+            for field_name, schema_type in planned.items():
+                await create_field_index(
+                    self.client, collection_name, field_name, {"type": schema_type}
+                )
+        return {"collection_name": collection_name, "dry_run": dry_run, "indexes": planned}
+
+
+def register_advisor_tools(
+    server: Server,
+    client: QdrantDatabaseClient,
+    tools_list: list,
+    advisor: PayloadIndexAdvisor,
+) -> None:
+    """Register payload index advisor tools with MCP server.
+
+    Args:
+        server: MCP server instance
+        client: Qdrant database client
+        tools_list: List to append tool definitions to
+        advisor: Advisor observing the client's filtered requests
+    """
+    from mcp.types import Tool
+
+    # Define tools
+    tools_list.extend(
+        [
+            Tool(
+                name="qdrant_db_index_advise",
+                description=(
+                    "Report payload fields used in search/count/scroll filters that have no "
+                    "payload index, ranked by observed latency"
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {"collection_name": {"type": "string"}},
+                    "required": ["collection_name"],
+                },
+            ),
+            Tool(
+                name="qdrant_db_index_apply_advice",
+                description=(
+                    "Create payload indexes for unindexed filter fields using inferred types"
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "collection_name": {"type": "string"},
+                        "fields": {"type": "array", "items": {"type": "string"}},
+                        "dry_run": {"type": "boolean", "default": False},
+                    },
+                    "required": ["collection_name"],
+                },
+            ),
+        ]
+    )
+
+    @server.call_tool()
+    async def qdrant_db_index_advise(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Report costly unindexed filter fields.
+
+        Args:
+            collection_name: Name of the collection
+        """
+        result = await advisor.report(arguments["collection_name"])
+        return [{"type": "text", "text": str(result)}]
+
+    @server.call_tool()
+    async def qdrant_db_index_apply_advice(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Create payload indexes for unindexed filter fields.
+
+        Args:
+            collection_name: Name of the collection
+            fields: Fields to index (optional, default: all unindexed observed fields)
+            dry_run: Only report what would be created (default: false)
+        """
+        result = await advisor.apply(
+            arguments["collection_name"],
+            arguments.get("fields"),
+            arguments.get("dry_run", False),
+        )
+        return [{"type": "text", "text": str(result)}]
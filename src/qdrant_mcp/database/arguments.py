@@ -0,0 +1,199 @@
+"""Typed arguments of the upload tools, validated locally for Qdrant Database API.
+
+Upload tools are defined by pydantic models: each model generates its tool's
+input schema, and a TypeAdapter compiled once at import validates every call,
+stopping at the first malformed point. Vector sizes are then checked against
+the collection's vector config, cached until the collection is changed, so a
+bad upload fails before any of it is sent.
+"""
+
+from typing import Annotated, Any, Optional, Union
+from uuid import UUID
+
+from mcp.types import Tool
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    StrictFloat,
+    StrictInt,
+    StrictStr,
+    Tag,
+    TypeAdapter,
+    ValidationError,
+)
+from typing_extensions import NotRequired, TypedDict
+
+from .collections import VectorSizeCache
+
+# Number of validation errors included in an ArgumentError message
+_MAX_ERRORS = 3
+
+
+class ArgumentError(ValueError):
+    """Raised when tool arguments are malformed or do not fit the collection."""
+
+
+def _same_length(vector: dict[str, Any]) -> dict[str, Any]:
+    if len(vector["indices"]) != len(vector["values"]):
+        raise ValueError("indices and values must have the same length")
+    return vector
+
+
+class SparseVector(TypedDict):
+    __pydantic_config__ = ConfigDict(extra="forbid")  # type: ignore[misc]
+
+    indices: list[Annotated[StrictInt, Field(ge=0)]]
+    values: list[StrictFloat]
+
+
+def _list_kind(value: Any) -> Optional[str]:
+    if isinstance(value, list):
+        return "multi" if value and isinstance(value[0], list) else "dense"
+    return None
+
+
+def _vector_kind(value: Any) -> Optional[str]:
+    """Discriminator picking a vector type by shape, so only that type is validated."""
+    return "named" if isinstance(value, dict) else _list_kind(value)
+
+
+def _named_vector_kind(value: Any) -> Optional[str]:
+    return "sparse" if isinstance(value, dict) else _list_kind(value)
+
+
+def _discriminator(kind: Any) -> Discriminator:
+    return Discriminator(
+        kind,
+        custom_error_type="invalid_vector",
+        custom_error_message="Input should be a vector",
+    )
+
+
+PointId = Union[Annotated[StrictInt, Field(ge=0)], UUID]
+ShardKey = Union[StrictStr, Annotated[StrictInt, Field(ge=0)]]
+ShardKeySelector = Union[ShardKey, Annotated[list[ShardKey], Field(min_length=1)]]
+DenseVector = list[StrictFloat]
+NamedVector = Annotated[
+    Union[
+        Annotated[DenseVector, Tag("dense")],
+        Annotated[list[DenseVector], Tag("multi")],
+        Annotated[SparseVector, AfterValidator(_same_length), Tag("sparse")],
+    ],
+    _discriminator(_named_vector_kind),
+]
+Vector = Annotated[
+    Union[
+        Annotated[DenseVector, Tag("dense")],
+        Annotated[list[DenseVector], Tag("multi")],
+        Annotated[dict[str, NamedVector], Tag("named")],
+    ],
+    _discriminator(_vector_kind),
+]
+
+
+class PointStruct(TypedDict):
+    __pydantic_config__ = ConfigDict(extra="forbid")  # type: ignore[misc]
+
+    id: PointId
+    vector: Vector
+    payload: NotRequired[Optional[dict[str, Any]]]
+
+
+class PointVectors(TypedDict):
+    __pydantic_config__ = ConfigDict(extra="forbid")  # type: ignore[misc]
+
+    id: PointId
+    vector: Vector
+
+
+class UpsertPointsArguments(BaseModel):
+    """Arguments of qdrant_db_points_upsert."""
+
+    collection_name: str
+    points: Annotated[
+        list[PointStruct],
+        Field(fail_fast=True, description="Points with id, vector and optional payload"),
+    ]
+    delta: bool = Field(False, description="Only send new or changed points")
+    shard_key: Optional[ShardKeySelector] = Field(
+        None, description="Shard key(s) to write to (custom sharding only)"
+    )
+
+
+class UpdateVectorsArguments(BaseModel):
+    """Arguments of qdrant_db_vectors_update."""
+
+    collection_name: str
+    points: Annotated[
+        list[PointVectors],
+        Field(fail_fast=True, description="Points with id and the vectors to set"),
+    ]
+    shard_key: Optional[ShardKeySelector] = Field(
+        None, description="Shard key(s) to write to (custom sharding only)"
+    )
+
+
+# Tool name -> model defining its arguments
+ARGUMENT_MODELS: dict[str, type[BaseModel]] = {
+    "qdrant_db_points_upsert": UpsertPointsArguments,
+    "qdrant_db_vectors_update": UpdateVectorsArguments,
+}
+
+_ADAPTERS = {name: TypeAdapter(model) for name, model in ARGUMENT_MODELS.items()}
+
+
+def model_tool(name: str, description: str) -> Tool:
+    """Tool definition whose input schema is generated from the tool's argument model."""
+    schema = ARGUMENT_MODELS[name].model_json_schema()
+    schema.pop("description", None)
+    return Tool(name=name, description=description, inputSchema=schema)
+
+
+def validate_arguments(name: str, arguments: dict[str, Any]) -> None:
+    """Validate the arguments of a tool defined by an argument model.
+
+    Raises:
+        ArgumentError: If the arguments do not match the model (only the first
+            malformed point of a list is reported)
+    """
+    try:
+        _ADAPTERS[name].validate_python(arguments)
+    except ValidationError as e:
+        problems = "; ".join(
+            f"{'.'.join(map(str, error['loc'])) or 'arguments'}: {error['msg']}"
+            for error in e.errors()[:_MAX_ERRORS]
+        )
+        raise ArgumentError(f"Invalid arguments: {problems}") from e
+
+
+async def check_vector_sizes(
+    vector_sizes: VectorSizeCache, collection_name: str, points: list[dict[str, Any]]
+) -> None:
+    """Check that the vectors of validated points fit the collection's vector config.
+
+    Raises:
+        ArgumentError: At the first vector with an unknown name or a wrong size
+    """
+    sizes = await vector_sizes.sizes(collection_name)
+    for i, point in enumerate(points):
+        vector = point.get("vector")
+        for name, value in (vector if isinstance(vector, dict) else {"": vector}).items():
+            where = f"points.{i}.vector" + (f".{name}" if name else "")
+            if name not in sizes:
+                kind = f"vector named {name!r}" if name else "unnamed vector"
+                raise ArgumentError(f"Invalid arguments: {where}: {collection_name} has no {kind}")
+            expected = sizes[name]
+            if expected is None:
+                continue
+            if not isinstance(value, list):
+                raise ArgumentError(f"Invalid arguments: {where}: expected a dense vector")
+            rows: list[Any] = value if value and isinstance(value[0], list) else [value]
+            for row in rows:
+                if len(row) != expected:
+                    raise ArgumentError(
+                        f"Invalid arguments: {where}: expected {expected} dimensions, "
+                        f"got {len(row)}"
+                    )
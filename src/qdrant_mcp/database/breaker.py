@@ -0,0 +1,184 @@
+"""Circuit breakers for the Qdrant Database API client."""
+
+import time
+from collections import deque
+from typing import Any, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a request is rejected because its circuit is open."""
+
+    def __init__(self, scope: str, retry_after: float):
+        super().__init__(f"Circuit for {scope} is open; failing fast (retry in {retry_after:.1f}s)")
+        self.scope = scope
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Sliding-window circuit breaker for a single scope (endpoint or collection).
+
+    The breaker opens when, over the last ``window_size`` calls, either the
+    error rate or the rate of calls slower than ``slow_call_seconds`` reaches
+    its threshold. Long-running operations (snapshots, index builds, large
+    waited upserts) count for errors but are never slow calls. While open
+    every call fails fast. Once ``reset_timeout`` has elapsed the breaker
+    moves to half-open and the client probes the endpoint; a successful probe
+    closes it, a failed one re-opens it.
+    """
+
+    def __init__(
+        self,
+        scope: str,
+        failure_rate: float = 0.5,
+        slow_call_seconds: float = 10.0,
+        slow_call_rate: float = 0.5,
+        window_size: int = 20,
+        min_calls: int = 5,
+        reset_timeout: float = 30.0,
+    ):
+        """Initialize circuit breaker.
+
+        Args:
+            scope: Human-readable scope name (endpoint URL or collection)
+            failure_rate: Error rate (0-1) at which the circuit opens
+            slow_call_seconds: Latency above which a call counts as slow
+            slow_call_rate: Slow-call rate (0-1) at which the circuit opens
+            window_size: Number of most recent calls considered
+            min_calls: Minimum calls in the window before the circuit may open
+            reset_timeout: Seconds to stay open before probing again
+        """
+        self.scope = scope
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+
+        self.state = CLOSED
+        self.opened_at: Optional[float] = None
+        self.times_opened = 0
+        self.rejected = 0
+        self.last_error: Optional[str] = None
+        self.probing = False
+        # (failed, slow) per call, most recent last
+        self._window: deque[tuple[bool, bool]] = deque(maxlen=window_size)
+
+    def _rates(self) -> tuple[float, float]:
+        if not self._window:
+            return 0.0, 0.0
+        total = len(self._window)
+        failed = sum(1 for f, _ in self._window if f)
+        slow = sum(1 for _, s in self._window if s)
+        return failed / total, slow / total
+
+    def retry_after(self) -> float:
+        """Seconds remaining until the circuit may be probed."""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def before_call(self) -> str:
+        """Check whether a call may proceed, advancing OPEN -> HALF_OPEN on timeout.
+
+        Returns:
+            Current state after the check
+
+        Raises:
+            CircuitOpenError: If the circuit is open and not yet due for probing
+        """
+        if self.state == OPEN and self.retry_after() <= 0:
+            self.state = HALF_OPEN
+        if self.state == OPEN:
+            self.rejected += 1
+            raise CircuitOpenError(self.scope, self.retry_after())
+        return self.state
+
+    def record(
+        self, latency: float, error: Optional[str] = None, long_running: bool = False
+    ) -> None:
+        """Record the outcome of a call made while the circuit was closed.
+
+        Args:
+            latency: Call duration in seconds
+            error: Error description if the call failed
+            long_running: Whether the operation is expected to take long
+        """
+        if error is not None:
+            self.last_error = error
+        slow = not long_running and latency >= self.slow_call_seconds
+        self._window.append((error is not None, slow))
+        if self.state != CLOSED or len(self._window) < self.min_calls:
+            return
+        failure_rate, slow_rate = self._rates()
+        if failure_rate >= self.failure_rate or slow_rate >= self.slow_call_rate:
+            self.trip()
+
+    def trip(self) -> None:
+        """Open the circuit."""
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self.times_opened += 1
+
+    def reset(self) -> None:
+        """Close the circuit and clear the call window."""
+        self.state = CLOSED
+        self.opened_at = None
+        self._window.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the breaker state as a plain dictionary."""
+        failure_rate, slow_rate = self._rates()
+        return {
+            "scope": self.scope,
+            "state": self.state,
+            "calls_in_window": len(self._window),
+            "failure_rate": round(failure_rate, 3),
+            "slow_call_rate": round(slow_rate, 3),
+            "retry_after": round(self.retry_after(), 3) if self.state == OPEN else None,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "last_error": self.last_error,
+        }
+
+
+class CircuitBreakerRegistry:
+    """Circuit breakers for one endpoint and, optionally, each of its collections."""
+
+    def __init__(self, endpoint: str, per_collection: bool = False, **breaker_options: Any):
+        """Initialize breaker registry.
+
+        Args:
+            endpoint: Base URL of the Qdrant endpoint
+            per_collection: Track a separate breaker per collection
+            **breaker_options: Options passed to each CircuitBreaker
+        """
+        self.endpoint = endpoint
+        self.per_collection = per_collection
+        self._options = breaker_options
+        self.endpoint_breaker = CircuitBreaker(endpoint, **breaker_options)
+        self._collections: dict[str, CircuitBreaker] = {}
+
+    def for_collection(self, collection_name: Optional[str]) -> Optional[CircuitBreaker]:
+        """Get the breaker for a collection, if per-collection tracking is enabled."""
+        if not self.per_collection or collection_name is None:
+            return None
+        breaker = self._collections.get(collection_name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                f"{self.endpoint}/collections/{collection_name}", **self._options
+            )
+            self._collections[collection_name] = breaker
+        return breaker
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the state of all breakers."""
+        return {
+            "endpoint": self.endpoint_breaker.snapshot(),
+            "collections": {
+                name: breaker.snapshot() for name, breaker in sorted(self._collections.items())
+            },
+        }
@@ -0,0 +1,431 @@
+"""Bulk-load sessions that defer indexing during imports for Qdrant Database API."""
+
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+from mcp.server import Server
+
+from ..deadline import DeadlineExceeded
+from .client import QdrantDatabaseClient
+from .collections import get_collection, update_collection
+from .readiness import wait_for_green
+
+logger = logging.getLogger(__name__)
+
+# Qdrant's default indexing threshold (KB), used when a collection reports none
+DEFAULT_INDEXING_THRESHOLD = 20000
+
+# Collection updates applied for the duration of a bulk load
+PRESETS: dict[str, dict[str, Any]] = {
+    # Keep new segments unindexed; HNSW graphs are built once after the import
+    "deferred_indexing": {"optimizers_config": {"indexing_threshold": 0}},
+    # Build no HNSW graph links at all during the import
+    "no_hnsw": {"hnsw_config": {"m": 0}},
+}
+
+
+def saved_settings(info: dict[str, Any], preset: str) -> dict[str, Any]:
+    """Get the current values of the settings a preset changes.
+
+    Args:
+        info: The "result" of a get_collection response
+        preset: Preset name
+
+    Returns:
+        Collection update restoring the current settings
+    """
+    config = info.get("config", {})
+    saved: dict[str, Any] = {}
+    for section, values in PRESETS[preset].items():
+        current = config.get("optimizer_config" if section == "optimizers_config" else section, {})
+        saved[section] = {key: current.get(key) for key in values}
+    threshold = saved.get("optimizers_config", {})
+    if "indexing_threshold" in threshold and threshold["indexing_threshold"] is None:
+        # null means "unchanged" in an update, so restore the default explicitly
+        threshold["indexing_threshold"] = DEFAULT_INDEXING_THRESHOLD
+    return saved
+
+
+def process_owner() -> dict[str, Any]:
+    """Identify a new owner of sessions in this process."""
+    return {"pid": os.getpid(), "host": socket.gethostname(), "id": uuid.uuid4().hex}
+
+
+def owner_alive(owner: Optional[dict[str, Any]]) -> bool:
+    """Check whether the process owning a saved session may still be running.
+
+    Processes on other hosts cannot be checked and are assumed alive.
+    """
+    if not owner:
+        return False
+    if owner.get("host") != socket.gethostname():
+        return True
+    try:
+        os.kill(owner["pid"], 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Running, as another user
+        return True
+    return True
+
+
+class BulkLoadSession:
+    """Ingest-optimized settings applied to one collection, with the originals saved."""
+
+    def __init__(
+        self,
+        collection_name: str,
+        preset: str,
+        original: dict[str, Any],
+        started_at: Optional[float] = None,
+        owner: Optional[dict[str, Any]] = None,
+    ):
+        """Initialize bulk-load session.
+
+        Args:
+            collection_name: Name of the collection
+            preset: Preset applied for the import
+            original: Collection update restoring the original settings
+            started_at: Unix time the session was opened (default: now)
+            owner: Manager holding the session (default: a new owner in this process)
+        """
+        self.collection_name = collection_name
+        self.preset = preset
+        self.original = original
+        self.started_at = time.time() if started_at is None else started_at
+        self.owner = owner or process_owner()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the session as a plain dictionary."""
+        return {
+            "collection_name": self.collection_name,
+            "preset": self.preset,
+            "applied": PRESETS[self.preset],
+            "original": self.original,
+            "started_at": self.started_at,
+            "owner": self.owner,
+        }
+
+
+class BulkLoadManager:
+    """Open bulk-load sessions, at most one per collection.
+
+    With a state file, open sessions and their original settings are saved
+    to disk (per endpoint), so that recover() can restore the settings of
+    sessions a crashed or restarted process left open. Several server
+    processes may share the file: each session records its owning process,
+    and only sessions whose owner has exited are recovered.
+    """
+
+    def __init__(self, client: QdrantDatabaseClient, state_path: Optional[str] = None):
+        """Initialize bulk-load manager.
+
+        Args:
+            client: Qdrant database client
+            state_path: JSON file persisting open sessions (default: memory only)
+        """
+        self.client = client
+        self.state_path = os.path.expanduser(state_path) if state_path else None
+        self.owner = process_owner()
+        self._sessions: dict[str, BulkLoadSession] = {}
+
+    def _read_state(self) -> dict[str, Any]:
+        if self.state_path is None:
+            return {}
+        try:
+            with open(self.state_path) as f:
+                state: dict[str, Any] = json.load(f)
+                return state
+        except FileNotFoundError:
+            return {}
+
+    @staticmethod
+    def _write_state(path: str, state: dict[str, Any]) -> None:
+        state = {endpoint: sessions for endpoint, sessions in state.items() if sessions}
+        partial = path + ".tmp"
+        with open(partial, "w") as f:
+            json.dump(state, f)
+        os.replace(partial, path)
+
+    @staticmethod
+    @contextmanager
+    def _locked(path: str) -> Iterator[None]:
+        """Hold an advisory lock on a state file across processes (where supported)."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path + ".lock", "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def _save(self) -> None:
+        """Write this process's open sessions atomically, keeping other processes'."""
+        path = self.state_path
+        if path is None:
+            return
+        with self._locked(path):
+            state = self._read_state()
+            sessions = {
+                name: session
+                for name, session in state.get(self.client.base_url, {}).items()
+                if session.get("owner") != self.owner
+            }
+            sessions.update({name: s.snapshot() for name, s in self._sessions.items()})
+            state[self.client.base_url] = sessions
+            self._write_state(path, state)
+
+    async def recover(self) -> dict[str, Any]:
+        """Restore the original settings of sessions left open by exited processes.
+
+        The sessions are taken over by this process first, so no other process
+        recovers them as well. Sessions that cannot be restored stay open (and
+        saved), so a later end() or shutdown retries them.
+
+        Returns:
+            Restore result or error per collection
+        """
+        path = self.state_path
+        if path is None:
+            return {}
+        with self._locked(path):
+            state = self._read_state()
+            saved = state.get(self.client.base_url, {})
+            orphaned = [
+                name
+                for name, session in saved.items()
+                if name not in self._sessions and not owner_alive(session.get("owner"))
+            ]
+            for name in orphaned:
+                session = saved[name]
+                self._sessions[name] = BulkLoadSession(
+                    name,
+                    session["preset"],
+                    session["original"],
+                    session.get("started_at"),
+                    self.owner,
+                )
+                saved[name] = self._sessions[name].snapshot()
+            self._write_state(path, state)
+        results: dict[str, Any] = {}
+        for name in orphaned:
+            try:
+                results[name] = await self.end(name, wait=False)
+                logger.warning("Restored settings of %s left by an interrupted bulk load", name)
+            except Exception as e:
+                results[name] = {"restored": False, "error": repr(e)}
+                logger.warning("Failed to restore %s after bulk load: %r", name, e)
+        return results
+
+    async def begin(
+        self, collection_name: str, preset: str = "deferred_indexing"
+    ) -> BulkLoadSession:
+        """Save the collection's settings and apply an ingest preset.
+
+        Raises:
+            ValueError: If the preset is unknown or a session is already open
+        """
+        if preset not in PRESETS:
+            raise ValueError(f"Unknown bulk-load preset {preset!r}; use one of {sorted(PRESETS)}")
+        if collection_name in self._sessions:
+            raise ValueError(f"A bulk-load session is already open for {collection_name}")
+        info = (await get_collection(self.client, collection_name)).get("result", {})
+        session = BulkLoadSession(
+            collection_name, preset, saved_settings(info, preset), owner=self.owner
+        )
+        # Saved before the preset is applied, so a crash in between cannot lose the originals
+        self._sessions[collection_name] = session
+        self._save()
+        try:
+            await update_collection(self.client, collection_name, PRESETS[preset])
+        except BaseException:
+            del self._sessions[collection_name]
+            self._save()
+            raise
+        return session
+
+    async def end(
+        self,
+        collection_name: str,
+        wait: bool = True,
+        timeout: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """Restore the original settings, then wait for indexing to finish.
+
+        Args:
+            collection_name: Name of the collection
+            wait: Wait until the collection is green again
+            timeout: Maximum seconds to wait (capped by the tool call's deadline)
+
+        Returns:
+            The restored settings and, if waited for, the readiness result
+
+        Raises:
+            ValueError: If no session is open for the collection
+        """
+        session = self._sessions.get(collection_name)
+        if session is None:
+            raise ValueError(f"No bulk-load session is open for {collection_name}")
+        await update_collection(self.client, collection_name, session.original)
+        del self._sessions[collection_name]
+        self._save()
+
+        result: dict[str, Any] = {**session.snapshot(), "restored": True}
+        if wait:
+            try:
+                result["readiness"] = await wait_for_green(
+                    self.client, collection_name, timeout=timeout
+                )
+            except DeadlineExceeded as e:
+                # Settings are restored; indexing continues in Qdrant
+                result["readiness"] = {"ready": False, "error": str(e)}
+        return result
+
+    def get(self, collection_name: str) -> Optional[BulkLoadSession]:
+        """Get the open session for a collection, if any."""
+        return self._sessions.get(collection_name)
+
+    async def close(self) -> None:
+        """Restore the settings of all open sessions, logging failures."""
+        for collection_name in list(self._sessions):
+            try:
+                await self.end(collection_name, wait=False)
+            except Exception as e:
+                logger.warning("Failed to restore %s after bulk load: %r", collection_name, e)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return all open sessions."""
+        return {name: session.snapshot() for name, session in sorted(self._sessions.items())}
+
+
+@asynccontextmanager
+async def bulk_load(
+    manager: BulkLoadManager,
+    collection_name: str,
+    preset: str = "deferred_indexing",
+    wait: bool = True,
+) -> AsyncIterator[BulkLoadSession]:
+    """Apply an ingest preset for the enclosed import and restore it afterwards.
+
+    The original settings are restored even if the import fails; indexing is
+    only waited for after a successful import.
+    """
+    session = await manager.begin(collection_name, preset)
+    try:
+        yield session
+    except BaseException:
+        try:
+            await manager.end(collection_name, wait=False)
+        except Exception as e:
+            logger.warning("Failed to restore %s after bulk load: %r", collection_name, e)
+        raise
+    await manager.end(collection_name, wait=wait)
+
+
+def register_bulk_load_tools(
+    server: Server,
+    client: QdrantDatabaseClient,
+    tools_list: list,
+    bulk_loads: BulkLoadManager,
+) -> None:
+    """Register bulk-load session tools with MCP server.
+
+    Args:
+        server: MCP server instance
+        client: Qdrant database client
+        tools_list: List to append tool definitions to
+        bulk_loads: Open bulk-load sessions (restored on shutdown)
+    """
+    from mcp.types import Tool
+
+    # Define tools
+    tools_list.extend(
+        [
+            Tool(
+                name="qdrant_db_bulk_load_begin",
+                description=(
+                    "Start a bulk load: save the collection's optimizer/HNSW settings and defer "
+                    "indexing until qdrant_db_bulk_load_end"
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "collection_name": {"type": "string"},
+                        "preset": {
+                            "type": "string",
+                            "enum": sorted(PRESETS),
+                            "default": "deferred_indexing",
+                        },
+                    },
+                    "required": ["collection_name"],
+                },
+            ),
+            Tool(
+                name="qdrant_db_bulk_load_end",
+                description=(
+                    "End a bulk load (whether or not the import succeeded): restore the saved "
+                    "settings and wait for indexing to finish"
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "collection_name": {"type": "string"},
+                        "wait_ready": {"type": "boolean", "default": True},
+                        "timeout": {"type": "number"},
+                    },
+                    "required": ["collection_name"],
+                },
+            ),
+            Tool(
+                name="qdrant_db_bulk_load_status",
+                description="List open bulk-load sessions and the settings they will restore",
+                inputSchema={"type": "object", "properties": {}, "required": []},
+            ),
+        ]
+    )
+
+    @server.call_tool()
+    async def qdrant_db_bulk_load_begin(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Save settings and apply an ingest preset.
+
+        Args:
+            collection_name: Name of the collection
+            preset: "deferred_indexing" (indexing_threshold 0) or "no_hnsw" (m 0)
+        """
+        session = await bulk_loads.begin(
+            arguments["collection_name"], arguments.get("preset", "deferred_indexing")
+        )
+        return [{"type": "text", "text": str(session.snapshot())}]
+
+    @server.call_tool()
+    async def qdrant_db_bulk_load_end(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Restore saved settings and wait for indexing.
+
+        Args:
+            collection_name: Name of the collection
+            wait_ready: Wait until the collection is green again (default: true)
+            timeout: Maximum seconds to wait (optional)
+        """
+        result = await bulk_loads.end(
+            arguments["collection_name"],
+            wait=arguments.get("wait_ready", True),
+            timeout=arguments.get("timeout"),
+        )
+        return [{"type": "text", "text": str(result)}]
+
+    @server.call_tool()
+    async def qdrant_db_bulk_load_status(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """List open bulk-load sessions."""
+        result = bulk_loads.snapshot()
+        return [{"type": "text", "text": str(result)}]
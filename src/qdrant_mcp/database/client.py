@@ -1,9 +1,73 @@
 """HTTP client for Qdrant Database API."""
 
-from typing import Any, Optional
+import functools
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Any, Optional, cast
 
 import httpx
 
+from .. import deadline
+from ..deadline import DeadlineExceeded
+from .breaker import HALF_OPEN, CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError
+from .codec import JSONCodec
+from .jsonstream import ItemStream
+from .limiter import ConcurrencyLimits, endpoint_class
+
+logger = logging.getLogger(__name__)
+
+# Called with (method, path, json body, latency) after each successful request
+RequestObserver = Callable[[str, str, Any, float], None]
+
+# Status codes that indicate an overloaded or failing server
+_FAILURE_STATUS = frozenset({429, 500, 502, 503, 504})
+# Status codes that ask the client to back off
+_CONGESTION_STATUS = frozenset({429, 503})
+# Operations expected to outlast the breaker's slow-call threshold (see endpoint_class)
+LONG_RUNNING_ENDPOINTS = frozenset(
+    {
+        "PUT /collections/*",
+        "PUT /collections/*/index",
+        "PUT /collections/*/shards",
+        "POST /collections/*/snapshots",
+        "GET /collections/*/snapshots/*",
+        "POST /collections/*/snapshots/upload",
+        "PUT /collections/*/snapshots/recover",
+        "POST /snapshots",
+        "GET /snapshots/*",
+    }
+)
+
+
+def _collection_from_path(path: str) -> Optional[str]:
+    """Extract the collection name from a /collections/{name}/... path."""
+    parts = path.lstrip("/").split("/")
+    if len(parts) >= 2 and parts[0] == "collections" and parts[1]:
+        return parts[1]
+    return None
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body stream that runs a callback once, when it is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close: Optional[Callable[[], None]] = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            on_close, self._on_close = self._on_close, None
+            if on_close is not None:
+                on_close()
+
 
 class QdrantDatabaseClient:
     """Async HTTP client for Qdrant Database REST API.
@@ -11,17 +75,32 @@ class QdrantDatabaseClient:
     Handles authentication, retries, and response parsing.
     """
 
-    def __init__(self, base_url: str, api_key: str, timeout: float = 30.0):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float = 30.0,
+        breakers: Optional[CircuitBreakerRegistry] = None,
+        limits: Optional[ConcurrencyLimits] = None,
+        codec: Optional[JSONCodec] = None,
+    ):
         """Initialize database client.
 
         Args:
             base_url: Qdrant database URL (e.g., https://xyz.qdrant.io:6333)
             api_key: API key for authentication
             timeout: Request timeout in seconds
+            breakers: Optional circuit breakers guarding every request
+            limits: Optional adaptive concurrency limits for reads and writes
+            codec: Optional codec decoding large responses off the event loop
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
+        self.breakers = breakers
+        self.limits = limits
+        self.codec = codec or JSONCodec(threshold=0)
+        self.observers: list[RequestObserver] = []
 
         self._client: Optional[httpx.AsyncClient] = None
 
@@ -51,6 +130,141 @@ class QdrantDatabaseClient:
             raise RuntimeError("Client not initialized. Use 'async with' context manager.")
         return self._client
 
+    def _breakers_for(self, path: str) -> list[CircuitBreaker]:
+        """Get the breakers guarding a request path, endpoint first."""
+        if self.breakers is None:
+            return []
+        guards = [self.breakers.endpoint_breaker]
+        collection_breaker = self.breakers.for_collection(_collection_from_path(path))
+        if collection_breaker is not None:
+            guards.append(collection_breaker)
+        return guards
+
+    async def _probe(self, breaker: CircuitBreaker) -> None:
+        """Probe /healthz for a half-open breaker, closing or re-opening it.
+
+        Only one probe runs at a time; concurrent callers fail fast meanwhile.
+
+        Raises:
+            CircuitOpenError: If the probe fails or another probe is in flight
+        """
+        if breaker.probing:
+            raise CircuitOpenError(breaker.scope, 0.0)
+        breaker.probing = True
+        try:
+            left = deadline.remaining()
+            timeout = min(self.timeout, 5.0, max(left, 0.0) if left is not None else 5.0)
+            response = await self.client.get("/healthz", timeout=timeout)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            breaker.last_error = f"probe failed: {e!r}"
+            breaker.trip()
+            raise CircuitOpenError(breaker.scope, breaker.retry_after()) from e
+        finally:
+            breaker.probing = False
+        breaker.reset()
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        stream: bool = False,
+        long_running: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Make a request through the circuit breakers and concurrency limits.
+
+        The request timeout is capped by the remaining deadline of the current
+        tool call. Running out of deadline is not counted as a server failure.
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            stream: Return once the headers arrive, without reading the body
+                (the caller must close the response; the concurrency slot is
+                held until then)
+            long_running: Never count the call as slow for the circuit breakers
+                (implied for LONG_RUNNING_ENDPOINTS)
+            **kwargs: Additional request parameters
+
+        Returns:
+            Successful HTTP response
+
+        Raises:
+            CircuitOpenError: If a breaker guarding the path is open
+            DeadlineExceeded: If the tool call's deadline passes
+            httpx.HTTPError: If the request fails
+        """
+        deadline.check()
+        guards = self._breakers_for(path)
+        for breaker in guards:
+            if breaker.before_call() == HALF_OPEN:
+                await self._probe(breaker)
+
+        endpoint = endpoint_class(method, path)
+        long_running = long_running or endpoint in LONG_RUNNING_ENDPOINTS
+        limiter = self.limits.for_request(method, path) if self.limits is not None else None
+        token = await limiter.acquire() if limiter is not None else 0
+
+        timeout = kwargs.pop("timeout", self.timeout)
+        left = deadline.remaining()
+        capped = False
+        if left is not None and isinstance(timeout, (int, float)) and left < timeout:
+            timeout, capped = max(left, 0.0), True
+
+        # Transport errors affect the whole endpoint; everything else is
+        # attributed to the narrowest scope being tracked.
+        scoped = guards[-1:]
+        latency: Optional[float] = None
+        congested = False
+        held = False
+        start = time.monotonic()
+        try:
+            try:
+                request = self.client.build_request(method, path, timeout=timeout, **kwargs)
+                response = await self.client.send(request, stream=stream)
+            except httpx.TimeoutException as e:
+                if capped:
+                    raise DeadlineExceeded(f"Deadline exceeded during {method} {path}") from e
+                for breaker in guards:
+                    breaker.record(time.monotonic() - start, repr(e), long_running)
+                latency, congested = time.monotonic() - start, True
+                raise
+            except httpx.TransportError as e:
+                for breaker in guards:
+                    breaker.record(time.monotonic() - start, repr(e), long_running)
+                raise
+
+            latency = time.monotonic() - start
+            congested = response.status_code in _CONGESTION_STATUS
+            error = None
+            if response.status_code in _FAILURE_STATUS:
+                error = f"HTTP {response.status_code}"
+            for breaker in scoped:
+                breaker.record(latency, error, long_running)
+            if stream and limiter is not None:
+                # The body is still to be read: keep the slot until it is closed
+                response.stream = _ReleasingStream(
+                    cast(httpx.AsyncByteStream, response.stream),
+                    functools.partial(limiter.release, token, latency, congested, endpoint),
+                )
+                held = True
+        finally:
+            if limiter is not None and not held:
+                limiter.release(token, latency, congested, endpoint)
+
+        if stream and response.is_error:
+            # Read the error body for the exception, and release the connection
+            await response.aread()
+            await response.aclose()
+        response.raise_for_status()
+        for observer in self.observers:
+            try:
+                observer(method, path, kwargs.get("json"), latency)
+            except Exception:
+                logger.exception("Request observer failed")
+        return response
+
     async def get(self, path: str, **kwargs: Any) -> Any:
         """Make GET request.
 
@@ -61,9 +275,8 @@ class QdrantDatabaseClient:
         Returns:
             Response JSON data
         """
-        response = await self.client.get(path, **kwargs)
-        response.raise_for_status()
-        return response.json()
+        response = await self.request("GET", path, **kwargs)
+        return await self.codec.decode(response.content)
 
     async def post(self, path: str, **kwargs: Any) -> Any:
         """Make POST request.
@@ -75,9 +288,8 @@ class QdrantDatabaseClient:
         Returns:
             Response JSON data
         """
-        response = await self.client.post(path, **kwargs)
-        response.raise_for_status()
-        return response.json()
+        response = await self.request("POST", path, **kwargs)
+        return await self.codec.decode(response.content)
 
     async def put(self, path: str, **kwargs: Any) -> Any:
         """Make PUT request.
@@ -89,9 +301,8 @@ class QdrantDatabaseClient:
         Returns:
             Response JSON data
         """
-        response = await self.client.put(path, **kwargs)
-        response.raise_for_status()
-        return response.json()
+        response = await self.request("PUT", path, **kwargs)
+        return await self.codec.decode(response.content)
 
     async def patch(self, path: str, **kwargs: Any) -> Any:
         """Make PATCH request.
@@ -103,9 +314,8 @@ class QdrantDatabaseClient:
         Returns:
             Response JSON data
         """
-        response = await self.client.patch(path, **kwargs)
-        response.raise_for_status()
-        return response.json()
+        response = await self.request("PATCH", path, **kwargs)
+        return await self.codec.decode(response.content)
 
     async def delete(self, path: str, **kwargs: Any) -> Any:
         """Make DELETE request.
@@ -117,6 +327,34 @@ class QdrantDatabaseClient:
         Returns:
             Response JSON data
         """
-        response = await self.client.delete(path, **kwargs)
-        response.raise_for_status()
-        return response.json()
+        response = await self.request("DELETE", path, **kwargs)
+        return await self.codec.decode(response.content)
+
+    @asynccontextmanager
+    async def stream_items(
+        self, method: str, path: str, item_path: tuple[str, ...], **kwargs: Any
+    ) -> AsyncIterator[ItemStream]:
+        """Make a request and parse one array of the response incrementally.
+
+        Items are decoded one at a time as the body arrives, so memory use does
+        not grow with the size of the array. Use as::
+
+            async with client.stream_items("POST", path, ("result", "points"), json=body) as points:
+                async for point in points:
+                    ...
+            next_offset = points.rest["result"].get("next_page_offset")
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            item_path: Object keys leading to the array, e.g. ("result", "points")
+            **kwargs: Additional request parameters
+
+        Yields:
+            Item stream; fields outside the array are in its ``rest`` once exhausted
+        """
+        response = await self.request(method, path, stream=True, **kwargs)
+        try:
+            yield ItemStream(response.aiter_bytes(), item_path)
+        finally:
+            await response.aclose()
@@ -0,0 +1,627 @@
+"""Cluster topology, per-peer shard load and shard rebalancing for Qdrant Database API."""
+
+import asyncio
+import time
+from typing import Any, Optional
+
+from mcp.server import Server
+
+from .. import deadline
+from ..deadline import DeadlineExceeded
+from ..jobs import report_progress
+from .client import QdrantDatabaseClient
+from .collections import get_collection, list_collections
+from .health import metrics
+
+ACTIVE = "Active"
+# Counters of requests served by a peer, summed over all their labels
+REQUEST_COUNTERS = ("rest_responses_total", "grpc_responses_total")
+TRANSFER_METHODS = ["stream_records", "snapshot", "wal_delta"]
+
+
+class ShardTransferError(RuntimeError):
+    """Raised when a shard transfer cannot start or ends without an active replica."""
+
+
+async def cluster_info(client: QdrantDatabaseClient) -> dict[str, Any]:
+    """Get cluster status: peers, Raft state and consensus health.
+
+    Returns:
+        Cluster information
+    """
+    return await client.get("/cluster")
+
+
+async def collection_cluster_info(
+    client: QdrantDatabaseClient, collection_name: str
+) -> dict[str, Any]:
+    """Get the shards of a collection, their replicas and the transfers in progress.
+
+    Args:
+        collection_name: Name of the collection
+
+    Returns:
+        Local shards (with point counts), remote shards and shard transfers
+    """
+    return await client.get(f"/collections/{collection_name}/cluster")
+
+
+async def update_collection_cluster(
+    client: QdrantDatabaseClient, collection_name: str, operation: dict[str, Any]
+) -> dict[str, Any]:
+    """Start a shard operation, e.g. {"move_shard": {"shard_id": 0, ...}}.
+
+    Args:
+        collection_name: Name of the collection
+        operation: move_shard, replicate_shard, abort_transfer or drop_replica operation
+
+    Returns:
+        Operation result
+    """
+    return await client.post(f"/collections/{collection_name}/cluster", json=operation)
+
+
+def cluster_peers(cluster: dict[str, Any], collection: dict[str, Any]) -> list[int]:
+    """Peer IDs of the cluster, or the single peer of a node without distributed mode.
+
+    Args:
+        cluster: The "result" of a cluster_info response
+        collection: The "result" of a collection_cluster_info response
+    """
+    peers = {int(peer_id) for peer_id in cluster.get("peers") or {}}
+    return sorted(peers or {collection["peer_id"]})
+
+
+def shard_replicas(collection: dict[str, Any]) -> list[dict[str, Any]]:
+    """Replicas of a collection's shards, with their peer and point count.
+
+    Only local shards report a point count. A remote replica gets the count of
+    a local replica of the same shard, else the mean of the known shard counts
+    (with "points_estimated" set); without any known count it is 0.
+
+    Args:
+        collection: The "result" of a collection_cluster_info response
+
+    Returns:
+        shard_id, shard_key, peer_id, state, points_count and points_estimated per replica
+    """
+    replicas = [
+        {
+            "shard_id": shard["shard_id"],
+            "shard_key": shard.get("shard_key"),
+            "peer_id": collection["peer_id"],
+            "state": shard.get("state"),
+            "points_count": shard.get("points_count") or 0,
+            "points_estimated": False,
+        }
+        for shard in collection.get("local_shards", [])
+    ]
+    known = {replica["shard_id"]: replica["points_count"] for replica in replicas}
+    mean = round(sum(known.values()) / len(known)) if known else 0
+    for shard in collection.get("remote_shards", []):
+        replicas.append(
+            {
+                "shard_id": shard["shard_id"],
+                "shard_key": shard.get("shard_key"),
+                "peer_id": shard["peer_id"],
+                "state": shard.get("state"),
+                "points_count": known.get(shard["shard_id"], mean),
+                "points_estimated": shard["shard_id"] not in known,
+            }
+        )
+    return replicas
+
+
+def peer_loads(peers: list[int], replicas: list[dict[str, Any]]) -> dict[int, dict[str, Any]]:
+    """Shard and point counts per peer, including peers holding no shard."""
+    loads: dict[int, dict[str, Any]] = {
+        peer: {"shards": 0, "points": 0, "shard_ids": []} for peer in peers
+    }
+    for replica in replicas:
+        load = loads.setdefault(replica["peer_id"], {"shards": 0, "points": 0, "shard_ids": []})
+        load["shards"] += 1
+        load["points"] += replica["points_count"]
+        load["shard_ids"].append(replica["shard_id"])
+    return loads
+
+
+def skew(values: list[int]) -> float:
+    """Ratio of the largest value to the mean (1.0 when perfectly even)."""
+    mean = sum(values) / len(values) if values else 0
+    return round(max(values) / mean, 3) if mean else 1.0
+
+
+def request_total(text: str) -> float:
+    """Total requests served, summed from the request counters of Prometheus metrics."""
+    total = 0.0
+    for line in text.splitlines():
+        name = line.split("{", 1)[0].split(" ", 1)[0]
+        if name in REQUEST_COUNTERS:
+            total += float(line.rsplit(" ", 1)[1])
+    return total
+
+
+async def request_rate(client: QdrantDatabaseClient, seconds: float) -> float:
+    """Requests per second served by the connected peer, sampled from its metrics.
+
+    Args:
+        seconds: Sampling interval
+    """
+    started = time.monotonic()
+    first = request_total(await metrics(client))
+    await asyncio.sleep(seconds)
+    last = request_total(await metrics(client))
+    return round((last - first) / (time.monotonic() - started), 3)
+
+
+async def cluster_load(
+    client: QdrantDatabaseClient,
+    collection_names: Optional[list[str]] = None,
+    sample_seconds: float = 0.0,
+) -> dict[str, Any]:
+    """Compute per-peer shard and point load over collections.
+
+    Request rates come from the metrics of the peer this client is connected
+    to, the only peer whose metrics the REST API serves.
+
+    Args:
+        collection_names: Collections to include (default: all)
+        sample_seconds: Seconds to sample the connected peer's request rate (0: skip)
+
+    Returns:
+        Load per peer overall and per collection, skew (largest / mean load),
+        and the shard transfers in progress
+    """
+    cluster = (await cluster_info(client)).get("result", {})
+    if collection_names is None:
+        listed = (await list_collections(client)).get("result", {}).get("collections", [])
+        collection_names = [collection["name"] for collection in listed]
+
+    peers: dict[int, dict[str, Any]] = {}
+    collections: dict[str, Any] = {}
+    local_peer = cluster.get("peer_id")
+    for name in collection_names:
+        info = (await collection_cluster_info(client, name)).get("result", {})
+        local_peer = info.get("peer_id", local_peer)
+        loads = peer_loads(cluster_peers(cluster, info), shard_replicas(info))
+        for peer, load in loads.items():
+            total = peers.setdefault(peer, {"shards": 0, "points": 0})
+            total["shards"] += load["shards"]
+            total["points"] += load["points"]
+        collections[name] = {
+            "peers": loads,
+            "points_skew": skew([load["points"] for load in loads.values()]),
+            "transfers": info.get("shard_transfers", []),
+        }
+    for peer_id, peer in (cluster.get("peers") or {}).items():
+        peers.setdefault(int(peer_id), {"shards": 0, "points": 0})["uri"] = peer.get("uri")
+    if sample_seconds > 0 and local_peer is not None:
+        peers.setdefault(local_peer, {"shards": 0, "points": 0})["request_rate"] = (
+            await request_rate(client, sample_seconds)
+        )
+    return {
+        "peer_id": local_peer,
+        "peers": peers,
+        "shards_skew": skew([peer["shards"] for peer in peers.values()]),
+        "points_skew": skew([peer["points"] for peer in peers.values()]),
+        "collections": collections,
+    }
+
+
+def plan_rebalance(
+    peers: list[int],
+    replicas: list[dict[str, Any]],
+    replication_factor: Optional[int] = None,
+    max_operations: int = 10,
+    balance_by: str = "points",
+) -> dict[str, Any]:
+    """Plan shard operations evening out the load of a collection's peers.
+
+    Shards with fewer active replicas than the replication factor are first
+    replicated to the least loaded peers without a replica. Then active
+    replicas are moved, one at a time, from the most to the least loaded peer:
+    each move picks the shard closest to half the difference, and planning
+    stops when no move reduces it.
+
+    Args:
+        peers: Peer IDs of the cluster
+        replicas: Replicas, as returned by shard_replicas
+        replication_factor: Wanted replicas per shard (default: no replication step)
+        max_operations: Maximum number of operations planned
+        balance_by: "points" or "shards" (points fall back to shards when all are 0)
+
+    Returns:
+        Operations in update_collection_cluster format, with the load before and after
+    """
+    if balance_by not in ("points", "shards"):
+        raise ValueError(f"balance_by must be 'points' or 'shards', got {balance_by!r}")
+    by_points = balance_by == "points" and any(r["points_count"] for r in replicas)
+
+    def weight(replica: dict[str, Any]) -> int:
+        return replica["points_count"] if by_points else 1
+
+    load = dict.fromkeys(peers, 0)
+    holders: dict[Any, set[int]] = {}
+    shards: dict[tuple[Any, int], dict[str, Any]] = {}
+    for replica in replicas:
+        load[replica["peer_id"]] = load.get(replica["peer_id"], 0) + weight(replica)
+        holders.setdefault(replica["shard_id"], set()).add(replica["peer_id"])
+        shards[replica["shard_id"], replica["peer_id"]] = replica
+    before = dict(load)
+    operations: list[dict[str, Any]] = []
+
+    if replication_factor:
+        for shard_id, peer_ids in sorted(holders.items(), key=lambda item: str(item[0])):
+            active = sorted(p for p in peer_ids if shards[shard_id, p]["state"] == ACTIVE)
+            missing = replication_factor - len(active)
+            while active and missing > 0 and len(operations) < max_operations:
+                candidates = [peer for peer in load if peer not in peer_ids]
+                if not candidates:
+                    break
+                target = min(candidates, key=lambda peer: (load[peer], peer))
+                replica = shards[shard_id, active[0]]
+                operations.append(
+                    {
+                        "replicate_shard": {
+                            "shard_id": shard_id,
+                            "from_peer_id": active[0],
+                            "to_peer_id": target,
+                        }
+                    }
+                )
+                load[target] += weight(replica)
+                peer_ids.add(target)
+                shards[shard_id, target] = {**replica, "peer_id": target}
+                missing -= 1
+
+    while len(operations) < max_operations and len(load) > 1:
+        source = max(load, key=lambda peer: (load[peer], -peer))
+        target = min(load, key=lambda peer: (load[peer], peer))
+        difference = load[source] - load[target]
+        movable = [
+            shards[shard_id, source]
+            for shard_id, peer_ids in holders.items()
+            if source in peer_ids
+            and target not in peer_ids
+            and shards[shard_id, source]["state"] == ACTIVE
+            and 0 < weight(shards[shard_id, source]) < difference
+        ]
+        if not movable:
+            break
+        replica = min(movable, key=lambda r: (abs(difference - 2 * weight(r)), str(r["shard_id"])))
+        operations.append(
+            {
+                "move_shard": {
+                    "shard_id": replica["shard_id"],
+                    "from_peer_id": source,
+                    "to_peer_id": target,
+                }
+            }
+        )
+        load[source] -= weight(replica)
+        load[target] += weight(replica)
+        holders[replica["shard_id"]] = holders[replica["shard_id"]] - {source} | {target}
+        shards[replica["shard_id"], target] = {**replica, "peer_id": target}
+        del shards[replica["shard_id"], source]
+
+    return {
+        "balance_by": "points" if by_points else "shards",
+        "operations": operations,
+        "load_before": before,
+        "load_after": load,
+    }
+
+
+async def wait_for_transfer(
+    client: QdrantDatabaseClient,
+    collection_name: str,
+    shard_id: Any,
+    from_peer_id: int,
+    to_peer_id: int,
+    timeout: Optional[float] = None,
+    initial_delay: float = 1.0,
+    max_delay: float = 10.0,
+) -> dict[str, Any]:
+    """Poll a collection until a shard transfer is done, with exponential backoff.
+
+    A transfer is done once it is no longer listed and the target peer holds
+    an active replica of the shard.
+
+    Args:
+        collection_name: Name of the collection
+        shard_id: Transferred shard
+        from_peer_id: Source peer
+        to_peer_id: Target peer
+        timeout: Maximum seconds to wait (capped by the tool call's deadline)
+        initial_delay: First poll interval in seconds
+        max_delay: Maximum poll interval in seconds
+
+    Returns:
+        The transfer, with the number of polls, seconds waited and last progress comment
+
+    Raises:
+        ShardTransferError: If the transfer ends without an active replica on the target
+        DeadlineExceeded: If the transfer does not finish in time
+    """
+    started = time.monotonic()
+    wait_until = None if timeout is None else started + timeout
+    left = deadline.remaining()
+    if left is not None:
+        call_end = started + left - 1.0
+        wait_until = call_end if wait_until is None else min(wait_until, call_end)
+
+    transfer = {"shard_id": shard_id, "from_peer_id": from_peer_id, "to_peer_id": to_peer_id}
+    delay = initial_delay
+    seen = False
+    comment = None
+    polls = 0
+    while True:
+        info = (await collection_cluster_info(client, collection_name)).get("result", {})
+        polls += 1
+        now = time.monotonic()
+        running = next(
+            (
+                t
+                for t in info.get("shard_transfers", [])
+                if t.get("shard_id") == shard_id
+                and t.get("from") == from_peer_id
+                and t.get("to") == to_peer_id
+            ),
+            None,
+        )
+        if running is not None:
+            seen = True
+            comment = running.get("comment", comment)
+        else:
+            states = {
+                replica["state"]
+                for replica in shard_replicas(info)
+                if replica["shard_id"] == shard_id and replica["peer_id"] == to_peer_id
+            }
+            if ACTIVE in states:
+                return {
+                    **transfer,
+                    "polls": polls,
+                    "waited_seconds": round(now - started, 3),
+                    "last_comment": comment,
+                }
+            # The transfer may not be listed yet right after it was started
+            if not states and (seen or polls >= 3):
+                raise ShardTransferError(
+                    f"Transfer of shard {shard_id} from peer {from_peer_id} to peer "
+                    f"{to_peer_id} in {collection_name} ended without a replica on the target"
+                )
+
+        if wait_until is not None and now + delay > wait_until:
+            raise DeadlineExceeded(
+                f"Transfer of shard {shard_id} in {collection_name} not done after "
+                f"{now - started:.1f}s (last progress: {comment})"
+            )
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, max_delay)
+
+
+async def rebalance(
+    client: QdrantDatabaseClient,
+    collection_name: str,
+    execute: bool = False,
+    max_operations: int = 10,
+    balance_by: str = "points",
+    replicate: bool = True,
+    method: Optional[str] = None,
+    timeout: Optional[float] = None,
+    initial_delay: float = 1.0,
+    max_delay: float = 10.0,
+) -> dict[str, Any]:
+    """Plan, and optionally run, shard moves and replications evening out peer load.
+
+    Operations run one at a time: each waits for its transfer to finish
+    before the next starts, so at most one shard is in transit.
+
+    Args:
+        collection_name: Name of the collection
+        execute: Run the planned operations (default: only plan them)
+        max_operations: Maximum number of operations
+        balance_by: "points" or "shards"
+        replicate: Plan replicas of shards below the replication factor
+        method: Transfer method (stream_records, snapshot or wal_delta; default: Qdrant's)
+        timeout: Maximum seconds to wait per transfer
+        initial_delay: First transfer poll interval in seconds
+        max_delay: Maximum transfer poll interval in seconds
+
+    Returns:
+        The plan and, when executed, the completed transfers
+
+    Raises:
+        ShardTransferError: If transfers are already running or one fails
+    """
+    cluster = (await cluster_info(client)).get("result", {})
+    info = (await collection_cluster_info(client, collection_name)).get("result", {})
+    replication_factor = None
+    if replicate:
+        collection = (await get_collection(client, collection_name)).get("result", {})
+        replication_factor = (
+            collection.get("config", {}).get("params", {}).get("replication_factor", 1)
+        )
+    plan = plan_rebalance(
+        cluster_peers(cluster, info),
+        shard_replicas(info),
+        replication_factor,
+        max_operations,
+        balance_by,
+    )
+    result = {"collection_name": collection_name, **plan}
+    running = info.get("shard_transfers", [])
+    if running:
+        result["transfers_in_progress"] = running
+    if not execute or not plan["operations"]:
+        return result
+    if running:
+        raise ShardTransferError(
+            f"{len(running)} shard transfers already running in {collection_name}; "
+            "wait for them before rebalancing"
+        )
+
+    completed = []
+    total = len(plan["operations"])
+    for done, operation in enumerate(plan["operations"]):
+        report_progress(done, total)
+        ((kind, transfer),) = operation.items()
+        await update_collection_cluster(
+            client,
+            collection_name,
+            {kind: {**transfer, "method": method}} if method else operation,
+        )
+        completed.append(
+            {
+                "operation": kind,
+                **await wait_for_transfer(
+                    client,
+                    collection_name,
+                    transfer["shard_id"],
+                    transfer["from_peer_id"],
+                    transfer["to_peer_id"],
+                    timeout,
+                    initial_delay,
+                    max_delay,
+                ),
+            }
+        )
+    report_progress(total, total)
+    result["completed"] = completed
+    return result
+
+
+def register_cluster_tools(server: Server, client: QdrantDatabaseClient, tools_list: list) -> None:
+    """Register cluster topology and rebalancing tools with MCP server.
+
+    Args:
+        server: MCP server instance
+        client: Qdrant database client
+        tools_list: List to append tool definitions to
+    """
+    from mcp.types import Tool
+
+    # Define tools
+    tools_list.extend(
+        [
+            Tool(
+                name="qdrant_db_cluster_info",
+                description="Get cluster status: peers, Raft state and consensus health",
+                inputSchema={"type": "object", "properties": {}, "required": []},
+            ),
+            Tool(
+                name="qdrant_db_cluster_collection_info",
+                description=(
+                    "Get the shards of a collection: replicas per peer, their state and "
+                    "the shard transfers in progress"
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {"collection_name": {"type": "string"}},
+                    "required": ["collection_name"],
+                },
+            ),
+            Tool(
+                name="qdrant_db_cluster_load",
+                description=(
+                    "Compute per-peer shard and point load and its skew, optionally with "
+                    "the connected peer's request rate"
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "collection_names": {"type": "array", "items": {"type": "string"}},
+                        "sample_seconds": {"type": "number", "minimum": 0, "default": 0},
+                    },
+                    "required": [],
+                },
+            ),
+            Tool(
+                name="qdrant_db_cluster_rebalance",
+                description=(
+                    "Plan shard moves and replications evening out a collection's load across "
+                    "peers; with execute, run them one at a time, tracking transfer progress"
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "collection_name": {"type": "string"},
+                        "execute": {"type": "boolean", "default": False},
+                        "max_operations": {"type": "integer", "minimum": 1, "default": 10},
+                        "balance_by": {
+                            "type": "string",
+                            "enum": ["points", "shards"],
+                            "default": "points",
+                        },
+                        "replicate": {"type": "boolean", "default": True},
+                        "method": {"type": "string", "enum": TRANSFER_METHODS},
+                        "timeout": {"type": "number"},
+                        "initial_delay": {"type": "number", "default": 1.0},
+                        "max_delay": {"type": "number", "default": 10.0},
+                    },
+                    "required": ["collection_name"],
+                },
+            ),
+        ]
+    )
+
+    @server.call_tool()
+    async def qdrant_db_cluster_info(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Get cluster status: peers, Raft state and consensus health."""
+        result = await cluster_info(client)
+        return [{"type": "text", "text": str(result)}]
+
+    @server.call_tool()
+    async def qdrant_db_cluster_collection_info(
+        arguments: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        """Get the shards of a collection and the shard transfers in progress.
+
+        Args:
+            collection_name: Name of the collection
+        """
+        result = await collection_cluster_info(client, arguments["collection_name"])
+        return [{"type": "text", "text": str(result)}]
+
+    @server.call_tool()
+    async def qdrant_db_cluster_load(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Compute per-peer shard and point load.
+
+        Args:
+            collection_names: Collections to include (default: all)
+            sample_seconds: Seconds to sample the connected peer's request rate (default: 0)
+        """
+        result = await cluster_load(
+            client, arguments.get("collection_names"), arguments.get("sample_seconds", 0.0)
+        )
+        return [{"type": "text", "text": str(result)}]
+
+    @server.call_tool()
+    async def qdrant_db_cluster_rebalance(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Plan, and optionally run, shard operations evening out peer load.
+
+        Args:
+            collection_name: Name of the collection
+            execute: Run the planned operations one at a time (default: false)
+            max_operations: Maximum number of operations (default: 10)
+            balance_by: "points" or "shards" (default: points)
+            replicate: Replicate shards below the replication factor (default: true)
+            method: Transfer method (optional)
+            timeout: Maximum seconds to wait per transfer (optional)
+            initial_delay: First transfer poll interval in seconds (default: 1)
+            max_delay: Maximum transfer poll interval in seconds (default: 10)
+        """
+        result = await rebalance(
+            client,
+            arguments["collection_name"],
+            execute=arguments.get("execute", False),
+            max_operations=arguments.get("max_operations", 10),
+            balance_by=arguments.get("balance_by", "points"),
+            replicate=arguments.get("replicate", True),
+            method=arguments.get("method"),
+            timeout=arguments.get("timeout"),
+            initial_delay=arguments.get("initial_delay", 1.0),
+            max_delay=arguments.get("max_delay", 10.0),
+        )
+        return [{"type": "text", "text": str(result)}]
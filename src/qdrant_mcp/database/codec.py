@@ -0,0 +1,112 @@
+"""JSON decoding and text rendering of large responses off the event loop."""
+
+import asyncio
+import json
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal, Optional
+
+# Approximate text size of one number in a vector or ID list
+_NUMBER_SIZE = 20
+
+
+def estimated_size(value: Any, limit: int) -> int:
+    """Roughly estimate the size of a value's text form, counting only until it exceeds limit.
+
+    Lists starting with a number (vectors, ID lists) are estimated from their
+    length alone, so large results are recognized without walking them.
+    """
+    size = 0
+    stack = [value]
+    while stack and size <= limit:
+        item = stack.pop()
+        if isinstance(item, dict):
+            size += 2 + 4 * len(item)
+            for key, nested in item.items():
+                size += len(key) if isinstance(key, str) else _NUMBER_SIZE
+                stack.append(nested)
+        elif isinstance(item, (list, tuple)):
+            if item and isinstance(item[0], (int, float)) and not isinstance(item[0], bool):
+                size += _NUMBER_SIZE * len(item)
+            else:
+                size += 2 + 2 * len(item)
+                stack.extend(item)
+        elif isinstance(item, str):
+            size += len(item) + 4
+        else:
+            size += 8
+    return size
+
+
+class JSONCodec:
+    """Decodes response bodies and renders tool results, offloading large ones to a pool.
+
+    Bodies larger than ``threshold`` bytes are decoded, and results whose text
+    is estimated to be larger are rendered, in a worker pool instead of on the
+    event loop, so that one huge scroll does not stall concurrent small calls.
+    json.loads and repr hold the GIL for the whole call, so only a process
+    pool keeps the event loop responsive (at the cost of pickling values to
+    and from the workers); a thread pool only helps on free-threaded builds.
+    """
+
+    def __init__(
+        self,
+        threshold: int = 1_000_000,
+        max_workers: int = 4,
+        executor: Literal["thread", "process"] = "process",
+    ):
+        """Initialize codec.
+
+        Args:
+            threshold: Size in bytes above which work is offloaded (0 never offloads)
+            max_workers: Worker pool size
+            executor: "thread" or "process" pool
+        """
+        self.threshold = threshold
+        self.max_workers = max_workers
+        self.executor = executor
+        self.offloaded = 0
+        self._pool: Optional[Executor] = None
+
+    def _executor(self) -> Executor:
+        if self._pool is None:
+            if self.executor == "process":
+                # Forking a process running an event loop and threads is unsafe
+                self._pool = ProcessPoolExecutor(
+                    self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                self._pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix="qdrant-json")
+        return self._pool
+
+    async def _offload(self, func: Callable[[Any], Any], value: Any) -> Any:
+        self.offloaded += 1
+        return await asyncio.get_running_loop().run_in_executor(self._executor(), func, value)
+
+    async def decode(self, content: bytes) -> Any:
+        """Decode a JSON response body."""
+        if self.threshold and len(content) > self.threshold:
+            return await self._offload(json.loads, content)
+        return json.loads(content)
+
+    async def render(self, result: Any) -> str:
+        """Render a tool result as text, like ``str(result)``."""
+        if self.threshold and estimated_size(result, self.threshold) > self.threshold:
+            return await self._offload(str, result)
+        return str(result)
+
+    def close(self) -> None:
+        """Shut down the worker pool without waiting for running work."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the codec settings and the number of offloaded operations."""
+        return {
+            "threshold": self.threshold,
+            "max_workers": self.max_workers,
+            "executor": self.executor,
+            "offloaded": self.offloaded,
+        }
@@ -1,12 +1,20 @@
 """Collection management tools for Qdrant Database API."""
 
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any, Optional
 
 from mcp.server import Server
-from mcp.types import Tool
 
 from .client import QdrantDatabaseClient
 
+if TYPE_CHECKING:
+    from .delta import ContentHashIndex
+
+# Input schema of a shard key of a custom-sharded collection
+SHARD_KEY_SCHEMA: dict[str, Any] = {"type": ["string", "integer"]}
+# Collection subpaths restoring a snapshot
+_RESTORE_PATHS = (["snapshots", "upload"], ["snapshots", "recover"])
+
 
 async def list_collections(client: QdrantDatabaseClient) -> dict[str, Any]:
     """List all collections in the database.
@@ -29,6 +37,60 @@ async def get_collection(client: QdrantDatabaseClient, collection_name: str) ->
     return await client.get(f"/collections/{collection_name}")
 
 
+def collection_vector_sizes(info: dict[str, Any]) -> dict[str, Optional[int]]:
+    """Vector names ("" for the unnamed vector) and sizes of a collection, None if sparse.
+
+    Args:
+        info: Result of get_collection
+    """
+    params = info.get("config", {}).get("params", {})
+    vectors = params.get("vectors") or {}
+    if "size" in vectors:
+        sizes: dict[str, Optional[int]] = {"": vectors["size"]}
+    else:
+        sizes = {name: config.get("size") for name, config in vectors.items()}
+    sizes.update(dict.fromkeys(params.get("sparse_vectors") or {}))
+    return sizes
+
+
+class VectorSizeCache:
+    """Vector sizes of collections, shared by upload checks and point resources.
+
+    Sizes are kept for ``ttl`` seconds and dropped when the collection is
+    created, updated, deleted or restored through the client (see observe).
+    """
+
+    def __init__(self, client: QdrantDatabaseClient, ttl: float = 300.0):
+        """Initialize vector size cache.
+
+        Args:
+            client: Qdrant database client
+            ttl: Seconds a collection's vector sizes are used
+        """
+        self.client = client
+        self.ttl = ttl
+        self._sizes: dict[str, tuple[float, dict[str, Optional[int]]]] = {}
+
+    def observe(self, method: str, path: str, body: Any, latency: float) -> None:
+        """Client request observer dropping the sizes of a collection whose config changed."""
+        segments = path.split("?")[0].strip("/").split("/")
+        if method == "GET" or len(segments) < 2 or segments[0] != "collections":
+            return
+        # Restoring a snapshot may replace the collection's config
+        if len(segments) == 2 or segments[2:] in _RESTORE_PATHS:
+            self._sizes.pop(segments[1], None)
+
+    async def sizes(self, collection_name: str) -> dict[str, Optional[int]]:
+        """Vector names of a collection ("" for the unnamed vector) and sizes, None if sparse."""
+        cached = self._sizes.get(collection_name)
+        if cached is not None and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+        info = (await get_collection(self.client, collection_name)).get("result", {})
+        sizes = collection_vector_sizes(info)
+        self._sizes[collection_name] = (time.monotonic(), sizes)
+        return sizes
+
+
 async def create_collection(
     client: QdrantDatabaseClient, collection_name: str, config: dict[str, Any]
 ) -> dict[str, Any]:
@@ -71,6 +133,53 @@ async def update_collection(
     return await client.patch(f"/collections/{collection_name}", json=updates)
 
 
+async def create_shard_key(
+    client: QdrantDatabaseClient,
+    collection_name: str,
+    shard_key: Any,
+    shards_number: Optional[int] = None,
+    replication_factor: Optional[int] = None,
+    placement: Optional[list[int]] = None,
+) -> dict[str, Any]:
+    """Create a shard key in a collection using custom sharding.
+
+    Args:
+        collection_name: Name of the collection
+        shard_key: Shard key to create (string or integer)
+        shards_number: Shards created for the key (default: the collection's shard_number)
+        replication_factor: Replicas of each shard (default: the collection's)
+        placement: Peer IDs to place the shards on (default: chosen by Qdrant)
+
+    Returns:
+        Creation result
+    """
+    body: dict[str, Any] = {"shard_key": shard_key}
+    if shards_number is not None:
+        body["shards_number"] = shards_number
+    if replication_factor is not None:
+        body["replication_factor"] = replication_factor
+    if placement is not None:
+        body["placement"] = placement
+    return await client.put(f"/collections/{collection_name}/shards", json=body)
+
+
+async def delete_shard_key(
+    client: QdrantDatabaseClient, collection_name: str, shard_key: Any
+) -> dict[str, Any]:
+    """Delete a shard key and all points stored under it.
+
+    Args:
+        collection_name: Name of the collection
+        shard_key: Shard key to delete
+
+    Returns:
+        Deletion result
+    """
+    return await client.post(
+        f"/collections/{collection_name}/shards/delete", json={"shard_key": shard_key}
+    )
+
+
 async def collection_exists(client: QdrantDatabaseClient, collection_name: str) -> dict[str, Any]:
     """Check if a collection exists.
 
@@ -83,13 +192,20 @@ async def collection_exists(client: QdrantDatabaseClient, collection_name: str)
     return await client.get(f"/collections/{collection_name}/exists")
 
 
-def register_collection_tools(server: Server, client: QdrantDatabaseClient, tools_list: list) -> None:
+def register_collection_tools(
+    server: Server,
+    client: QdrantDatabaseClient,
+    tools_list: list,
+    delta_index: Optional["ContentHashIndex"] = None,
+) -> None:
     """Register collection management tools with MCP server.
 
     Args:
         server: MCP server instance
         client: Qdrant database client
         tools_list: List to append tool definitions to
+        delta_index: Optional content hash index (dropped when a collection or shard
+            key is deleted)
     """
 
     from mcp.types import Tool
@@ -117,6 +233,13 @@ def register_collection_tools(server: Server, client: QdrantDatabaseClient, tool
             "properties": {
                 "collection_name": {"type": "string"},
                 "vectors": {"type": "object"},
+                "shard_keys": {
+                    "type": "array",
+                    "items": SHARD_KEY_SCHEMA,
+                    "description": (
+                        "Create the collection with custom sharding and these shard keys"
+                    ),
+                },
             },
             "required": ["collection_name", "vectors"],
         },
@@ -148,6 +271,33 @@ def register_collection_tools(server: Server, client: QdrantDatabaseClient, tool
             "required": ["collection_name"],
         },
     ))
+    tools_list.append(Tool(
+        name="qdrant_db_shard_keys_create",
+        description="Create a shard key in a collection using custom sharding",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "collection_name": {"type": "string"},
+                "shard_key": SHARD_KEY_SCHEMA,
+                "shards_number": {"type": "integer", "minimum": 1},
+                "replication_factor": {"type": "integer", "minimum": 1},
+                "placement": {"type": "array", "items": {"type": "integer"}},
+            },
+            "required": ["collection_name", "shard_key"],
+        },
+    ))
+    tools_list.append(Tool(
+        name="qdrant_db_shard_keys_delete",
+        description="Delete a shard key and all points stored under it",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "collection_name": {"type": "string"},
+                "shard_key": SHARD_KEY_SCHEMA,
+            },
+            "required": ["collection_name", "shard_key"],
+        },
+    ))
 
     @server.call_tool()
     async def qdrant_db_collections_list(arguments: dict[str, Any]) -> list[dict[str, Any]]:
@@ -176,12 +326,20 @@ def register_collection_tools(server: Server, client: QdrantDatabaseClient, tool
         Args:
             collection_name: Name for the new collection
             vectors: Vector configuration (size, distance metric)
+            shard_keys: Shard keys to create, using custom sharding (optional)
             Additional optional parameters for collection configuration
         """
         collection_name = arguments["collection_name"]
-        # Remove collection_name from arguments to get config
-        config = {k: v for k, v in arguments.items() if k != "collection_name"}
+        # Remove collection_name and shard_keys from arguments to get config
+        config = {
+            k: v for k, v in arguments.items() if k not in ("collection_name", "shard_keys")
+        }
+        shard_keys = arguments.get("shard_keys")
+        if shard_keys:
+            config["sharding_method"] = "custom"
         result = await create_collection(client, collection_name, config)
+        for shard_key in shard_keys or []:
+            await create_shard_key(client, collection_name, shard_key)
         return [{"type": "text", "text": str(result)}]
 
     @server.call_tool()
@@ -192,6 +350,8 @@ def register_collection_tools(server: Server, client: QdrantDatabaseClient, tool
             collection_name: Name of the collection to delete
         """
         collection_name = arguments["collection_name"]
+        if delta_index is not None:
+            await delta_index.forget(collection_name)
         result = await delete_collection(client, collection_name)
         return [{"type": "text", "text": str(result)}]
 
@@ -218,3 +378,39 @@ def register_collection_tools(server: Server, client: QdrantDatabaseClient, tool
         collection_name = arguments["collection_name"]
         result = await collection_exists(client, collection_name)
         return [{"type": "text", "text": str(result)}]
+
+    @server.call_tool()
+    async def qdrant_db_shard_keys_create(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Create a shard key in a collection using custom sharding.
+
+        Args:
+            collection_name: Name of the collection
+            shard_key: Shard key to create
+            shards_number: Shards created for the key (optional)
+            replication_factor: Replicas of each shard (optional)
+            placement: Peer IDs to place the shards on (optional)
+        """
+        result = await create_shard_key(
+            client,
+            arguments["collection_name"],
+            arguments["shard_key"],
+            arguments.get("shards_number"),
+            arguments.get("replication_factor"),
+            arguments.get("placement"),
+        )
+        return [{"type": "text", "text": str(result)}]
+
+    @server.call_tool()
+    async def qdrant_db_shard_keys_delete(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Delete a shard key and all points stored under it.
+
+        Args:
+            collection_name: Name of the collection
+            shard_key: Shard key to delete
+        """
+        collection_name = arguments["collection_name"]
+        if delta_index is not None:
+            # Hashes are not kept per shard key, so drop the collection's
+            await delta_index.forget(collection_name)
+        result = await delete_shard_key(client, collection_name, arguments["shard_key"])
+        return [{"type": "text", "text": str(result)}]
@@ -0,0 +1,193 @@
+"""Cached and approximate point counts for Qdrant Database API."""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from ..deadline import detached
+from .client import QdrantDatabaseClient, _collection_from_path
+from .filters import compile_filter
+from .limiter import is_read_request
+from .points import count_points, shard_selector
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry:
+    __slots__ = ("count", "exact", "fetched_at", "stale")
+
+    def __init__(self, count: int, exact: bool, fetched_at: float, stale: bool):
+        self.count = count
+        self.exact = exact
+        self.fetched_at = fetched_at
+        self.stale = stale
+
+
+class CountCache:
+    """Point counts cached per collection and canonical filter.
+
+    Entries expire after ``ttl`` seconds and are marked stale by any
+    successful write request to their collection made through the client
+    (see observe). A count started before such a write is stored as stale,
+    so it never masks the write for a full TTL.
+    """
+
+    def __init__(self, client: QdrantDatabaseClient, ttl: float = 30.0, max_entries: int = 1024):
+        """Initialize count cache.
+
+        Args:
+            client: Qdrant database client
+            ttl: Seconds a count is served from the cache
+            max_entries: Maximum number of cached counts (least recently used are evicted)
+        """
+        self.client = client
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._refreshing: dict[tuple[str, str], asyncio.Task[Any]] = {}
+
+    def observe(self, method: str, path: str, body: Any, latency: float) -> None:
+        """Client request observer invalidating counts after writes to a collection."""
+        if is_read_request(method, path):
+            return
+        collection_name = _collection_from_path(path)
+        if collection_name is not None:
+            self.invalidate(collection_name)
+
+    def invalidate(self, collection_name: str) -> None:
+        """Mark all cached counts of a collection as stale."""
+        self._generations[collection_name] = self._generations.get(collection_name, 0) + 1
+        for (name, _), entry in self._entries.items():
+            if name == collection_name:
+                entry.stale = True
+
+    def _fresh(self, entry: Optional[_Entry]) -> bool:
+        return (
+            entry is not None and not entry.stale and time.monotonic() - entry.fetched_at < self.ttl
+        )
+
+    async def _fetch(
+        self,
+        collection_name: str,
+        filter_key: str,
+        filter_: Any,
+        exact: bool,
+        shard_key: Any = None,
+    ) -> _Entry:
+        generation = self._generations.get(collection_name, 0)
+        started = time.monotonic()
+        response = await count_points(self.client, collection_name, filter_, exact, shard_key)
+        entry = _Entry(
+            response["result"]["count"],
+            exact,
+            started,
+            stale=self._generations.get(collection_name, 0) != generation,
+        )
+        key = (collection_name, filter_key)
+        current = self._entries.get(key)
+        # Never replace a fresh exact count with an approximate one
+        if exact or current is None or not current.exact or not self._fresh(current):
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def _refresh_in_background(
+        self, collection_name: str, filter_key: str, filter_: Any, shard_key: Any = None
+    ) -> None:
+        key = (collection_name, filter_key)
+        if key in self._refreshing:
+            return
+        task = detached().run(
+            asyncio.ensure_future, self._refresh(collection_name, filter_key, filter_, shard_key)
+        )
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _refresh(
+        self, collection_name: str, filter_key: str, filter_: Any, shard_key: Any = None
+    ) -> None:
+        try:
+            await self._fetch(collection_name, filter_key, filter_, True, shard_key)
+        except Exception as e:
+            logger.warning("Background recount of %s failed: %r", collection_name, e)
+
+    async def count(
+        self,
+        collection_name: str,
+        filter_: Optional[dict[str, Any]] = None,
+        exact: bool = True,
+        stale_ok: bool = False,
+        shard_key: Any = None,
+    ) -> dict[str, Any]:
+        """Count points, serving fresh counts from the cache.
+
+        Args:
+            collection_name: Name of the collection
+            filter_: Optional filter (equivalent filters share a cache entry)
+            exact: Require an exact count rather than Qdrant's estimate
+            stale_ok: Return a cached (possibly stale) or approximate count
+                immediately and refresh the exact count in the background
+            shard_key: Shard key(s) to count in (counts per shard key are cached apart)
+
+        Returns:
+            {"result": {"count": n}} plus whether the count is exact, cached,
+            stale, its age in seconds, and whether a recount is running
+        """
+        compiled = compile_filter(filter_)
+        filter_key = compiled.key
+        if shard_key is not None:
+            filter_key += "@" + json.dumps(shard_selector(shard_key)["shard_key"])
+        key = (collection_name, filter_key)
+        entry = self._entries.get(key)
+        usable = entry is not None and self._fresh(entry) and (entry.exact or not exact)
+        refreshing = False
+
+        if entry is not None and (usable or stale_ok):
+            self.hits += 1
+            self._entries.move_to_end(key)
+            cached = True
+        else:
+            self.misses += 1
+            # Without a cached value, stale_ok falls back to Qdrant's fast estimate
+            entry = await self._fetch(
+                collection_name, filter_key, compiled.filter, exact and not stale_ok, shard_key
+            )
+            cached = False
+        if stale_ok and not (entry.exact and self._fresh(entry)):
+            self._refresh_in_background(collection_name, filter_key, compiled.filter, shard_key)
+            refreshing = True
+
+        return {
+            "result": {"count": entry.count},
+            "exact": entry.exact,
+            "cached": cached,
+            "stale": not self._fresh(entry),
+            "age": round(time.monotonic() - entry.fetched_at, 3),
+            "refreshing": refreshing,
+        }
+
+    async def close(self) -> None:
+        """Cancel running background recounts."""
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return cache statistics as a plain dictionary."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshing": len(self._refreshing),
+            "ttl": self.ttl,
+            "max_entries": self.max_entries,
+        }
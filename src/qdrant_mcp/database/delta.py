@@ -0,0 +1,377 @@
+"""Content-hash delta upserts for Qdrant Database API."""
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import struct
+import threading
+import time
+import uuid
+from array import array
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from mcp.server import Server
+
+from .. import deadline
+from .client import QdrantDatabaseClient
+from .collections import get_collection
+from .points import scroll_points_stream, upsert_points
+
+# Max host parameters per SQLite statement is 999 on older builds
+_SQL_CHUNK = 500
+
+
+def _f32(x: float) -> float:
+    """Round a float to the nearest float32."""
+    value: float = struct.unpack("f", struct.pack("f", x))[0]
+    return value
+
+
+def _vector_bytes(vector: Any, normalize: bool) -> bytes:
+    """Encode a vector the way Qdrant stores it (float32, unit length for Cosine)."""
+    if isinstance(vector, list) and vector and isinstance(vector[0], list):
+        # Multivector
+        return b"".join(_vector_bytes(v, normalize) for v in vector)
+    if isinstance(vector, list):
+        values = array("f", vector)
+        if normalize:
+            # Qdrant normalizes the float32 vector in float32 arithmetic
+            squares = 0.0
+            for x in values:
+                squares = _f32(squares + x * x)
+            norm = _f32(math.sqrt(squares))
+            if norm > 0:
+                values = array("f", [x / norm for x in values])
+        return values.tobytes()
+    # Sparse vectors and anything else
+    return json.dumps(vector, sort_keys=True, separators=(",", ":")).encode()
+
+
+def content_hash(point: dict[str, Any], cosine: frozenset[str] = frozenset()) -> bytes:
+    """Hash the vector(s) and payload of a point.
+
+    Vectors are hashed as float32 and, for Cosine-distance vectors, after
+    normalization, so that points read back from Qdrant hash the same as the
+    points that were written.
+
+    Args:
+        point: Point with "vector" and optional "payload"
+        cosine: Vector names using Cosine distance ("" for the unnamed vector)
+
+    Returns:
+        16-byte digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    vector = point.get("vector")
+    if isinstance(vector, dict):
+        for name in sorted(vector):
+            digest.update(name.encode() + b"\0")
+            digest.update(_vector_bytes(vector[name], name in cosine))
+    elif vector is not None:
+        digest.update(_vector_bytes(vector, "" in cosine))
+    digest.update(b"\0payload\0")
+    digest.update(
+        json.dumps(point.get("payload") or {}, sort_keys=True, separators=(",", ":")).encode()
+    )
+    return digest.digest()
+
+
+def cosine_vector_names(collection_info: dict[str, Any]) -> frozenset[str]:
+    """Get the names of Cosine-distance vectors from a get_collection response."""
+    vectors = collection_info.get("result", {}).get("config", {}).get("params", {}).get("vectors")
+    if not isinstance(vectors, dict):
+        return frozenset()
+    if "distance" in vectors:
+        return frozenset({""}) if vectors["distance"] == "Cosine" else frozenset()
+    return frozenset(
+        name
+        for name, params in vectors.items()
+        if isinstance(params, dict) and params.get("distance") == "Cosine"
+    )
+
+
+def _point_key(point_id: Any) -> str:
+    if isinstance(point_id, str):
+        # UUIDs in any spelling Qdrant accepts map to the form it returns
+        point_id = str(uuid.UUID(point_id))
+    return json.dumps(point_id)
+
+
+class ContentHashIndex:
+    """Local SQLite index of point ID -> content hash, per endpoint and collection."""
+
+    def __init__(self, path: str, endpoint: str):
+        """Initialize content hash index.
+
+        The database is opened on first use.
+
+        Args:
+            path: SQLite database file path
+            endpoint: Qdrant endpoint the hashes belong to
+        """
+        self.path = os.path.expanduser(path)
+        self.endpoint = endpoint
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS point_hashes ("
+                " scope TEXT NOT NULL, point_id TEXT NOT NULL, hash BLOB NOT NULL,"
+                " PRIMARY KEY (scope, point_id)) WITHOUT ROWID"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _scope(self, collection_name: str) -> str:
+        return f"{self.endpoint}/collections/{collection_name}"
+
+    def _lookup(self, collection_name: str, keys: list[str]) -> dict[str, bytes]:
+        scope = self._scope(collection_name)
+        found: dict[str, bytes] = {}
+        with self._lock:
+            conn = self._connect()
+            for i in range(0, len(keys), _SQL_CHUNK):
+                chunk = keys[i : i + _SQL_CHUNK]
+                rows = conn.execute(
+                    "SELECT point_id, hash FROM point_hashes WHERE scope = ? AND point_id IN "
+                    f"({','.join('?' * len(chunk))})",
+                    [scope, *chunk],
+                )
+                found.update(rows)
+        return found
+
+    def _store(self, collection_name: str, items: Iterable[tuple[str, bytes]]) -> None:
+        scope = self._scope(collection_name)
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO point_hashes (scope, point_id, hash) VALUES (?, ?, ?)",
+                    ((scope, key, digest) for key, digest in items),
+                )
+
+    def _forget(self, collection_name: str, keys: Optional[list[str]]) -> None:
+        scope = self._scope(collection_name)
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                if keys is None:
+                    conn.execute("DELETE FROM point_hashes WHERE scope = ?", (scope,))
+                    return
+                for i in range(0, len(keys), _SQL_CHUNK):
+                    chunk = keys[i : i + _SQL_CHUNK]
+                    conn.execute(
+                        "DELETE FROM point_hashes WHERE scope = ? AND point_id IN "
+                        f"({','.join('?' * len(chunk))})",
+                        [scope, *chunk],
+                    )
+
+    def _count(self, collection_name: str) -> int:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT COUNT(*) FROM point_hashes WHERE scope = ?",
+                    (self._scope(collection_name),),
+                )
+                .fetchone()
+            )
+        return int(row[0])
+
+    async def changed(
+        self, collection_name: str, points: list[dict[str, Any]], cosine: frozenset[str]
+    ) -> tuple[list[dict[str, Any]], list[tuple[str, bytes]]]:
+        """Split out the points whose content differs from the index.
+
+        Returns:
+            Changed points and their (key, hash) pairs to store after upserting
+        """
+        hashed = [(_point_key(p["id"]), content_hash(p, cosine), p) for p in points]
+        known = await asyncio.to_thread(self._lookup, collection_name, [k for k, _, _ in hashed])
+        changed = [(k, h, p) for k, h, p in hashed if known.get(k) != h]
+        return [p for _, _, p in changed], [(k, h) for k, h, _ in changed]
+
+    async def store(self, collection_name: str, items: list[tuple[str, bytes]]) -> None:
+        """Record content hashes for points that were written."""
+        await asyncio.to_thread(self._store, collection_name, items)
+
+    async def forget(self, collection_name: str, point_ids: Optional[list[Any]] = None) -> None:
+        """Drop hashes for some points, or for the whole collection if point_ids is None."""
+        keys = None if point_ids is None else [_point_key(i) for i in point_ids]
+        await asyncio.to_thread(self._forget, collection_name, keys)
+
+    async def count(self, collection_name: str) -> int:
+        """Number of points tracked for a collection."""
+        return await asyncio.to_thread(self._count, collection_name)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+async def delta_upsert_points(
+    client: QdrantDatabaseClient,
+    index: ContentHashIndex,
+    collection_name: str,
+    points: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Upsert only the points that are new or whose vector/payload changed.
+
+    Args:
+        collection_name: Name of the collection
+        points: List of points to upsert
+
+    Returns:
+        Counts of sent and skipped points, and the upsert result if one was sent
+    """
+    cosine = cosine_vector_names(await get_collection(client, collection_name))
+    changed, hashes = await index.changed(collection_name, points, cosine)
+    result = None
+    if changed:
+        result = await upsert_points(client, collection_name, changed)
+        await index.store(collection_name, hashes)
+    return {"upserted": len(changed), "skipped": len(points) - len(changed), "result": result}
+
+
+async def reconcile_index(
+    client: QdrantDatabaseClient,
+    index: ContentHashIndex,
+    collection_name: str,
+    batch_size: int = 256,
+    offset: Any | None = None,
+) -> dict[str, Any]:
+    """Rebuild the content hash index of a collection from a full scroll.
+
+    Stops at a page boundary if the tool call's deadline would not leave time
+    for another page; pass the returned next_page_offset to resume.
+
+    Args:
+        collection_name: Name of the collection
+        batch_size: Points per scroll page
+        offset: Scroll offset to resume from (None starts over and clears the index)
+
+    Returns:
+        Number of points indexed, whether the scroll completed, and the resume offset
+    """
+    cosine = cosine_vector_names(await get_collection(client, collection_name))
+    if offset is None:
+        await index.forget(collection_name)
+    indexed = 0
+    page_seconds = 0.0
+    while True:
+        if indexed and not deadline.has_time_for(2 * page_seconds):
+            return {
+                "collection_name": collection_name,
+                "indexed": indexed,
+                "completed": False,
+                "next_page_offset": offset,
+            }
+        started = time.monotonic()
+        # Hash points as they are parsed; only the hashes of a page are kept
+        async with scroll_points_stream(
+            client, collection_name, batch_size, offset, with_vector=True
+        ) as points:
+            hashes = [(_point_key(p["id"]), content_hash(p, cosine)) async for p in points]
+        await index.store(collection_name, hashes)
+        page_seconds = time.monotonic() - started
+        indexed += len(hashes)
+        offset = points.rest.get("result", {}).get("next_page_offset")
+        if offset is None:
+            break
+    return {
+        "collection_name": collection_name,
+        "indexed": indexed,
+        "completed": True,
+        "next_page_offset": None,
+    }
+
+
+def register_delta_tools(
+    server: Server, client: QdrantDatabaseClient, tools_list: list, index: ContentHashIndex
+) -> None:
+    """Register content hash index tools with MCP server.
+
+    Args:
+        server: MCP server instance
+        client: Qdrant database client
+        tools_list: List to append tool definitions to
+        index: Content hash index used by delta upserts
+    """
+    from mcp.types import Tool
+
+    # Define tools
+    tools_list.extend(
+        [
+            Tool(
+                name="qdrant_db_points_delta_reconcile",
+                description=(
+                    "Rebuild the local content hash index used by delta upserts "
+                    "from a full scroll of the collection"
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "collection_name": {"type": "string"},
+                        "batch_size": {"type": "integer", "default": 256},
+                        "offset": {"type": ["string", "integer", "null"]},
+                    },
+                    "required": ["collection_name"],
+                },
+            ),
+            Tool(
+                name="qdrant_db_points_delta_status",
+                description="Get the number of points tracked by the delta upsert index",
+                inputSchema={
+                    "type": "object",
+                    "properties": {"collection_name": {"type": "string"}},
+                    "required": ["collection_name"],
+                },
+            ),
+        ]
+    )
+
+    @server.call_tool()
+    async def qdrant_db_points_delta_reconcile(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Rebuild the content hash index from a streaming scroll.
+
+        Args:
+            collection_name: Name of the collection
+            batch_size: Points per scroll page (default: 256)
+            offset: Resume offset from a previous incomplete run (optional)
+        """
+        result = await reconcile_index(
+            client,
+            index,
+            arguments["collection_name"],
+            arguments.get("batch_size", 256),
+            arguments.get("offset"),
+        )
+        return [{"type": "text", "text": str(result)}]
+
+    @server.call_tool()
+    async def qdrant_db_points_delta_status(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Get the number of points tracked by the delta index.
+
+        Args:
+            collection_name: Name of the collection
+        """
+        collection_name = arguments["collection_name"]
+        result = {
+            "collection_name": collection_name,
+            "tracked_points": await index.count(collection_name),
+            "index_path": index.path,
+        }
+        return [{"type": "text", "text": str(result)}]
@@ -0,0 +1,274 @@
+"""Offline recall and latency evaluation for Qdrant Database API."""
+
+import ast
+import asyncio
+import json
+import math
+import os
+import struct
+import time
+from array import array
+from typing import Any, Optional
+
+from mcp.server import Server
+
+from ..jobs import report_progress
+from ..paths import resolve_path
+from .client import QdrantDatabaseClient
+from .collections import get_collection
+from .tuning import query_vector, recall_at_k, sample_points, search_neighbour_ids
+
+_NPY_MAGIC = b"\x93NUMPY"
+_NPY_TYPES = {"<f4": "f", "<f8": "d"}
+
+
+def load_npy(path: str) -> list[list[float]]:
+    """Load a 2-D float32/float64 C-order .npy file as a list of query vectors.
+
+    Raises:
+        ValueError: If the file is not a supported .npy array
+    """
+    with open(os.path.expanduser(path), "rb") as f:
+        if f.read(6) != _NPY_MAGIC:
+            raise ValueError(f"{path} is not a .npy file")
+        major = f.read(2)[0]
+        (header_len,) = struct.unpack("<H" if major == 1 else "<I", f.read(2 if major == 1 else 4))
+        header = ast.literal_eval(f.read(header_len).decode("latin1"))
+        dtype, shape = header["descr"], header["shape"]
+        if dtype not in _NPY_TYPES or header["fortran_order"] or len(shape) != 2:
+            raise ValueError(
+                f"{path}: expected a 2-D C-order float32/float64 array, got {dtype} {shape}"
+            )
+        values = array(_NPY_TYPES[dtype])
+        values.frombytes(f.read())
+    rows, dim = shape
+    if len(values) != rows * dim:
+        raise ValueError(f"{path}: truncated data for shape {shape}")
+    return [list(values[i * dim : (i + 1) * dim]) for i in range(rows)]
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Percentile of values with linear interpolation between closest ranks."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * p / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def reciprocal_rank(found: list[Any], truth: list[Any]) -> float:
+    """1/rank at which the true nearest neighbour was found (0 if it was not)."""
+    if not truth:
+        return 1.0
+    try:
+        return 1.0 / (found.index(truth[0]) + 1)
+    except ValueError:
+        return 0.0
+
+
+def latency_summary(seconds: list[float]) -> dict[str, float]:
+    """Mean and percentile latencies in milliseconds."""
+    ms = [1000 * s for s in seconds]
+    return {
+        "mean": round(sum(ms) / len(ms), 3) if ms else 0.0,
+        **{f"p{p}": round(percentile(ms, p), 3) for p in (50, 90, 95, 99)},
+    }
+
+
+async def evaluate_search(
+    client: QdrantDatabaseClient,
+    collection_name: str,
+    param_sets: Optional[list[dict[str, Any]]] = None,
+    queries_path: Optional[str] = None,
+    sample_size: int = 100,
+    k: int = 10,
+    batch_size: int = 1,
+    concurrency: int = 4,
+    vector_name: Optional[str] = None,
+    filter_: Optional[dict[str, Any]] = None,
+    output_path: Optional[str] = None,
+) -> dict[str, Any]:
+    """Measure recall@k, MRR and latency percentiles of search parameter settings.
+
+    Exact searches (the ground truth) and the searches of every parameter
+    setting run concurrently, ``concurrency`` batches at a time. Latency
+    percentiles are over batches, divided by the batch size, so keep
+    ``batch_size`` at 1 to measure single-query latency.
+
+    Args:
+        collection_name: Name of the collection
+        param_sets: Search params per setting (default: the collection's defaults)
+        queries_path: .npy file of query vectors (default: random sample of points)
+        sample_size: Number of points sampled as queries without a .npy file
+        k: Number of neighbours compared
+        batch_size: Queries per search_batch request
+        concurrency: Batches in flight at once
+        vector_name: Named vector to search
+        filter_: Optional filter applied to every query
+        output_path: Write the report as JSON to this file
+
+    Returns:
+        Report with the collection's index configuration and one result per setting
+    """
+    param_sets = param_sets or [{}]
+    if queries_path:
+        vectors = await asyncio.to_thread(load_npy, queries_path)
+        queries: list[tuple[Any, Any]] = [
+            (None, v if vector_name is None else {"name": vector_name, "vector": v})
+            for v in vectors
+        ]
+        source = queries_path
+    else:
+        points = await sample_points(
+            client,
+            collection_name,
+            sample_size,
+            filter_=filter_,
+            with_vector=[vector_name] if vector_name else True,
+        )
+        queries = [(p["id"], query_vector(p, vector_name)) for p in points]
+        source = "sampled"
+    if not queries:
+        raise ValueError(f"No queries to evaluate {collection_name} with")
+
+    batches = [queries[i : i + batch_size] for i in range(0, len(queries), batch_size)]
+    settings = [{"exact": True}, *param_sets]
+    found: list[list[list[Any]]] = [[[] for _ in queries] for _ in settings]
+    seconds: list[list[float]] = [[] for _ in settings]
+    slots = asyncio.Semaphore(concurrency)
+    done = 0
+
+    async def run(setting: int, batch: int) -> None:
+        nonlocal done
+        async with slots:
+            ids, elapsed = await search_neighbour_ids(
+                client, collection_name, batches[batch], k, settings[setting], filter_
+            )
+        start = batch * batch_size
+        found[setting][start : start + len(ids)] = ids
+        seconds[setting].append(elapsed / len(ids))
+        done += 1
+        report_progress(done, len(settings) * len(batches))
+
+    await asyncio.gather(*(run(s, b) for b in range(len(batches)) for s in range(len(settings))))
+
+    truth = found[0]
+    results = []
+    for setting in range(1, len(settings)):
+        pairs = list(zip(found[setting], truth, strict=True))
+        results.append(
+            {
+                "params": settings[setting],
+                f"recall@{k}": round(sum(recall_at_k(f, t, k) for f, t in pairs) / len(pairs), 4),
+                "mrr": round(sum(reciprocal_rank(f, t) for f, t in pairs) / len(pairs), 4),
+                "latency_ms": latency_summary(seconds[setting]),
+            }
+        )
+
+    config = (await get_collection(client, collection_name)).get("result", {}).get("config", {})
+    report = {
+        "collection_name": collection_name,
+        "evaluated_at": time.time(),
+        "collection_config": {
+            key: config.get(key)
+            for key in ("params", "hnsw_config", "quantization_config", "optimizer_config")
+        },
+        "queries": len(queries),
+        "query_source": source,
+        "k": k,
+        "batch_size": batch_size,
+        "exact_latency_ms": latency_summary(seconds[0]),
+        "results": results,
+    }
+    if output_path:
+        path = os.path.expanduser(output_path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+def register_evaluation_tools(
+    server: Server,
+    client: QdrantDatabaseClient,
+    tools_list: list,
+    evaluation_dir: str = "~/.cache/qdrant-fabric/evaluations",
+) -> None:
+    """Register search evaluation tools with MCP server.
+
+    Args:
+        server: MCP server instance
+        client: Qdrant database client
+        tools_list: List to append tool definitions to
+        evaluation_dir: Directory of query files and evaluation reports
+    """
+    from mcp.types import Tool
+
+    # Define tools
+    tools_list.extend(
+        [
+            Tool(
+                name="qdrant_db_search_evaluate",
+                description=(
+                    "Evaluate recall@k, MRR and latency percentiles of search parameter settings "
+                    "against exact search, using a .npy query file or sampled points"
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "collection_name": {"type": "string"},
+                        "param_sets": {"type": "array", "items": {"type": "object"}},
+                        "queries_path": {
+                            "type": "string",
+                            "description": ".npy file in the evaluation directory",
+                        },
+                        "sample_size": {"type": "integer", "default": 100},
+                        "k": {"type": "integer", "default": 10},
+                        "batch_size": {"type": "integer", "default": 1},
+                        "concurrency": {"type": "integer", "default": 4},
+                        "vector_name": {"type": "string"},
+                        "filter": {"type": "object"},
+                        "output_path": {
+                            "type": "string",
+                            "description": "JSON report file in the evaluation directory",
+                        },
+                    },
+                    "required": ["collection_name"],
+                },
+            ),
+        ]
+    )
+
+    @server.call_tool()
+    async def qdrant_db_search_evaluate(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Evaluate search quality and latency.
+
+        Args:
+            collection_name: Name of the collection
+            param_sets: Search params per setting, e.g. [{"hnsw_ef": 64}] (optional)
+            queries_path: .npy file under evaluation_dir (optional, default: sampled points)
+            sample_size: Points sampled as queries (default: 100)
+            k: Number of neighbours compared (default: 10)
+            batch_size: Queries per search_batch request (default: 1)
+            concurrency: Batches in flight at once (default: 4)
+            vector_name: Named vector to search (optional)
+            filter: Filter applied to every query (optional)
+            output_path: JSON report file under evaluation_dir (optional)
+        """
+        queries_path = arguments.get("queries_path")
+        output_path = arguments.get("output_path")
+        result = await evaluate_search(
+            client,
+            arguments["collection_name"],
+            param_sets=arguments.get("param_sets"),
+            queries_path=queries_path and resolve_path(evaluation_dir, queries_path),
+            sample_size=arguments.get("sample_size", 100),
+            k=arguments.get("k", 10),
+            batch_size=arguments.get("batch_size", 1),
+            concurrency=arguments.get("concurrency", 4),
+            vector_name=arguments.get("vector_name"),
+            filter_=arguments.get("filter"),
+            output_path=output_path and resolve_path(evaluation_dir, output_path),
+        )
+        return [{"type": "text", "text": str(result)}]
@@ -0,0 +1,343 @@
+"""Filter validation and canonicalization for Qdrant Database API."""
+
+import json
+from functools import lru_cache
+from typing import Annotated, Any, Optional, Union
+
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Discriminator,
+    Field,
+    StrictBool,
+    StrictInt,
+    StrictStr,
+    Tag,
+    ValidationError,
+    model_validator,
+)
+
+_CLAUSES = ("must", "should", "must_not")
+_CONDITION_KINDS = ("key", "is_empty", "is_null", "has_id", "has_vector", "nested")
+_MATCH_KINDS = ("value", "text", "any", "except", "phrase", "text_any")
+_FIELD_CONDITIONS = (
+    "match",
+    "range",
+    "geo_bounding_box",
+    "geo_radius",
+    "geo_polygon",
+    "values_count",
+    "is_empty",
+    "is_null",
+)
+
+
+def _kind(kinds: tuple[str, ...], default: str) -> Any:
+    """Discriminator picking a union member by which distinguishing key is present."""
+
+    def discriminate(value: Any) -> Optional[str]:
+        if isinstance(value, dict):
+            keys: Any = value
+        elif isinstance(value, BaseModel):
+            keys = value.model_fields_set
+        else:
+            return None
+        return next((kind for kind in kinds if kind in keys), default)
+
+    return Discriminator(discriminate)
+
+
+class FilterError(ValueError):
+    """Raised when a filter is malformed."""
+
+
+class _Model(BaseModel):
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+
+
+class MatchValue(_Model):
+    value: Union[StrictBool, StrictInt, StrictStr]
+
+
+class MatchText(_Model):
+    text: str
+
+
+class MatchPhrase(_Model):
+    phrase: str
+
+
+class MatchTextAny(_Model):
+    text_any: str
+
+
+class MatchAny(_Model):
+    any: Union[list[StrictInt], list[StrictStr]]
+
+
+class MatchExcept(_Model):
+    except_: Union[list[StrictInt], list[StrictStr]] = Field(alias="except")
+
+
+class Range(_Model):
+    lt: Optional[Union[float, str]] = None
+    gt: Optional[Union[float, str]] = None
+    gte: Optional[Union[float, str]] = None
+    lte: Optional[Union[float, str]] = None
+
+
+class ValuesCount(_Model):
+    lt: Optional[int] = None
+    gt: Optional[int] = None
+    gte: Optional[int] = None
+    lte: Optional[int] = None
+
+
+class GeoPoint(_Model):
+    lon: float
+    lat: float
+
+
+class GeoBoundingBox(_Model):
+    top_left: GeoPoint
+    bottom_right: GeoPoint
+
+
+class GeoRadius(_Model):
+    center: GeoPoint
+    radius: float
+
+
+class GeoLineString(_Model):
+    points: list[GeoPoint]
+
+
+class GeoPolygon(_Model):
+    exterior: GeoLineString
+    interiors: Optional[list[GeoLineString]] = None
+
+
+Match = Annotated[
+    Union[
+        Annotated[MatchValue, Tag("value")],
+        Annotated[MatchText, Tag("text")],
+        Annotated[MatchAny, Tag("any")],
+        Annotated[MatchExcept, Tag("except")],
+        Annotated[MatchPhrase, Tag("phrase")],
+        Annotated[MatchTextAny, Tag("text_any")],
+    ],
+    _kind(_MATCH_KINDS, "value"),
+]
+
+
+class FieldCondition(_Model):
+    key: str
+    match: Optional[Match] = None
+    range: Optional[Range] = None
+    geo_bounding_box: Optional[GeoBoundingBox] = None
+    geo_radius: Optional[GeoRadius] = None
+    geo_polygon: Optional[GeoPolygon] = None
+    values_count: Optional[ValuesCount] = None
+    is_empty: Optional[StrictBool] = None
+    is_null: Optional[StrictBool] = None
+
+    @model_validator(mode="after")
+    def _one_condition(self) -> "FieldCondition":
+        given = [name for name in _FIELD_CONDITIONS if getattr(self, name) is not None]
+        if len(given) != 1:
+            raise ValueError(
+                f"field condition on '{self.key}' needs exactly one of "
+                f"{', '.join(_FIELD_CONDITIONS)} (got {given or 'none'})"
+            )
+        return self
+
+
+class PayloadField(_Model):
+    key: str
+
+
+class IsEmptyCondition(_Model):
+    is_empty: PayloadField
+
+
+class IsNullCondition(_Model):
+    is_null: PayloadField
+
+
+class HasIdCondition(_Model):
+    has_id: list[Union[StrictInt, StrictStr]]
+
+
+class HasVectorCondition(_Model):
+    has_vector: str
+
+
+class Nested(_Model):
+    key: str
+    filter: "Filter"
+
+
+class NestedCondition(_Model):
+    nested: Nested
+
+
+Condition = Annotated[
+    Union[
+        Annotated[FieldCondition, Tag("key")],
+        Annotated[IsEmptyCondition, Tag("is_empty")],
+        Annotated[IsNullCondition, Tag("is_null")],
+        Annotated[HasIdCondition, Tag("has_id")],
+        Annotated[HasVectorCondition, Tag("has_vector")],
+        Annotated[NestedCondition, Tag("nested")],
+        Annotated["Filter", Tag("filter")],
+    ],
+    _kind(_CONDITION_KINDS, "filter"),
+]
+
+
+# A clause takes a list of conditions or a single condition
+Clause = Annotated[list[Condition], BeforeValidator(lambda v: [v] if isinstance(v, dict) else v)]
+
+
+class MinShould(_Model):
+    conditions: list[Condition]
+    min_count: int = Field(ge=0)
+
+
+class Filter(_Model):
+    """Qdrant filter: boolean clauses over conditions, nestable."""
+
+    must: Optional[Clause] = None
+    should: Optional[Clause] = None
+    must_not: Optional[Clause] = None
+    min_should: Optional[MinShould] = None
+
+
+Nested.model_rebuild()
+MinShould.model_rebuild()
+Filter.model_rebuild()
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def _only(filter_: dict[str, Any]) -> Optional[str]:
+    """Name of the single clause a filter uses, if it uses exactly one."""
+    return next(iter(filter_)) if len(filter_) == 1 and next(iter(filter_)) in _CLAUSES else None
+
+
+def _canonical_condition(condition: dict[str, Any]) -> dict[str, Any]:
+    if any(clause in condition for clause in (*_CLAUSES, "min_should")) or not condition:
+        return _canonical_filter(condition)
+    if "nested" in condition:
+        nested = condition["nested"]
+        return {"nested": {"key": nested["key"], "filter": _canonical_filter(nested["filter"])}}
+    if "has_id" in condition:
+        return {"has_id": sorted(set(condition["has_id"]), key=_dumps)}
+    match = condition.get("match")
+    if isinstance(match, dict):
+        for kind in ("any", "except"):
+            if kind in match:
+                return {**condition, "match": {kind: sorted(set(match[kind]), key=_dumps)}}
+    return condition
+
+
+def _canonical_filter(filter_: dict[str, Any]) -> dict[str, Any]:
+    """Canonicalize a validated filter dict.
+
+    Sub-filters that are equivalent to their parent's clause are spliced in
+    (AND of AND, OR of OR, NOT of OR), single-condition wrappers are unwrapped,
+    a lone should condition becomes a must condition, and each clause is
+    deduplicated and sorted. An empty sub-filter matches everything: it is
+    dropped from must, where it has no effect, but kept in should and
+    must_not, where it decides the result.
+    """
+    clauses: dict[str, list[dict[str, Any]]] = {clause: [] for clause in _CLAUSES}
+    for clause in _CLAUSES:
+        conditions = filter_.get(clause)
+        if conditions is None:
+            continue
+        if isinstance(conditions, dict):
+            conditions = [conditions]
+        for condition in conditions:
+            condition = _canonical_condition(condition)
+            inner = _only(condition)
+            if inner is not None and (
+                (clause, inner) in (("must", "must"), ("should", "should"), ("must_not", "should"))
+            ):
+                clauses[clause] += condition[inner]
+            elif inner == "must_not" and clause == "must":
+                clauses["must_not"] += condition["must_not"]
+            elif inner in ("must", "should") and len(condition[inner]) == 1:
+                clauses[clause].append(condition[inner][0])
+            elif condition or clause != "must":
+                clauses[clause].append(condition)
+
+    if len(clauses["should"]) == 1:
+        clauses["must"] += clauses["should"]
+        clauses["should"] = []
+
+    result: dict[str, Any] = {}
+    for clause in _CLAUSES:
+        unique = {_dumps(c): c for c in clauses[clause]}
+        if unique:
+            result[clause] = [unique[key] for key in sorted(unique)]
+    min_should = filter_.get("min_should")
+    if min_should is not None:
+        unique = {_dumps(c): c for c in map(_canonical_condition, min_should["conditions"])}
+        result["min_should"] = {
+            "conditions": [unique[key] for key in sorted(unique)],
+            "min_count": min_should["min_count"],
+        }
+    return result
+
+
+class CompiledFilter:
+    """A validated, canonical filter and its cache key. Treat as immutable."""
+
+    __slots__ = ("filter", "key")
+
+    def __init__(self, filter_: Optional[dict[str, Any]]):
+        self.filter = filter_
+        self.key = _dumps(filter_) if filter_ is not None else ""
+
+
+@lru_cache(maxsize=1024)
+def _compile(raw: str) -> CompiledFilter:
+    try:
+        Filter.model_validate_json(raw)
+    except ValidationError as e:
+        problems = "; ".join(
+            f"{'.'.join(map(str, error['loc'])) or 'filter'}: {error['msg']}"
+            for error in e.errors()
+        )
+        raise FilterError(f"Invalid filter: {problems}") from e
+    # Canonicalize the input as given, so numbers keep their JSON types
+    canonical = _canonical_filter(json.loads(raw))
+    return CompiledFilter(canonical or None)
+
+
+def compile_filter(filter_: Optional[dict[str, Any]]) -> CompiledFilter:
+    """Validate and canonicalize a filter, reusing the result for identical filters.
+
+    Args:
+        filter_: Filter in Qdrant JSON form, or None
+
+    Returns:
+        Compiled filter; its ``filter`` is None when the filter matches everything
+
+    Raises:
+        FilterError: If the filter is malformed
+    """
+    if not filter_:
+        return CompiledFilter(None)
+    if not isinstance(filter_, dict):
+        raise FilterError(f"Invalid filter: expected an object, got {type(filter_).__name__}")
+    return _compile(_dumps(filter_))
+
+
+def canonical_filter(filter_: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
+    """Validate and canonicalize a filter (see compile_filter)."""
+    return compile_filter(filter_).filter
@@ -60,6 +60,28 @@ async def metrics(client: QdrantDatabaseClient) -> str:
     return response.text
 
 
+def circuit_state(client: QdrantDatabaseClient) -> dict[str, Any]:
+    """Get circuit breaker state for the database endpoint and its collections.
+
+    Returns:
+        Breaker state per scope
+    """
+    if client.breakers is None:
+        return {"enabled": False}
+    return {"enabled": True, **client.breakers.snapshot()}
+
+
+def concurrency_state(client: QdrantDatabaseClient) -> dict[str, Any]:
+    """Get adaptive concurrency limits for read and write requests.
+
+    Returns:
+        Current limit, in-flight and queued requests per class
+    """
+    if client.limits is None:
+        return {"enabled": False}
+    return {"enabled": True, **client.limits.snapshot()}
+
+
 def register_health_tools(server: Server, client: QdrantDatabaseClient, tools_list: list) -> None:
     """Register health check tools with MCP server.
 
@@ -97,6 +119,16 @@ def register_health_tools(server: Server, client: QdrantDatabaseClient, tools_li
             description="Get Prometheus metrics from Qdrant",
             inputSchema={"type": "object", "properties": {}, "required": []},
         ),
+        Tool(
+            name="qdrant_db_health_circuit",
+            description="Get circuit breaker state (closed/open/half_open) per endpoint and collection",
+            inputSchema={"type": "object", "properties": {}, "required": []},
+        ),
+        Tool(
+            name="qdrant_db_health_concurrency",
+            description="Get adaptive concurrency limits and queue depths for reads and writes",
+            inputSchema={"type": "object", "properties": {}, "required": []},
+        ),
     ])
 
     @server.call_tool()
@@ -143,3 +175,21 @@ def register_health_tools(server: Server, client: QdrantDatabaseClient, tools_li
         """
         result = await metrics(client)
         return [{"type": "text", "text": result}]
+
+    @server.call_tool()
+    async def qdrant_db_health_circuit(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Get circuit breaker state.
+
+        Returns state, error and slow-call rates, and retry time per breaker.
+        """
+        result = circuit_state(client)
+        return [{"type": "text", "text": str(result)}]
+
+    @server.call_tool()
+    async def qdrant_db_health_concurrency(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Get adaptive concurrency limits.
+
+        Returns the current limit, in-flight and queued requests for reads and writes.
+        """
+        result = concurrency_state(client)
+        return [{"type": "text", "text": str(result)}]
@@ -4,6 +4,7 @@ from typing import Any
 
 from mcp.server import Server
 
+from ..jobs import current_job, record_operation
 from .client import QdrantDatabaseClient
 
 
@@ -12,6 +13,7 @@ async def create_field_index(
     collection_name: str,
     field_name: str,
     field_schema: dict[str, Any] | None = None,
+    wait: bool = False,
 ) -> dict[str, Any]:
     """Create an index for a payload field.
 
@@ -19,6 +21,7 @@ async def create_field_index(
         collection_name: Name of the collection
         field_name: Name of the field to index
         field_schema: Optional field schema (type, indexing parameters)
+        wait: Wait until the index is built instead of only acknowledged
 
     Returns:
         Index creation result
@@ -26,7 +29,8 @@ async def create_field_index(
     body: dict[str, Any] = {"field_name": field_name}
     if field_schema:
         body["field_schema"] = field_schema
-    return await client.put(f"/collections/{collection_name}/index", json=body)
+    params = {"wait": "true"} if wait else None
+    return await client.put(f"/collections/{collection_name}/index", json=body, params=params)
 
 
 async def delete_field_index(
@@ -94,12 +98,15 @@ def register_index_tools(server: Server, client: QdrantDatabaseClient, tools_lis
             field_name: Name of the field to index
             field_schema: Optional field schema configuration
         """
+        # As a background job, finish only once the index is built
         result = await create_field_index(
             client,
             arguments["collection_name"],
             arguments["field_name"],
             arguments.get("field_schema"),
+            wait=current_job() is not None,
         )
+        record_operation(result)
         return [{"type": "text", "text": str(result)}]
 
     @server.call_tool()
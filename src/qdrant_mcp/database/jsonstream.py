@@ -0,0 +1,146 @@
+"""Incremental parsing of the items of one array in a streamed JSON response."""
+
+import codecs
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+# Characters that may follow a complete value in valid JSON
+_AFTER_VALUE = _WHITESPACE + ",:]}"
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """Pull-based reader over a stream of byte chunks, keeping only unparsed text."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    async def fill(self) -> bool:
+        """Read the next chunk, dropping consumed text; False at the end of the stream."""
+        if self.eof:
+            return False
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self.eof = True
+            chunk = b""
+        self.text = self.text[self.pos :] + self._utf8.decode(chunk, final=self.eof)
+        self.pos = 0
+        return True
+
+    async def peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not await self.fill():
+                raise ValueError("Unexpected end of JSON stream")
+
+    async def take(self, expected: str) -> str:
+        """Consume the next non-whitespace character, which must be one of expected."""
+        char = await self.peek()
+        if char not in expected:
+            raise ValueError(f"Expected one of {expected!r} in JSON stream, got {char!r}")
+        self.pos += 1
+        return char
+
+    async def value(self) -> Any:
+        """Decode the next complete JSON value.
+
+        A number may be cut short at the end of the buffered text ("0." of
+        "0.25"), so a value is only accepted once the character after it is
+        buffered and may follow a value, or at the end of the stream. After a
+        failed attempt the buffer is at least doubled before retrying, which
+        keeps values spanning many chunks linear to parse.
+        """
+        await self.peek()
+        while True:
+            attempted = len(self.text) - self.pos
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+                if self.eof or (end < len(self.text) and self.text[end] in _AFTER_VALUE):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            while len(self.text) - self.pos < 2 * attempted and await self.fill():
+                pass
+
+
+class ItemStream:
+    """Async iterator over the items of the array at ``item_path`` in a JSON stream.
+
+    Everything else in the document is collected into ``rest`` (complete once
+    the iteration ends), e.g. ``{"result": {"next_page_offset": 42}, "status": "ok"}``
+    for the path ("result", "points") of a scroll response. Only the text of
+    the item being parsed is held in memory, however large the array.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes], item_path: tuple[str, ...]):
+        """Initialize item stream.
+
+        Args:
+            chunks: Response body chunks
+            item_path: Object keys leading to the array
+        """
+        self.item_path = item_path
+        self.rest: dict[str, Any] = {}
+        self.count = 0
+        self._items = self._walk(_Reader(chunks), item_path, self.rest, None)
+
+    def __aiter__(self) -> "ItemStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        item = await self._items.__anext__()
+        self.count += 1
+        return item
+
+    async def _walk(
+        self, reader: _Reader, path: tuple[str, ...], rest: dict[str, Any], key: Any
+    ) -> AsyncIterator[Any]:
+        if not path:
+            if await reader.peek() != "[":
+                # Not an array (e.g. null): keep it with the rest of the document
+                rest[key] = await reader.value()
+                return
+            reader.pos += 1
+            if await reader.peek() == "]":
+                reader.pos += 1
+                return
+            while True:
+                yield await reader.value()
+                if await reader.take(",]") == "]":
+                    return
+
+        if await reader.peek() != "{":
+            rest[key] = await reader.value()
+            return
+        reader.pos += 1
+        members: dict[str, Any] = {}
+        if await reader.peek() == "}":
+            reader.pos += 1
+        else:
+            while True:
+                name = await reader.value()
+                await reader.take(":")
+                if name == path[0]:
+                    async for item in self._walk(reader, path[1:], members, name):
+                        yield item
+                else:
+                    members[name] = await reader.value()
+                if await reader.take(",}") == "}":
+                    break
+        if key is None:
+            rest.update(members)
+        elif members:
+            rest[key] = members
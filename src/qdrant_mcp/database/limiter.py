@@ -0,0 +1,221 @@
+"""Adaptive (AIMD) concurrency limits for the Qdrant Database API client."""
+
+import asyncio
+import re
+from collections import deque
+from typing import Any, Optional
+
+# POST endpoints that only read data
+_READ_SUFFIXES = (
+    "/points",
+    "/points/search",
+    "/points/search/batch",
+    "/points/recommend",
+    "/points/recommend/batch",
+    "/points/scroll",
+    "/points/count",
+    "/points/query",
+    "/points/query/batch",
+)
+
+
+# Path segments that name an operation rather than an object (point id, snapshot name)
+_OPERATION_SEGMENT = re.compile(r"^[a-z_]+$")
+
+
+def endpoint_class(method: str, path: str) -> str:
+    """Group requests whose latencies are comparable, e.g. "POST /collections/*/points/search".
+
+    The collection name and object identifiers such as point ids or snapshot
+    names are replaced with "*".
+    """
+    parts = path.split("?", 1)[0].strip("/").split("/")
+    if len(parts) >= 2 and parts[0] == "collections":
+        parts[1] = "*"
+    parts = [
+        part if i < 2 or _OPERATION_SEGMENT.match(part) else "*" for i, part in enumerate(parts)
+    ]
+    return f"{method.upper()} /{'/'.join(parts)}"
+
+
+def is_read_request(method: str, path: str) -> bool:
+    """Classify a request as a read (True) or a write (False)."""
+    method = method.upper()
+    if method in ("GET", "HEAD"):
+        return True
+    if method == "POST":
+        return path.split("?", 1)[0].rstrip("/").endswith(_READ_SUFFIXES)
+    return False
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that adapts with additive increase / multiplicative decrease.
+
+    Each successful call with healthy latency raises the limit by roughly
+    ``increase`` per window of ``limit`` calls. A 429, a timeout, or a latency
+    above ``latency_tolerance`` times the smoothed baseline multiplies the
+    limit by ``backoff``. Only one decrease is applied per generation of
+    in-flight requests, so a single burst of failures cuts the limit once.
+
+    Baselines are kept per endpoint class, since a scroll and a point lookup
+    have very different normal latencies. A baseline is the mean of the first
+    ``warmup`` samples, then a moving average of every sample, slow ones
+    included, so a lasting shift in latency stops counting as congestion.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        backoff: float = 0.7,
+        latency_tolerance: float = 2.0,
+        warmup: int = 10,
+    ):
+        """Initialize adaptive limiter.
+
+        Args:
+            name: Limiter name (e.g., "read" or "write")
+            initial: Initial concurrency limit
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+            increase: Additive increase per window of successful calls
+            backoff: Multiplicative factor applied on congestion (0-1)
+            latency_tolerance: Latency/baseline ratio treated as congestion
+            warmup: Samples of an endpoint class averaged before its latency is judged
+        """
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.warmup = warmup
+
+        self.limit = float(min(max(initial, min_limit), max_limit))
+        self.in_flight = 0
+        self.baselines: dict[str, float] = {}
+        self._samples: dict[str, int] = {}
+        self.decreases = 0
+        self._epoch = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def capacity(self) -> int:
+        """Current whole-number concurrency limit."""
+        return max(self.min_limit, int(self.limit))
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for a slot."""
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.capacity:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    async def acquire(self) -> int:
+        """Wait for a concurrency slot.
+
+        Returns:
+            Token to pass back to release()
+        """
+        if self.in_flight < self.capacity and not self._waiters:
+            self.in_flight += 1
+            return self._epoch
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was granted just before cancellation; hand it on
+                self.in_flight -= 1
+                self._wake()
+            raise
+        return self._epoch
+
+    def _observe(self, endpoint: str, latency: float) -> bool:
+        """Update the endpoint's baseline and return whether the latency looks congested."""
+        samples = self._samples.get(endpoint, 0) + 1
+        self._samples[endpoint] = samples
+        baseline = self.baselines.get(endpoint)
+        if baseline is None:
+            self.baselines[endpoint] = latency
+            return False
+        slow = samples > self.warmup and latency > baseline * self.latency_tolerance
+        weight = 1.0 / samples if samples <= self.warmup else 0.05
+        self.baselines[endpoint] = baseline + weight * (latency - baseline)
+        return slow
+
+    def release(
+        self,
+        token: int,
+        latency: Optional[float] = None,
+        congested: bool = False,
+        endpoint: str = "",
+    ) -> None:
+        """Release a slot and adapt the limit to the call outcome.
+
+        Args:
+            token: Value returned by acquire()
+            latency: Call duration in seconds, or None to skip adaptation
+            congested: Whether the call hit a 429, 503 or timeout
+            endpoint: Endpoint class whose latency baseline the call is compared to
+        """
+        self.in_flight -= 1
+
+        if latency is not None and not congested:
+            congested = self._observe(endpoint, latency)
+
+        if congested:
+            if token == self._epoch:
+                self._epoch += 1
+                self.decreases += 1
+                self.limit = max(float(self.min_limit), self.limit * self.backoff)
+        elif latency is not None:
+            self.limit = min(float(self.max_limit), self.limit + self.increase / self.limit)
+
+        self._wake()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the limiter state as a plain dictionary."""
+        return {
+            "limit": self.capacity,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "baseline_latency": {
+                endpoint: round(latency, 4) for endpoint, latency in sorted(self.baselines.items())
+            },
+            "decreases": self.decreases,
+        }
+
+
+class ConcurrencyLimits:
+    """Separate adaptive limiters for read and write requests."""
+
+    def __init__(self, read: AdaptiveLimiter, write: AdaptiveLimiter):
+        """Initialize concurrency limits.
+
+        Args:
+            read: Limiter for searches, scrolls, counts and retrievals
+            write: Limiter for upserts, deletes and configuration changes
+        """
+        self.read = read
+        self.write = write
+
+    def for_request(self, method: str, path: str) -> AdaptiveLimiter:
+        """Get the limiter for a request."""
+        return self.read if is_read_request(method, path) else self.write
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the state of both limiters."""
+        return {"read": self.read.snapshot(), "write": self.write.snapshot()}
@@ -0,0 +1,589 @@
+"""Resumable, pipelined migration of points between collections for Qdrant Database API.
+
+A reader scrolls the source page by page (vectors and payload) into a bounded
+queue, and several writers upsert the pages into the target concurrently, so
+reads and writes overlap while the queue caps the pages held in memory. Pages
+may finish out of order; the checkpoint only advances past pages whose
+predecessors are all written, so a resumed migration rewrites at most the
+pages in flight (upserts are idempotent).
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import time
+from typing import TYPE_CHECKING, Any, Optional
+
+from mcp.server import Server
+
+from .. import deadline
+from ..jobs import report_progress
+from .client import QdrantDatabaseClient
+from .collections import collection_exists, create_collection, get_collection
+from .filters import canonical_filter
+from .points import count_points, get_points, scroll_points_stream, upsert_points
+from .tuning import sample_points
+
+if TYPE_CHECKING:
+    from .delta import ContentHashIndex
+
+ENDPOINTS = ["primary", "remote"]
+# Point fields copied to the target
+_POINT_FIELDS = ("id", "vector", "payload")
+# Collection config sections copied when creating the target
+_CREATE_SECTIONS = ("vectors", "sparse_vectors")
+
+
+def migration_id(
+    source_endpoint: str, source_collection: str, target_endpoint: str, target_collection: str
+) -> str:
+    """Stable identifier of a migration, naming its checkpoint file."""
+    key = f"{source_endpoint}/{source_collection}->{target_endpoint}/{target_collection}"
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+class MigrationCheckpoints:
+    """Progress of migrations, persisted as one JSON file per migration."""
+
+    def __init__(self, directory: str):
+        """Initialize checkpoint store.
+
+        Args:
+            directory: Directory of the checkpoint files (created on first save)
+        """
+        self.directory = os.path.expanduser(directory)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, key: str) -> Optional[dict[str, Any]]:
+        """Get a migration's last checkpoint, or None."""
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save(self, key: str, state: dict[str, Any]) -> None:
+        """Write a checkpoint atomically, so a crash leaves the previous one intact."""
+        os.makedirs(self.directory, exist_ok=True)
+        partial = self._path(key) + ".tmp"
+        with open(partial, "w") as f:
+            json.dump(state, f)
+        os.replace(partial, self._path(key))
+
+
+def _close(a: Any, b: Any, tolerance: float) -> bool:
+    """Compare vectors (dense, multi or sparse) allowing float rounding differences."""
+    if isinstance(a, dict) and isinstance(b, dict):
+        if "indices" in a:
+            return a.get("indices") == b.get("indices") and _close(
+                a.get("values"), b.get("values"), tolerance
+            )
+        return a.keys() == b.keys() and all(_close(a[k], b[k], tolerance) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_close(x, y, tolerance) for x, y in zip(a, b, strict=True))
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return math.isclose(a, b, rel_tol=tolerance, abs_tol=tolerance)
+    return a == b
+
+
+def point_differences(
+    source: dict[str, Any], target: Optional[dict[str, Any]], tolerance: float = 1e-3
+) -> list[str]:
+    """Fields of a migrated point that differ from the source point ("missing" if absent)."""
+    if target is None:
+        return ["missing"]
+    differences = []
+    if (source.get("payload") or {}) != (target.get("payload") or {}):
+        differences.append("payload")
+    if not _close(source.get("vector"), target.get("vector"), tolerance):
+        differences.append("vector")
+    return differences
+
+
+async def _ensure_target(
+    source_client: QdrantDatabaseClient,
+    source_collection: str,
+    target_client: QdrantDatabaseClient,
+    target_collection: str,
+) -> bool:
+    """Create the target with the source's vector config if it does not exist."""
+    exists = await collection_exists(target_client, target_collection)
+    if exists.get("result", {}).get("exists"):
+        return False
+    info = (await get_collection(source_client, source_collection)).get("result", {})
+    params = info.get("config", {}).get("params", {})
+    config = {section: params[section] for section in _CREATE_SECTIONS if params.get(section)}
+    await create_collection(target_client, target_collection, config)
+    return True
+
+
+async def verify_migration(
+    source_client: QdrantDatabaseClient,
+    source_collection: str,
+    target_client: QdrantDatabaseClient,
+    target_collection: str,
+    sample_ids: list[Any],
+    filter_: Optional[dict[str, Any]] = None,
+    tolerance: float = 1e-3,
+) -> dict[str, Any]:
+    """Compare exact counts and a sample of points between source and target.
+
+    Args:
+        source_collection: Name of the source collection
+        target_collection: Name of the target collection
+        sample_ids: IDs of points to compare
+        filter_: Filter the migration was limited to (applied to both counts)
+        tolerance: Allowed difference between vector components
+
+    Returns:
+        Both counts, the number of points sampled and the differing ones
+    """
+    source_count = await count_points(source_client, source_collection, filter_, True)
+    target_count = await count_points(target_client, target_collection, filter_, True)
+    mismatched = []
+    if sample_ids:
+        source_points = (
+            await get_points(source_client, source_collection, sample_ids, True, True)
+        ).get("result", [])
+        target_points = {
+            json.dumps(point["id"]): point
+            for point in (
+                await get_points(target_client, target_collection, sample_ids, True, True)
+            ).get("result", [])
+        }
+        for point in source_points:
+            differences = point_differences(
+                point, target_points.get(json.dumps(point["id"])), tolerance
+            )
+            if differences:
+                mismatched.append({"id": point["id"], "differences": differences})
+    source_total = source_count.get("result", {}).get("count")
+    target_total = target_count.get("result", {}).get("count")
+    return {
+        "source_count": source_total,
+        "target_count": target_total,
+        "count_match": source_total == target_total,
+        "sampled": len(sample_ids),
+        "mismatched": mismatched,
+        "verified": source_total == target_total and not mismatched,
+    }
+
+
+async def migrate_collection(
+    source_client: QdrantDatabaseClient,
+    source_collection: str,
+    target_client: QdrantDatabaseClient,
+    target_collection: str,
+    checkpoints: MigrationCheckpoints,
+    checkpoint_key: str,
+    filter_: Optional[dict[str, Any]] = None,
+    batch_size: int = 500,
+    concurrency: int = 4,
+    queue_depth: Optional[int] = None,
+    resume: bool = True,
+    create_target: bool = False,
+    verify: bool = True,
+    sample_size: int = 100,
+) -> dict[str, Any]:
+    """Copy the points of a collection into another, resuming from the last checkpoint.
+
+    Stops reading at a page boundary if the tool call's deadline would not
+    leave time to write the queued pages; run the migration again to resume.
+
+    Args:
+        source_collection: Name of the source collection
+        target_collection: Name of the target collection
+        checkpoints: Checkpoint store
+        checkpoint_key: Identifier of the migration's checkpoint
+        filter_: Only migrate points matching this filter
+        batch_size: Points per scroll page and upsert
+        concurrency: Upserts in flight at once
+        queue_depth: Pages read ahead of the writers (default: 2 * concurrency)
+        resume: Continue an unfinished migration from its checkpoint
+        create_target: Create the target with the source's vector config if missing
+        verify: Compare counts and a sample of points once complete
+        sample_size: Points compared by the verification, sampled from the
+            points written or, for a resumed migration, from the whole target
+
+    Returns:
+        Points migrated, whether the migration completed, the checkpoint offset
+        and, if verified, the verification result
+
+    Raises:
+        ValueError: If a resumed migration's filter differs from the checkpoint's
+    """
+    filter_ = canonical_filter(filter_) or None
+    state = checkpoints.load(checkpoint_key) if resume else None
+    if state is not None and state.get("completed"):
+        state = None
+    if state is not None and state.get("filter") != filter_:
+        raise ValueError(
+            "The checkpoint of this migration has a different filter; "
+            "pass resume=false to start over"
+        )
+    offset = state["offset"] if state else None
+    migrated = state["migrated"] if state else 0
+    resumed_from = offset if state else None
+    started = time.time()
+    state = {
+        "source_collection": source_collection,
+        "target_collection": target_collection,
+        "filter": filter_,
+        "offset": offset,
+        "migrated": migrated,
+        "completed": False,
+        "started_at": state["started_at"] if state else started,
+        "updated_at": started,
+    }
+    checkpoints.save(checkpoint_key, state)
+
+    created = False
+    if create_target:
+        created = await _ensure_target(
+            source_client, source_collection, target_client, target_collection
+        )
+    estimate = await count_points(source_client, source_collection, filter_, exact=False)
+    total = estimate.get("result", {}).get("count")
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=queue_depth or 2 * concurrency)
+    written: dict[int, tuple[int, Any]] = {}
+    next_seq = 0
+    page_seconds = 0.0
+    finished = False
+    samples: list[Any] = []
+    seen = 0
+
+    def commit() -> None:
+        """Advance the checkpoint past every page whose predecessors are all written."""
+        nonlocal next_seq, migrated
+        advanced = False
+        while next_seq in written:
+            count, next_offset = written.pop(next_seq)
+            migrated += count
+            state["offset"] = next_offset
+            next_seq += 1
+            advanced = True
+        if advanced:
+            state["migrated"] = migrated
+            state["updated_at"] = time.time()
+            checkpoints.save(checkpoint_key, state)
+            report_progress(migrated, total)
+
+    async def read() -> None:
+        nonlocal finished, page_seconds
+        seq = 0
+        cursor = offset
+        while True:
+            backlog = queue.qsize() / concurrency + 2
+            if seq and not deadline.has_time_for(backlog * page_seconds):
+                break
+            page_started = time.monotonic()
+            async with scroll_points_stream(
+                source_client, source_collection, batch_size, cursor, filter_, True, True
+            ) as stream:
+                points = [
+                    {k: point[k] for k in _POINT_FIELDS if k in point} async for point in stream
+                ]
+            page_seconds = max(page_seconds, time.monotonic() - page_started)
+            cursor = stream.rest.get("result", {}).get("next_page_offset")
+            await queue.put((seq, points, cursor))
+            seq += 1
+            if cursor is None:
+                finished = True
+                break
+        # Only after a normal finish: if a task failed, the writers are cancelled
+        # and a full queue would never take the sentinels
+        for _ in range(concurrency):
+            await queue.put(None)
+
+    async def write() -> None:
+        nonlocal page_seconds, seen
+        while (item := await queue.get()) is not None:
+            seq, points, next_offset = item
+            page_started = time.monotonic()
+            if points:
+                await upsert_points(target_client, target_collection, points, wait=True)
+            page_seconds = max(page_seconds, time.monotonic() - page_started)
+            # Reservoir sample of the IDs written, for the verification
+            for point in points:
+                seen += 1
+                if len(samples) < sample_size:
+                    samples.append(point["id"])
+                elif (slot := random.randrange(seen)) < sample_size:
+                    samples[slot] = point["id"]
+            written[seq] = (len(points), next_offset)
+            commit()
+
+    tasks = [asyncio.ensure_future(read())]
+    tasks += [asyncio.ensure_future(write()) for _ in range(concurrency)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    state["completed"] = finished
+    checkpoints.save(checkpoint_key, state)
+    result: dict[str, Any] = {
+        "source_collection": source_collection,
+        "target_collection": target_collection,
+        "migrated": migrated,
+        "completed": finished,
+        "next_page_offset": state["offset"],
+        "resumed_from": resumed_from,
+        "target_created": created,
+        "seconds": round(time.time() - started, 3),
+    }
+    if finished and verify:
+        sampled_from = "written"
+        if resumed_from is not None:
+            # The reservoir only saw this run's pages; sample the whole target instead
+            points = await sample_points(
+                target_client, target_collection, sample_size, filter_, with_vector=False
+            )
+            samples = [point["id"] for point in points]
+            sampled_from = "target"
+        result["verification"] = {
+            **await verify_migration(
+                source_client,
+                source_collection,
+                target_client,
+                target_collection,
+                samples,
+                filter_,
+            ),
+            "sampled_from": sampled_from,
+        }
+    return result
+
+
+class MigrationManager:
+    """Endpoints and checkpoints of collection migrations.
+
+    Migrations read from and write to this server's endpoint ("primary") or
+    a second configured endpoint ("remote"), whose client is opened on first
+    use.
+    """
+
+    def __init__(
+        self,
+        client: QdrantDatabaseClient,
+        checkpoint_dir: str,
+        remote_url: Optional[str] = None,
+        remote_api_key: Optional[str] = None,
+    ):
+        """Initialize migration manager.
+
+        Args:
+            client: Qdrant database client of this server's endpoint
+            checkpoint_dir: Directory of the checkpoint files
+            remote_url: URL of the second endpoint (optional)
+            remote_api_key: API key of the second endpoint (optional)
+        """
+        self.client = client
+        self.checkpoints = MigrationCheckpoints(checkpoint_dir)
+        self.remote_url = remote_url
+        self.remote_api_key = remote_api_key
+        self._remote: Optional[QdrantDatabaseClient] = None
+        self._running: set[str] = set()
+
+    async def endpoint(self, name: str) -> QdrantDatabaseClient:
+        """Get the client of an endpoint.
+
+        Raises:
+            ValueError: If the endpoint is unknown or the remote one is not configured
+        """
+        if name == "primary":
+            return self.client
+        if name != "remote":
+            raise ValueError(f"Unknown endpoint {name!r}; use one of {ENDPOINTS}")
+        if self.remote_url is None:
+            raise ValueError("No remote endpoint configured; set QDRANT_REMOTE_URL")
+        if self._remote is None:
+            remote = QdrantDatabaseClient(
+                base_url=self.remote_url,
+                api_key=self.remote_api_key or "",
+                codec=self.client.codec,
+            )
+            await remote.__aenter__()
+            self._remote = remote
+        return self._remote
+
+    async def migrate(
+        self,
+        source_collection: str,
+        target_collection: str,
+        source_endpoint: str = "primary",
+        target_endpoint: str = "primary",
+        **options: Any,
+    ) -> dict[str, Any]:
+        """Run or resume a migration (see migrate_collection for the options).
+
+        Raises:
+            ValueError: If source and target are the same collection, or the
+                migration is already running
+        """
+        if (source_endpoint, source_collection) == (target_endpoint, target_collection):
+            raise ValueError("Source and target are the same collection")
+        key = migration_id(source_endpoint, source_collection, target_endpoint, target_collection)
+        if key in self._running:
+            # Both runs would advance, and overwrite, the same checkpoint
+            raise ValueError(
+                f"Migration of {source_endpoint}/{source_collection} to "
+                f"{target_endpoint}/{target_collection} is already running"
+            )
+        self._running.add(key)
+        try:
+            return await migrate_collection(
+                await self.endpoint(source_endpoint),
+                source_collection,
+                await self.endpoint(target_endpoint),
+                target_collection,
+                self.checkpoints,
+                key,
+                **options,
+            )
+        finally:
+            self._running.discard(key)
+
+    def status(
+        self,
+        source_collection: str,
+        target_collection: str,
+        source_endpoint: str = "primary",
+        target_endpoint: str = "primary",
+    ) -> Optional[dict[str, Any]]:
+        """Get the last checkpoint of a migration, or None if it never ran."""
+        key = migration_id(source_endpoint, source_collection, target_endpoint, target_collection)
+        return self.checkpoints.load(key)
+
+    async def close(self) -> None:
+        """Close the remote endpoint's client."""
+        if self._remote is not None:
+            await self._remote.__aexit__()
+            self._remote = None
+
+
+def register_migration_tools(
+    server: Server,
+    client: QdrantDatabaseClient,
+    tools_list: list,
+    migrations: MigrationManager,
+    delta_index: Optional["ContentHashIndex"] = None,
+) -> None:
+    """Register collection migration tools with MCP server.
+
+    Args:
+        server: MCP server instance
+        client: Qdrant database client
+        tools_list: List to append tool definitions to
+        migrations: Migration endpoints and checkpoints
+        delta_index: Optional content hash index (dropped for a primary target)
+    """
+    from mcp.types import Tool
+
+    endpoints = {
+        "source_collection": {"type": "string"},
+        "target_collection": {"type": "string"},
+        "source_endpoint": {"type": "string", "enum": ENDPOINTS, "default": "primary"},
+        "target_endpoint": {"type": "string", "enum": ENDPOINTS, "default": "primary"},
+    }
+
+    # Define tools
+    tools_list.extend(
+        [
+            Tool(
+                name="qdrant_db_collections_migrate",
+                description=(
+                    "Copy a collection's points into another collection, on this or the remote "
+                    "endpoint, with pipelined scroll and upserts, resuming from a checkpoint and "
+                    "verifying counts and sampled points"
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        **endpoints,
+                        "filter": {"type": "object"},
+                        "batch_size": {"type": "integer", "minimum": 1, "default": 500},
+                        "concurrency": {"type": "integer", "minimum": 1, "default": 4},
+                        "resume": {"type": "boolean", "default": True},
+                        "create_target": {"type": "boolean", "default": False},
+                        "verify": {"type": "boolean", "default": True},
+                        "sample_size": {"type": "integer", "minimum": 0, "default": 100},
+                    },
+                    "required": ["source_collection", "target_collection"],
+                },
+            ),
+            Tool(
+                name="qdrant_db_collections_migrate_status",
+                description="Get the last checkpoint of a collection migration",
+                inputSchema={
+                    "type": "object",
+                    "properties": endpoints,
+                    "required": ["source_collection", "target_collection"],
+                },
+            ),
+        ]
+    )
+
+    @server.call_tool()
+    async def qdrant_db_collections_migrate(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Copy a collection's points into another collection.
+
+        Args:
+            source_collection: Name of the source collection
+            target_collection: Name of the target collection
+            source_endpoint: "primary" or "remote" (default: primary)
+            target_endpoint: "primary" or "remote" (default: primary)
+            filter: Only migrate points matching this filter (optional)
+            batch_size: Points per scroll page and upsert (default: 500)
+            concurrency: Upserts in flight at once (default: 4)
+            resume: Continue from the last checkpoint (default: true)
+            create_target: Create a missing target with the source's vector config
+                (default: false)
+            verify: Compare counts and sampled points once complete (default: true)
+            sample_size: Points compared by the verification (default: 100)
+        """
+        target_endpoint = arguments.get("target_endpoint", "primary")
+        if delta_index is not None and target_endpoint == "primary":
+            await delta_index.forget(arguments["target_collection"])
+        result = await migrations.migrate(
+            arguments["source_collection"],
+            arguments["target_collection"],
+            arguments.get("source_endpoint", "primary"),
+            target_endpoint,
+            filter_=arguments.get("filter"),
+            batch_size=arguments.get("batch_size", 500),
+            concurrency=arguments.get("concurrency", 4),
+            resume=arguments.get("resume", True),
+            create_target=arguments.get("create_target", False),
+            verify=arguments.get("verify", True),
+            sample_size=arguments.get("sample_size", 100),
+        )
+        return [{"type": "text", "text": str(result)}]
+
+    @server.call_tool()
+    async def qdrant_db_collections_migrate_status(
+        arguments: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        """Get the last checkpoint of a collection migration.
+
+        Args:
+            source_collection: Name of the source collection
+            target_collection: Name of the target collection
+            source_endpoint: "primary" or "remote" (default: primary)
+            target_endpoint: "primary" or "remote" (default: primary)
+        """
+        result = migrations.status(
+            arguments["source_collection"],
+            arguments["target_collection"],
+            arguments.get("source_endpoint", "primary"),
+            arguments.get("target_endpoint", "primary"),
+        )
+        return [{"type": "text", "text": str(result)}]
@@ -1,10 +1,15 @@
 """Payload management tools for Qdrant Database API."""
 
-from typing import Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from mcp.server import Server
 
 from .client import QdrantDatabaseClient
+from .points import SHARD_KEY_SELECTOR_SCHEMA, shard_selector
+
+if TYPE_CHECKING:
+    from .delta import ContentHashIndex
+    from .writebuffer import WriteBehindManager
 
 
 async def set_payload(
@@ -12,6 +17,7 @@ async def set_payload(
     collection_name: str,
     payload: dict[str, Any],
     points: list[Any],
+    shard_key: Any = None,
 ) -> dict[str, Any]:
     """Set payload for specified points (merges with existing payload).
 
@@ -19,13 +25,14 @@ async def set_payload(
         collection_name: Name of the collection
         payload: Payload data to set
         points: List of point IDs to update
+        shard_key: Shard key(s) the points are in (custom sharding only)
 
     Returns:
         Operation result
     """
     return await client.post(
         f"/collections/{collection_name}/points/payload",
-        json={"payload": payload, "points": points},
+        json={"payload": payload, "points": points, **shard_selector(shard_key)},
     )
 
 
@@ -34,6 +41,7 @@ async def overwrite_payload(
     collection_name: str,
     payload: dict[str, Any],
     points: list[Any],
+    shard_key: Any = None,
 ) -> dict[str, Any]:
     """Overwrite payload for specified points (replaces existing payload).
 
@@ -41,13 +49,14 @@ async def overwrite_payload(
         collection_name: Name of the collection
         payload: Payload data to set
         points: List of point IDs to update
+        shard_key: Shard key(s) the points are in (custom sharding only)
 
     Returns:
         Operation result
     """
     return await client.put(
         f"/collections/{collection_name}/points/payload",
-        json={"payload": payload, "points": points},
+        json={"payload": payload, "points": points, **shard_selector(shard_key)},
     )
 
 
@@ -56,6 +65,7 @@ async def delete_payload(
     collection_name: str,
     keys: list[str],
     points: list[Any],
+    shard_key: Any = None,
 ) -> dict[str, Any]:
     """Delete specific payload fields from points.
 
@@ -63,40 +73,55 @@ async def delete_payload(
         collection_name: Name of the collection
         keys: List of payload keys to delete
         points: List of point IDs to update
+        shard_key: Shard key(s) the points are in (custom sharding only)
 
     Returns:
         Operation result
     """
     return await client.post(
         f"/collections/{collection_name}/points/payload/delete",
-        json={"keys": keys, "points": points},
+        json={"keys": keys, "points": points, **shard_selector(shard_key)},
     )
 
 
 async def clear_payload(
-    client: QdrantDatabaseClient, collection_name: str, points: list[Any]
+    client: QdrantDatabaseClient,
+    collection_name: str,
+    points: list[Any],
+    shard_key: Any = None,
 ) -> dict[str, Any]:
     """Clear all payload data from specified points.
 
     Args:
         collection_name: Name of the collection
         points: List of point IDs to clear
+        shard_key: Shard key(s) the points are in (custom sharding only)
 
     Returns:
         Operation result
     """
     return await client.post(
-        f"/collections/{collection_name}/points/payload/clear", json={"points": points}
+        f"/collections/{collection_name}/points/payload/clear",
+        json={"points": points, **shard_selector(shard_key)},
     )
 
 
-def register_payload_tools(server: Server, client: QdrantDatabaseClient, tools_list: list) -> None:
+def register_payload_tools(
+    server: Server,
+    client: QdrantDatabaseClient,
+    tools_list: list,
+    write_buffers: Optional["WriteBehindManager"] = None,
+    delta_index: Optional["ContentHashIndex"] = None,
+) -> None:
     """Register payload management tools with MCP server.
 
     Args:
         server: MCP server instance
         client: Qdrant database client
         tools_list: List to append tool definitions to
+        write_buffers: Optional write-behind buffers for payload set/delete (writes
+            to a shard key bypass them)
+        delta_index: Optional content hash index (hashes of modified points are dropped)
     """
     from mcp.types import Tool
 
@@ -111,6 +136,7 @@ def register_payload_tools(server: Server, client: QdrantDatabaseClient, tools_l
                     "collection_name": {"type": "string"},
                     "payload": {"type": "object"},
                     "points": {"type": "array"},
+                    "shard_key": SHARD_KEY_SELECTOR_SCHEMA,
                 },
                 "required": ["collection_name", "payload", "points"],
             },
@@ -124,6 +150,7 @@ def register_payload_tools(server: Server, client: QdrantDatabaseClient, tools_l
                     "collection_name": {"type": "string"},
                     "payload": {"type": "object"},
                     "points": {"type": "array"},
+                    "shard_key": SHARD_KEY_SELECTOR_SCHEMA,
                 },
                 "required": ["collection_name", "payload", "points"],
             },
@@ -137,6 +164,7 @@ def register_payload_tools(server: Server, client: QdrantDatabaseClient, tools_l
                     "collection_name": {"type": "string"},
                     "keys": {"type": "array", "items": {"type": "string"}},
                     "points": {"type": "array"},
+                    "shard_key": SHARD_KEY_SELECTOR_SCHEMA,
                 },
                 "required": ["collection_name", "keys", "points"],
             },
@@ -149,6 +177,7 @@ def register_payload_tools(server: Server, client: QdrantDatabaseClient, tools_l
                 "properties": {
                     "collection_name": {"type": "string"},
                     "points": {"type": "array"},
+                    "shard_key": SHARD_KEY_SELECTOR_SCHEMA,
                 },
                 "required": ["collection_name", "points"],
             },
@@ -163,12 +192,25 @@ def register_payload_tools(server: Server, client: QdrantDatabaseClient, tools_l
             collection_name: Name of the collection
             payload: Payload data to set
             points: List of point IDs to update
+            shard_key: Shard key(s) the points are in (custom sharding only)
         """
+        shard_key = arguments.get("shard_key")
+        if delta_index is not None:
+            await delta_index.forget(arguments["collection_name"], arguments["points"])
+        buffer = write_buffers.get(arguments["collection_name"]) if write_buffers else None
+        if buffer is not None and shard_key is None:
+            result = await buffer.add(
+                {"set_payload": {"payload": arguments["payload"], "points": arguments["points"]}}
+            )
+            return [{"type": "text", "text": str(result)}]
+        if write_buffers is not None:
+            await write_buffers.barrier(arguments["collection_name"])
         result = await set_payload(
             client,
             arguments["collection_name"],
             arguments["payload"],
             arguments["points"],
+            shard_key,
         )
         return [{"type": "text", "text": str(result)}]
 
@@ -180,12 +222,18 @@ def register_payload_tools(server: Server, client: QdrantDatabaseClient, tools_l
             collection_name: Name of the collection
             payload: Payload data to set
             points: List of point IDs to update
+            shard_key: Shard key(s) the points are in (custom sharding only)
         """
+        if delta_index is not None:
+            await delta_index.forget(arguments["collection_name"], arguments["points"])
+        if write_buffers is not None:
+            await write_buffers.barrier(arguments["collection_name"])
         result = await overwrite_payload(
             client,
             arguments["collection_name"],
             arguments["payload"],
             arguments["points"],
+            arguments.get("shard_key"),
         )
         return [{"type": "text", "text": str(result)}]
 
@@ -197,12 +245,25 @@ def register_payload_tools(server: Server, client: QdrantDatabaseClient, tools_l
             collection_name: Name of the collection
             keys: List of payload keys to delete
             points: List of point IDs to update
+            shard_key: Shard key(s) the points are in (custom sharding only)
         """
+        shard_key = arguments.get("shard_key")
+        if delta_index is not None:
+            await delta_index.forget(arguments["collection_name"], arguments["points"])
+        buffer = write_buffers.get(arguments["collection_name"]) if write_buffers else None
+        if buffer is not None and shard_key is None:
+            result = await buffer.add(
+                {"delete_payload": {"keys": arguments["keys"], "points": arguments["points"]}}
+            )
+            return [{"type": "text", "text": str(result)}]
+        if write_buffers is not None:
+            await write_buffers.barrier(arguments["collection_name"])
         result = await delete_payload(
             client,
             arguments["collection_name"],
             arguments["keys"],
             arguments["points"],
+            shard_key,
         )
         return [{"type": "text", "text": str(result)}]
 
@@ -213,8 +274,13 @@ def register_payload_tools(server: Server, client: QdrantDatabaseClient, tools_l
         Args:
             collection_name: Name of the collection
             points: List of point IDs to clear
+            shard_key: Shard key(s) the points are in (custom sharding only)
         """
+        if delta_index is not None:
+            await delta_index.forget(arguments["collection_name"], arguments["points"])
+        if write_buffers is not None:
+            await write_buffers.barrier(arguments["collection_name"])
         result = await clear_payload(
-            client, arguments["collection_name"], arguments["points"]
+            client, arguments["collection_name"], arguments["points"], arguments.get("shard_key")
         )
         return [{"type": "text", "text": str(result)}]
@@ -1,40 +1,216 @@
 """Point management tools for Qdrant Database API."""
 
-from typing import Any
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, Optional
 
 from mcp.server import Server
 
+from ..jobs import current_job, record_operation, report_progress
 from .client import QdrantDatabaseClient
+from .collections import SHARD_KEY_SCHEMA
+from .filters import canonical_filter
+from .jsonstream import ItemStream
+
+# Points per upsert request when an upsert runs as a background job
+JOB_CHUNK_SIZE = 500
+# Waited upserts of at least this many points are not counted as slow calls
+LARGE_UPSERT_POINTS = 100
+
+# Input schema of the payload fields returned with points
+WITH_PAYLOAD_SCHEMA: dict[str, Any] = {
+    "description": (
+        "Payload to return: true/false, a list of fields to include, "
+        'or {"include": [...]} / {"exclude": [...]}'
+    ),
+    "anyOf": [
+        {"type": "boolean"},
+        {"type": "array", "items": {"type": "string"}},
+        {
+            "type": "object",
+            "properties": {
+                "include": {"type": "array", "items": {"type": "string"}},
+                "exclude": {"type": "array", "items": {"type": "string"}},
+            },
+        },
+    ],
+}
+
+# Input schema of the vectors returned with points
+WITH_VECTOR_SCHEMA: dict[str, Any] = {
+    "description": "Vectors to return: true/false or a list of named vectors",
+    "anyOf": [{"type": "boolean"}, {"type": "array", "items": {"type": "string"}}],
+}
+
+# Input schema of the shard keys an operation is routed to
+SHARD_KEY_SELECTOR_SCHEMA: dict[str, Any] = {
+    "description": (
+        "Shard key (or list of keys) of a custom-sharded collection to route to; "
+        "default: all shards for reads, the default shard key for writes"
+    ),
+    "anyOf": [SHARD_KEY_SCHEMA, {"type": "array", "items": SHARD_KEY_SCHEMA}],
+}
+
+if TYPE_CHECKING:
+    from .collections import VectorSizeCache
+    from .counts import CountCache
+    from .delta import ContentHashIndex
+    from .resources import PointResources
+    from .writebuffer import WriteBehindManager
+
+
+def payload_selector(with_payload: Any) -> Any:
+    """Validate a with_payload value and normalize field lists to ``{"include": [...]}``.
+
+    Raises:
+        ValueError: If the value is not a boolean, a field list or an include/exclude object
+    """
+    if isinstance(with_payload, bool):
+        return with_payload
+    if isinstance(with_payload, list):
+        with_payload = {"include": with_payload}
+    if (
+        isinstance(with_payload, dict)
+        and len(with_payload) == 1
+        and next(iter(with_payload)) in ("include", "exclude")
+    ):
+        fields = next(iter(with_payload.values()))
+        if isinstance(fields, list) and all(isinstance(f, str) for f in fields):
+            # Preserve the caller's order; duplicates would only bloat the request
+            return {next(iter(with_payload)): list(dict.fromkeys(fields))}
+    raise ValueError(
+        f"with_payload must be a boolean, a list of fields or one of "
+        f'{{"include": [...]}} / {{"exclude": [...]}}, got {with_payload!r}'
+    )
+
+
+def vector_selector(with_vector: Any) -> Any:
+    """Validate a with_vector value: a boolean or a list of named vectors.
+
+    Raises:
+        ValueError: If the value is neither
+    """
+    if isinstance(with_vector, bool) or (
+        isinstance(with_vector, list) and all(isinstance(v, str) for v in with_vector)
+    ):
+        return with_vector
+    raise ValueError(
+        f"with_vector must be a boolean or a list of vector names, got {with_vector!r}"
+    )
+
+
+def shard_selector(shard_key: Any = None) -> dict[str, Any]:
+    """Request field routing an operation to shard keys; empty if shard_key is None.
+
+    Raises:
+        ValueError: If the value is not a shard key (string or integer) or a list of them
+    """
+    if shard_key is None:
+        return {}
+    keys = shard_key if isinstance(shard_key, list) else [shard_key]
+    if not keys or not all(
+        isinstance(key, (str, int)) and not isinstance(key, bool) for key in keys
+    ):
+        raise ValueError(
+            f"shard_key must be a string, an integer or a non-empty list of them, "
+            f"got {shard_key!r}"
+        )
+    return {"shard_key": shard_key}
+
+
+def projection(with_payload: Any = None, with_vector: Any = None) -> dict[str, Any]:
+    """Request fields selecting the payload and vectors returned; None values are omitted."""
+    body: dict[str, Any] = {}
+    if with_payload is not None:
+        body["with_payload"] = payload_selector(with_payload)
+    if with_vector is not None:
+        body["with_vector"] = vector_selector(with_vector)
+    return body
 
 
 async def upsert_points(
-    client: QdrantDatabaseClient, collection_name: str, points: list[dict[str, Any]]
+    client: QdrantDatabaseClient,
+    collection_name: str,
+    points: list[dict[str, Any]],
+    wait: bool = False,
+    shard_key: Any = None,
 ) -> dict[str, Any]:
     """Upsert (insert or update) points in a collection.
 
     Args:
         collection_name: Name of the collection
         points: List of points to upsert
+        wait: Wait until the update is applied instead of only acknowledged
+        shard_key: Shard key(s) to write to (custom sharding only)
 
     Returns:
         Upsert operation result
     """
-    return await client.put(f"/collections/{collection_name}/points", json={"points": points})
+    params = {"wait": "true"} if wait else None
+    return await client.put(
+        f"/collections/{collection_name}/points",
+        json={"points": points, **shard_selector(shard_key)},
+        params=params,
+        long_running=wait and len(points) >= LARGE_UPSERT_POINTS,
+    )
+
+
+async def upsert_points_chunked(
+    client: QdrantDatabaseClient,
+    collection_name: str,
+    points: list[dict[str, Any]],
+    chunk_size: int = JOB_CHUNK_SIZE,
+    shard_key: Any = None,
+) -> dict[str, Any]:
+    """Upsert points in chunks, reporting progress to the current job.
+
+    Chunks are only acknowledged by Qdrant, except the last one, which waits
+    until it is applied; updates are applied in order, so the earlier chunks
+    are applied by then too.
+
+    Args:
+        collection_name: Name of the collection
+        points: List of points to upsert
+        chunk_size: Points per request
+        shard_key: Shard key(s) to write to (custom sharding only)
+
+    Returns:
+        Result of the last chunk and the operation IDs of all chunks
+    """
+    result: dict[str, Any] = {}
+    operation_ids = []
+    for start in range(0, len(points), chunk_size):
+        chunk = points[start : start + chunk_size]
+        last = start + chunk_size >= len(points)
+        result = await upsert_points(client, collection_name, chunk, last, shard_key)
+        record_operation(result)
+        operation_ids.append(result.get("result", {}).get("operation_id"))
+        report_progress(start + len(chunk), len(points))
+    return {**result, "operation_ids": operation_ids}
 
 
 async def get_points(
-    client: QdrantDatabaseClient, collection_name: str, ids: list[Any]
+    client: QdrantDatabaseClient,
+    collection_name: str,
+    ids: list[Any],
+    with_payload: Any = True,
+    with_vector: Any = False,
+    shard_key: Any = None,
 ) -> dict[str, Any]:
     """Retrieve points by their IDs.
 
     Args:
         collection_name: Name of the collection
         ids: List of point IDs to retrieve
+        with_payload: Payload to return (boolean, field list or include/exclude object)
+        with_vector: Vectors to return (boolean or list of named vectors)
+        shard_key: Shard key(s) to read from (custom sharding only)
 
     Returns:
         Retrieved points
     """
-    return await client.post(f"/collections/{collection_name}/points", json={"ids": ids})
+    body = {"ids": ids, **projection(with_payload, with_vector), **shard_selector(shard_key)}
+    return await client.post(f"/collections/{collection_name}/points", json=body)
 
 
 async def get_point(
@@ -53,35 +229,47 @@ async def get_point(
 
 
 async def delete_points(
-    client: QdrantDatabaseClient, collection_name: str, points: list[Any]
+    client: QdrantDatabaseClient,
+    collection_name: str,
+    points: list[Any],
+    shard_key: Any = None,
 ) -> dict[str, Any]:
     """Delete points from a collection.
 
     Args:
         collection_name: Name of the collection
         points: List of point IDs to delete
+        shard_key: Shard key(s) to delete from (custom sharding only)
 
     Returns:
         Deletion result
     """
     return await client.post(
-        f"/collections/{collection_name}/points/delete", json={"points": points}
+        f"/collections/{collection_name}/points/delete",
+        json={"points": points, **shard_selector(shard_key)},
     )
 
 
 async def count_points(
-    client: QdrantDatabaseClient, collection_name: str, filter_: dict[str, Any] | None = None
+    client: QdrantDatabaseClient,
+    collection_name: str,
+    filter_: dict[str, Any] | None = None,
+    exact: bool = True,
+    shard_key: Any = None,
 ) -> dict[str, Any]:
     """Count points in a collection, optionally with a filter.
 
     Args:
         collection_name: Name of the collection
         filter_: Optional filter to apply
+        exact: Count exactly instead of returning Qdrant's estimate
+        shard_key: Shard key(s) to count in (custom sharding only)
 
     Returns:
         Point count
     """
-    body = {"exact": True}
+    body: dict[str, Any] = {"exact": exact, **shard_selector(shard_key)}
+    filter_ = canonical_filter(filter_)
     if filter_:
         body["filter"] = filter_
     return await client.post(f"/collections/{collection_name}/points/count", json=body)
@@ -93,6 +281,9 @@ async def scroll_points(
     limit: int = 10,
     offset: Any | None = None,
     filter_: dict[str, Any] | None = None,
+    with_vector: Any = False,
+    with_payload: Any = True,
+    shard_key: Any = None,
 ) -> dict[str, Any]:
     """Scroll through points in a collection.
 
@@ -101,16 +292,107 @@ async def scroll_points(
         limit: Maximum number of points to return
         offset: Scroll offset (point ID or numeric offset)
         filter_: Optional filter to apply
+        with_vector: Vectors to return (boolean or list of named vectors)
+        with_payload: Payload to return (boolean, field list or include/exclude object)
+        shard_key: Shard key(s) to read from (custom sharding only)
 
     Returns:
         Scrolled points and next offset
     """
-    body: dict[str, Any] = {"limit": limit, "with_payload": True, "with_vector": False}
+    body = _scroll_body(limit, offset, filter_, with_vector, with_payload, shard_key)
+    return await client.post(f"/collections/{collection_name}/points/scroll", json=body)
+
+
+def _scroll_body(
+    limit: int,
+    offset: Any | None,
+    filter_: dict[str, Any] | None,
+    with_vector: Any,
+    with_payload: Any,
+    shard_key: Any = None,
+) -> dict[str, Any]:
+    body: dict[str, Any] = {
+        "limit": limit,
+        **projection(with_payload, with_vector),
+        **shard_selector(shard_key),
+    }
     if offset is not None:
         body["offset"] = offset
+    filter_ = canonical_filter(filter_)
     if filter_:
         body["filter"] = filter_
-    return await client.post(f"/collections/{collection_name}/points/scroll", json=body)
+    return body
+
+
+@asynccontextmanager
+async def scroll_points_stream(
+    client: QdrantDatabaseClient,
+    collection_name: str,
+    limit: int = 10,
+    offset: Any | None = None,
+    filter_: dict[str, Any] | None = None,
+    with_vector: Any = False,
+    with_payload: Any = True,
+    shard_key: Any = None,
+) -> AsyncIterator[ItemStream]:
+    """Scroll one page, parsing its points one at a time as the response arrives.
+
+    Takes the same arguments as scroll_points. Once the points are exhausted,
+    the next page offset is in ``stream.rest["result"]["next_page_offset"]``.
+
+    Yields:
+        Stream of the page's points
+    """
+    body = _scroll_body(limit, offset, filter_, with_vector, with_payload, shard_key)
+    async with client.stream_items(
+        "POST", f"/collections/{collection_name}/points/scroll", ("result", "points"), json=body
+    ) as points:
+        yield points
+
+
+async def iter_points(
+    client: QdrantDatabaseClient,
+    collection_name: str,
+    page_size: int = 1000,
+    offset: Any | None = None,
+    filter_: dict[str, Any] | None = None,
+    with_vector: Any = False,
+    with_payload: Any = True,
+    shard_key: Any = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield every point of a collection, scrolling page by page.
+
+    Pages are parsed incrementally, so memory use does not depend on the page
+    size.
+
+    Args:
+        collection_name: Name of the collection
+        page_size: Points per scroll request
+        offset: Scroll offset to start from
+        filter_: Optional filter to apply
+        with_vector: Vectors to return (boolean or list of named vectors)
+        with_payload: Payload to return (boolean, field list or include/exclude object)
+        shard_key: Shard key(s) to read from (custom sharding only)
+
+    Yields:
+        Points in scroll order
+    """
+    while True:
+        async with scroll_points_stream(
+            client,
+            collection_name,
+            page_size,
+            offset,
+            filter_,
+            with_vector,
+            with_payload,
+            shard_key,
+        ) as points:
+            async for point in points:
+                yield point
+        offset = points.rest.get("result", {}).get("next_page_offset")
+        if offset is None:
+            return
 
 
 async def batch_update(
@@ -130,29 +412,40 @@ async def batch_update(
     )
 
 
-def register_point_tools(server: Server, client: QdrantDatabaseClient, tools_list: list) -> None:
+def register_point_tools(
+    server: Server,
+    client: QdrantDatabaseClient,
+    tools_list: list,
+    write_buffers: Optional["WriteBehindManager"] = None,
+    delta_index: Optional["ContentHashIndex"] = None,
+    count_cache: Optional["CountCache"] = None,
+    resources: Optional["PointResources"] = None,
+    vector_sizes: Optional["VectorSizeCache"] = None,
+) -> None:
     """Register point management tools with MCP server.
 
     Args:
         server: MCP server instance
         client: Qdrant database client
         tools_list: List to append tool definitions to
+        write_buffers: Optional write-behind buffers (pending writes are flushed first)
+        delta_index: Optional content hash index enabling delta upserts
+        count_cache: Optional cache serving qdrant_db_points_count
+        resources: Optional resources replacing vectors and large payload fields in
+            get and scroll results with URIs
+        vector_sizes: Optional cache of vector sizes checking upserted vectors before sending
     """
     from mcp.types import Tool
 
+    from .arguments import check_vector_sizes, model_tool
+    from .delta import delta_upsert_points
+
     # Define tools
     tools_list.extend([
-        Tool(
-            name="qdrant_db_points_upsert",
-            description="Upsert (insert or update) points in a collection",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "collection_name": {"type": "string"},
-                    "points": {"type": "array", "items": {"type": "object"}},
-                },
-                "required": ["collection_name", "points"],
-            },
+        model_tool(
+            "qdrant_db_points_upsert",
+            "Upsert (insert or update) points in a collection. "
+            "With delta=true, only new or changed points are sent",
         ),
         Tool(
             name="qdrant_db_points_get",
@@ -162,6 +455,14 @@ def register_point_tools(server: Server, client: QdrantDatabaseClient, tools_lis
                 "properties": {
                     "collection_name": {"type": "string"},
                     "ids": {"type": "array"},
+                    "shard_key": SHARD_KEY_SELECTOR_SCHEMA,
+                    "with_payload": {**WITH_PAYLOAD_SCHEMA, "default": True},
+                    "with_vector": {**WITH_VECTOR_SCHEMA, "default": False},
+                    "inline": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "Return vectors and large payload fields, not URIs",
+                    },
                 },
                 "required": ["collection_name", "ids"],
             },
@@ -174,6 +475,11 @@ def register_point_tools(server: Server, client: QdrantDatabaseClient, tools_lis
                 "properties": {
                     "collection_name": {"type": "string"},
                     "point_id": {"type": ["string", "integer"]},
+                    "inline": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "Return vectors and large payload fields, not URIs",
+                    },
                 },
                 "required": ["collection_name", "point_id"],
             },
@@ -186,18 +492,25 @@ def register_point_tools(server: Server, client: QdrantDatabaseClient, tools_lis
                 "properties": {
                     "collection_name": {"type": "string"},
                     "points": {"type": "array"},
+                    "shard_key": SHARD_KEY_SELECTOR_SCHEMA,
                 },
                 "required": ["collection_name", "points"],
             },
         ),
         Tool(
             name="qdrant_db_points_count",
-            description="Count points in a collection with optional filter",
+            description=(
+                "Count points in a collection with optional filter; counts are cached "
+                "until the collection is written to"
+            ),
             inputSchema={
                 "type": "object",
                 "properties": {
                     "collection_name": {"type": "string"},
                     "filter": {"type": "object"},
+                    "exact": {"type": "boolean", "default": True},
+                    "stale_ok": {"type": "boolean", "default": False},
+                    "shard_key": SHARD_KEY_SELECTOR_SCHEMA,
                 },
                 "required": ["collection_name"],
             },
@@ -212,6 +525,14 @@ def register_point_tools(server: Server, client: QdrantDatabaseClient, tools_lis
                     "limit": {"type": "integer", "default": 10},
                     "offset": {"type": ["string", "integer", "null"]},
                     "filter": {"type": "object"},
+                    "shard_key": SHARD_KEY_SELECTOR_SCHEMA,
+                    "with_payload": {**WITH_PAYLOAD_SCHEMA, "default": True},
+                    "with_vector": {**WITH_VECTOR_SCHEMA, "default": False},
+                    "inline": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "Return vectors and large payload fields, not URIs",
+                    },
                 },
                 "required": ["collection_name"],
             },
@@ -237,10 +558,36 @@ def register_point_tools(server: Server, client: QdrantDatabaseClient, tools_lis
         Args:
             collection_name: Name of the collection
             points: List of points with id, vector, and optional payload
+            delta: Skip points whose vector and payload are unchanged (default: false)
+            shard_key: Shard key(s) to write to (custom sharding only)
         """
-        result = await upsert_points(
-            client, arguments["collection_name"], arguments["points"]
-        )
+        shard_key = arguments.get("shard_key")
+        if arguments.get("delta", False) and shard_key is not None:
+            # The content hash index has one hash per point ID and collection
+            raise ValueError("delta upserts do not support shard_key")
+        if vector_sizes is not None:
+            await check_vector_sizes(
+                vector_sizes, arguments["collection_name"], arguments["points"]
+            )
+        if write_buffers is not None:
+            await write_buffers.barrier(arguments["collection_name"])
+        if arguments.get("delta", False) and delta_index is not None:
+            result = await delta_upsert_points(
+                client, delta_index, arguments["collection_name"], arguments["points"]
+            )
+            return [{"type": "text", "text": str(result)}]
+        if delta_index is not None:
+            await delta_index.forget(
+                arguments["collection_name"], [p["id"] for p in arguments["points"]]
+            )
+        if current_job() is not None:
+            result = await upsert_points_chunked(
+                client, arguments["collection_name"], arguments["points"], shard_key=shard_key
+            )
+        else:
+            result = await upsert_points(
+                client, arguments["collection_name"], arguments["points"], shard_key=shard_key
+            )
         return [{"type": "text", "text": str(result)}]
 
     @server.call_tool()
@@ -250,9 +597,25 @@ def register_point_tools(server: Server, client: QdrantDatabaseClient, tools_lis
         Args:
             collection_name: Name of the collection
             ids: List of point IDs to retrieve
+            with_payload: Payload to return, e.g. ["title"] or {"exclude": ["body"]}
+                (default: true)
+            with_vector: Vectors to return, e.g. ["image"] (default: false)
+            inline: Return vectors and large payload fields inline (default: false)
+            shard_key: Shard key(s) to read from (default: all shards)
         """
-        result = await get_points(client, arguments["collection_name"], arguments["ids"])
-        return [{"type": "text", "text": str(result)}]
+        linked = resources is not None and not arguments.get("inline", False)
+        with_vector = arguments.get("with_vector", False)
+        result = await get_points(
+            client,
+            arguments["collection_name"],
+            arguments["ids"],
+            arguments.get("with_payload", True),
+            False if linked else with_vector,
+            arguments.get("shard_key"),
+        )
+        if linked and resources is not None:
+            await resources.externalize(arguments["collection_name"], result, with_vector)
+        return [{"type": "text", "text": await client.codec.render(result)}]
 
     @server.call_tool()
     async def qdrant_db_points_get_single(arguments: dict[str, Any]) -> list[dict[str, Any]]:
@@ -261,9 +624,12 @@ def register_point_tools(server: Server, client: QdrantDatabaseClient, tools_lis
         Args:
             collection_name: Name of the collection
             point_id: ID of the point to retrieve
+            inline: Return the vector and large payload fields inline (default: false)
         """
         result = await get_point(client, arguments["collection_name"], arguments["point_id"])
-        return [{"type": "text", "text": str(result)}]
+        if resources is not None and not arguments.get("inline", False):
+            await resources.externalize(arguments["collection_name"], result)
+        return [{"type": "text", "text": await client.codec.render(result)}]
 
     @server.call_tool()
     async def qdrant_db_points_delete(arguments: dict[str, Any]) -> list[dict[str, Any]]:
@@ -272,8 +638,15 @@ def register_point_tools(server: Server, client: QdrantDatabaseClient, tools_lis
         Args:
             collection_name: Name of the collection
             points: List of point IDs to delete
+            shard_key: Shard key(s) to delete from (custom sharding only)
         """
-        result = await delete_points(client, arguments["collection_name"], arguments["points"])
+        if write_buffers is not None:
+            await write_buffers.barrier(arguments["collection_name"])
+        if delta_index is not None:
+            await delta_index.forget(arguments["collection_name"], arguments["points"])
+        result = await delete_points(
+            client, arguments["collection_name"], arguments["points"], arguments.get("shard_key")
+        )
         return [{"type": "text", "text": str(result)}]
 
     @server.call_tool()
@@ -283,9 +656,26 @@ def register_point_tools(server: Server, client: QdrantDatabaseClient, tools_lis
         Args:
             collection_name: Name of the collection
             filter: Optional filter conditions
+            exact: Count exactly instead of estimating (default: true)
+            stale_ok: Return a cached or estimated count immediately and refresh
+                the exact count in the background (default: false)
+            shard_key: Shard key(s) to count in (default: all shards)
         """
         filter_ = arguments.get("filter")
-        result = await count_points(client, arguments["collection_name"], filter_)
+        exact = arguments.get("exact", True)
+        shard_key = arguments.get("shard_key")
+        if count_cache is not None:
+            result = await count_cache.count(
+                arguments["collection_name"],
+                filter_,
+                exact,
+                arguments.get("stale_ok", False),
+                shard_key,
+            )
+        else:
+            result = await count_points(
+                client, arguments["collection_name"], filter_, exact, shard_key
+            )
         return [{"type": "text", "text": str(result)}]
 
     @server.call_tool()
@@ -297,15 +687,27 @@ def register_point_tools(server: Server, client: QdrantDatabaseClient, tools_lis
             limit: Maximum number of points to return (default: 10)
             offset: Scroll offset (optional)
             filter: Optional filter conditions
+            with_payload: Payload to return, e.g. ["title"] or {"exclude": ["body"]}
+                (default: true)
+            with_vector: Vectors to return, e.g. ["image"] (default: false)
+            inline: Return vectors and large payload fields inline (default: false)
+            shard_key: Shard key(s) to read from (default: all shards)
         """
+        linked = resources is not None and not arguments.get("inline", False)
+        with_vector = arguments.get("with_vector", False)
         result = await scroll_points(
             client,
             arguments["collection_name"],
             arguments.get("limit", 10),
             arguments.get("offset"),
             arguments.get("filter"),
+            False if linked else with_vector,
+            arguments.get("with_payload", True),
+            arguments.get("shard_key"),
         )
-        return [{"type": "text", "text": str(result)}]
+        if linked and resources is not None:
+            await resources.externalize(arguments["collection_name"], result, with_vector)
+        return [{"type": "text", "text": await client.codec.render(result)}]
 
     @server.call_tool()
     async def qdrant_db_points_batch(arguments: dict[str, Any]) -> list[dict[str, Any]]:
@@ -316,8 +718,13 @@ def register_point_tools(server: Server, client: QdrantDatabaseClient, tools_lis
 
         Args:
             collection_name: Name of the collection
-            operations: List of operations to perform
+            operations: List of operations to perform; each may carry its own shard_key
         """
+        if write_buffers is not None:
+            await write_buffers.barrier(arguments["collection_name"])
+        if delta_index is not None:
+            # Batches may select points by filter; drop the whole collection's hashes
+            await delta_index.forget(arguments["collection_name"])
         result = await batch_update(
             client, arguments["collection_name"], arguments["operations"]
         )
@@ -0,0 +1,193 @@
+"""Collection readiness (wait-for-green) for Qdrant Database API."""
+
+import asyncio
+import time
+from typing import Any, Optional
+
+from mcp.server import Server
+
+from .. import deadline
+from ..deadline import DeadlineExceeded
+from ..jobs import report_progress
+from .client import QdrantDatabaseClient
+from .collections import get_collection
+
+
+class CollectionNotReadyError(RuntimeError):
+    """Raised when a collection is red or its optimizer reports an error."""
+
+
+def dense_vector_count(info: dict[str, Any]) -> int:
+    """Number of dense vectors per point, from a get_collection result."""
+    vectors = info.get("config", {}).get("params", {}).get("vectors")
+    if not isinstance(vectors, dict) or "size" in vectors:
+        return 1
+    return max(1, len(vectors))
+
+
+def collection_progress(info: dict[str, Any]) -> dict[str, Any]:
+    """Summarize indexing progress from a get_collection result.
+
+    Args:
+        info: The "result" of a get_collection response
+
+    Returns:
+        Status, optimizer status, point/indexed vector/segment counts and indexed ratio
+    """
+    points = info.get("points_count") or 0
+    expected = points * dense_vector_count(info)
+    indexed = info.get("indexed_vectors_count") or 0
+    optimizer = info.get("optimizer_status", "ok")
+    return {
+        "status": info.get("status"),
+        "optimizer_status": optimizer,
+        "points_count": points,
+        "indexed_vectors_count": indexed,
+        "expected_indexed_vectors": expected,
+        "indexed_ratio": round(min(1.0, indexed / expected), 4) if expected else 1.0,
+        "segments_count": info.get("segments_count"),
+    }
+
+
+def _eta(samples: list[tuple[float, int]], remaining_vectors: int) -> Optional[float]:
+    """Seconds to index the remaining vectors at the rate observed so far."""
+    if remaining_vectors <= 0:
+        return 0.0
+    (first_at, first), (last_at, last) = samples[0], samples[-1]
+    if last_at <= first_at or last <= first:
+        return None
+    return round(remaining_vectors / ((last - first) / (last_at - first_at)), 1)
+
+
+async def wait_for_green(
+    client: QdrantDatabaseClient,
+    collection_name: str,
+    timeout: Optional[float] = None,
+    require_indexed: bool = False,
+    initial_delay: float = 0.5,
+    max_delay: float = 10.0,
+    settle_polls: int = 2,
+) -> dict[str, Any]:
+    """Poll a collection with exponential backoff until it is green.
+
+    A collection is ready once it is green with an "ok" optimizer status for
+    ``settle_polls`` consecutive polls (an update can briefly leave a
+    collection green before its optimizations start). With
+    ``require_indexed``, indexed_vectors_count must also reach points_count
+    times the number of dense vectors. Qdrant does not index segments below
+    the indexing threshold, so only require this after bulk loads.
+
+    Args:
+        collection_name: Name of the collection
+        timeout: Maximum seconds to wait (capped by the tool call's deadline)
+        require_indexed: Also wait until every vector is in an HNSW index
+        initial_delay: First poll interval in seconds
+        max_delay: Maximum poll interval in seconds
+        settle_polls: Consecutive ready polls required
+
+    Returns:
+        Final progress, with the number of polls and seconds waited
+
+    Raises:
+        CollectionNotReadyError: If the collection is red or the optimizer fails
+        DeadlineExceeded: If the collection is not ready in time
+    """
+    started = time.monotonic()
+    wait_until = None if timeout is None else started + timeout
+    left = deadline.remaining()
+    if left is not None:
+        # Keep enough of the call's budget to return the final state
+        call_end = started + left - 1.0
+        wait_until = call_end if wait_until is None else min(wait_until, call_end)
+
+    delay = initial_delay
+    samples: list[tuple[float, int]] = []
+    ready_polls = 0
+    polls = 0
+    while True:
+        info = (await get_collection(client, collection_name)).get("result", {})
+        polls += 1
+        now = time.monotonic()
+        progress = collection_progress(info)
+        samples.append((now, progress["indexed_vectors_count"]))
+        progress["eta_seconds"] = _eta(
+            samples, progress["expected_indexed_vectors"] - progress["indexed_vectors_count"]
+        )
+        progress.update(polls=polls, waited_seconds=round(now - started, 3))
+        report_progress(progress["indexed_vectors_count"], progress["expected_indexed_vectors"])
+
+        if progress["status"] == "red" or progress["optimizer_status"] != "ok":
+            raise CollectionNotReadyError(f"Collection {collection_name} failed: {progress}")
+        indexed = progress["indexed_vectors_count"] >= progress["expected_indexed_vectors"]
+        if progress["status"] == "green" and (indexed or not require_indexed):
+            ready_polls += 1
+            if ready_polls >= settle_polls:
+                return {"collection_name": collection_name, "ready": True, **progress}
+        else:
+            ready_polls = 0
+
+        if wait_until is not None and now + delay > wait_until:
+            raise DeadlineExceeded(
+                f"Collection {collection_name} not ready after {now - started:.1f}s: {progress}"
+            )
+        await asyncio.sleep(delay)
+        # Recheck quickly to confirm readiness; otherwise back off
+        delay = initial_delay if ready_polls else min(delay * 2, max_delay)
+
+
+def register_readiness_tools(
+    server: Server, client: QdrantDatabaseClient, tools_list: list
+) -> None:
+    """Register collection readiness tools with MCP server.
+
+    Args:
+        server: MCP server instance
+        client: Qdrant database client
+        tools_list: List to append tool definitions to
+    """
+    from mcp.types import Tool
+
+    # Define tools
+    tools_list.extend(
+        [
+            Tool(
+                name="qdrant_db_collections_wait_ready",
+                description=(
+                    "Wait until a collection is green (optimizations done), optionally until "
+                    "all vectors are indexed, reporting indexing progress and an ETA"
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "collection_name": {"type": "string"},
+                        "timeout": {"type": "number"},
+                        "require_indexed": {"type": "boolean", "default": False},
+                        "initial_delay": {"type": "number", "default": 0.5},
+                        "max_delay": {"type": "number", "default": 10.0},
+                    },
+                    "required": ["collection_name"],
+                },
+            ),
+        ]
+    )
+
+    @server.call_tool()
+    async def qdrant_db_collections_wait_ready(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Wait until a collection is green.
+
+        Args:
+            collection_name: Name of the collection
+            timeout: Maximum seconds to wait (optional, default: the call's deadline)
+            require_indexed: Also wait until all vectors are indexed (default: false)
+            initial_delay: First poll interval in seconds (default: 0.5)
+            max_delay: Maximum poll interval in seconds (default: 10)
+        """
+        result = await wait_for_green(
+            client,
+            arguments["collection_name"],
+            timeout=arguments.get("timeout"),
+            require_indexed=arguments.get("require_indexed", False),
+            initial_delay=arguments.get("initial_delay", 0.5),
+            max_delay=arguments.get("max_delay", 10.0),
+        )
+        return [{"type": "text", "text": str(result)}]
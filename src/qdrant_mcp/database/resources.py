@@ -0,0 +1,275 @@
+"""Vectors and large payload fields as lazily read MCP resources for Qdrant Database API."""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+from urllib.parse import quote, unquote, urlsplit
+
+from mcp.server import Server
+
+from .client import QdrantDatabaseClient, _collection_from_path
+from .collections import VectorSizeCache
+from .limiter import is_read_request
+
+SCHEME = "qdrant"
+
+
+def vector_uri(collection_name: str, point_id: Any, vector_name: str = "") -> str:
+    """URI of a point's vector (the unnamed vector if vector_name is empty)."""
+    uri = f"{SCHEME}://{quote(collection_name, safe='')}/{quote(str(point_id), safe='')}/vector"
+    return f"{uri}/{quote(vector_name, safe='')}" if vector_name else uri
+
+
+def payload_uri(collection_name: str, point_id: Any, field: str) -> str:
+    """URI of one top-level payload field of a point."""
+    return (
+        f"{SCHEME}://{quote(collection_name, safe='')}/{quote(str(point_id), safe='')}"
+        f"/payload/{quote(field, safe='')}"
+    )
+
+
+def parse_uri(uri: str) -> tuple[str, Any, str, str]:
+    """Split a point resource URI into collection, point ID, kind and name.
+
+    Returns:
+        (collection_name, point_id, "vector" or "payload", vector name or field)
+
+    Raises:
+        ValueError: If the URI is not a point resource URI
+    """
+    parts = urlsplit(uri)
+    segments = [unquote(s) for s in parts.path.lstrip("/").split("/")]
+    if (
+        parts.scheme != SCHEME
+        or not parts.netloc
+        or len(segments) not in (2, 3)
+        or segments[1] not in ("vector", "payload")
+        or (segments[1] == "payload" and len(segments) != 3)
+    ):
+        raise ValueError(f"Not a Qdrant point resource URI: {uri}")
+    point_id: Any = segments[0]
+    if point_id.isdigit():
+        point_id = int(point_id)
+    return unquote(parts.netloc), point_id, segments[1], segments[2] if len(segments) == 3 else ""
+
+
+def _points_of(response: dict[str, Any]) -> list[dict[str, Any]]:
+    """Points of a search/recommend/retrieve (list), scroll or single point response."""
+    result = response.get("result")
+    if isinstance(result, dict):
+        return result.get("points", [result] if "id" in result else [])
+    return result if isinstance(result, list) else []
+
+
+class PointResources:
+    """Replaces vectors and large payload fields in results with resource URIs.
+
+    Values already fetched are cached (least recently used evicted) so that
+    reading their URI needs no request; vectors that were never fetched are
+    retrieved from Qdrant when their URI is read. Cached values of a
+    collection are dropped after writes to it made through the client (see
+    observe).
+    """
+
+    def __init__(
+        self,
+        client: QdrantDatabaseClient,
+        inline_payload_bytes: int = 4096,
+        max_entries: int = 1024,
+        ttl: float = 300.0,
+        vector_sizes: Optional[VectorSizeCache] = None,
+    ):
+        """Initialize point resources.
+
+        Args:
+            client: Qdrant database client
+            inline_payload_bytes: Payload fields whose JSON is larger are returned as
+                URIs (0 keeps all payload fields inline)
+            max_entries: Maximum number of cached values
+            ttl: Seconds a cached value or collection vector config is used
+            vector_sizes: Vector size cache shared with the upload checks (default:
+                a cache of its own, kept up to date by observe)
+        """
+        self.client = client
+        self.inline_payload_bytes = inline_payload_bytes
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._values: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._owns_sizes = vector_sizes is None
+        self._sizes = vector_sizes or VectorSizeCache(client, ttl=ttl)
+
+    def observe(self, method: str, path: str, body: Any, latency: float) -> None:
+        """Client request observer dropping cached values after writes to a collection."""
+        if self._owns_sizes:
+            self._sizes.observe(method, path, body, latency)
+        if is_read_request(method, path):
+            return
+        collection_name = _collection_from_path(path)
+        if collection_name is not None:
+            self.invalidate(collection_name)
+
+    def invalidate(self, collection_name: str) -> None:
+        """Drop the cached values of a collection."""
+        prefix = f"{SCHEME}://{quote(collection_name, safe='')}/"
+        for uri in [uri for uri in self._values if uri.startswith(prefix)]:
+            del self._values[uri]
+
+    def _store(self, uri: str, value: Any) -> None:
+        self._values[uri] = (time.monotonic(), value)
+        self._values.move_to_end(uri)
+        while len(self._values) > self.max_entries:
+            self._values.popitem(last=False)
+
+    async def vector_sizes(self, collection_name: str) -> dict[str, Optional[int]]:
+        """Vector names of a collection ("" for the unnamed vector) and their sizes."""
+        return await self._sizes.sizes(collection_name)
+
+    def _vector_ref(self, collection_name: str, point_id: Any, name: str, value: Any) -> Any:
+        uri = vector_uri(collection_name, point_id, name)
+        self._store(uri, value)
+        size = len(value) if isinstance(value, list) else len(value.get("indices", []))
+        return {"resource_uri": uri, "size": size}
+
+    async def externalize(
+        self, collection_name: str, response: dict[str, Any], with_vector: Any = False
+    ) -> dict[str, Any]:
+        """Replace vectors and large payload fields of a response's points with URIs.
+
+        Args:
+            collection_name: Name of the collection
+            response: Search, recommend, retrieve, scroll or single point response
+            with_vector: Vectors the caller asked for but which were not fetched
+
+        Returns:
+            The response, modified in place
+        """
+        points = _points_of(response)
+        lazy: dict[str, Optional[int]] = {}
+        if with_vector and any(p.get("vector") is None for p in points):
+            sizes = await self.vector_sizes(collection_name)
+            names = with_vector if isinstance(with_vector, list) else list(sizes)
+            lazy = {name: sizes.get(name) for name in names}
+
+        for point in points:
+            point_id = point.get("id")
+            vector = point.get("vector")
+            if isinstance(vector, dict):
+                point["vector"] = {
+                    name: self._vector_ref(collection_name, point_id, name, value)
+                    for name, value in vector.items()
+                }
+            elif vector is not None:
+                point["vector"] = self._vector_ref(collection_name, point_id, "", vector)
+            elif lazy:
+                refs = {
+                    name: {"resource_uri": vector_uri(collection_name, point_id, name), "size": n}
+                    for name, n in lazy.items()
+                }
+                point["vector"] = refs.pop("") if list(refs) == [""] else refs
+
+            payload = point.get("payload")
+            if self.inline_payload_bytes and isinstance(payload, dict):
+                for field, value in payload.items():
+                    size = len(json.dumps(value, separators=(",", ":")))
+                    if size > self.inline_payload_bytes:
+                        uri = payload_uri(collection_name, point_id, field)
+                        self._store(uri, value)
+                        payload[field] = {"resource_uri": uri, "bytes": size}
+        return response
+
+    async def read(self, uri: str) -> Any:
+        """Get the value of a point resource URI, from the cache or from Qdrant.
+
+        Raises:
+            ValueError: If the URI is invalid or the point, vector or field does not exist
+        """
+        collection_name, point_id, kind, name = parse_uri(uri)
+        if kind == "vector":
+            uri = vector_uri(collection_name, point_id, name)
+        else:
+            uri = payload_uri(collection_name, point_id, name)
+        cached = self._values.get(uri)
+        if cached is not None and time.monotonic() - cached[0] < self.ttl:
+            self._values.move_to_end(uri)
+            return cached[1]
+
+        # Imported here so that serving resources does not load the point tools at startup
+        from .points import get_points
+
+        if kind == "vector":
+            response = await get_points(
+                self.client,
+                collection_name,
+                [point_id],
+                with_payload=False,
+                with_vector=[name] if name else True,
+            )
+        else:
+            response = await get_points(
+                self.client, collection_name, [point_id], with_payload=[name], with_vector=False
+            )
+        points = response.get("result") or []
+        if not points:
+            raise ValueError(f"Point {point_id} not found in {collection_name}")
+        source = points[0].get("vector" if kind == "vector" else "payload") or {}
+        if kind == "vector" and not name:
+            value = source or None
+        else:
+            value = source.get(name) if isinstance(source, dict) else None
+        if value is None:
+            raise ValueError(f"{uri} does not exist")
+        self._store(uri, value)
+        return value
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return cache statistics."""
+        return {"cached_values": len(self._values), "max_entries": self.max_entries}
+
+
+def register_point_resources(server: Server, resources: PointResources) -> None:
+    """Register point resource templates and the resource read handler with MCP server.
+
+    Args:
+        server: MCP server instance
+        resources: Point resources serving the URIs returned by point tools
+    """
+    from mcp.server.lowlevel.helper_types import ReadResourceContents
+    from mcp.types import Resource, ResourceTemplate
+
+    templates = [
+        ResourceTemplate(
+            uriTemplate=f"{SCHEME}://{{collection}}/{{point_id}}/vector",
+            name="point-vector",
+            description="Unnamed vector of a point",
+            mimeType="application/json",
+        ),
+        ResourceTemplate(
+            uriTemplate=f"{SCHEME}://{{collection}}/{{point_id}}/vector/{{vector_name}}",
+            name="point-named-vector",
+            description="Named (dense or sparse) vector of a point",
+            mimeType="application/json",
+        ),
+        ResourceTemplate(
+            uriTemplate=f"{SCHEME}://{{collection}}/{{point_id}}/payload/{{field}}",
+            name="point-payload-field",
+            description="Top-level payload field of a point",
+            mimeType="application/json",
+        ),
+    ]
+
+    @server.list_resources()
+    async def list_resources() -> list[Resource]:
+        """List no concrete resources; point URIs are returned by the point tools."""
+        return []
+
+    @server.list_resource_templates()
+    async def list_resource_templates() -> list[ResourceTemplate]:
+        """List the point resource URI templates."""
+        return templates
+
+    @server.read_resource()
+    async def read_resource(uri: Any) -> list[ReadResourceContents]:
+        """Read a vector or payload field by URI."""
+        value = await resources.read(str(uri))
+        return [ReadResourceContents(content=json.dumps(value), mime_type="application/json")]
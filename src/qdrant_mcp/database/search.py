@@ -1,10 +1,66 @@
 """Vector search tools for Qdrant Database API."""
 
-from typing import Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from mcp.server import Server
 
 from .client import QdrantDatabaseClient
+from .filters import canonical_filter
+from .points import (
+    SHARD_KEY_SELECTOR_SCHEMA,
+    WITH_PAYLOAD_SCHEMA,
+    WITH_VECTOR_SCHEMA,
+    projection,
+    shard_selector,
+)
+
+if TYPE_CHECKING:
+    from .resources import PointResources
+
+# Input schema of per-request search parameters
+SEARCH_PARAMS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "description": "Search parameters trading recall for latency",
+    "properties": {
+        "hnsw_ef": {"type": "integer", "description": "HNSW beam size (higher: better recall)"},
+        "exact": {"type": "boolean", "description": "Full scan instead of HNSW"},
+        "indexed_only": {"type": "boolean", "description": "Skip unindexed segments"},
+        "quantization": {
+            "type": "object",
+            "properties": {
+                "ignore": {"type": "boolean"},
+                "rescore": {"type": "boolean"},
+                "oversampling": {"type": "number"},
+            },
+        },
+    },
+}
+
+# Input schema of one request of a batch search or recommendation
+BATCH_REQUEST_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "params": SEARCH_PARAMS_SCHEMA,
+        "with_payload": WITH_PAYLOAD_SCHEMA,
+        "with_vector": WITH_VECTOR_SCHEMA,
+        "shard_key": SHARD_KEY_SELECTOR_SCHEMA,
+    },
+}
+
+
+def _canonical_requests(searches: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Validate and canonicalize the filter, projection and shard key of each request in a batch."""
+    requests = []
+    for request in searches:
+        filter_ = canonical_filter(request.get("filter"))
+        shard = shard_selector(request.get("shard_key"))
+        request = {k: v for k, v in request.items() if k not in ("filter", "shard_key")}
+        if filter_:
+            request["filter"] = filter_
+        request.update(projection(request.get("with_payload"), request.get("with_vector")))
+        request.update(shard)
+        requests.append(request)
+    return requests
 
 
 async def search_points(
@@ -13,8 +69,10 @@ async def search_points(
     vector: list[float],
     limit: int = 10,
     filter_: dict[str, Any] | None = None,
-    with_payload: bool = True,
-    with_vector: bool = False,
+    with_payload: Any = True,
+    with_vector: Any = False,
+    params: dict[str, Any] | None = None,
+    shard_key: Any = None,
 ) -> dict[str, Any]:
     """Search for similar vectors in a collection.
 
@@ -23,8 +81,10 @@ async def search_points(
         vector: Query vector
         limit: Maximum number of results
         filter_: Optional filter conditions
-        with_payload: Include payload in results
-        with_vector: Include vectors in results
+        with_payload: Payload to return (boolean, field list or include/exclude object)
+        with_vector: Vectors to return (boolean or list of named vectors)
+        params: Optional search parameters (hnsw_ef, exact, indexed_only, quantization)
+        shard_key: Shard key(s) to search in (default: all shards)
 
     Returns:
         Search results with scores
@@ -32,11 +92,14 @@ async def search_points(
     body: dict[str, Any] = {
         "vector": vector,
         "limit": limit,
-        "with_payload": with_payload,
-        "with_vector": with_vector,
+        **projection(with_payload, with_vector),
+        **shard_selector(shard_key),
     }
+    filter_ = canonical_filter(filter_)
     if filter_:
         body["filter"] = filter_
+    if params:
+        body["params"] = params
     return await client.post(f"/collections/{collection_name}/points/search", json=body)
 
 
@@ -53,7 +116,8 @@ async def search_batch_points(
         Batch search results
     """
     return await client.post(
-        f"/collections/{collection_name}/points/search/batch", json={"searches": searches}
+        f"/collections/{collection_name}/points/search/batch",
+        json={"searches": _canonical_requests(searches)},
     )
 
 
@@ -64,6 +128,10 @@ async def recommend_points(
     negative: list[Any] | None = None,
     limit: int = 10,
     filter_: dict[str, Any] | None = None,
+    params: dict[str, Any] | None = None,
+    with_payload: Any = None,
+    with_vector: Any = None,
+    shard_key: Any = None,
 ) -> dict[str, Any]:
     """Get recommendations based on positive and negative examples.
 
@@ -73,15 +141,27 @@ async def recommend_points(
         negative: List of negative example point IDs
         limit: Maximum number of results
         filter_: Optional filter conditions
+        params: Optional search parameters (hnsw_ef, exact, indexed_only, quantization)
+        with_payload: Payload to return (default: none)
+        with_vector: Vectors to return (default: none)
+        shard_key: Shard key(s) to recommend from (default: all shards)
 
     Returns:
         Recommended points
     """
-    body: dict[str, Any] = {"positive": positive, "limit": limit}
+    body: dict[str, Any] = {
+        "positive": positive,
+        "limit": limit,
+        **projection(with_payload, with_vector),
+        **shard_selector(shard_key),
+    }
     if negative:
         body["negative"] = negative
+    filter_ = canonical_filter(filter_)
     if filter_:
         body["filter"] = filter_
+    if params:
+        body["params"] = params
     return await client.post(f"/collections/{collection_name}/points/recommend", json=body)
 
 
@@ -98,17 +178,25 @@ async def recommend_batch_points(
         Batch recommendation results
     """
     return await client.post(
-        f"/collections/{collection_name}/points/recommend/batch", json={"searches": searches}
+        f"/collections/{collection_name}/points/recommend/batch",
+        json={"searches": _canonical_requests(searches)},
     )
 
 
-def register_search_tools(server: Server, client: QdrantDatabaseClient, tools_list: list) -> None:
+def register_search_tools(
+    server: Server,
+    client: QdrantDatabaseClient,
+    tools_list: list,
+    resources: Optional["PointResources"] = None,
+) -> None:
     """Register vector search tools with MCP server.
 
     Args:
         server: MCP server instance
         client: Qdrant database client
         tools_list: List to append tool definitions to
+        resources: Optional resources replacing vectors and large payload fields in
+            search and recommend results with URIs
     """
     from mcp.types import Tool
 
@@ -124,8 +212,15 @@ def register_search_tools(server: Server, client: QdrantDatabaseClient, tools_li
                     "vector": {"type": "array", "items": {"type": "number"}},
                     "limit": {"type": "integer", "default": 10},
                     "filter": {"type": "object"},
-                    "with_payload": {"type": "boolean", "default": True},
-                    "with_vector": {"type": "boolean", "default": False},
+                    "with_payload": {**WITH_PAYLOAD_SCHEMA, "default": True},
+                    "with_vector": {**WITH_VECTOR_SCHEMA, "default": False},
+                    "params": SEARCH_PARAMS_SCHEMA,
+                    "shard_key": SHARD_KEY_SELECTOR_SCHEMA,
+                    "inline": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "Return vectors and large payload fields, not URIs",
+                    },
                 },
                 "required": ["collection_name", "vector"],
             },
@@ -137,7 +232,7 @@ def register_search_tools(server: Server, client: QdrantDatabaseClient, tools_li
                 "type": "object",
                 "properties": {
                     "collection_name": {"type": "string"},
-                    "searches": {"type": "array", "items": {"type": "object"}},
+                    "searches": {"type": "array", "items": BATCH_REQUEST_SCHEMA},
                 },
                 "required": ["collection_name", "searches"],
             },
@@ -153,6 +248,15 @@ def register_search_tools(server: Server, client: QdrantDatabaseClient, tools_li
                     "negative": {"type": "array"},
                     "limit": {"type": "integer", "default": 10},
                     "filter": {"type": "object"},
+                    "params": SEARCH_PARAMS_SCHEMA,
+                    "with_payload": {**WITH_PAYLOAD_SCHEMA, "default": False},
+                    "with_vector": {**WITH_VECTOR_SCHEMA, "default": False},
+                    "shard_key": SHARD_KEY_SELECTOR_SCHEMA,
+                    "inline": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "Return vectors and large payload fields, not URIs",
+                    },
                 },
                 "required": ["collection_name", "positive"],
             },
@@ -164,7 +268,7 @@ def register_search_tools(server: Server, client: QdrantDatabaseClient, tools_li
                 "type": "object",
                 "properties": {
                     "collection_name": {"type": "string"},
-                    "searches": {"type": "array", "items": {"type": "object"}},
+                    "searches": {"type": "array", "items": BATCH_REQUEST_SCHEMA},
                 },
                 "required": ["collection_name", "searches"],
             },
@@ -180,9 +284,15 @@ def register_search_tools(server: Server, client: QdrantDatabaseClient, tools_li
             vector: Query vector (list of floats)
             limit: Maximum number of results (default: 10)
             filter: Optional filter conditions
-            with_payload: Include payload in results (default: true)
-            with_vector: Include vectors in results (default: false)
+            with_payload: Payload to return, e.g. ["title"] or {"exclude": ["body"]}
+                (default: true)
+            with_vector: Vectors to return, e.g. ["image"] (default: false)
+            params: Search parameters, e.g. {"hnsw_ef": 128} (optional)
+            shard_key: Shard key(s) to search in (default: all shards)
+            inline: Return vectors and large payload fields inline (default: false)
         """
+        linked = resources is not None and not arguments.get("inline", False)
+        with_vector = arguments.get("with_vector", False)
         result = await search_points(
             client,
             arguments["collection_name"],
@@ -190,9 +300,13 @@ def register_search_tools(server: Server, client: QdrantDatabaseClient, tools_li
             arguments.get("limit", 10),
             arguments.get("filter"),
             arguments.get("with_payload", True),
-            arguments.get("with_vector", False),
+            False if linked else with_vector,
+            arguments.get("params"),
+            arguments.get("shard_key"),
         )
-        return [{"type": "text", "text": str(result)}]
+        if linked and resources is not None:
+            await resources.externalize(arguments["collection_name"], result, with_vector)
+        return [{"type": "text", "text": await client.codec.render(result)}]
 
     @server.call_tool()
     async def qdrant_db_points_search_batch(arguments: dict[str, Any]) -> list[dict[str, Any]]:
@@ -200,12 +314,12 @@ def register_search_tools(server: Server, client: QdrantDatabaseClient, tools_li
 
         Args:
             collection_name: Name of the collection
-            searches: List of search queries
+            searches: List of search queries, each with an optional shard_key
         """
         result = await search_batch_points(
             client, arguments["collection_name"], arguments["searches"]
         )
-        return [{"type": "text", "text": str(result)}]
+        return [{"type": "text", "text": await client.codec.render(result)}]
 
     @server.call_tool()
     async def qdrant_db_points_recommend(arguments: dict[str, Any]) -> list[dict[str, Any]]:
@@ -217,7 +331,14 @@ def register_search_tools(server: Server, client: QdrantDatabaseClient, tools_li
             negative: List of negative example point IDs (optional)
             limit: Maximum number of results (default: 10)
             filter: Optional filter conditions
+            params: Search parameters, e.g. {"hnsw_ef": 128} (optional)
+            with_payload: Payload to return, e.g. ["title"] (default: false)
+            with_vector: Vectors to return, e.g. ["image"] (default: false)
+            shard_key: Shard key(s) to recommend from (default: all shards)
+            inline: Return vectors and large payload fields inline (default: false)
         """
+        linked = resources is not None and not arguments.get("inline", False)
+        with_vector = arguments.get("with_vector")
         result = await recommend_points(
             client,
             arguments["collection_name"],
@@ -225,8 +346,14 @@ def register_search_tools(server: Server, client: QdrantDatabaseClient, tools_li
             arguments.get("negative"),
             arguments.get("limit", 10),
             arguments.get("filter"),
+            arguments.get("params"),
+            arguments.get("with_payload"),
+            None if linked else with_vector,
+            arguments.get("shard_key"),
         )
-        return [{"type": "text", "text": str(result)}]
+        if linked and resources is not None:
+            await resources.externalize(arguments["collection_name"], result, with_vector)
+        return [{"type": "text", "text": await client.codec.render(result)}]
 
     @server.call_tool()
     async def qdrant_db_points_recommend_batch(arguments: dict[str, Any]) -> list[dict[str, Any]]:
@@ -234,9 +361,9 @@ def register_search_tools(server: Server, client: QdrantDatabaseClient, tools_li
 
         Args:
             collection_name: Name of the collection
-            searches: List of recommendation queries
+            searches: List of recommendation queries, each with an optional shard_key
         """
         result = await recommend_batch_points(
             client, arguments["collection_name"], arguments["searches"]
         )
-        return [{"type": "text", "text": str(result)}]
+        return [{"type": "text", "text": await client.codec.render(result)}]
@@ -0,0 +1,427 @@
+"""Collection snapshots streamed to and from local files for Qdrant Database API.
+
+Snapshot files can be tens of GB, so they never pass through memory: a download
+is written to disk chunk by chunk while its SHA-256 checksum is computed, and a
+restore streams the file as the body of a multipart upload. File reads, writes
+and hashing run in worker threads, off the event loop.
+"""
+
+import asyncio
+import hashlib
+import os
+import uuid
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any, BinaryIO, Optional
+from urllib.parse import quote
+
+from mcp.server import Server
+
+from ..jobs import report_progress
+from ..paths import resolve_path
+from .client import QdrantDatabaseClient
+
+if TYPE_CHECKING:
+    from .delta import ContentHashIndex
+
+# Bytes read from or written to a snapshot file at a time
+CHUNK_SIZE = 1 << 20
+# Suffix of a download in progress, resumed by the next download to the same path
+PARTIAL_SUFFIX = ".part"
+SNAPSHOT_PRIORITIES = ["replica", "snapshot", "no_sync"]
+
+
+class SnapshotChecksumError(ValueError):
+    """Raised when a downloaded snapshot does not match its checksum."""
+
+
+def _snapshots_path(collection_name: str, snapshot_name: Optional[str] = None) -> str:
+    path = f"/collections/{collection_name}/snapshots"
+    return path if snapshot_name is None else f"{path}/{quote(snapshot_name, safe='')}"
+
+
+async def create_snapshot(client: QdrantDatabaseClient, collection_name: str) -> dict[str, Any]:
+    """Create a snapshot of a collection, waiting until it is written.
+
+    Args:
+        collection_name: Name of the collection
+
+    Returns:
+        Snapshot name, creation time, size and SHA-256 checksum
+    """
+    return await client.post(_snapshots_path(collection_name), params={"wait": "true"})
+
+
+async def list_snapshots(client: QdrantDatabaseClient, collection_name: str) -> dict[str, Any]:
+    """List the snapshots of a collection.
+
+    Args:
+        collection_name: Name of the collection
+
+    Returns:
+        Name, creation time, size and SHA-256 checksum of each snapshot
+    """
+    return await client.get(_snapshots_path(collection_name))
+
+
+async def delete_snapshot(
+    client: QdrantDatabaseClient, collection_name: str, snapshot_name: str
+) -> dict[str, Any]:
+    """Delete a snapshot of a collection.
+
+    Args:
+        collection_name: Name of the collection
+        snapshot_name: Name of the snapshot
+
+    Returns:
+        Deletion result
+    """
+    return await client.delete(
+        _snapshots_path(collection_name, snapshot_name), params={"wait": "true"}
+    )
+
+
+def _hash_file(path: str, hasher: Any, chunk_size: int = CHUNK_SIZE) -> int:
+    """Feed a file to a hasher in chunks; returns its size."""
+    size = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            hasher.update(chunk)
+            size += len(chunk)
+    return size
+
+
+def _write_chunk(f: BinaryIO, hasher: Any, chunk: bytes) -> None:
+    f.write(chunk)
+    hasher.update(chunk)
+
+
+async def download_snapshot(
+    client: QdrantDatabaseClient,
+    collection_name: str,
+    snapshot_name: str,
+    path: str,
+    checksum: Optional[str] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> dict[str, Any]:
+    """Download a snapshot to a local file, verifying its checksum.
+
+    The file is written to ``path + ".part"`` and renamed once complete and
+    verified. A partial file left by an interrupted download is resumed with
+    a Range request (its bytes are hashed again first), or not requested at
+    all if it is already complete; if the server ignores the range, the
+    download restarts from the beginning. A file failing the checksum is
+    deleted.
+
+    Args:
+        collection_name: Name of the collection
+        snapshot_name: Name of the snapshot
+        path: Local file to write
+        checksum: Expected SHA-256 checksum (default: from the snapshot list)
+        chunk_size: Bytes written at a time
+
+    Returns:
+        Path, size, checksum and the number of bytes resumed from a partial file
+
+    Raises:
+        SnapshotChecksumError: If the downloaded file does not match the checksum
+        ValueError: If the snapshot does not exist
+    """
+    # The size is needed even with a checksum, to tell a complete partial file
+    # from one to resume (a Range request past the end fails with 416)
+    listed = (await list_snapshots(client, collection_name)).get("result", [])
+    snapshot = next((s for s in listed if s.get("name") == snapshot_name), None)
+    if snapshot is None:
+        raise ValueError(f"Snapshot {snapshot_name} of {collection_name} not found")
+    size: Optional[int] = snapshot.get("size")
+    checksum = checksum or snapshot.get("checksum")
+
+    path = os.path.expanduser(path)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    partial = path + PARTIAL_SUFFIX
+    hasher = hashlib.sha256()
+    offset = 0
+    if os.path.exists(partial):
+        offset = await asyncio.to_thread(_hash_file, partial, hasher, chunk_size)
+        if size is not None and offset > size:
+            hasher, offset = hashlib.sha256(), 0
+    resumed = offset
+
+    if size is None or offset < size:
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        response = await client.request(
+            "GET", _snapshots_path(collection_name, snapshot_name), stream=True, headers=headers
+        )
+        try:
+            if offset and response.status_code != 206:
+                hasher, offset, resumed = hashlib.sha256(), 0, 0
+            with open(partial, "ab" if offset else "wb") as f:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    await asyncio.to_thread(_write_chunk, f, hasher, chunk)
+                    offset += len(chunk)
+                    report_progress(offset, size)
+        finally:
+            await response.aclose()
+
+    digest = hasher.hexdigest()
+    if checksum and digest != checksum:
+        os.remove(partial)
+        raise SnapshotChecksumError(
+            f"Snapshot {snapshot_name} checksum {digest} does not match {checksum}; "
+            "the partial file was deleted"
+        )
+    os.replace(partial, path)
+    return {"path": path, "size": offset, "checksum": digest, "resumed_bytes": resumed}
+
+
+async def _multipart_body(
+    path: str, head: bytes, tail: bytes, size: int, chunk_size: int
+) -> AsyncIterator[bytes]:
+    yield head
+    sent = 0
+    with open(path, "rb") as f:
+        while chunk := await asyncio.to_thread(f.read, chunk_size):
+            sent += len(chunk)
+            report_progress(sent, size)
+            yield chunk
+    yield tail
+
+
+async def upload_snapshot(
+    client: QdrantDatabaseClient,
+    collection_name: str,
+    path: str,
+    priority: Optional[str] = None,
+    checksum: Optional[str] = None,
+    verify: bool = True,
+    chunk_size: int = CHUNK_SIZE,
+) -> dict[str, Any]:
+    """Restore a collection from a local snapshot file, streamed as a multipart upload.
+
+    The collection is created if it does not exist. With ``verify``, Qdrant
+    rejects the upload unless it matches the checksum, which is computed from
+    the file (one extra read) when not given.
+
+    Args:
+        collection_name: Name of the collection to restore
+        path: Local snapshot file
+        priority: Source of truth on conflicts: replica, snapshot or no_sync
+            (default: Qdrant's)
+        checksum: SHA-256 checksum of the file
+        verify: Have Qdrant verify the checksum
+        chunk_size: Bytes read at a time
+
+    Returns:
+        Restore result
+    """
+    path = os.path.expanduser(path)
+    size = os.path.getsize(path)
+    params = {"wait": "true"}
+    if priority is not None:
+        params["priority"] = priority
+    if verify:
+        if checksum is None:
+            hasher = hashlib.sha256()
+            await asyncio.to_thread(_hash_file, path, hasher, chunk_size)
+            checksum = hasher.hexdigest()
+        params["checksum"] = checksum
+
+    boundary = uuid.uuid4().hex
+    filename = os.path.basename(path).replace('"', "")
+    head = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="snapshot"; filename="{filename}"\r\n'
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode()
+    tail = f"\r\n--{boundary}--\r\n".encode()
+    response = await client.request(
+        "POST",
+        f"{_snapshots_path(collection_name)}/upload",
+        params=params,
+        content=_multipart_body(path, head, tail, size, chunk_size),
+        headers={
+            "Content-Type": f"multipart/form-data; boundary={boundary}",
+            "Content-Length": str(len(head) + size + len(tail)),
+        },
+    )
+    return await client.codec.decode(response.content)
+
+
+def register_snapshot_tools(
+    server: Server,
+    client: QdrantDatabaseClient,
+    tools_list: list,
+    snapshot_dir: str = "~/.cache/qdrant-fabric/snapshots",
+    delta_index: Optional["ContentHashIndex"] = None,
+) -> None:
+    """Register snapshot tools with MCP server.
+
+    Args:
+        server: MCP server instance
+        client: Qdrant database client
+        tools_list: List to append tool definitions to
+        snapshot_dir: Directory of downloaded and uploaded snapshot files
+        delta_index: Optional content hash index (dropped when a collection is restored)
+    """
+    from mcp.types import Tool
+
+    # Define tools
+    tools_list.extend(
+        [
+            Tool(
+                name="qdrant_db_snapshots_create",
+                description="Create a snapshot of a collection",
+                inputSchema={
+                    "type": "object",
+                    "properties": {"collection_name": {"type": "string"}},
+                    "required": ["collection_name"],
+                },
+            ),
+            Tool(
+                name="qdrant_db_snapshots_list",
+                description="List the snapshots of a collection with their sizes and checksums",
+                inputSchema={
+                    "type": "object",
+                    "properties": {"collection_name": {"type": "string"}},
+                    "required": ["collection_name"],
+                },
+            ),
+            Tool(
+                name="qdrant_db_snapshots_delete",
+                description="Delete a snapshot of a collection",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "collection_name": {"type": "string"},
+                        "snapshot_name": {"type": "string"},
+                    },
+                    "required": ["collection_name", "snapshot_name"],
+                },
+            ),
+            Tool(
+                name="qdrant_db_snapshots_download",
+                description=(
+                    "Stream a snapshot to a local file, verifying its checksum and resuming "
+                    "an interrupted download"
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "collection_name": {"type": "string"},
+                        "snapshot_name": {"type": "string"},
+                        "path": {
+                            "type": "string",
+                            "description": (
+                                "Local file in the snapshot directory "
+                                "(default: {collection}/{name})"
+                            ),
+                        },
+                        "checksum": {"type": "string", "description": "Expected SHA-256 checksum"},
+                    },
+                    "required": ["collection_name", "snapshot_name"],
+                },
+            ),
+            Tool(
+                name="qdrant_db_snapshots_upload",
+                description=(
+                    "Restore a collection from a local snapshot file, streamed as a "
+                    "multipart upload"
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "collection_name": {"type": "string"},
+                        "path": {
+                            "type": "string",
+                            "description": "Local file in the snapshot directory",
+                        },
+                        "priority": {"type": "string", "enum": SNAPSHOT_PRIORITIES},
+                        "checksum": {
+                            "type": "string",
+                            "description": "SHA-256 checksum of the file",
+                        },
+                        "verify": {"type": "boolean", "default": True},
+                    },
+                    "required": ["collection_name", "path"],
+                },
+            ),
+        ]
+    )
+
+    @server.call_tool()
+    async def qdrant_db_snapshots_create(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Create a snapshot of a collection.
+
+        Args:
+            collection_name: Name of the collection
+        """
+        result = await create_snapshot(client, arguments["collection_name"])
+        return [{"type": "text", "text": str(result)}]
+
+    @server.call_tool()
+    async def qdrant_db_snapshots_list(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """List the snapshots of a collection.
+
+        Args:
+            collection_name: Name of the collection
+        """
+        result = await list_snapshots(client, arguments["collection_name"])
+        return [{"type": "text", "text": str(result)}]
+
+    @server.call_tool()
+    async def qdrant_db_snapshots_delete(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Delete a snapshot of a collection.
+
+        Args:
+            collection_name: Name of the collection
+            snapshot_name: Name of the snapshot
+        """
+        result = await delete_snapshot(
+            client, arguments["collection_name"], arguments["snapshot_name"]
+        )
+        return [{"type": "text", "text": str(result)}]
+
+    @server.call_tool()
+    async def qdrant_db_snapshots_download(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Stream a snapshot to a local file.
+
+        Args:
+            collection_name: Name of the collection
+            snapshot_name: Name of the snapshot
+            path: Local file under snapshot_dir (default: {collection_name}/{snapshot_name})
+            checksum: Expected SHA-256 checksum (default: from the snapshot list)
+        """
+        collection_name = arguments["collection_name"]
+        snapshot_name = arguments["snapshot_name"]
+        path = resolve_path(
+            snapshot_dir,
+            arguments.get("path") or os.path.join(collection_name, os.path.basename(snapshot_name)),
+        )
+        result = await download_snapshot(
+            client, collection_name, snapshot_name, path, arguments.get("checksum")
+        )
+        return [{"type": "text", "text": str(result)}]
+
+    @server.call_tool()
+    async def qdrant_db_snapshots_upload(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Restore a collection from a local snapshot file.
+
+        Args:
+            collection_name: Name of the collection to restore
+            path: Local snapshot file under snapshot_dir
+            priority: replica, snapshot or no_sync (optional)
+            checksum: SHA-256 checksum of the file (default: computed from it)
+            verify: Have Qdrant verify the checksum (default: true)
+        """
+        collection_name = arguments["collection_name"]
+        path = resolve_path(snapshot_dir, arguments["path"])
+        if delta_index is not None:
+            await delta_index.forget(collection_name)
+        result = await upload_snapshot(
+            client,
+            collection_name,
+            path,
+            arguments.get("priority"),
+            arguments.get("checksum"),
+            arguments.get("verify", True),
+        )
+        return [{"type": "text", "text": str(result)}]
@@ -0,0 +1,273 @@
+"""Search parameter tuning against exact ground truth for Qdrant Database API."""
+
+import random
+import time
+from typing import Any, Optional
+
+import httpx
+from mcp.server import Server
+
+from ..jobs import report_progress
+from .client import QdrantDatabaseClient
+from .filters import canonical_filter
+from .points import get_points, iter_points, projection
+from .search import search_batch_points
+
+DEFAULT_EF_CANDIDATES = [16, 32, 64, 128, 256, 512]
+
+
+def recall_at_k(found: list[Any], truth: list[Any], k: int) -> float:
+    """Fraction of the true top-k IDs among the first k found IDs."""
+    expected = set(truth[:k])
+    if not expected:
+        return 1.0
+    return len(expected & set(found[:k])) / len(expected)
+
+
+def query_vector(point: dict[str, Any], vector_name: Optional[str]) -> Any:
+    """Build a search "vector" from a scrolled point, for an unnamed or named vector."""
+    vector = point.get("vector")
+    if isinstance(vector, dict):
+        name = vector_name or next(iter(vector))
+        return {"name": name, "vector": vector[name]}
+    return vector if vector_name is None else {"name": vector_name, "vector": vector}
+
+
+async def sample_points(
+    client: QdrantDatabaseClient,
+    collection_name: str,
+    sample_size: int,
+    filter_: Optional[dict[str, Any]] = None,
+    with_vector: Any = True,
+) -> list[dict[str, Any]]:
+    """Draw a uniform random sample of points, without payloads.
+
+    Uses the query API's random sampling. Servers without it (before Qdrant
+    1.11) reject the request; the sample is then drawn from all point IDs by
+    reservoir sampling and the sampled points are fetched by ID.
+
+    Args:
+        collection_name: Name of the collection
+        sample_size: Number of points to sample
+        filter_: Optional filter the sampled points must match
+        with_vector: Vectors to return (boolean or list of named vectors)
+
+    Returns:
+        Sampled points, in no particular order
+    """
+    filter_ = canonical_filter(filter_)
+    body: dict[str, Any] = {
+        "query": {"sample": "random"},
+        "limit": sample_size,
+        **projection(False, with_vector),
+    }
+    if filter_:
+        body["filter"] = filter_
+    try:
+        response = await client.post(f"/collections/{collection_name}/points/query", json=body)
+        points: list[dict[str, Any]] = response["result"]["points"]
+        return points
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code not in (400, 404, 422):
+            raise
+
+    ids: list[Any] = []
+    seen = 0
+    async for point in iter_points(client, collection_name, filter_=filter_, with_payload=False):
+        seen += 1
+        if len(ids) < sample_size:
+            ids.append(point["id"])
+        elif (slot := random.randrange(seen)) < sample_size:
+            ids[slot] = point["id"]
+    if not ids:
+        return []
+    response = await get_points(
+        client, collection_name, ids, with_payload=False, with_vector=with_vector
+    )
+    points = response["result"]
+    return points
+
+
+async def search_neighbour_ids(
+    client: QdrantDatabaseClient,
+    collection_name: str,
+    queries: list[tuple[Any, Any]],
+    k: int,
+    params: dict[str, Any],
+    filter_: Optional[dict[str, Any]],
+) -> tuple[list[list[Any]], float]:
+    """Run one batch search for (point ID or None, vector) queries.
+
+    Returns:
+        Top-k IDs per query, excluding the query's own point, and the request time
+    """
+    searches = []
+    for _, vector in queries:
+        search: dict[str, Any] = {
+            "vector": vector,
+            "limit": k + 1,
+            "params": params,
+            "with_payload": False,
+        }
+        if filter_:
+            search["filter"] = filter_
+        searches.append(search)
+    started = time.monotonic()
+    response = await search_batch_points(client, collection_name, searches)
+    elapsed = time.monotonic() - started
+    ids = [
+        [hit["id"] for hit in hits if hit["id"] != point_id][:k]
+        for (point_id, _), hits in zip(queries, response["result"], strict=True)
+    ]
+    return ids, elapsed
+
+
+async def tune_search_params(
+    client: QdrantDatabaseClient,
+    collection_name: str,
+    target_recall: float = 0.95,
+    k: int = 10,
+    sample_size: int = 50,
+    ef_candidates: Optional[list[int]] = None,
+    oversampling_candidates: Optional[list[float]] = None,
+    vector_name: Optional[str] = None,
+    filter_: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    """Find the cheapest search parameters that reach a target recall@k.
+
+    Points sampled at random from the collection are used as queries. Their exact
+    (full scan) neighbours are the ground truth; each query's own point is
+    excluded. Candidates are measured in increasing hnsw_ef order, stopping
+    at the first hnsw_ef for which some oversampling meets the target.
+
+    Args:
+        collection_name: Name of the collection
+        target_recall: Mean recall@k to reach
+        k: Number of neighbours compared
+        sample_size: Number of sampled query points
+        ef_candidates: hnsw_ef values to try (default: 16..512)
+        oversampling_candidates: Quantization oversampling values to try, with
+            rescoring (default: quantization settings left unchanged)
+        vector_name: Named vector to tune (default: the unnamed or first vector)
+        filter_: Optional filter applied to every query
+
+    Returns:
+        Measurements per candidate and the recommended parameters, or None if
+        no candidate met the target
+    """
+    points = await sample_points(
+        client,
+        collection_name,
+        sample_size,
+        filter_=filter_,
+        with_vector=[vector_name] if vector_name else True,
+    )
+    queries = [(p["id"], query_vector(p, vector_name)) for p in points]
+    if not queries:
+        raise ValueError(f"Collection {collection_name} has no points to sample queries from")
+
+    truth, exact_seconds = await search_neighbour_ids(
+        client, collection_name, queries, k, {"exact": True}, filter_
+    )
+    candidates = [
+        {"hnsw_ef": ef, **({"quantization": {"rescore": True, "oversampling": o}} if o else {})}
+        for ef in sorted(ef_candidates or DEFAULT_EF_CANDIDATES)
+        for o in sorted(oversampling_candidates or [0.0])
+    ]
+
+    measured: list[dict[str, Any]] = []
+    recommended: Optional[dict[str, Any]] = None
+    for i, params in enumerate(candidates):
+        if recommended is not None and params["hnsw_ef"] > recommended["params"]["hnsw_ef"]:
+            break
+        found, seconds = await search_neighbour_ids(
+            client, collection_name, queries, k, params, filter_
+        )
+        recall = sum(recall_at_k(f, t, k) for f, t in zip(found, truth, strict=True)) / len(queries)
+        result = {
+            "params": params,
+            f"recall@{k}": round(recall, 4),
+            "latency_ms_per_query": round(1000 * seconds / len(queries), 3),
+        }
+        measured.append(result)
+        report_progress(i + 1, len(candidates))
+        if recall >= target_recall and (
+            recommended is None
+            or result["latency_ms_per_query"] < recommended["latency_ms_per_query"]
+        ):
+            recommended = result
+
+    return {
+        "collection_name": collection_name,
+        "queries": len(queries),
+        "k": k,
+        "target_recall": target_recall,
+        "exact_latency_ms_per_query": round(1000 * exact_seconds / len(queries), 3),
+        "measured": measured,
+        "recommended": recommended,
+    }
+
+
+def register_tuning_tools(server: Server, client: QdrantDatabaseClient, tools_list: list) -> None:
+    """Register search tuning tools with MCP server.
+
+    Args:
+        server: MCP server instance
+        client: Qdrant database client
+        tools_list: List to append tool definitions to
+    """
+    from mcp.types import Tool
+
+    # Define tools
+    tools_list.extend(
+        [
+            Tool(
+                name="qdrant_db_search_tune",
+                description=(
+                    "Recommend the smallest hnsw_ef (and quantization oversampling) reaching a "
+                    "target recall@k, measured against exact search on sampled points"
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "collection_name": {"type": "string"},
+                        "target_recall": {"type": "number", "default": 0.95},
+                        "k": {"type": "integer", "default": 10},
+                        "sample_size": {"type": "integer", "default": 50},
+                        "ef_candidates": {"type": "array", "items": {"type": "integer"}},
+                        "oversampling_candidates": {"type": "array", "items": {"type": "number"}},
+                        "vector_name": {"type": "string"},
+                        "filter": {"type": "object"},
+                    },
+                    "required": ["collection_name"],
+                },
+            ),
+        ]
+    )
+
+    @server.call_tool()
+    async def qdrant_db_search_tune(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Tune search parameters for a target recall.
+
+        Args:
+            collection_name: Name of the collection
+            target_recall: Mean recall@k to reach (default: 0.95)
+            k: Number of neighbours compared (default: 10)
+            sample_size: Number of sampled query points (default: 50)
+            ef_candidates: hnsw_ef values to try (optional)
+            oversampling_candidates: Quantization oversampling values to try (optional)
+            vector_name: Named vector to tune (optional)
+            filter: Filter applied to every query (optional)
+        """
+        result = await tune_search_params(
+            client,
+            arguments["collection_name"],
+            target_recall=arguments.get("target_recall", 0.95),
+            k=arguments.get("k", 10),
+            sample_size=arguments.get("sample_size", 50),
+            ef_candidates=arguments.get("ef_candidates"),
+            oversampling_candidates=arguments.get("oversampling_candidates"),
+            vector_name=arguments.get("vector_name"),
+            filter_=arguments.get("filter"),
+        )
+        return [{"type": "text", "text": str(result)}]
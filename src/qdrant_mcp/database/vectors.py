@@ -1,28 +1,37 @@
 """Vector operations tools for Qdrant Database API."""
 
-from typing import Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from mcp.server import Server
 
 from .client import QdrantDatabaseClient
+from .points import SHARD_KEY_SELECTOR_SCHEMA, shard_selector
+
+if TYPE_CHECKING:
+    from .collections import VectorSizeCache
+    from .delta import ContentHashIndex
+    from .writebuffer import WriteBehindManager
 
 
 async def update_vectors(
     client: QdrantDatabaseClient,
     collection_name: str,
     points: list[dict[str, Any]],
+    shard_key: Any = None,
 ) -> dict[str, Any]:
     """Update vectors for existing points.
 
     Args:
         collection_name: Name of the collection
         points: List of points with id and vector to update
+        shard_key: Shard key(s) the points are in (custom sharding only)
 
     Returns:
         Update operation result
     """
     return await client.put(
-        f"/collections/{collection_name}/points/vectors", json={"points": points}
+        f"/collections/{collection_name}/points/vectors",
+        json={"points": points, **shard_selector(shard_key)},
     )
 
 
@@ -31,6 +40,7 @@ async def delete_vectors(
     collection_name: str,
     points: list[Any],
     vector_names: list[str] | None = None,
+    shard_key: Any = None,
 ) -> dict[str, Any]:
     """Delete vectors from points.
 
@@ -38,40 +48,43 @@ async def delete_vectors(
         collection_name: Name of the collection
         points: List of point IDs to delete vectors from
         vector_names: Optional list of vector names to delete (for named vectors)
+        shard_key: Shard key(s) the points are in (custom sharding only)
 
     Returns:
         Deletion operation result
     """
-    body: dict[str, Any] = {"points": points}
+    body: dict[str, Any] = {"points": points, **shard_selector(shard_key)}
     if vector_names:
         body["vectors"] = vector_names
     return await client.post(f"/collections/{collection_name}/points/vectors/delete", json=body)
 
 
-def register_vector_tools(server: Server, client: QdrantDatabaseClient, tools_list: list) -> None:
+def register_vector_tools(
+    server: Server,
+    client: QdrantDatabaseClient,
+    tools_list: list,
+    write_buffers: Optional["WriteBehindManager"] = None,
+    delta_index: Optional["ContentHashIndex"] = None,
+    vector_sizes: Optional["VectorSizeCache"] = None,
+) -> None:
     """Register vector operation tools with MCP server.
 
     Args:
         server: MCP server instance
         client: Qdrant database client
         tools_list: List to append tool definitions to
+        write_buffers: Optional write-behind buffers for vector updates (writes to a
+            shard key bypass them)
+        delta_index: Optional content hash index (hashes of modified points are dropped)
+        vector_sizes: Optional cache of vector sizes checking updated vectors before sending
     """
     from mcp.types import Tool
 
+    from .arguments import check_vector_sizes, model_tool
+
     # Define tools
     tools_list.extend([
-        Tool(
-            name="qdrant_db_vectors_update",
-            description="Update vectors for existing points",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "collection_name": {"type": "string"},
-                    "points": {"type": "array", "items": {"type": "object"}},
-                },
-                "required": ["collection_name", "points"],
-            },
-        ),
+        model_tool("qdrant_db_vectors_update", "Update vectors for existing points"),
         Tool(
             name="qdrant_db_vectors_delete",
             description="Delete specific named vectors from points",
@@ -81,6 +94,7 @@ def register_vector_tools(server: Server, client: QdrantDatabaseClient, tools_li
                     "collection_name": {"type": "string"},
                     "vector_names": {"type": "array", "items": {"type": "string"}},
                     "points": {"type": "array"},
+                    "shard_key": SHARD_KEY_SELECTOR_SCHEMA,
                 },
                 "required": ["collection_name", "vector_names", "points"],
             },
@@ -94,9 +108,25 @@ def register_vector_tools(server: Server, client: QdrantDatabaseClient, tools_li
         Args:
             collection_name: Name of the collection
             points: List of points with id and vector fields
+            shard_key: Shard key(s) the points are in (custom sharding only)
         """
+        shard_key = arguments.get("shard_key")
+        if vector_sizes is not None:
+            await check_vector_sizes(
+                vector_sizes, arguments["collection_name"], arguments["points"]
+            )
+        if delta_index is not None:
+            await delta_index.forget(
+                arguments["collection_name"], [p["id"] for p in arguments["points"]]
+            )
+        buffer = write_buffers.get(arguments["collection_name"]) if write_buffers else None
+        if buffer is not None and shard_key is None:
+            result = await buffer.add({"update_vectors": {"points": arguments["points"]}})
+            return [{"type": "text", "text": str(result)}]
+        if write_buffers is not None:
+            await write_buffers.barrier(arguments["collection_name"])
         result = await update_vectors(
-            client, arguments["collection_name"], arguments["points"]
+            client, arguments["collection_name"], arguments["points"], shard_key
         )
         return [{"type": "text", "text": str(result)}]
 
@@ -108,11 +138,17 @@ def register_vector_tools(server: Server, client: QdrantDatabaseClient, tools_li
             collection_name: Name of the collection
             points: List of point IDs to delete vectors from
             vector_names: Optional list of vector names (for named vectors)
+            shard_key: Shard key(s) the points are in (custom sharding only)
         """
+        if delta_index is not None:
+            await delta_index.forget(arguments["collection_name"], arguments["points"])
+        if write_buffers is not None:
+            await write_buffers.barrier(arguments["collection_name"])
         result = await delete_vectors(
             client,
             arguments["collection_name"],
             arguments["points"],
             arguments.get("vector_names"),
+            arguments.get("shard_key"),
         )
         return [{"type": "text", "text": str(result)}]
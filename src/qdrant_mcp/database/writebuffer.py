@@ -0,0 +1,423 @@
+"""Write-behind buffering of payload and vector updates for Qdrant Database API."""
+
+import asyncio
+import json
+import logging
+from typing import Any, Optional
+
+from mcp.server import Server
+
+from ..deadline import detached
+from .client import QdrantDatabaseClient
+from .points import batch_update
+
+logger = logging.getLogger(__name__)
+
+
+def _points_key(points: list[Any]) -> tuple[str, ...]:
+    return tuple(sorted({json.dumps(p) for p in points}))
+
+
+def _union(first: list[Any], second: list[Any]) -> list[Any]:
+    seen = {json.dumps(item) for item in first}
+    return first + [item for item in second if json.dumps(item) not in seen]
+
+
+def _count_points(op: dict[str, Any]) -> int:
+    (body,) = op.values()
+    return len(body.get("points", []))
+
+
+def coalesce(pending: list[dict[str, Any]], op: dict[str, Any]) -> None:
+    """Append a batch operation to a pending list, merging it into the last one if possible.
+
+    Only the most recent pending operation is considered, so the relative order
+    of different kinds of operations on the same points is always preserved.
+
+    Args:
+        pending: Pending batch operations (modified in place)
+        op: Operation in /points/batch format, e.g. {"set_payload": {...}}
+    """
+    if not pending or pending[-1].keys() != op.keys():
+        pending.append(op)
+        return
+
+    (kind,) = op.keys()
+    last, new = pending[-1][kind], op[kind]
+
+    if kind == "set_payload":
+        if _points_key(last["points"]) == _points_key(new["points"]):
+            last["payload"] = {**last["payload"], **new["payload"]}
+            return
+        if last["payload"] == new["payload"]:
+            last["points"] = _union(last["points"], new["points"])
+            return
+    elif kind == "delete_payload":
+        if _points_key(last["points"]) == _points_key(new["points"]):
+            last["keys"] = _union(last["keys"], new["keys"])
+            return
+        if sorted(last["keys"]) == sorted(new["keys"]):
+            last["points"] = _union(last["points"], new["points"])
+            return
+    elif kind == "update_vectors":
+        merged: dict[str, dict[str, Any]] = {json.dumps(p["id"]): p for p in last["points"]}
+        for point in new["points"]:
+            key = json.dumps(point["id"])
+            previous = merged.get(key)
+            if (
+                previous is not None
+                and isinstance(previous["vector"], dict)
+                and isinstance(point["vector"], dict)
+            ):
+                # Named vectors: later names override, others are kept
+                merged[key] = {**point, "vector": {**previous["vector"], **point["vector"]}}
+            else:
+                merged[key] = point
+        last["points"] = list(merged.values())
+        return
+
+    pending.append(op)
+
+
+class WriteBehindBuffer:
+    """Buffers updates for one collection and flushes them as a single batch request.
+
+    A flush happens when the buffer reaches ``max_ops`` operations or
+    ``max_points`` point references, ``max_delay`` seconds after the first
+    buffered write, or when flush() is called. Flushes are serialized, so
+    updates reach Qdrant in the order they were buffered. Operations of a
+    failed timed flush are put back in front of the pending ones, and the
+    error is raised by the next call for the collection.
+    """
+
+    def __init__(
+        self,
+        client: QdrantDatabaseClient,
+        collection_name: str,
+        max_ops: int = 100,
+        max_points: int = 1000,
+        max_delay: float = 1.0,
+    ):
+        """Initialize write-behind buffer.
+
+        Args:
+            client: Qdrant database client
+            collection_name: Name of the collection
+            max_ops: Flush once this many (coalesced) operations are pending
+            max_points: Flush once this many point references are pending
+            max_delay: Seconds after the first buffered write before flushing
+        """
+        self.client = client
+        self.collection_name = collection_name
+        self.max_ops = max_ops
+        self.max_points = max_points
+        self.max_delay = max_delay
+
+        self.pending: list[dict[str, Any]] = []
+        self.received = 0
+        self.flushed_ops = 0
+        self.flushes = 0
+        self.last_error: Optional[str] = None
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timed_flush: Optional[asyncio.Task[Any]] = None
+        self._failure: Optional[Exception] = None
+
+    def _pending_points(self) -> int:
+        return sum(_count_points(op) for op in self.pending)
+
+    async def add(self, op: dict[str, Any]) -> dict[str, Any]:
+        """Buffer an operation, flushing if a size threshold is reached.
+
+        Args:
+            op: Operation in /points/batch format
+
+        Returns:
+            Buffering status
+
+        Raises:
+            Exception: The error of a failed timed flush, if not yet reported.
+                The operation is buffered all the same.
+        """
+        coalesce(self.pending, op)
+        self.received += 1
+
+        if len(self.pending) >= self.max_ops or self._pending_points() >= self.max_points:
+            await self.flush()
+            return {"status": "flushed", "collection_name": self.collection_name}
+
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.max_delay, self._on_timer, context=detached()
+            )
+        self._raise_failure()
+        return {
+            "status": "buffered",
+            "collection_name": self.collection_name,
+            "pending_operations": len(self.pending),
+        }
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._timed_flush = asyncio.ensure_future(self._flush_quietly())
+
+    async def _flush_quietly(self) -> None:
+        try:
+            await self.flush(requeue=True)
+        except Exception as e:
+            # Nobody awaits a timed flush: keep the error for the next caller
+            self._failure = e
+            logger.warning("Write-behind flush for %s failed: %r", self.collection_name, e)
+
+    def _raise_failure(self) -> None:
+        failure, self._failure = self._failure, None
+        if failure is not None:
+            raise failure
+
+    async def flush(self, requeue: bool = False) -> Optional[dict[str, Any]]:
+        """Send all pending operations as one /points/batch request.
+
+        Waits for a flush already in flight, so once this returns every write
+        buffered before the call has reached Qdrant.
+
+        Args:
+            requeue: Put the operations back in front of the pending ones if the
+                request fails, instead of dropping them
+
+        Returns:
+            Batch operation result, or None if nothing was pending
+
+        Raises:
+            httpx.HTTPError: If the batch request fails
+            Exception: The error of a failed timed flush, if not yet reported
+        """
+        async with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._raise_failure()
+            ops, self.pending = self.pending, []
+            if not ops:
+                return None
+            try:
+                result = await batch_update(self.client, self.collection_name, ops)
+            except Exception as e:
+                self.last_error = repr(e)
+                if requeue:
+                    self.pending = ops + self.pending
+                raise
+            self.flushes += 1
+            self.flushed_ops += len(ops)
+            return result
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the buffer state as a plain dictionary."""
+        return {
+            "pending_operations": len(self.pending),
+            "pending_points": self._pending_points(),
+            "received": self.received,
+            "flushed_operations": self.flushed_ops,
+            "flushes": self.flushes,
+            "max_ops": self.max_ops,
+            "max_points": self.max_points,
+            "max_delay": self.max_delay,
+            "last_error": self.last_error,
+        }
+
+
+class WriteBehindManager:
+    """Opt-in write-behind buffers, one per collection."""
+
+    def __init__(
+        self,
+        client: QdrantDatabaseClient,
+        max_ops: int = 100,
+        max_points: int = 1000,
+        max_delay: float = 1.0,
+    ):
+        """Initialize write-behind manager.
+
+        Args:
+            client: Qdrant database client
+            max_ops: Default operation threshold for new buffers
+            max_points: Default point threshold for new buffers
+            max_delay: Default flush delay for new buffers
+        """
+        self.client = client
+        self.defaults = {"max_ops": max_ops, "max_points": max_points, "max_delay": max_delay}
+        self._buffers: dict[str, WriteBehindBuffer] = {}
+
+    def get(self, collection_name: str) -> Optional[WriteBehindBuffer]:
+        """Get the buffer for a collection, if write-behind is enabled for it."""
+        return self._buffers.get(collection_name)
+
+    def enable(self, collection_name: str, **options: Any) -> WriteBehindBuffer:
+        """Enable write-behind for a collection, updating thresholds if already enabled."""
+        options = {**self.defaults, **{k: v for k, v in options.items() if v is not None}}
+        buffer = self._buffers.get(collection_name)
+        if buffer is None:
+            buffer = WriteBehindBuffer(self.client, collection_name, **options)
+            self._buffers[collection_name] = buffer
+        else:
+            for name, value in options.items():
+                setattr(buffer, name, value)
+        return buffer
+
+    async def disable(self, collection_name: str) -> Optional[dict[str, Any]]:
+        """Flush and remove the buffer for a collection.
+
+        The buffer is only removed once it is empty; if the flush fails, its
+        writes stay pending and write-behind stays enabled.
+        """
+        buffer = self._buffers.get(collection_name)
+        if buffer is None:
+            return None
+        result = await buffer.flush(requeue=True)
+        while buffer.pending:
+            # Writes buffered while the flush was in flight
+            result = await buffer.flush(requeue=True)
+        del self._buffers[collection_name]
+        return result
+
+    async def barrier(self, collection_name: str) -> None:
+        """Flush pending writes for a collection before an unbuffered write to it.
+
+        Always goes through flush(), which waits for a timed flush in flight even
+        when nothing is pending anymore.
+        """
+        buffer = self._buffers.get(collection_name)
+        if buffer is not None:
+            await buffer.flush()
+
+    async def flush(self, collection_name: Optional[str] = None) -> dict[str, Any]:
+        """Flush one collection's buffer, or all buffers.
+
+        Returns:
+            Batch result per flushed collection
+        """
+        names = [collection_name] if collection_name else list(self._buffers)
+        results: dict[str, Any] = {}
+        for name in names:
+            buffer = self._buffers.get(name)
+            if buffer is not None:
+                results[name] = await buffer.flush()
+        return results
+
+    async def close(self) -> None:
+        """Flush all buffers, logging failures."""
+        for name, buffer in list(self._buffers.items()):
+            try:
+                await buffer.flush()
+            except Exception as e:
+                logger.warning("Write-behind flush for %s failed on shutdown: %r", name, e)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the state of all buffers."""
+        return {name: buffer.snapshot() for name, buffer in sorted(self._buffers.items())}
+
+
+def register_write_buffer_tools(
+    server: Server,
+    client: QdrantDatabaseClient,
+    tools_list: list,
+    write_buffers: WriteBehindManager,
+) -> None:
+    """Register write-behind buffer tools with MCP server.
+
+    Args:
+        server: MCP server instance
+        client: Qdrant database client
+        tools_list: List to append tool definitions to
+        write_buffers: Write-behind buffers shared with the payload and vector tools
+    """
+    from mcp.types import Tool
+
+    # Define tools
+    tools_list.extend(
+        [
+            Tool(
+                name="qdrant_db_write_buffer_enable",
+                description=(
+                    "Enable write-behind buffering of payload set/delete and vector updates "
+                    "for a collection, coalescing them into batch requests"
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "collection_name": {"type": "string"},
+                        "max_ops": {"type": "integer"},
+                        "max_points": {"type": "integer"},
+                        "max_delay": {"type": "number"},
+                    },
+                    "required": ["collection_name"],
+                },
+            ),
+            Tool(
+                name="qdrant_db_write_buffer_disable",
+                description="Flush and disable write-behind buffering for a collection",
+                inputSchema={
+                    "type": "object",
+                    "properties": {"collection_name": {"type": "string"}},
+                    "required": ["collection_name"],
+                },
+            ),
+            Tool(
+                name="qdrant_db_write_buffer_flush",
+                description="Flush buffered writes for a collection (or all collections)",
+                inputSchema={
+                    "type": "object",
+                    "properties": {"collection_name": {"type": "string"}},
+                    "required": [],
+                },
+            ),
+            Tool(
+                name="qdrant_db_write_buffer_status",
+                description="Get pending operations and flush statistics of write-behind buffers",
+                inputSchema={"type": "object", "properties": {}, "required": []},
+            ),
+        ]
+    )
+
+    @server.call_tool()
+    async def qdrant_db_write_buffer_enable(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Enable write-behind buffering for a collection.
+
+        Args:
+            collection_name: Name of the collection
+            max_ops: Flush once this many operations are pending (optional)
+            max_points: Flush once this many point references are pending (optional)
+            max_delay: Seconds after the first buffered write before flushing (optional)
+        """
+        buffer = write_buffers.enable(
+            arguments["collection_name"],
+            max_ops=arguments.get("max_ops"),
+            max_points=arguments.get("max_points"),
+            max_delay=arguments.get("max_delay"),
+        )
+        return [{"type": "text", "text": str(buffer.snapshot())}]
+
+    @server.call_tool()
+    async def qdrant_db_write_buffer_disable(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Flush and disable write-behind buffering for a collection.
+
+        Args:
+            collection_name: Name of the collection
+        """
+        result = await write_buffers.disable(arguments["collection_name"])
+        return [{"type": "text", "text": str(result)}]
+
+    @server.call_tool()
+    async def qdrant_db_write_buffer_flush(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Flush buffered writes.
+
+        Args:
+            collection_name: Name of the collection (optional, default: all)
+        """
+        result = await write_buffers.flush(arguments.get("collection_name"))
+        return [{"type": "text", "text": str(result)}]
+
+    @server.call_tool()
+    async def qdrant_db_write_buffer_status(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Get write-behind buffer state per collection."""
+        result = write_buffers.snapshot()
+        return [{"type": "text", "text": str(result)}]
@@ -0,0 +1,97 @@
+"""Deadline budgets propagated from tool calls to outgoing requests."""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, copy_context
+from typing import Optional
+
+# Absolute time.monotonic() deadline of the current tool call, if any
+_deadline: ContextVar[Optional[float]] = ContextVar("qdrant_mcp_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a tool call runs out of its deadline budget."""
+
+
+def remaining() -> Optional[float]:
+    """Seconds left until the current deadline, or None if there is no deadline."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def check() -> None:
+    """Raise DeadlineExceeded if the current deadline has passed."""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded("Deadline exceeded")
+
+
+def has_time_for(seconds: float) -> bool:
+    """Check whether at least ``seconds`` remain before the current deadline."""
+    left = remaining()
+    return left is None or left >= seconds
+
+
+def detached() -> Context:
+    """Copy the current context without its deadline, for background work.
+
+    Tasks and callbacks inherit the context they are created in, so background
+    work started from a tool call would otherwise share that call's deadline.
+    """
+    context = copy_context()
+    context.run(_deadline.set, None)
+    return context
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[None]:
+    """Set a deadline for the enclosed code, never extending an outer deadline.
+
+    Args:
+        seconds: Budget in seconds, or None to keep the current deadline
+    """
+    if seconds is None:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    outer = _deadline.get()
+    token = _deadline.set(deadline if outer is None else min(outer, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+class DeadlineBudgets:
+    """Default deadline per tool class, with per-tool overrides."""
+
+    def __init__(
+        self,
+        read: float = 30.0,
+        write: float = 120.0,
+        long_running: float = 600.0,
+        overrides: Optional[dict[str, float]] = None,
+    ):
+        """Initialize deadline budgets.
+
+        Args:
+            read: Budget for read-only tools (searches, scrolls, counts, lookups)
+            write: Budget for tools that modify points or payloads
+            long_running: Budget for collection, index and maintenance tools
+            overrides: Budget per tool name, taking precedence over the class default
+        """
+        self.read = read
+        self.write = write
+        self.long_running = long_running
+        self.overrides = overrides or {}
+
+    def for_tool(self, name: str, read_only: bool, long_running: bool) -> float:
+        """Get the budget for a tool call."""
+        if name in self.overrides:
+            return self.overrides[name]
+        if long_running:
+            return self.long_running
+        return self.read if read_only else self.write
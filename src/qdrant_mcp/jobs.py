@@ -0,0 +1,346 @@
+"""Background jobs for long-running tool calls."""
+
+import asyncio
+import itertools
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from mcp.server import Server
+from mcp.types import Tool
+
+from . import deadline
+from .deadline import detached
+
+# Job executing in the current context, if any
+_current_job: ContextVar[Optional["Job"]] = ContextVar("qdrant_mcp_job", default=None)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+_FINISHED = frozenset({SUCCEEDED, FAILED, CANCELLED})
+
+
+class JobNotFoundError(KeyError):
+    """Raised when a job ID is unknown or its record has been dropped."""
+
+
+class Job:
+    """A tool call running in the background."""
+
+    def __init__(self, tool: str, arguments: dict[str, Any]):
+        """Initialize job.
+
+        Args:
+            tool: Tool name
+            arguments: Tool arguments
+        """
+        self.id = uuid.uuid4().hex
+        self.tool = tool
+        self.collection_name = arguments.get("collection_name")
+        self.status = QUEUED
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.done = 0
+        self.total: Optional[int] = None
+        self.operation_ids: list[int] = []
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.task: Optional[asyncio.Task[Any]] = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has succeeded, failed or been cancelled."""
+        return self.status in _FINISHED
+
+    def snapshot(self, with_result: bool = True) -> dict[str, Any]:
+        """Return the job state as a plain dictionary."""
+        state: dict[str, Any] = {
+            "job_id": self.id,
+            "tool": self.tool,
+            "collection_name": self.collection_name,
+            "status": self.status,
+            "progress": {"done": self.done, "total": self.total},
+            "operation_ids": self.operation_ids,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+        }
+        if with_result and self.status == SUCCEEDED:
+            state["result"] = self.result
+        return state
+
+
+def current_job() -> Optional[Job]:
+    """Get the job the current tool call runs as, or None for a foreground call."""
+    return _current_job.get()
+
+
+def report_progress(done: int, total: Optional[int] = None) -> None:
+    """Record progress of the current job; a no-op outside a job."""
+    job = _current_job.get()
+    if job is not None:
+        job.done = done
+        if total is not None:
+            job.total = total
+
+
+def job_started() -> None:
+    """Mark the current job as running; a no-op outside a job.
+
+    Called by the scheduler once the call leaves its queue, so a job waiting
+    for its collection's earlier writes or for an in-flight slot is reported
+    as queued.
+    """
+    job = _current_job.get()
+    if job is not None and job.status == QUEUED:
+        job.status = RUNNING
+        job.started_at = time.time()
+
+
+def record_operation(response: Any) -> None:
+    """Record the Qdrant operation ID of an update response on the current job."""
+    job = _current_job.get()
+    if job is None or not isinstance(response, dict):
+        return
+    operation_id = (response.get("result") or {}).get("operation_id")
+    if operation_id is not None:
+        job.operation_ids.append(operation_id)
+
+
+class JobManager:
+    """Runs tool calls as background jobs and keeps a bounded record of them.
+
+    Finished jobs are kept for ``retention`` seconds, and at most
+    ``max_finished`` of them are kept (oldest dropped first).
+    """
+
+    def __init__(self, max_finished: int = 100, retention: float = 3600.0):
+        """Initialize job manager.
+
+        Args:
+            max_finished: Maximum number of finished jobs to keep
+            retention: Seconds a finished job is kept
+        """
+        self.max_finished = max_finished
+        self.retention = retention
+        self._jobs: dict[str, Job] = {}
+
+    def submit(
+        self, tool: str, arguments: dict[str, Any], run: Callable[[], Awaitable[Any]]
+    ) -> Job:
+        """Start a job.
+
+        The job runs in a context without the submitting call's deadline. It
+        is queued until ``run`` calls ``job_started``, as the scheduler does.
+
+        Args:
+            tool: Tool name
+            arguments: Tool arguments
+            run: Coroutine function performing the tool call
+
+        Returns:
+            The started job
+        """
+        self.prune()
+        job = Job(tool, arguments)
+        context = detached()
+        context.run(_current_job.set, job)
+        job.task = context.run(asyncio.ensure_future, self._run(job, run))
+        self._jobs[job.id] = job
+        return job
+
+    async def _run(self, job: Job, run: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            job.result = await run()
+            job.status = SUCCEEDED
+        except asyncio.CancelledError:
+            job.status = CANCELLED
+        except Exception as e:
+            job.status = FAILED
+            job.error = repr(e)
+        finally:
+            job.finished_at = time.time()
+
+    def get(self, job_id: str) -> Job:
+        """Get a job by ID.
+
+        Raises:
+            JobNotFoundError: If the job is unknown or was dropped
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise JobNotFoundError(f"Unknown job: {job_id}")
+        return job
+
+    async def wait(self, job_id: str, timeout: Optional[float] = None) -> Job:
+        """Wait until a job finishes or the timeout (capped by the deadline) elapses.
+
+        Returns:
+            The job, finished or not
+        """
+        job = self.get(job_id)
+        left = deadline.remaining()
+        if left is not None:
+            # Leave time to return the job state before the call's deadline
+            left = max(0.0, left - 0.5)
+            timeout = left if timeout is None else min(timeout, left)
+        if job.task is not None and not job.finished:
+            await asyncio.wait({job.task}, timeout=timeout)
+        return job
+
+    async def cancel(self, job_id: str) -> Job:
+        """Cancel a job and wait for it to stop."""
+        job = self.get(job_id)
+        if job.task is not None and not job.task.done():
+            job.task.cancel()
+            await asyncio.wait({job.task})
+        if not job.finished:
+            # Cancelled before it started running
+            job.status = CANCELLED
+            job.finished_at = time.time()
+        return job
+
+    def prune(self) -> None:
+        """Drop expired finished jobs and the oldest beyond max_finished."""
+        now = time.time()
+        finished = sorted(
+            (job for job in self._jobs.values() if job.finished),
+            key=lambda job: job.finished_at or 0.0,
+        )
+        expired = [job for job in finished if now - (job.finished_at or now) > self.retention]
+        excess = finished[: max(0, len(finished) - self.max_finished)]
+        for job in itertools.chain(expired, excess):
+            self._jobs.pop(job.id, None)
+
+    def list(self, status: Optional[str] = None) -> list[Job]:
+        """List known jobs, newest first, optionally by status."""
+        self.prune()
+        jobs = sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+        return [job for job in jobs if status is None or job.status == status]
+
+    async def close(self) -> None:
+        """Cancel all running jobs."""
+        tasks = [job.task for job in self._jobs.values() if job.task and not job.task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def add_wait_argument(tools: list[Tool], names: frozenset[str]) -> None:
+    """Add the ``wait`` argument to the input schema of tools that can run as jobs."""
+    for tool in tools:
+        if tool.name in names:
+            tool.inputSchema.setdefault("properties", {})["wait"] = {
+                "type": "boolean",
+                "default": True,
+                "description": "Set to false to run as a background job and return its job_id",
+            }
+
+
+def register_job_tools(server: Server, tools_list: list, jobs: JobManager) -> None:
+    """Register background job tools with MCP server.
+
+    Args:
+        server: MCP server instance
+        tools_list: List to append tool definitions to
+        jobs: Job manager running wait=false tool calls
+    """
+    # Define tools
+    tools_list.extend(
+        [
+            Tool(
+                name="qdrant_job_status",
+                description="Get the status, progress and result of a background job",
+                inputSchema={
+                    "type": "object",
+                    "properties": {"job_id": {"type": "string"}},
+                    "required": ["job_id"],
+                },
+            ),
+            Tool(
+                name="qdrant_job_wait",
+                description="Wait for a background job to finish and return its status",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "job_id": {"type": "string"},
+                        "timeout": {"type": "number"},
+                    },
+                    "required": ["job_id"],
+                },
+            ),
+            Tool(
+                name="qdrant_job_cancel",
+                description="Cancel a background job",
+                inputSchema={
+                    "type": "object",
+                    "properties": {"job_id": {"type": "string"}},
+                    "required": ["job_id"],
+                },
+            ),
+            Tool(
+                name="qdrant_job_list",
+                description="List background jobs, newest first",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "status": {
+                            "type": "string",
+                            "enum": [QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED],
+                        }
+                    },
+                    "required": [],
+                },
+            ),
+        ]
+    )
+
+    @server.call_tool()
+    async def qdrant_job_status(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Get the state of a background job.
+
+        Args:
+            job_id: Job ID returned by a wait=false tool call
+        """
+        result = jobs.get(arguments["job_id"]).snapshot()
+        return [{"type": "text", "text": str(result)}]
+
+    @server.call_tool()
+    async def qdrant_job_wait(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Wait for a background job to finish.
+
+        Args:
+            job_id: Job ID returned by a wait=false tool call
+            timeout: Maximum seconds to wait (optional, default: the call's deadline)
+        """
+        job = await jobs.wait(arguments["job_id"], arguments.get("timeout"))
+        return [{"type": "text", "text": str(job.snapshot())}]
+
+    @server.call_tool()
+    async def qdrant_job_cancel(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Cancel a background job.
+
+        Requests already accepted by Qdrant are not rolled back.
+
+        Args:
+            job_id: Job ID returned by a wait=false tool call
+        """
+        job = await jobs.cancel(arguments["job_id"])
+        return [{"type": "text", "text": str(job.snapshot())}]
+
+    @server.call_tool()
+    async def qdrant_job_list(arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """List background jobs.
+
+        Args:
+            status: Only list jobs with this status (optional)
+        """
+        result = [job.snapshot(with_result=False) for job in jobs.list(arguments.get("status"))]
+        return [{"type": "text", "text": str(result)}]
@@ -0,0 +1,31 @@
+"""Local files named by tool arguments, confined to configured directories."""
+
+import os
+
+
+class PathNotAllowedError(ValueError):
+    """Raised when a tool argument names a file outside its allowed directory."""
+
+
+def resolve_path(base_dir: str, path: str) -> str:
+    """Resolve a file argument of a tool inside a base directory.
+
+    Relative paths are taken relative to ``base_dir``; absolute paths must lie
+    in it. Symbolic links are resolved first, so a link inside the directory
+    cannot lead out of it.
+
+    Args:
+        base_dir: Directory the tool may read or write (``~`` is expanded)
+        path: File named by the tool argument
+
+    Returns:
+        Absolute path of the file
+
+    Raises:
+        PathNotAllowedError: If the file is outside the directory
+    """
+    base = os.path.realpath(os.path.expanduser(base_dir))
+    resolved = os.path.realpath(os.path.join(base, os.path.expanduser(path)))
+    if resolved == base or os.path.commonpath([base, resolved]) != base:
+        raise PathNotAllowedError(f"{path} is not a file in {base_dir}")
+    return resolved
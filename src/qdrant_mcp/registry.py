@@ -0,0 +1,328 @@
+"""Lazily loaded tool modules and the static manifest of their tool schemas.
+
+Startup imports no tool module and builds no Tool object per module: list_tools
+serves the schemas of tool_manifest.json, and a tool module is imported and
+registered on the first call to one of its tools. Regenerate the manifest
+after changing a tool schema with:
+
+    python -m qdrant_mcp.registry
+"""
+
+import functools
+import importlib
+import json
+import os
+from collections.abc import Callable
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Optional
+
+import jsonschema
+from mcp.server import Server
+from mcp.types import Tool
+
+from .config import QdrantConfig
+from .database.client import QdrantDatabaseClient
+from .jobs import JobManager, add_wait_argument, register_job_tools
+from .scheduler import BACKGROUND_TOOLS
+
+MANIFEST_PATH = Path(__file__).with_name("tool_manifest.json")
+
+# Tool modules of the database package in registration order, with their register
+# function and the shared components passed to it after the tools list
+TOOL_MODULES: list[tuple[str, str, tuple[str, ...]]] = [
+    ("collections", "register_collection_tools", ("delta_index",)),
+    (
+        "points",
+        "register_point_tools",
+        ("write_buffers", "delta_index", "count_cache", "resources", "vector_sizes"),
+    ),
+    ("search", "register_search_tools", ("resources",)),
+    ("payload", "register_payload_tools", ("write_buffers", "delta_index")),
+    ("health", "register_health_tools", ()),
+    ("vectors", "register_vector_tools", ("write_buffers", "delta_index", "vector_sizes")),
+    ("index", "register_index_tools", ()),
+    ("writebuffer", "register_write_buffer_tools", ("write_buffers",)),
+    ("delta", "register_delta_tools", ("delta_index",)),
+    ("advisor", "register_advisor_tools", ("advisor",)),
+    ("readiness", "register_readiness_tools", ()),
+    ("bulkload", "register_bulk_load_tools", ("bulk_loads",)),
+    ("tuning", "register_tuning_tools", ()),
+    ("evaluation", "register_evaluation_tools", ("evaluation_dir",)),
+    ("cluster", "register_cluster_tools", ()),
+    ("snapshots", "register_snapshot_tools", ("snapshot_dir", "delta_index")),
+    ("migration", "register_migration_tools", ("migrations", "delta_index")),
+]
+
+
+class DatabaseComponents:
+    """State shared by the tool modules, each part created on first use.
+
+    Parts only needed by tools (write buffers, content hash index, count cache,
+    vector sizes, bulk-load sessions, migrations, point resources) are created when the first module
+    using them is loaded, so their modules are not imported at startup. Parts
+    that must see every request from the start are created by ``start``.
+    """
+
+    def __init__(self, config: QdrantConfig, client: QdrantDatabaseClient):
+        """Initialize components.
+
+        Args:
+            config: Server configuration
+            client: Qdrant database client
+        """
+        self.config = config
+        self.client = client
+
+    def start(self) -> None:
+        """Create the parts that must exist before the first tool call."""
+        self._ensure("advisor")
+        if self.config.write_behind_collections:
+            self._ensure("write_buffers")
+
+    def _ensure(self, *names: str) -> None:
+        """Create parts now instead of on first use."""
+        for name in names:
+            getattr(self, name)
+
+    async def recover(self) -> None:
+        """Restore collection settings left changed by a previous process."""
+        # The bulk-load module is only imported if a previous process left sessions open
+        if os.path.exists(os.path.expanduser(self.config.bulk_load_state_path)):
+            await self.bulk_loads.recover()
+
+    def created(self, name: str) -> Any:
+        """Get a part if it has been created, else None."""
+        return self.__dict__.get(name)
+
+    @cached_property
+    def write_buffers(self) -> Any:
+        from .database.writebuffer import WriteBehindManager
+
+        write_buffers = WriteBehindManager(
+            self.client,
+            max_ops=self.config.write_behind_max_ops,
+            max_points=self.config.write_behind_max_points,
+            max_delay=self.config.write_behind_max_delay,
+        )
+        for collection_name in self.config.write_behind_collections:
+            write_buffers.enable(collection_name)
+        return write_buffers
+
+    @cached_property
+    def delta_index(self) -> Any:
+        from .database.delta import ContentHashIndex
+
+        return ContentHashIndex(self.config.delta_index_path, self.client.base_url)
+
+    @cached_property
+    def advisor(self) -> Any:
+        from .database.advisor import PayloadIndexAdvisor
+
+        advisor = PayloadIndexAdvisor(
+            self.client,
+            auto_create=self.config.index_advisor_auto_create,
+            min_calls=self.config.index_advisor_min_calls,
+            min_avg_latency=self.config.index_advisor_min_avg_latency,
+        )
+        self.client.observers.append(advisor.observe)
+        return advisor
+
+    @cached_property
+    def count_cache(self) -> Any:
+        # Nothing is cached before the point tools are loaded, so writes made
+        # until then need not be observed
+        from .database.counts import CountCache
+
+        count_cache = CountCache(
+            self.client,
+            ttl=self.config.count_cache_ttl,
+            max_entries=self.config.count_cache_max_entries,
+        )
+        self.client.observers.append(count_cache.observe)
+        return count_cache
+
+    @cached_property
+    def vector_sizes(self) -> Any:
+        from .database.collections import VectorSizeCache
+
+        vector_sizes = VectorSizeCache(self.client, ttl=self.config.vector_size_cache_ttl)
+        self.client.observers.append(vector_sizes.observe)
+        return vector_sizes
+
+    @property
+    def snapshot_dir(self) -> str:
+        return os.path.expanduser(self.config.snapshot_dir)
+
+    @property
+    def evaluation_dir(self) -> str:
+        return os.path.expanduser(self.config.evaluation_dir)
+
+    @cached_property
+    def bulk_loads(self) -> Any:
+        from .database.bulkload import BulkLoadManager
+
+        return BulkLoadManager(self.client, self.config.bulk_load_state_path)
+
+    @cached_property
+    def migrations(self) -> Any:
+        from .database.migration import MigrationManager
+
+        return MigrationManager(
+            self.client,
+            self.config.migration_checkpoint_dir,
+            self.config.remote_url,
+            self.config.remote_api_key,
+        )
+
+    @cached_property
+    def resources(self) -> Any:
+        if not self.config.resources_enabled:
+            return None
+        from .database.resources import PointResources
+
+        resources = PointResources(
+            self.client,
+            inline_payload_bytes=self.config.resource_inline_payload_bytes,
+            max_entries=self.config.resource_cache_max_entries,
+            ttl=self.config.resource_cache_ttl,
+            vector_sizes=self.vector_sizes,
+        )
+        self.client.observers.append(resources.observe)
+        return resources
+
+    async def close(self) -> None:
+        """Stop recounts, flush writes, restore bulk-load settings, close clients and the index."""
+        for name in ("count_cache", "write_buffers", "bulk_loads", "migrations"):
+            part = self.created(name)
+            if part is not None:
+                await part.close()
+        delta_index = self.created("delta_index")
+        if delta_index is not None:
+            delta_index.close()
+
+
+def load_tool_module(
+    module: str,
+    server: Server,
+    client: QdrantDatabaseClient,
+    components: DatabaseComponents,
+    tools_list: Optional[list] = None,
+) -> None:
+    """Import a database tool module and register its tool handlers.
+
+    Args:
+        module: Module name in the database package (see TOOL_MODULES)
+        server: MCP server instance
+        client: Qdrant database client
+        components: Shared state passed to the register function
+        tools_list: List to append tool definitions to (default: discarded)
+    """
+    register, parts = next((r, p) for m, r, p in TOOL_MODULES if m == module)
+    register_tools = getattr(importlib.import_module(f".database.{module}", __package__), register)
+    register_tools(
+        server,
+        client,
+        tools_list if tools_list is not None else [],
+        *(getattr(components, part) for part in parts),
+    )
+
+
+class ArgumentValidator:
+    """Validates tool arguments before dispatch, compiling each tool's validator on first use.
+
+    Tools defined by an argument model (see database.arguments) are validated
+    by its precompiled TypeAdapter, others against their manifest input schema
+    by a jsonschema validator built once instead of on every call.
+    """
+
+    def __init__(self, manifest: list[dict[str, Any]]):
+        """Initialize validator.
+
+        Args:
+            manifest: Tool manifest entries
+        """
+        self.schemas = {entry["name"]: entry["inputSchema"] for entry in manifest}
+        self._validators: dict[str, Callable[[dict[str, Any]], None]] = {}
+
+    def __call__(self, name: str, arguments: dict[str, Any]) -> None:
+        """Validate the arguments of a tool call.
+
+        Raises:
+            ValueError: If the arguments are invalid
+        """
+        validate = self._validators.get(name)
+        if validate is None:
+            validate = self._validators[name] = self._compile(name)
+        validate(arguments)
+
+    def _compile(self, name: str) -> Callable[[dict[str, Any]], None]:
+        from .database.arguments import ARGUMENT_MODELS, ArgumentError, validate_arguments
+
+        if name in ARGUMENT_MODELS:
+            return functools.partial(validate_arguments, name)
+        schema = self.schemas.get(name)
+        if schema is None:
+            return lambda arguments: None
+        validator = jsonschema.validators.validator_for(schema)(schema)
+
+        def validate(arguments: dict[str, Any]) -> None:
+            error = jsonschema.exceptions.best_match(validator.iter_errors(arguments))
+            if error is not None:
+                raise ArgumentError(f"Input validation error: {error.message}")
+
+        return validate
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> list[dict[str, Any]]:
+    """Load the tool manifest: name, description, inputSchema and module of each tool."""
+    return json.loads(path.read_text())
+
+
+def manifest_tools(manifest: list[dict[str, Any]]) -> list[Tool]:
+    """Build the Tool objects served by list_tools from manifest entries."""
+    return [
+        Tool(name=entry["name"], description=entry["description"], inputSchema=entry["inputSchema"])
+        for entry in manifest
+    ]
+
+
+def build_manifest() -> list[dict[str, Any]]:
+    """Register every tool module against a throwaway server and collect the schemas.
+
+    Returns:
+        Manifest entries in registration order; job tools have module "jobs"
+    """
+    config = QdrantConfig(url="http://localhost:6333", api_key="manifest", resources_enabled=True)
+    client = QdrantDatabaseClient(base_url=config.url, api_key=config.api_key)  # type: ignore
+    components = DatabaseComponents(config, client)
+    server = Server("qdrant-mcp-manifest")
+    entries: list[tuple[Tool, str]] = []
+    for module, _, _ in TOOL_MODULES:
+        tools: list[Tool] = []
+        load_tool_module(module, server, client, components, tools)
+        entries.extend((tool, module) for tool in tools)
+    tools = []
+    register_job_tools(server, tools, JobManager())
+    entries.extend((tool, "jobs") for tool in tools)
+    add_wait_argument([tool for tool, _ in entries], BACKGROUND_TOOLS)
+    return [
+        {
+            "name": tool.name,
+            "description": tool.description,
+            "inputSchema": tool.inputSchema,
+            "module": module,
+        }
+        for tool, module in entries
+    ]
+
+
+def write_manifest(path: Path = MANIFEST_PATH) -> int:
+    """Regenerate the manifest file; returns the number of tools."""
+    manifest = build_manifest()
+    path.write_text(json.dumps(manifest, indent=2) + "\n")
+    return len(manifest)
+
+
+if __name__ == "__main__":
+    print(f"Wrote {write_manifest()} tools to {MANIFEST_PATH}")
@@ -0,0 +1,275 @@
+"""Ordered, bounded execution of MCP tool calls."""
+
+import asyncio
+import contextlib
+import weakref
+from collections.abc import Awaitable, Callable
+from typing import Any, Optional
+
+from .deadline import DeadlineBudgets, DeadlineExceeded, deadline_scope, remaining
+from .jobs import job_started
+
+ToolHandler = Callable[[dict[str, Any]], Awaitable[Any]]
+
+# Tools that never modify data. Every other tool is treated as a write and
+# ordered per collection, which is always safe.
+READ_ONLY_TOOLS = frozenset(
+    {
+        "qdrant_db_collections_list",
+        "qdrant_db_collections_get",
+        "qdrant_db_collections_exists",
+        "qdrant_db_collections_wait_ready",
+        "qdrant_db_points_get",
+        "qdrant_db_points_get_single",
+        "qdrant_db_points_count",
+        "qdrant_db_points_scroll",
+        "qdrant_db_points_search",
+        "qdrant_db_points_search_batch",
+        "qdrant_db_points_recommend",
+        "qdrant_db_points_recommend_batch",
+        "qdrant_db_search_tune",
+        "qdrant_db_search_evaluate",
+        "qdrant_db_points_delta_status",
+        "qdrant_db_index_advise",
+        "qdrant_db_health_root",
+        "qdrant_db_health_check",
+        "qdrant_db_health_liveness",
+        "qdrant_db_health_readiness",
+        "qdrant_db_health_metrics",
+        "qdrant_db_health_circuit",
+        "qdrant_db_health_concurrency",
+        "qdrant_db_write_buffer_status",
+        "qdrant_db_bulk_load_status",
+        "qdrant_db_cluster_info",
+        "qdrant_db_cluster_collection_info",
+        "qdrant_db_cluster_load",
+        "qdrant_db_snapshots_list",
+        "qdrant_db_snapshots_download",
+        "qdrant_db_collections_migrate_status",
+        "qdrant_job_status",
+        "qdrant_job_wait",
+        "qdrant_job_list",
+    }
+)
+
+# Tools that may legitimately run for minutes and get the long-running deadline
+LONG_RUNNING_TOOLS = frozenset(
+    {
+        "qdrant_db_collections_create",
+        "qdrant_db_collections_delete",
+        "qdrant_db_collections_update",
+        "qdrant_db_collections_wait_ready",
+        "qdrant_db_bulk_load_begin",
+        "qdrant_db_bulk_load_end",
+        "qdrant_db_index_create",
+        "qdrant_db_index_delete",
+        "qdrant_db_index_apply_advice",
+        "qdrant_db_points_delta_reconcile",
+        "qdrant_db_search_tune",
+        "qdrant_db_search_evaluate",
+        "qdrant_db_shard_keys_create",
+        "qdrant_db_shard_keys_delete",
+        "qdrant_db_cluster_rebalance",
+        "qdrant_db_snapshots_create",
+        "qdrant_db_snapshots_delete",
+        "qdrant_db_snapshots_download",
+        "qdrant_db_snapshots_upload",
+        "qdrant_db_collections_migrate",
+        "qdrant_job_wait",
+    }
+)
+
+# Tools whose writes go to a collection named by another argument than
+# collection_name, ordered as writes to that collection
+COLLECTION_ARGUMENTS = {
+    "qdrant_db_collections_migrate": "target_collection",
+}
+
+# Tools that accept wait=false to run as a background job
+BACKGROUND_TOOLS = frozenset(
+    {
+        "qdrant_db_collections_create",
+        "qdrant_db_collections_delete",
+        "qdrant_db_collections_update",
+        "qdrant_db_collections_wait_ready",
+        "qdrant_db_bulk_load_end",
+        "qdrant_db_index_create",
+        "qdrant_db_index_delete",
+        "qdrant_db_index_apply_advice",
+        "qdrant_db_points_upsert",
+        "qdrant_db_points_batch",
+        "qdrant_db_points_delta_reconcile",
+        "qdrant_db_search_tune",
+        "qdrant_db_search_evaluate",
+        "qdrant_db_shard_keys_create",
+        "qdrant_db_shard_keys_delete",
+        "qdrant_db_cluster_rebalance",
+        "qdrant_db_snapshots_create",
+        "qdrant_db_snapshots_delete",
+        "qdrant_db_snapshots_download",
+        "qdrant_db_snapshots_upload",
+        "qdrant_db_collections_migrate",
+    }
+)
+
+
+class _CollectionQueue:
+    """FIFO of writes waiting for one collection."""
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.waiting = 0
+
+
+class SessionLimits:
+    """Per-session caps on the tool calls executing at once.
+
+    With the HTTP transport many MCP sessions share one scheduler; a cap per
+    session keeps one busy agent from taking every in-flight slot. Sessions
+    are tracked weakly and forgotten once closed.
+    """
+
+    def __init__(self, max_in_flight: int = 16):
+        """Initialize session limits.
+
+        Args:
+            max_in_flight: Maximum number of tool calls of one session executing at once
+        """
+        self.max_in_flight = max_in_flight
+        self._slots: weakref.WeakKeyDictionary[Any, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+
+    def for_session(self, session: Any) -> asyncio.Semaphore:
+        """Get the slots of a session."""
+        slots = self._slots.get(session)
+        if slots is None:
+            slots = self._slots[session] = asyncio.Semaphore(self.max_in_flight)
+        return slots
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the number of tracked sessions and the per-session cap."""
+        return {"sessions": len(self._slots), "max_in_flight_per_session": self.max_in_flight}
+
+
+class ToolScheduler:
+    """Runs tool calls with per-collection write ordering and a global in-flight cap.
+
+    Read-only tools run fully concurrently. Writes to different collections run
+    concurrently, while writes to the same collection run one at a time in the
+    order they were submitted. At most ``max_in_flight`` tool calls execute at
+    once; the rest wait.
+
+    Each call gets a deadline budget, counted from submission, that bounds
+    queueing as well as every request the handler makes. A call that runs out
+    of budget, or is cancelled by the MCP client, cancels its in-flight request.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 64,
+        budgets: Optional[DeadlineBudgets] = None,
+        read_only_tools: frozenset[str] = READ_ONLY_TOOLS,
+        long_running_tools: frozenset[str] = LONG_RUNNING_TOOLS,
+    ):
+        """Initialize tool scheduler.
+
+        Args:
+            max_in_flight: Maximum number of tool calls executing at once
+            budgets: Optional deadline budgets per tool class
+            read_only_tools: Names of tools that never modify data
+            long_running_tools: Names of tools that get the long-running budget
+        """
+        self.max_in_flight = max_in_flight
+        self.budgets = budgets
+        self.read_only_tools = read_only_tools
+        self.long_running_tools = long_running_tools
+        self.in_flight = 0
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._queues: dict[str, _CollectionQueue] = {}
+
+    def is_read_only(self, name: str) -> bool:
+        """Check whether a tool only reads data."""
+        return name in self.read_only_tools
+
+    async def _execute(
+        self,
+        handler: ToolHandler,
+        arguments: dict[str, Any],
+        session_slots: Optional[asyncio.Semaphore] = None,
+    ) -> Any:
+        async with session_slots or contextlib.nullcontext(), self._slots:
+            job_started()
+            self.in_flight += 1
+            try:
+                return await handler(arguments)
+            finally:
+                self.in_flight -= 1
+
+    def budget_for(self, name: str) -> Optional[float]:
+        """Get the deadline budget for a tool, if budgets are configured."""
+        if self.budgets is None:
+            return None
+        return self.budgets.for_tool(name, self.is_read_only(name), name in self.long_running_tools)
+
+    async def run(
+        self,
+        name: str,
+        arguments: dict[str, Any],
+        handler: ToolHandler,
+        session_slots: Optional[asyncio.Semaphore] = None,
+    ) -> Any:
+        """Run a tool call under the scheduling rules and its deadline.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+            handler: Tool handler to call with the arguments
+            session_slots: Optional in-flight slots of the calling session
+
+        Returns:
+            Handler result
+
+        Raises:
+            DeadlineExceeded: If the call does not finish within its budget
+        """
+        budget = self.budget_for(name)
+        with deadline_scope(budget):
+            try:
+                return await asyncio.wait_for(
+                    self._schedule(name, arguments, handler, session_slots), remaining()
+                )
+            except asyncio.TimeoutError as e:
+                raise DeadlineExceeded(f"{name} exceeded its {budget}s deadline") from e
+
+    async def _schedule(
+        self,
+        name: str,
+        arguments: dict[str, Any],
+        handler: ToolHandler,
+        session_slots: Optional[asyncio.Semaphore] = None,
+    ) -> Any:
+        collection_name: Optional[str] = arguments.get(
+            COLLECTION_ARGUMENTS.get(name, "collection_name")
+        )
+        if self.is_read_only(name) or not isinstance(collection_name, str):
+            return await self._execute(handler, arguments, session_slots)
+
+        queue = self._queues.get(collection_name)
+        if queue is None:
+            queue = self._queues[collection_name] = _CollectionQueue()
+        queue.waiting += 1
+        try:
+            # asyncio.Lock wakes waiters in FIFO order, preserving submission order
+            async with queue.lock:
+                return await self._execute(handler, arguments, session_slots)
+        finally:
+            queue.waiting -= 1
+            if queue.waiting == 0:
+                del self._queues[collection_name]
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the scheduler state as a plain dictionary."""
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "pending_writes": {name: queue.waiting for name, queue in sorted(self._queues.items())},
+        }
@@ -1,38 +1,151 @@
 """Main MCP server for Qdrant APIs."""
 
 import asyncio
+import functools
 import logging
-from typing import Any
+from collections.abc import Callable, Iterable
+from contextlib import AsyncExitStack
+from typing import Any, Optional
 
 from mcp.server import Server
-from mcp.server.stdio import stdio_server
 from mcp.types import Tool
 
 from .config import QdrantConfig
-from .database import (
-    QdrantDatabaseClient,
-    register_collection_tools,
-    register_health_tools,
-    register_index_tools,
-    register_payload_tools,
-    register_point_tools,
-    register_search_tools,
-    register_vector_tools,
+from .database.breaker import CircuitBreakerRegistry
+from .database.client import QdrantDatabaseClient
+from .database.codec import JSONCodec
+from .database.limiter import AdaptiveLimiter, ConcurrencyLimits
+from .database.resources import register_point_resources
+from .deadline import DeadlineBudgets
+from .jobs import JobManager, register_job_tools
+from .registry import (
+    ArgumentValidator,
+    DatabaseComponents,
+    load_manifest,
+    load_tool_module,
+    manifest_tools,
 )
+from .scheduler import BACKGROUND_TOOLS, SessionLimits, ToolHandler, ToolScheduler
+from .transport import serve_http, serve_stdio
 
 logger = logging.getLogger(__name__)
 
-# Global list to track registered tools
+# Tools served by list_tools, from the static manifest
 REGISTERED_TOOLS: list[Tool] = []
 
 
-async def main() -> None:
-    """Run the Qdrant MCP server."""
+class QdrantMCPServer(Server):
+    """MCP server that routes each tool call to its handler through a scheduler.
+
+    The register_*_tools functions decorate one handler per tool with
+    ``@server.call_tool()``; the handler's function name is the tool name.
+    A single MCP call_tool handler dispatches to them by name, first running
+    the tool's loader if its module has not been registered yet. Calls to
+    background-capable tools with ``wait: false`` are submitted as jobs.
+    Foreground calls count against the calling session's limit, if any.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        scheduler: ToolScheduler,
+        jobs: Optional[JobManager] = None,
+        session_limits: Optional[SessionLimits] = None,
+        validate_arguments: Optional[Callable[[str, dict[str, Any]], None]] = None,
+    ):
+        """Initialize server.
+
+        Args:
+            name: Server name
+            scheduler: Scheduler that runs every tool call
+            jobs: Optional job manager for wait=false calls
+            session_limits: Optional per-session in-flight caps
+            validate_arguments: Optional check of a call's arguments, raising
+                ValueError before the call is scheduled
+        """
+        super().__init__(name)
+        self.scheduler = scheduler
+        self.jobs = jobs
+        self.session_limits = session_limits
+        self.validate_arguments = validate_arguments
+        self.tool_handlers: dict[str, ToolHandler] = {}
+        self.tool_loaders: dict[str, Callable[[], None]] = {}
+        # Arguments are validated by validate_arguments, not by jsonschema on every call
+        super().call_tool(validate_input=False)(self._dispatch)
+
+    def add_tool_loader(self, names: Iterable[str], loader: Callable[[], None]) -> None:
+        """Register a loader that registers the handlers of the named tools on first call."""
+        for name in names:
+            self.tool_loaders[name] = loader
+
+    def _handler(self, name: str) -> Optional[ToolHandler]:
+        handler = self.tool_handlers.get(name)
+        loader = self.tool_loaders.get(name)
+        if handler is None and loader is not None:
+            loader()
+            for loaded in [n for n, other in self.tool_loaders.items() if other is loader]:
+                del self.tool_loaders[loaded]
+            handler = self.tool_handlers.get(name)
+        return handler
+
+    def call_tool(self, *, validate_input: bool = True) -> Callable[[ToolHandler], ToolHandler]:
+        """Register a handler for the tool named after the decorated function."""
+
+        def decorator(func: ToolHandler) -> ToolHandler:
+            self.tool_handlers[func.__name__] = func
+            return func
+
+        return decorator
+
+    async def _dispatch(self, name: str, arguments: dict[str, Any]) -> Any:
+        handler = self._handler(name)
+        if handler is None:
+            raise ValueError(f"Unknown tool: {name}")
+        if self.validate_arguments is not None:
+            self.validate_arguments(name, arguments)
+        wait = True
+        if name in BACKGROUND_TOOLS:
+            # The job argument is never passed on to the handler or to Qdrant
+            wait = arguments.get("wait", True)
+            arguments = {k: v for k, v in arguments.items() if k != "wait"}
+        if self.jobs is not None and wait is False:
+            job = self.jobs.submit(
+                name, arguments, lambda: self.scheduler.run(name, arguments, handler)
+            )
+            return [{"type": "text", "text": str(job.snapshot())}]
+        session_slots = None
+        if self.session_limits is not None:
+            try:
+                session_slots = self.session_limits.for_session(self.request_context.session)
+            except LookupError:
+                # Called outside an MCP request
+                pass
+        return await self.scheduler.run(name, arguments, handler, session_slots)
+
+
+async def main(config: Optional[QdrantConfig] = None) -> None:
+    """Run the Qdrant MCP server.
+
+    Args:
+        config: Configuration (default: loaded from the environment)
+    """
     # Load configuration
-    config = QdrantConfig()
+    config = config or QdrantConfig()
 
     # Initialize MCP server
-    server = Server("qdrant-mcp")
+    budgets = DeadlineBudgets(
+        read=config.deadline_read,
+        write=config.deadline_write,
+        long_running=config.deadline_long_running,
+        overrides=config.deadline_overrides,
+    )
+    jobs = JobManager(max_finished=config.job_max_finished, retention=config.job_retention)
+    server = QdrantMCPServer(
+        "qdrant-mcp",
+        ToolScheduler(config.max_in_flight_tools, budgets),
+        jobs,
+        SessionLimits(config.max_in_flight_per_session),
+    )
 
     # List tools handler - returns all registered tools
     @server.list_tools()
@@ -43,35 +156,104 @@ async def main() -> None:
     # Register database tools if configured
     if config.validate_database_config():
         logger.info("Initializing Qdrant Database API tools")
+        breakers = None
+        if config.breaker_enabled:
+            breakers = CircuitBreakerRegistry(
+                config.url,  # type: ignore
+                per_collection=config.breaker_per_collection,
+                failure_rate=config.breaker_failure_rate,
+                slow_call_seconds=config.breaker_slow_call_seconds,
+                slow_call_rate=config.breaker_slow_call_rate,
+                window_size=config.breaker_window_size,
+                min_calls=config.breaker_min_calls,
+                reset_timeout=config.breaker_reset_timeout,
+            )
+        limits = None
+        if config.limiter_enabled:
+            limits = ConcurrencyLimits(
+                read=AdaptiveLimiter(
+                    "read",
+                    initial=config.limiter_read_initial,
+                    max_limit=config.limiter_read_max,
+                    backoff=config.limiter_backoff,
+                    latency_tolerance=config.limiter_latency_tolerance,
+                ),
+                write=AdaptiveLimiter(
+                    "write",
+                    initial=config.limiter_write_initial,
+                    max_limit=config.limiter_write_max,
+                    backoff=config.limiter_backoff,
+                    latency_tolerance=config.limiter_latency_tolerance,
+                ),
+            )
+        codec = JSONCodec(
+            threshold=config.json_offload_threshold,
+            max_workers=config.json_offload_workers,
+            executor=config.json_offload_executor,
+        )
         db_client = QdrantDatabaseClient(
             base_url=config.url,  # type: ignore
             api_key=config.api_key,  # type: ignore
+            breakers=breakers,
+            limits=limits,
+            codec=codec,
         )
+        components = DatabaseComponents(config, db_client)
+        components.start()
+        if config.resources_enabled:
+            register_point_resources(server, components.resources)
 
-        register_collection_tools(server, db_client, REGISTERED_TOOLS)
-        register_point_tools(server, db_client, REGISTERED_TOOLS)
-        register_search_tools(server, db_client, REGISTERED_TOOLS)
-        register_payload_tools(server, db_client, REGISTERED_TOOLS)
-        register_health_tools(server, db_client, REGISTERED_TOOLS)
-        register_vector_tools(server, db_client, REGISTERED_TOOLS)
-        register_index_tools(server, db_client, REGISTERED_TOOLS)
-        logger.info("Registered 30 database tools (Phase 1 complete)")
+        # Tool modules are imported and registered on the first call to one of their tools
+        manifest = load_manifest()
+        modules: dict[str, list[str]] = {}
+        for entry in manifest:
+            modules.setdefault(entry["module"], []).append(entry["name"])
+        modules.pop("jobs")
+        for module, names in modules.items():
+            server.add_tool_loader(
+                names, functools.partial(load_tool_module, module, server, db_client, components)
+            )
+        register_job_tools(server, [], jobs)
+        server.validate_arguments = ArgumentValidator(manifest)
+        REGISTERED_TOOLS.extend(manifest_tools(manifest))
+        logger.info("Serving %d database tools", len(REGISTERED_TOOLS))
     else:
         logger.warning("Database API not configured. Set QDRANT_URL and QDRANT_API_KEY")
         logger.info("Running with no tools registered")
 
     # Run server
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    async with AsyncExitStack() as stack:
+        if config.validate_database_config():
+            await stack.enter_async_context(db_client)
+            # Callbacks run in reverse order: stop jobs, close the components
+            # created so far, then the JSON worker pool and the client
+            stack.callback(codec.close)
+            stack.push_async_callback(components.close)
+            stack.push_async_callback(jobs.close)
+            await components.recover()
+        if config.transport == "http":
+            await serve_http(
+                server,
+                config.http_host,
+                config.http_port,
+                config.http_path,
+                config.http_auth_token,
+            )
+        else:
+            await serve_stdio(server)
+
 
+def serve(config: Optional[QdrantConfig] = None) -> None:
+    """Entry point for running the server.
 
-def serve() -> None:
-    """Entry point for running the server."""
+    Args:
+        config: Configuration (default: loaded from the environment)
+    """
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
-    asyncio.run(main())
+    asyncio.run(main(config))
 
 
 if __name__ == "__main__":
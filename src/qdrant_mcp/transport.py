@@ -0,0 +1,142 @@
+"""Transports serving the Qdrant MCP server over stdio or HTTP."""
+
+import hmac
+import ipaddress
+import logging
+from typing import Any, Optional
+
+from mcp.server import Server
+from mcp.server.stdio import stdio_server
+
+logger = logging.getLogger(__name__)
+
+TRANSPORTS = ("stdio", "http")
+
+# Endpoints of the legacy HTTP+SSE transport, served next to streamable HTTP
+SSE_PATH = "/sse"
+SSE_MESSAGES_PATH = "/messages/"
+
+
+class _ASGIEndpoint:
+    """Wraps an ASGI callable so Starlette routes raw requests to it, not a Request."""
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        await self.app(scope, receive, send)
+
+
+class _BearerAuth:
+    """ASGI middleware rejecting HTTP requests without the expected bearer token."""
+
+    def __init__(self, app: Any, token: str):
+        self.app = app
+        self._expected = f"Bearer {token}".encode()
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        if scope["type"] == "http":
+            given = dict(scope["headers"]).get(b"authorization", b"")
+            if not hmac.compare_digest(given, self._expected):
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": 401,
+                        "headers": [(b"www-authenticate", b"Bearer"), (b"content-length", b"0")],
+                    }
+                )
+                await send({"type": "http.response.body", "body": b""})
+                return
+        await self.app(scope, receive, send)
+
+
+def is_loopback(host: str) -> bool:
+    """Whether a bind address only accepts connections from this machine."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+async def serve_stdio(server: Server) -> None:
+    """Serve a single MCP session over stdin/stdout."""
+    async with stdio_server() as (read_stream, write_stream):
+        await server.run(read_stream, write_stream, server.create_initialization_options())
+
+
+def http_app(server: Server, path: str = "/mcp", auth_token: Optional[str] = None) -> Any:
+    """Build a Starlette app serving concurrent MCP sessions of one server.
+
+    Streamable HTTP is served at ``path`` and the legacy HTTP+SSE transport
+    at /sse (with messages posted to /messages/). All sessions share the
+    server's handlers and therefore its client, caches and scheduler.
+
+    Args:
+        server: MCP server instance
+        path: Streamable HTTP endpoint
+        auth_token: Bearer token required on every request (default: none)
+
+    Returns:
+        ASGI application; its lifespan runs the streamable HTTP session manager
+    """
+    from mcp.server.sse import SseServerTransport
+    from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+    from starlette.applications import Starlette
+    from starlette.middleware import Middleware
+    from starlette.routing import Mount, Route
+
+    sessions = StreamableHTTPSessionManager(app=server)
+    sse = SseServerTransport(SSE_MESSAGES_PATH)
+
+    async def sse_session(scope: Any, receive: Any, send: Any) -> None:
+        async with sse.connect_sse(scope, receive, send) as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+
+    return Starlette(
+        routes=[
+            Route(path, endpoint=_ASGIEndpoint(sessions.handle_request)),
+            Route(SSE_PATH, endpoint=_ASGIEndpoint(sse_session), methods=["GET"]),
+            Mount(SSE_MESSAGES_PATH, app=sse.handle_post_message),
+        ],
+        middleware=[Middleware(_BearerAuth, token=auth_token)] if auth_token else [],
+        lifespan=lambda app: sessions.run(),
+    )
+
+
+async def serve_http(
+    server: Server,
+    host: str,
+    port: int,
+    path: str = "/mcp",
+    auth_token: Optional[str] = None,
+) -> None:
+    """Serve concurrent MCP sessions over streamable HTTP and SSE until interrupted.
+
+    Tools read and write local files and act with the server's API keys, so
+    binding a non-loopback address requires a bearer token.
+
+    Args:
+        server: MCP server instance
+        host: Interface to bind
+        port: TCP port to bind
+        path: Streamable HTTP endpoint
+        auth_token: Bearer token required on every request
+
+    Raises:
+        ValueError: If host is not a loopback address and no token is set
+    """
+    import uvicorn
+
+    if not auth_token and not is_loopback(host):
+        raise ValueError(
+            f"Refusing to serve HTTP on {host} without authentication; "
+            "set QDRANT_HTTP_AUTH_TOKEN or bind a loopback address"
+        )
+
+    logger.info("Serving MCP over HTTP at http://%s:%d%s (SSE at %s)", host, port, path, SSE_PATH)
+    config = uvicorn.Config(
+        http_app(server, path, auth_token), host=host, port=port, log_level="info"
+    )
+    await uvicorn.Server(config).serve()
@@ -0,0 +1,91 @@
+"""Tests for the payload index advisor."""
+
+import json
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.advisor import PayloadIndexAdvisor, extract_conditions
+from qdrant_mcp.database.client import QdrantDatabaseClient
+
+
+def test_extract_conditions_infers_schema_types():
+    """Test that filter conditions map to fields, match types and schema types."""
+    filter_ = {
+        "must": [
+            {"key": "city", "match": {"value": "London"}},
+            {"key": "price", "range": {"gte": 10, "lt": 20}},
+            {"should": [{"key": "tags", "match": {"any": ["a", "b"]}}]},
+        ],
+        "must_not": [{"key": "created", "range": {"gt": "2024-01-01T00:00:00Z"}}],
+        "should": [
+            {
+                "nested": {
+                    "key": "diet",
+                    "filter": {"must": [{"key": "vegan", "match": {"value": True}}]},
+                }
+            }
+        ],
+    }
+    assert sorted(extract_conditions(filter_)) == [
+        ("city", "value", "keyword"),
+        ("created", "range", "datetime"),
+        ("diet[].vegan", "value", "bool"),
+        ("price", "range", "integer"),
+        ("tags", "any", "keyword"),
+    ]
+
+
+def test_extract_conditions_full_text_and_index_free_conditions():
+    """Test that phrase/text_any need a text index and count/empty/null checks none."""
+    filter_ = {
+        "must": [
+            {"key": "title", "match": {"phrase": "vector search"}},
+            {"key": "body", "match": {"text_any": "qdrant vectors"}},
+            {"key": "comments", "values_count": {"gt": 2}},
+            {"key": "tags", "is_empty": True},
+            {"key": "owner", "is_null": False},
+        ]
+    }
+    assert sorted(extract_conditions(filter_)) == [
+        ("body", "text_any", "text"),
+        ("title", "phrase", "text"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_advisor_reports_and_creates_missing_indexes():
+    """Test that observed unindexed fields are reported and indexed with inferred types."""
+    created = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(
+                200, json={"result": {"payload_schema": {"city": {"data_type": "keyword"}}}}
+            )
+        if request.url.path.endswith("/index"):
+            created.append(json.loads(request.content))
+            return httpx.Response(200, json={"result": {"status": "acknowledged"}})
+        return httpx.Response(200, json={"result": []})
+
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    advisor = PayloadIndexAdvisor(client)
+    client.observers.append(advisor.observe)
+
+    filter_ = {
+        "must": [{"key": "city", "match": {"value": "x"}}, {"key": "year", "match": {"value": 1}}]
+    }
+    await client.post("/collections/docs/points/search", json={"vector": [0.1], "filter": filter_})
+    await client.post("/collections/docs/points/count", json={"filter": filter_})
+
+    report = await advisor.report("docs")
+    assert [f["field_name"] for f in report["unindexed"]] == ["year"]
+    assert report["unindexed"][0]["calls"] == 2
+    assert [f["field_name"] for f in report["indexed"]] == ["city"]
+
+    result = await advisor.apply("docs")
+    assert result["indexes"] == {"year": "integer"}
+    assert created == [{"field_name": "year", "field_schema": {"type": "integer"}}]
@@ -0,0 +1,112 @@
+"""Tests for local validation of upload tool arguments."""
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.arguments import (
+    ArgumentError,
+    check_vector_sizes,
+    model_tool,
+    validate_arguments,
+)
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.database.collections import VectorSizeCache
+
+
+def _client(handler) -> QdrantDatabaseClient:
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def test_model_generates_input_schema():
+    """Test that the upsert tool's input schema is generated from its argument model."""
+    schema = model_tool("qdrant_db_points_upsert", "Upsert points").inputSchema
+    assert schema["required"] == ["collection_name", "points"]
+    point = schema["$defs"]["PointStruct"]
+    assert point["required"] == ["id", "vector"]
+    assert point["additionalProperties"] is False
+
+
+def test_valid_points_pass():
+    """Test dense, named, multi and sparse vectors with integer and UUID IDs."""
+    validate_arguments(
+        "qdrant_db_points_upsert",
+        {
+            "collection_name": "docs",
+            "points": [
+                {"id": 1, "vector": [0.1, 2], "payload": {"title": "a"}},
+                {
+                    "id": "5c56c793-69f3-4fbf-87e6-c4bf54c28c26",
+                    "vector": {
+                        "text": [0.5, 0.5],
+                        "colbert": [[1.0, 0.0], [0.0, 1.0]],
+                        "keywords": {"indices": [3, 9], "values": [0.2, 0.8]},
+                    },
+                },
+            ],
+            "wait": False,
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    ("point", "problem"),
+    [
+        ({"id": -1, "vector": [0.1]}, "points.0.id"),
+        ({"id": 1, "vector": ["x"]}, "points.0.vector"),
+        ({"id": 1, "vectors": [0.1]}, "points.0"),
+        ({"id": 1, "vector": {"s": {"indices": [1], "values": [0.1, 0.2]}}}, "same length"),
+    ],
+)
+def test_malformed_points_fail(point, problem):
+    """Test that malformed points are rejected with their location."""
+    with pytest.raises(ArgumentError, match=problem):
+        validate_arguments("qdrant_db_points_upsert", {"collection_name": "c", "points": [point]})
+
+
+def test_validation_stops_at_first_bad_point():
+    """Test that a large upload with a bad point reports only that point."""
+    points = [{"id": i, "vector": [0.5] * 128} for i in range(10000)]
+    points[1] = {"id": 1, "vector": "not a vector"}
+    points[2] = {"id": 2, "vector": "not a vector"}
+    with pytest.raises(ArgumentError) as e:
+        validate_arguments("qdrant_db_vectors_update", {"collection_name": "c", "points": points})
+    assert "points.1" in str(e.value) and "points.2" not in str(e.value)
+
+
+@pytest.mark.asyncio
+async def test_vector_sizes_are_checked_against_cached_collection_config():
+    """Test that dimensions come from the cached config, dropped when the collection changes."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path))
+        params = {"vectors": {"text": {"size": 3}}, "sparse_vectors": {"keywords": {}}}
+        return httpx.Response(200, json={"result": {"config": {"params": params}}})
+
+    client = _client(handler)
+    sizes = VectorSizeCache(client)
+    client.observers.append(sizes.observe)
+
+    await check_vector_sizes(
+        sizes, "docs", [{"id": 1, "vector": {"text": [1, 2, 3], "keywords": {}}}]
+    )
+    points = [{"id": 1, "vector": {"text": [1, 2, 3]}}, {"id": 2, "vector": {"text": [1, 2]}}]
+    with pytest.raises(ArgumentError, match=r"points.1.vector.text: expected 3 dimensions, got 2"):
+        await check_vector_sizes(sizes, "docs", points)
+    with pytest.raises(ArgumentError, match="has no unnamed vector"):
+        await check_vector_sizes(sizes, "docs", [{"id": 1, "vector": [1, 2, 3]}])
+    assert requests == [("GET", "/collections/docs")]
+
+    await client.patch("/collections/docs/points/payload", json={})
+    await check_vector_sizes(sizes, "docs", [])
+    assert len(requests) == 2
+    await client.patch("/collections/docs", json={})
+    await check_vector_sizes(sizes, "docs", [])
+    assert requests[-1] == ("GET", "/collections/docs") and len(requests) == 4
+    await client.post("/collections/docs/snapshots/upload", json={})
+    await check_vector_sizes(sizes, "docs", [])
+    assert len(requests) == 6
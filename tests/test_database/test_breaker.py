@@ -0,0 +1,140 @@
+"""Tests for the Qdrant Database API circuit breaker."""
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+)
+from qdrant_mcp.database.client import QdrantDatabaseClient
+
+
+def _client(handler, **breaker_options) -> QdrantDatabaseClient:
+    client = QdrantDatabaseClient(
+        base_url="https://test.qdrant.io:6333",
+        api_key="test-key",
+        breakers=CircuitBreakerRegistry("https://test.qdrant.io:6333", **breaker_options),
+    )
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def test_breaker_opens_on_error_rate():
+    """Test that the breaker opens once the error rate reaches the threshold."""
+    breaker = CircuitBreaker("test", failure_rate=0.5, window_size=4, min_calls=4)
+    for error in (None, "boom", None):
+        breaker.record(0.01, error=error)
+    assert breaker.state == CLOSED
+
+    breaker.record(0.01, error="boom")
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.rejected == 1
+
+
+def test_breaker_opens_on_slow_calls():
+    """Test that the breaker opens when too many calls exceed the latency threshold."""
+    breaker = CircuitBreaker("test", slow_call_seconds=1.0, slow_call_rate=0.5, min_calls=2)
+    breaker.record(2.0)
+    breaker.record(3.0)
+    assert breaker.state == OPEN
+
+
+def test_breaker_half_open_after_timeout():
+    """Test that an open breaker becomes half-open once the reset timeout elapses."""
+    breaker = CircuitBreaker("test", reset_timeout=0.0)
+    breaker.trip()
+    assert breaker.before_call() == HALF_OPEN
+
+
+@pytest.mark.asyncio
+async def test_client_fails_fast_when_open():
+    """Test that requests are rejected without hitting the network while open."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(503)
+
+    client = _client(handler, min_calls=2, reset_timeout=60.0)
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get("/collections")
+
+    with pytest.raises(CircuitOpenError):
+        await client.get("/collections")
+    assert calls == ["/collections", "/collections"]
+
+
+@pytest.mark.asyncio
+async def test_client_probes_healthz_when_half_open():
+    """Test that a half-open breaker probes /healthz and closes on success."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path == "/healthz":
+            return httpx.Response(200, text="healthz check passed")
+        return httpx.Response(200, json={"result": {"collections": []}})
+
+    client = _client(handler, reset_timeout=0.0)
+    client.breakers.endpoint_breaker.trip()
+
+    result = await client.get("/collections")
+    assert result == {"result": {"collections": []}}
+    assert calls == ["/healthz", "/collections"]
+    assert client.breakers.endpoint_breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_client_per_collection_breakers():
+    """Test that per-collection breakers isolate a failing collection."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/collections/bad"):
+            return httpx.Response(500)
+        return httpx.Response(200, json={"result": {}})
+
+    client = _client(handler, per_collection=True, min_calls=1, reset_timeout=60.0)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get("/collections/bad")
+
+    with pytest.raises(CircuitOpenError):
+        await client.get("/collections/bad")
+    assert await client.get("/collections/good") == {"result": {}}
+
+    snapshot = client.breakers.snapshot()
+    assert snapshot["endpoint"]["state"] == CLOSED
+    assert snapshot["collections"]["bad"]["state"] == OPEN
+
+
+def test_long_running_calls_are_never_slow():
+    """Test that long-running operations count for errors but not for slowness."""
+    breaker = CircuitBreaker("test", slow_call_seconds=1.0, slow_call_rate=0.5, min_calls=2)
+    breaker.record(30.0, long_running=True)
+    breaker.record(30.0, long_running=True)
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["slow_call_rate"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_client_exempts_long_running_endpoints_from_slow_calls():
+    """Test that snapshot creation does not open the endpoint breaker by being slow."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"result": True})
+
+    client = _client(handler, slow_call_seconds=0.0, slow_call_rate=0.3, min_calls=1)
+    await client.post("/collections/docs/snapshots", params={"wait": "true"})
+    await client.put("/collections/docs/points", json={"points": []}, long_running=True)
+    assert client.breakers.endpoint_breaker.state == CLOSED
+    await client.get("/collections/docs")
+    assert client.breakers.endpoint_breaker.state == OPEN
@@ -0,0 +1,121 @@
+"""Tests for bulk-load sessions."""
+
+import json
+import subprocess
+import sys
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.bulkload import BulkLoadManager, bulk_load
+from qdrant_mcp.database.client import QdrantDatabaseClient
+
+
+def _client(updates: list[dict]) -> QdrantDatabaseClient:
+    """Client for a green collection with indexing_threshold 10000 and m 32."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "PATCH":
+            updates.append(json.loads(request.content))
+            return httpx.Response(200, json={"result": True})
+        return httpx.Response(
+            200,
+            json={
+                "result": {
+                    "status": "green",
+                    "optimizer_status": "ok",
+                    "points_count": 0,
+                    "indexed_vectors_count": 0,
+                    "config": {
+                        "params": {"vectors": {"size": 4, "distance": "Cosine"}},
+                        "optimizer_config": {"indexing_threshold": 10000},
+                        "hnsw_config": {"m": 32, "ef_construct": 100},
+                    },
+                }
+            },
+        )
+
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_session_applies_preset_and_restores_original_settings():
+    """Test that a session saves, overrides and restores the changed settings."""
+    updates: list[dict] = []
+    manager = BulkLoadManager(_client(updates))
+
+    await manager.begin("docs", "no_hnsw")
+    with pytest.raises(ValueError):
+        await manager.begin("docs")
+    result = await manager.end("docs")
+
+    assert updates == [{"hnsw_config": {"m": 0}}, {"hnsw_config": {"m": 32}}]
+    assert result["restored"] is True and result["readiness"]["ready"] is True
+    assert manager.snapshot() == {}
+
+
+@pytest.mark.asyncio
+async def test_settings_are_restored_when_the_import_fails():
+    """Test that a failed import still restores the original settings."""
+    updates: list[dict] = []
+    manager = BulkLoadManager(_client(updates))
+
+    with pytest.raises(RuntimeError):
+        async with bulk_load(manager, "docs"):
+            raise RuntimeError("import failed")
+
+    assert updates == [
+        {"optimizers_config": {"indexing_threshold": 0}},
+        {"optimizers_config": {"indexing_threshold": 10000}},
+    ]
+    assert manager.get("docs") is None
+
+
+@pytest.mark.asyncio
+async def test_sessions_left_open_by_a_crash_are_restored_on_recover(tmp_path):
+    """Test that saved sessions survive the process and are restored by the next one."""
+    updates: list[dict] = []
+    state_path = str(tmp_path / "bulk-loads.json")
+    crashed = BulkLoadManager(_client(updates), state_path)
+    await crashed.begin("docs")
+    saved = json.loads(open(state_path).read())
+    assert saved["https://test.qdrant.io:6333"]["docs"]["original"] == {
+        "optimizers_config": {"indexing_threshold": 10000}
+    }
+
+    # The process that opened the session has exited
+    exited = subprocess.Popen([sys.executable, "-c", ""])
+    exited.wait()
+    saved["https://test.qdrant.io:6333"]["docs"]["owner"]["pid"] = exited.pid
+    with open(state_path, "w") as f:
+        json.dump(saved, f)
+
+    restarted = BulkLoadManager(_client(updates), state_path)
+    results = await restarted.recover()
+    assert results["docs"]["restored"] is True
+    assert updates[-1] == {"optimizers_config": {"indexing_threshold": 10000}}
+    assert restarted.snapshot() == {} and json.loads(open(state_path).read()) == {}
+
+
+@pytest.mark.asyncio
+async def test_sessions_of_running_processes_are_not_recovered(tmp_path):
+    """Test that a starting process leaves another live process's session alone."""
+    updates: list[dict] = []
+    state_path = str(tmp_path / "bulk-loads.json")
+    running = BulkLoadManager(_client(updates), state_path)
+    await running.begin("docs")
+
+    other = BulkLoadManager(_client(updates), state_path)
+    assert await other.recover() == {}
+    await other.begin("news")
+    await other.end("news", wait=False)
+
+    saved = json.loads(open(state_path).read())["https://test.qdrant.io:6333"]
+    assert list(saved) == ["docs"]
+    assert updates == [{"optimizers_config": {"indexing_threshold": 0}}] * 2 + [
+        {"optimizers_config": {"indexing_threshold": 10000}}
+    ]
@@ -0,0 +1,141 @@
+"""Tests for cluster load and shard rebalancing."""
+
+import json
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.database.cluster import (
+    ShardTransferError,
+    cluster_load,
+    plan_rebalance,
+    rebalance,
+    request_total,
+    shard_replicas,
+)
+
+CLUSTER = {"peer_id": 1, "peers": {"1": {"uri": "http://a"}, "2": {"uri": "http://b"}}}
+
+
+def _shards(local: list, remote: list, transfers: list = ()) -> dict:
+    return {
+        "peer_id": 1,
+        "shard_count": len(local) + len(remote),
+        "local_shards": [{"shard_id": s, "points_count": n, "state": "Active"} for s, n in local],
+        "remote_shards": [{"shard_id": s, "peer_id": p, "state": st} for s, p, st in remote],
+        "shard_transfers": list(transfers),
+    }
+
+
+def _client(routes: dict, requests: list) -> QdrantDatabaseClient:
+    """Client answering GETs of each path with the next of its responses, repeating the last one."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content) if request.content else None
+        requests.append((request.method, request.url.path, body))
+        if request.method != "GET":
+            return httpx.Response(200, json={"result": True, "status": "ok"})
+        responses = routes[request.url.path]
+        result = responses.pop(0) if len(responses) > 1 else responses[0]
+        return httpx.Response(200, json={"result": result, "status": "ok"})
+
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def test_remote_replicas_take_local_or_mean_counts():
+    """Test point counts of remote replicas from local replicas of the shard, else the mean."""
+    replicas = shard_replicas(_shards([(0, 100), (1, 300)], [(0, 2, "Active"), (2, 2, "Active")]))
+    counts = {(r["shard_id"], r["peer_id"]): r["points_count"] for r in replicas}
+    assert counts == {(0, 1): 100, (1, 1): 300, (0, 2): 100, (2, 2): 200}
+    assert [r["points_estimated"] for r in replicas] == [False, False, False, True]
+
+
+def test_plan_moves_shards_to_the_least_loaded_peer():
+    """Test that moves even out points across peers, including an empty peer."""
+    replicas = shard_replicas(_shards([(0, 100), (1, 100), (2, 100), (3, 100)], []))
+    plan = plan_rebalance([1, 2, 3], replicas)
+    moves = [op["move_shard"] for op in plan["operations"]]
+    assert [(m["from_peer_id"], m["to_peer_id"]) for m in moves] == [(1, 2), (1, 3)]
+    assert plan["load_after"] == {1: 200, 2: 100, 3: 100}
+
+
+def test_plan_replicates_under_replicated_shards_first():
+    """Test that shards below the replication factor get a replica on another peer."""
+    replicas = shard_replicas(_shards([(0, 10)], [(1, 2, "Active"), (1, 3, "Dead")]))
+    plan = plan_rebalance([1, 2, 3], replicas, replication_factor=2, balance_by="shards")
+    assert plan["operations"] == [
+        {"replicate_shard": {"shard_id": 0, "from_peer_id": 1, "to_peer_id": 2}},
+        {"replicate_shard": {"shard_id": 1, "from_peer_id": 2, "to_peer_id": 1}},
+    ]
+
+
+def test_request_total_sums_response_counters():
+    """Test that REST and gRPC response counters are summed over their labels."""
+    text = (
+        "# TYPE rest_responses_total counter\n"
+        'rest_responses_total{method="GET",endpoint="/",status="200"} 3\n'
+        'rest_responses_total{method="POST",endpoint="/search",status="200"} 7\n'
+        "rest_responses_fail_total 5\n"
+        "grpc_responses_total 2\n"
+    )
+    assert request_total(text) == 12
+
+
+@pytest.mark.asyncio
+async def test_cluster_load_per_peer_and_collection():
+    """Test load totals, skew and peers holding no shard."""
+    routes = {
+        "/cluster": [CLUSTER],
+        "/collections/docs/cluster": [_shards([(0, 300), (1, 100)], [])],
+    }
+    load = await cluster_load(_client(routes, []), ["docs"])
+    assert load["peers"][1] == {"shards": 2, "points": 400, "uri": "http://a"}
+    assert load["peers"][2] == {"shards": 0, "points": 0, "uri": "http://b"}
+    assert load["points_skew"] == 2.0
+    assert load["collections"]["docs"]["peers"][1]["shard_ids"] == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_rebalance_runs_moves_one_at_a_time_and_tracks_transfers():
+    """Test that each move waits for its transfer before the next one starts."""
+    transfer = {"shard_id": 0, "from": 1, "to": 2, "sync": False, "comment": "5/10"}
+    states = [
+        _shards([(0, 100), (1, 100)], []),
+        _shards([(0, 100), (1, 100)], [(0, 2, "Partial")], [transfer]),
+        _shards([(1, 100)], [(0, 2, "Active")]),
+    ]
+    routes = {
+        "/cluster": [CLUSTER],
+        "/collections/docs": [{"config": {"params": {"replication_factor": 1}}}],
+        "/collections/docs/cluster": states,
+    }
+    requests: list = []
+    result = await rebalance(
+        _client(routes, requests), "docs", execute=True, method="wal_delta", initial_delay=0
+    )
+    posts = [body for method, _, body in requests if method == "POST"]
+    assert posts == [
+        {"move_shard": {"shard_id": 0, "from_peer_id": 1, "to_peer_id": 2, "method": "wal_delta"}}
+    ]
+    assert result["completed"][0]["last_comment"] == "5/10"
+    assert result["load_after"] == {1: 100, 2: 100}
+
+
+@pytest.mark.asyncio
+async def test_rebalance_refuses_to_execute_during_transfers():
+    """Test that running transfers are reported and block execution."""
+    transfer = {"shard_id": 0, "from": 1, "to": 2, "sync": False}
+    routes = {
+        "/cluster": [CLUSTER],
+        "/collections/docs/cluster": [_shards([(0, 100), (1, 100)], [], [transfer])],
+    }
+    client = _client(routes, [])
+    plan = await rebalance(client, "docs", replicate=False)
+    assert plan["transfers_in_progress"] == [transfer]
+    with pytest.raises(ShardTransferError, match="already running"):
+        await rebalance(client, "docs", execute=True, replicate=False)
@@ -0,0 +1,29 @@
+"""Tests for offloaded JSON decoding and rendering."""
+
+import json
+
+import pytest
+
+from qdrant_mcp.database.codec import JSONCodec, estimated_size
+
+
+def test_estimated_size_stops_at_limit():
+    """Test that vectors are sized from their length and small values fully."""
+    assert estimated_size({"a": [0.5] * 1000}, 100) > 100
+    assert estimated_size({"status": "ok", "result": {"count": 3}}, 1000) < 100
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor", ["thread", "process"])
+async def test_large_values_are_offloaded(executor):
+    """Test that only values above the threshold go to the worker pool."""
+    codec = JSONCodec(threshold=1000, max_workers=1, executor=executor)
+    big = {"result": {"points": [{"id": i, "vector": [0.25] * 16} for i in range(50)]}}
+    try:
+        assert await codec.decode(b'{"result": true}') == {"result": True}
+        assert codec.offloaded == 0
+        assert await codec.decode(json.dumps(big).encode()) == big
+        assert await codec.render(big) == str(big)
+        assert codec.offloaded == 2
+    finally:
+        codec.close()
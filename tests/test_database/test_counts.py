@@ -0,0 +1,70 @@
+"""Tests for the point count cache."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.database.counts import CountCache
+
+
+def _client(counts: list[bool]) -> QdrantDatabaseClient:
+    """Client whose count endpoint returns 100 exact / 90 estimated, recording `exact`."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/count"):
+            exact = json.loads(request.content)["exact"]
+            counts.append(exact)
+            return httpx.Response(200, json={"result": {"count": 100 if exact else 90}})
+        return httpx.Response(200, json={"result": {"status": "acknowledged"}})
+
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_counts_are_cached_per_canonical_filter_and_invalidated_by_writes():
+    """Test that equivalent filters hit one entry until a write to the collection."""
+    counts: list[bool] = []
+    client = _client(counts)
+    cache = CountCache(client)
+    client.observers.append(cache.observe)
+    first = {"must": [{"key": "a", "match": {"value": 1}}, {"key": "b", "match": {"value": 2}}]}
+    second = {"must": [{"key": "b", "match": {"value": 2}}, {"key": "a", "match": {"value": 1}}]}
+
+    assert (await cache.count("docs", first))["cached"] is False
+    result = await cache.count("docs", second)
+    assert result["cached"] is True and result["result"] == {"count": 100}
+    # A fresh exact count also answers approximate requests
+    assert (await cache.count("docs", first, exact=False))["exact"] is True
+    assert counts == [True]
+
+    await client.put("/collections/other/points", json={"points": []})
+    assert (await cache.count("docs", first))["cached"] is True
+    await client.put("/collections/docs/points", json={"points": []})
+    assert (await cache.count("docs", first))["cached"] is False
+    assert counts == [True, True]
+
+
+@pytest.mark.asyncio
+async def test_stale_ok_returns_estimate_and_recounts_in_background():
+    """Test that stale_ok answers immediately and refreshes the exact count later."""
+    counts: list[bool] = []
+    client = _client(counts)
+    cache = CountCache(client)
+
+    result = await cache.count("docs", stale_ok=True)
+    assert result["result"] == {"count": 90}
+    assert result["exact"] is False and result["refreshing"] is True
+    await asyncio.sleep(0.01)
+
+    result = await cache.count("docs", stale_ok=True)
+    assert result["result"] == {"count": 100}
+    assert result["exact"] is True and result["cached"] is True and result["refreshing"] is False
+    assert counts == [False, True]
+    await cache.close()
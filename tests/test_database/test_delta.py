@@ -0,0 +1,117 @@
+"""Tests for content-hash delta upserts."""
+
+import json
+import math
+from array import array
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.database.delta import (
+    ContentHashIndex,
+    _point_key,
+    content_hash,
+    delta_upsert_points,
+    reconcile_index,
+)
+
+COLLECTION_INFO = {"result": {"config": {"params": {"vectors": {"size": 2, "distance": "Cosine"}}}}}
+
+
+def test_content_hash_matches_stored_form():
+    """Test that hashes ignore float64 noise and Cosine normalization."""
+    written = {"id": 1, "vector": [3.0, 4.0], "payload": {"b": 1, "a": 2}}
+    stored = {"id": 1, "vector": [0.6, 0.8], "payload": {"a": 2, "b": 1}}
+    assert content_hash(written, frozenset({""})) == content_hash(stored, frozenset({""}))
+    assert content_hash(written) != content_hash(stored)
+
+
+def test_content_hash_normalizes_in_float32():
+    """Test that Cosine vectors are cast to float32 before they are normalized."""
+    written = {"id": 1, "vector": [-0.7, 0.7, 0.5]}
+    values = array("f", written["vector"])
+    squares = array("f", [0.0])
+    for x in values:
+        squares[0] += x * x
+    norm = array("f", [math.sqrt(squares[0])])[0]
+    stored = {"id": 1, "vector": list(array("f", [x / norm for x in values]))}
+    assert content_hash(written, frozenset({""})) == content_hash(stored)
+
+
+def test_point_key_canonicalizes_uuids():
+    """Test that upper- and lower-case spellings of a UUID share one index key."""
+    lower = "5c56c793-69f3-4fbf-87e6-c4bf54c28c26"
+    assert _point_key(lower.upper()) == _point_key(lower)
+    assert _point_key("5c56c79369f34fbf87e6c4bf54c28c26") == _point_key(lower)
+    assert _point_key(7) == "7"
+
+
+def test_content_hash_detects_payload_change():
+    """Test that a payload change produces a different hash."""
+    point = {"id": 1, "vector": [0.1, 0.2], "payload": {"a": 1}}
+    assert content_hash(point) != content_hash({**point, "payload": {"a": 2}})
+
+
+def _client(handler) -> QdrantDatabaseClient:
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_delta_upsert_skips_unchanged(tmp_path):
+    """Test that a second upsert of the same points sends only the changed one."""
+    upserts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, json=COLLECTION_INFO)
+        upserts.append([p["id"] for p in json.loads(request.content)["points"]])
+        return httpx.Response(200, json={"result": {"status": "completed"}})
+
+    client = _client(handler)
+    index = ContentHashIndex(str(tmp_path / "delta.sqlite3"), client.base_url)
+    points = [{"id": i, "vector": [0.1, float(i)], "payload": {"n": i}} for i in range(3)]
+
+    first = await delta_upsert_points(client, index, "docs", points)
+    assert first["upserted"] == 3
+
+    points[1] = {**points[1], "payload": {"n": 100}}
+    second = await delta_upsert_points(client, index, "docs", points)
+    assert (second["upserted"], second["skipped"]) == (1, 2)
+    assert upserts == [[0, 1, 2], [1]]
+
+    third = await delta_upsert_points(client, index, "docs", points)
+    assert third == {"upserted": 0, "skipped": 3, "result": None}
+    index.close()
+
+
+@pytest.mark.asyncio
+async def test_reconcile_rebuilds_from_scroll(tmp_path):
+    """Test that reconcile indexes every page of a scroll."""
+    pages = {
+        None: {"points": [{"id": 1, "vector": [0.6, 0.8], "payload": {}}], "next_page_offset": 2},
+        2: {"points": [{"id": 2, "vector": [1.0, 0.0], "payload": {}}], "next_page_offset": None},
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, json=COLLECTION_INFO)
+        body = json.loads(request.content)
+        assert body["with_vector"] is True
+        return httpx.Response(200, json={"result": pages[body.get("offset")]})
+
+    client = _client(handler)
+    index = ContentHashIndex(str(tmp_path / "delta.sqlite3"), client.base_url)
+    result = await reconcile_index(client, index, "docs", batch_size=1)
+    assert result["indexed"] == 2
+    assert await index.count("docs") == 2
+
+    changed, _ = await index.changed(
+        "docs", [{"id": 1, "vector": [3.0, 4.0], "payload": {}}], frozenset({""})
+    )
+    assert changed == []
+    index.close()
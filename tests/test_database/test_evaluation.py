@@ -0,0 +1,99 @@
+"""Tests for the search evaluation harness."""
+
+import json
+import struct
+from array import array
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.database.evaluation import (
+    evaluate_search,
+    load_npy,
+    percentile,
+    reciprocal_rank,
+    register_evaluation_tools,
+)
+from qdrant_mcp.paths import PathNotAllowedError
+from qdrant_mcp.scheduler import ToolScheduler
+from qdrant_mcp.server import QdrantMCPServer
+
+
+def _write_npy(path, rows):
+    header = repr({"descr": "<f4", "fortran_order": False, "shape": (len(rows), len(rows[0]))})
+    header = header.encode("latin1").ljust(118) + b"\n"
+    with open(path, "wb") as f:
+        f.write(b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header)
+        f.write(array("f", [x for row in rows for x in row]).tobytes())
+
+
+def test_load_npy_and_metrics(tmp_path):
+    """Test .npy loading, interpolated percentiles and reciprocal rank."""
+    path = tmp_path / "queries.npy"
+    _write_npy(path, [[0.5, 1.0], [2.0, -1.0]])
+    assert load_npy(str(path)) == [[0.5, 1.0], [2.0, -1.0]]
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+    assert reciprocal_rank([7, 3, 1], [3, 1]) == 0.5
+    assert reciprocal_rank([7], [3]) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_evaluation_reports_recall_mrr_and_writes_json(tmp_path):
+    """Test that each setting is scored against exact search and the report is saved."""
+    path = tmp_path / "queries.npy"
+    _write_npy(path, [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, json={"result": {"config": {"hnsw_config": {"m": 16}}}})
+        body = json.loads(request.content)
+        params = body["searches"][0]["params"]
+        ids = [1, 2] if params.get("exact") or params.get("hnsw_ef", 0) >= 64 else [2, 9]
+        hits = [{"id": i, "score": 1.0} for i in ids]
+        return httpx.Response(200, json={"result": [hits for _ in body["searches"]]})
+
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    output = tmp_path / "reports" / "eval.json"
+    report = await evaluate_search(
+        client,
+        "docs",
+        param_sets=[{"hnsw_ef": 16}, {"hnsw_ef": 64}],
+        queries_path=str(path),
+        k=2,
+        output_path=str(output),
+    )
+
+    low, high = report["results"]
+    assert (low["recall@2"], low["mrr"]) == (0.5, 0.0)
+    assert (high["recall@2"], high["mrr"]) == (1.0, 1.0)
+    assert set(high["latency_ms"]) == {"mean", "p50", "p90", "p95", "p99"}
+    assert report["queries"] == 3
+    assert json.loads(output.read_text())["collection_config"]["hnsw_config"] == {"m": 16}
+
+
+@pytest.mark.asyncio
+async def test_evaluation_tool_confines_paths_to_evaluation_dir(tmp_path):
+    """Test that query and report files outside the evaluation directory are rejected."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(404)
+
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    server = QdrantMCPServer("test", ToolScheduler())
+    register_evaluation_tools(server, client, [], evaluation_dir=str(tmp_path / "evaluations"))
+    evaluate = server.tool_handlers["qdrant_db_search_evaluate"]
+
+    with pytest.raises(PathNotAllowedError):
+        await evaluate({"collection_name": "docs", "queries_path": "../queries.npy"})
+    with pytest.raises(PathNotAllowedError):
+        await evaluate({"collection_name": "docs", "output_path": str(tmp_path / "eval.json")})
+    assert requests == []
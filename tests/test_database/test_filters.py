@@ -0,0 +1,119 @@
+"""Tests for filter validation and canonicalization."""
+
+import json
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.database.filters import FilterError, canonical_filter, compile_filter
+from qdrant_mcp.database.points import count_points
+from qdrant_mcp.database.search import search_batch_points
+
+
+def test_equivalent_filters_share_a_canonical_form():
+    """Test that reordered, duplicated and redundantly nested filters compile to one key."""
+    first = {
+        "must": [
+            {"key": "city", "match": {"value": "London"}},
+            {"must": [{"key": "tags", "match": {"any": ["b", "a", "a"]}}]},
+        ],
+        "must_not": [{"should": [{"has_id": [3, 1]}, {"key": "price", "range": {"gt": 10}}]}],
+    }
+    second = {
+        "must_not": [{"key": "price", "range": {"gt": 10}}, {"has_id": [1, 3, 3]}],
+        "should": {"key": "city", "match": {"value": "London"}},
+        "must": [
+            {"key": "tags", "match": {"any": ["a", "b"]}},
+            {"key": "city", "match": {"value": "London"}},
+        ],
+    }
+
+    assert compile_filter(first).key == compile_filter(second).key
+    assert canonical_filter(first) == {
+        "must": [
+            {"key": "city", "match": {"value": "London"}},
+            {"key": "tags", "match": {"any": ["a", "b"]}},
+        ],
+        "must_not": [{"has_id": [1, 3]}, {"key": "price", "range": {"gt": 10}}],
+    }
+
+
+def test_empty_filters_match_everything():
+    """Test that missing and empty filters compile to no filter."""
+    assert canonical_filter(None) is None
+    assert canonical_filter({}) is None
+    assert canonical_filter({"must": []}) is None
+
+
+def test_field_level_emptiness_and_text_matches_are_accepted():
+    """Test that field-level is_empty/is_null and phrase/text_any matches pass through."""
+    filter_ = {
+        "must": [
+            {"key": "tags", "is_empty": False},
+            {"key": "owner", "is_null": True},
+            {"key": "body", "match": {"phrase": "vector search"}},
+            {"key": "title", "match": {"text_any": "qdrant filter"}},
+        ]
+    }
+    assert canonical_filter(filter_) == filter_
+    with pytest.raises(FilterError):
+        compile_filter({"must": [{"key": "tags", "is_empty": "no"}]})
+
+
+def test_empty_sub_filters_keep_their_meaning():
+    """Test that an empty sub-filter is kept where it changes the result."""
+    condition = {"key": "a", "match": {"value": 1}}
+    assert canonical_filter({"must": [{}, condition]}) == {"must": [condition]}
+    assert canonical_filter({"should": [{}, condition]}) == {"should": [condition, {}]}
+    assert canonical_filter({"must_not": [{}]}) == {"must_not": [{}]}
+    assert canonical_filter({"must": [condition], "must_not": [{"must": []}]}) == {
+        "must": [condition],
+        "must_not": [{}],
+    }
+
+
+@pytest.mark.parametrize(
+    "filter_",
+    [
+        {"must": [{"key": "city"}]},
+        {"must": [{"key": "city", "match": {"value": "x"}, "range": {"gt": 1}}]},
+        {"must": [{"key": "city", "match": {"valeu": "x"}}]},
+        {"filter": {"must": []}},
+        {"must": "city"},
+        ["city"],
+    ],
+)
+def test_malformed_filters_are_rejected(filter_):
+    """Test that malformed filters raise FilterError."""
+    with pytest.raises(FilterError):
+        compile_filter(filter_)
+
+
+@pytest.mark.asyncio
+async def test_requests_send_canonical_filters_and_reject_malformed_ones():
+    """Test that count and batch search send canonical filters and fail before any request."""
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={"result": {"count": 0}})
+
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    nested = {"must": [{"must": [{"key": "a", "match": {"value": 1}}]}]}
+
+    await count_points(client, "docs", nested)
+    await search_batch_points(
+        client, "docs", [{"vector": [0.1], "limit": 1, "filter": nested}, {"vector": [0.2]}]
+    )
+    with pytest.raises(FilterError):
+        await count_points(client, "docs", {"must": [{"key": "a"}]})
+
+    canonical = {"must": [{"key": "a", "match": {"value": 1}}]}
+    assert bodies == [
+        {"exact": True, "filter": canonical},
+        {"searches": [{"vector": [0.1], "limit": 1, "filter": canonical}, {"vector": [0.2]}]},
+    ]
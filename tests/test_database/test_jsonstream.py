@@ -0,0 +1,68 @@
+"""Tests for incremental JSON array parsing."""
+
+import json
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.database.jsonstream import ItemStream
+from qdrant_mcp.database.points import iter_points
+
+
+async def _chunks(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 7, 10_000])
+async def test_items_and_rest_survive_any_chunking(chunk_size):
+    """Test that items split across chunks (including multi-byte text) parse intact."""
+    document = {
+        "result": {
+            "points": [{"id": i, "payload": {"name": "café ☕", "n": 12345}} for i in range(5)],
+            "next_page_offset": 1234567,
+        },
+        "status": "ok",
+        "time": 0.25,
+    }
+    stream = ItemStream(_chunks(json.dumps(document).encode(), chunk_size), ("result", "points"))
+    assert [item async for item in stream] == document["result"]["points"]
+    assert stream.rest == {"result": {"next_page_offset": 1234567}, "status": "ok", "time": 0.25}
+
+
+@pytest.mark.asyncio
+async def test_top_level_and_empty_arrays():
+    """Test arrays directly under result, empty arrays and null results."""
+    stream = ItemStream(_chunks(b'{"result": [1, 2.5, "x"]}', 2), ("result",))
+    assert [item async for item in stream] == [1, 2.5, "x"]
+    stream = ItemStream(_chunks(b'{"result": {"points": []}}', 3), ("result", "points"))
+    assert [item async for item in stream] == []
+    stream = ItemStream(_chunks(b'{"result": null, "status": "ok"}', 3), ("result", "points"))
+    assert [item async for item in stream] == []
+    assert stream.rest == {"result": None, "status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_iter_points_follows_page_offsets():
+    """Test that iter_points streams every page until there is no next offset."""
+    offsets = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = json.loads(request.content).get("offset")
+        offsets.append(offset)
+        start = offset or 0
+        result = {
+            "points": [{"id": i} for i in range(start, start + 2)],
+            "next_page_offset": start + 2 if start < 2 else None,
+        }
+        return httpx.Response(200, json={"result": result, "status": "ok"})
+
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    points = [p["id"] async for p in iter_points(client, "docs", page_size=2)]
+    assert points == [0, 1, 2, 3]
+    assert offsets == [None, 2]
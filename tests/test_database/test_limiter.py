@@ -0,0 +1,166 @@
+"""Tests for adaptive concurrency limits."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.database.limiter import (
+    AdaptiveLimiter,
+    ConcurrencyLimits,
+    endpoint_class,
+    is_read_request,
+)
+
+
+def test_request_classification():
+    """Test that searches and retrievals are reads and mutations are writes."""
+    assert is_read_request("GET", "/collections/docs")
+    assert is_read_request("POST", "/collections/docs/points/search")
+    assert is_read_request("POST", "/collections/docs/points/scroll")
+    assert is_read_request("POST", "/collections/docs/points")
+    assert not is_read_request("PUT", "/collections/docs/points")
+    assert not is_read_request("POST", "/collections/docs/points/delete")
+    assert not is_read_request("POST", "/collections/docs/points/batch")
+
+
+def test_endpoint_classes():
+    """Test that collection names and object ids are left out of endpoint classes."""
+    assert endpoint_class("post", "/collections/docs/points/search?wait=true") == (
+        "POST /collections/*/points/search"
+    )
+    assert endpoint_class("GET", "/collections/docs/points/42") == "GET /collections/*/points/*"
+    assert endpoint_class("GET", "/collections/docs/snapshots/docs-1.snapshot") == (
+        "GET /collections/*/snapshots/*"
+    )
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_additively():
+    """Test that healthy calls raise the limit by about one per window."""
+    limiter = AdaptiveLimiter("read", initial=4, max_limit=10)
+    for _ in range(4):
+        token = await limiter.acquire()
+        limiter.release(token, latency=0.01)
+    assert limiter.capacity == 4
+    assert 4.9 < limiter.limit < 5.0
+
+
+@pytest.mark.asyncio
+async def test_limit_cut_once_per_generation():
+    """Test that a burst of 429s cuts the limit once, not once per request."""
+    limiter = AdaptiveLimiter("write", initial=8, backoff=0.5)
+    tokens = [await limiter.acquire() for _ in range(4)]
+    for token in tokens:
+        limiter.release(token, latency=0.01, congested=True)
+    assert limiter.capacity == 4
+    assert limiter.decreases == 1
+
+
+@pytest.mark.asyncio
+async def test_rising_latency_cuts_limit():
+    """Test that latency well above the baseline counts as congestion."""
+    limiter = AdaptiveLimiter("read", initial=8, backoff=0.5, latency_tolerance=2.0, warmup=1)
+    token = await limiter.acquire()
+    limiter.release(token, latency=0.01)
+    token = await limiter.acquire()
+    limiter.release(token, latency=0.5)
+    assert limiter.capacity == 4
+
+
+@pytest.mark.asyncio
+async def test_mixed_latencies_do_not_collapse_limit():
+    """Test that healthy calls of differing latency are not treated as congestion."""
+    limiter = AdaptiveLimiter("read", initial=8, backoff=0.7)
+    for i in range(200):
+        token = await limiter.acquire()
+        limiter.release(token, latency=0.005 if i % 2 else 0.05, endpoint="POST /search")
+    for i in range(200):
+        token = await limiter.acquire()
+        endpoint = "GET /points/*" if i % 2 else "POST /collections/*/points/scroll"
+        limiter.release(token, latency=0.005 if i % 2 else 0.05, endpoint=endpoint)
+    assert limiter.decreases == 0
+    assert limiter.capacity > 8
+
+
+@pytest.mark.asyncio
+async def test_lasting_slowdown_moves_the_baseline():
+    """Test that slow samples shift the baseline so the limit can recover."""
+    limiter = AdaptiveLimiter("read", initial=8, warmup=1)
+    for latency in [0.01] + [0.05] * 100:
+        token = await limiter.acquire()
+        limiter.release(token, latency=latency)
+    assert limiter.baselines[""] > 0.04
+    decreases = limiter.decreases
+    token = await limiter.acquire()
+    limiter.release(token, latency=0.05)
+    assert limiter.decreases == decreases
+
+
+@pytest.mark.asyncio
+async def test_waiters_queue_until_release():
+    """Test that requests beyond the limit queue and are admitted in order."""
+    limiter = AdaptiveLimiter("write", initial=1, max_limit=1)
+    token = await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queued == 1
+    assert not waiter.done()
+
+    limiter.release(token)
+    await waiter
+    assert limiter.in_flight == 1
+    assert limiter.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_client_cuts_write_limit_on_429():
+    """Test that the client feeds 429 responses back into the write limiter."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429)
+
+    limits = ConcurrencyLimits(
+        read=AdaptiveLimiter("read", initial=8),
+        write=AdaptiveLimiter("write", initial=8, backoff=0.5),
+    )
+    client = QdrantDatabaseClient(
+        base_url="https://test.qdrant.io:6333", api_key="test-key", limits=limits
+    )
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.put("/collections/docs/points", json={"points": []})
+    assert limits.write.capacity == 4
+    assert limits.read.capacity == 8
+    assert limits.write.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_streamed_response_holds_slot_until_closed():
+    """Test that a streamed body counts against the limit while it is being read."""
+
+    async def body():
+        yield b"x" * 10
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body())
+
+    limits = ConcurrencyLimits(read=AdaptiveLimiter("read"), write=AdaptiveLimiter("write"))
+    client = QdrantDatabaseClient(
+        base_url="https://test.qdrant.io:6333", api_key="test-key", limits=limits
+    )
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+
+    response = await client.request("GET", "/collections/docs/snapshots/d-1.snapshot", stream=True)
+    assert limits.read.in_flight == 1
+    assert await response.aread() == b"x" * 10
+    await response.aclose()
+    await response.aclose()
+    assert limits.read.in_flight == 0
+    assert "GET /collections/*/snapshots/*" in limits.read.baselines
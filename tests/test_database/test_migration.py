@@ -0,0 +1,181 @@
+"""Tests for pipelined, resumable collection migration."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.database.migration import (
+    MigrationCheckpoints,
+    MigrationManager,
+    migrate_collection,
+    point_differences,
+)
+
+
+class FakeQdrant:
+    """In-memory collections served over the scroll, upsert, count and retrieve APIs."""
+
+    def __init__(self, collections: dict[str, dict[int, dict]]):
+        self.collections = collections
+        self.upserts = 0
+        self.fail_upsert = None
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        _, _, name, *rest = request.url.path.split("/")
+        body = json.loads(request.content) if request.content else {}
+        points = self.collections.setdefault(name, {})
+        if rest == ["exists"]:
+            return self._ok({"exists": name in self.collections})
+        if rest == ["points", "scroll"]:
+            ids = sorted(i for i in points if body.get("offset") is None or i >= body["offset"])
+            page = ids[: body["limit"]]
+            following = ids[body["limit"]] if len(ids) > body["limit"] else None
+            found = [points[i] for i in page]
+            return self._ok({"points": found, "next_page_offset": following})
+        if rest == ["points"] and request.method == "PUT":
+            self.upserts += 1
+            if self.upserts == self.fail_upsert:
+                return httpx.Response(500, json={"status": {"error": "boom"}})
+            points.update({p["id"]: p for p in body["points"]})
+            return self._ok({"status": "completed"})
+        if rest == ["points", "query"]:
+            return self._ok({"points": [points[i] for i in sorted(points)[: body["limit"]]]})
+        if rest == ["points", "count"]:
+            return self._ok({"count": len(points)})
+        if rest == ["points"]:
+            return self._ok([points[i] for i in body["ids"] if i in points])
+        raise AssertionError(f"unexpected request {request.method} {request.url.path}")
+
+    @staticmethod
+    def _ok(result) -> httpx.Response:
+        return httpx.Response(200, json={"result": result, "status": "ok"})
+
+    def client(self) -> QdrantDatabaseClient:
+        client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+        client._client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(self.handler)
+        )
+        return client
+
+
+def _points(n: int) -> dict[int, dict]:
+    return {
+        i: {"id": i, "vector": [i / 10, 1.0], "payload": {"n": i}, "shard_key": "a"}
+        for i in range(n)
+    }
+
+
+def test_point_differences():
+    """Test that vectors are compared with a tolerance and payloads exactly."""
+    point = {"id": 1, "vector": {"a": [0.1, 0.2], "s": {"indices": [1], "values": [0.5]}}}
+    close = {"id": 1, "vector": {"a": [0.1001, 0.2], "s": {"indices": [1], "values": [0.5]}}}
+    assert point_differences(point, close) == []
+    assert point_differences(point, {**close, "payload": {"x": 1}}) == ["payload"]
+    assert point_differences(point, {"id": 1, "vector": {"a": [0.2, 0.2]}}) == ["vector"]
+    assert point_differences(point, None) == ["missing"]
+
+
+@pytest.mark.asyncio
+async def test_migration_copies_all_points_and_verifies(tmp_path):
+    """Test a pipelined migration between two endpoints and its verification."""
+    source, target = FakeQdrant({"docs": _points(95)}), FakeQdrant({})
+    checkpoints = MigrationCheckpoints(str(tmp_path))
+    result = await migrate_collection(
+        source.client(),
+        "docs",
+        target.client(),
+        "docs_v2",
+        checkpoints,
+        "m1",
+        batch_size=10,
+        concurrency=3,
+        sample_size=20,
+    )
+    assert result["completed"] and result["migrated"] == 95
+    assert target.collections["docs_v2"] == {
+        i: {k: v for k, v in p.items() if k != "shard_key"} for i, p in _points(95).items()
+    }
+    verification = result["verification"]
+    assert verification["verified"] and verification["sampled"] == 20
+    assert checkpoints.load("m1")["completed"] is True
+
+
+@pytest.mark.asyncio
+async def test_failed_migration_resumes_from_checkpoint(tmp_path):
+    """Test that a failed write leaves a checkpoint the next run resumes from."""
+    source, target = FakeQdrant({"docs": _points(50)}), FakeQdrant({"docs_v2": {}})
+    target.fail_upsert = 3
+    checkpoints = MigrationCheckpoints(str(tmp_path))
+    with pytest.raises(httpx.HTTPStatusError):
+        await migrate_collection(
+            source.client(),
+            "docs",
+            target.client(),
+            "docs_v2",
+            checkpoints,
+            "m1",
+            batch_size=10,
+            concurrency=1,
+        )
+    state = checkpoints.load("m1")
+    assert state["migrated"] == 20 and state["offset"] == 20 and not state["completed"]
+
+    result = await migrate_collection(
+        source.client(), "docs", target.client(), "docs_v2", checkpoints, "m1", batch_size=10
+    )
+    assert result["resumed_from"] == 20 and result["migrated"] == 50
+    assert result["verification"]["count_match"]
+    # The sample covers the pages written before the failure too
+    assert result["verification"]["sampled_from"] == "target"
+    assert result["verification"]["sampled"] == 50
+    assert target.upserts == 3 + 3
+
+
+@pytest.mark.asyncio
+async def test_failed_upsert_with_full_queue_raises(tmp_path):
+    """Test that a failed write ends the migration with its error instead of hanging."""
+    source, target = FakeQdrant({"docs": _points(100)}), FakeQdrant({"docs_v2": {}})
+    target.fail_upsert = 1
+    migration = migrate_collection(
+        source.client(),
+        "docs",
+        target.client(),
+        "docs_v2",
+        MigrationCheckpoints(str(tmp_path)),
+        "m1",
+        batch_size=5,
+        concurrency=1,
+        queue_depth=1,
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        await asyncio.wait_for(migration, 5)
+
+
+@pytest.mark.asyncio
+async def test_running_migration_cannot_start_twice(tmp_path):
+    """Test that a second run of a running migration is rejected, not interleaved."""
+    source = FakeQdrant({"docs": _points(10), "docs_v2": {}})
+    release = asyncio.Event()
+    handler = source.handler
+
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/scroll"):
+            await release.wait()
+        return handler(request)
+
+    client = source.client()
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(slow_handler)
+    )
+    migrations = MigrationManager(client, str(tmp_path))
+    first = asyncio.ensure_future(migrations.migrate("docs", "docs_v2"))
+    await asyncio.sleep(0.01)
+    with pytest.raises(ValueError, match="already running"):
+        await migrations.migrate("docs", "docs_v2")
+
+    release.set()
+    assert (await first)["completed"]
+    assert (await migrations.migrate("docs", "docs_v2"))["completed"]
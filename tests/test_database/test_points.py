@@ -0,0 +1,47 @@
+"""Tests for point retrieval projections."""
+
+import json
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.database.points import get_points, payload_selector, scroll_points
+from qdrant_mcp.database.search import recommend_points, search_batch_points
+
+
+def test_payload_selector():
+    """Test that field lists become include selectors and invalid values are rejected."""
+    assert payload_selector(False) is False
+    assert payload_selector(["title", "title", "url"]) == {"include": ["title", "url"]}
+    assert payload_selector({"exclude": ["body"]}) == {"exclude": ["body"]}
+    with pytest.raises(ValueError):
+        payload_selector({"include": ["a"], "exclude": ["b"]})
+    with pytest.raises(ValueError):
+        payload_selector("title")
+
+
+@pytest.mark.asyncio
+async def test_projection_is_sent_on_scroll_get_search_and_recommend():
+    """Test that payload and vector selections reach every read request."""
+    bodies = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies[request.url.path.split("/points")[-1] or "/get"] = json.loads(request.content)
+        return httpx.Response(200, json={"result": []})
+
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    await scroll_points(client, "docs", with_payload=["title"], with_vector=["image"])
+    await get_points(client, "docs", [1, 2], with_payload={"exclude": ["body"]})
+    await search_batch_points(client, "docs", [{"vector": [0.1], "with_payload": ["url"]}])
+    await recommend_points(client, "docs", [1])
+
+    assert bodies["/scroll"]["with_payload"] == {"include": ["title"]}
+    assert bodies["/scroll"]["with_vector"] == ["image"]
+    assert bodies["/get"]["with_payload"] == {"exclude": ["body"]}
+    assert bodies["/get"]["with_vector"] is False
+    assert bodies["/search/batch"]["searches"][0]["with_payload"] == {"include": ["url"]}
+    assert "with_payload" not in bodies["/recommend"]
@@ -0,0 +1,69 @@
+"""Tests for collection readiness polling."""
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.database.readiness import (
+    CollectionNotReadyError,
+    collection_progress,
+    wait_for_green,
+)
+from qdrant_mcp.deadline import DeadlineExceeded
+
+
+def _client(states: list[dict]) -> QdrantDatabaseClient:
+    """Client whose get_collection returns the given states, repeating the last one."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        state = states.pop(0) if len(states) > 1 else states[0]
+        return httpx.Response(200, json={"result": state})
+
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def _state(status: str, indexed: int, points: int = 100, optimizer="ok") -> dict:
+    return {
+        "status": status,
+        "optimizer_status": optimizer,
+        "points_count": points,
+        "indexed_vectors_count": indexed,
+        "segments_count": 4,
+        "config": {"params": {"vectors": {"a": {"size": 4}, "b": {"size": 4}}}},
+    }
+
+
+def test_progress_counts_named_vectors():
+    """Test that expected indexed vectors account for every named vector."""
+    progress = collection_progress(_state("yellow", 50))
+    assert progress["expected_indexed_vectors"] == 200
+    assert progress["indexed_ratio"] == 0.25
+
+
+@pytest.mark.asyncio
+async def test_waits_until_green_and_indexed():
+    """Test that polling continues through yellow states and reports an ETA."""
+    client = _client([_state("yellow", 0), _state("yellow", 100), _state("green", 200)])
+    result = await wait_for_green(
+        client, "docs", timeout=5, require_indexed=True, initial_delay=0.001
+    )
+    assert result["ready"] is True
+    assert result["indexed_ratio"] == 1.0
+    assert result["eta_seconds"] == 0.0
+    assert result["polls"] == 4
+
+
+@pytest.mark.asyncio
+async def test_fails_on_optimizer_error_or_deadline():
+    """Test that optimizer errors fail fast and slow collections hit the timeout."""
+    failing = _client([_state("yellow", 0, optimizer={"error": "disk full"})])
+    with pytest.raises(CollectionNotReadyError, match="disk full"):
+        await wait_for_green(failing, "docs", timeout=5, initial_delay=0.001)
+
+    slow = _client([_state("yellow", 0)])
+    with pytest.raises(DeadlineExceeded):
+        await wait_for_green(slow, "docs", timeout=0.05, initial_delay=0.01, max_delay=0.02)
@@ -0,0 +1,60 @@
+"""Tests for vectors and payload fields served as MCP resources."""
+
+import json
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.database.resources import PointResources, parse_uri, vector_uri
+
+
+def _client(handler) -> QdrantDatabaseClient:
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def test_uri_round_trip():
+    """Test that collection names, UUIDs and vector names survive quoting."""
+    uri = vector_uri("my docs", "6f1c-aa", "image/v2")
+    assert parse_uri(uri) == ("my docs", "6f1c-aa", "vector", "image/v2")
+    assert parse_uri("qdrant://docs/7/payload/body") == ("docs", 7, "payload", "body")
+    with pytest.raises(ValueError):
+        parse_uri("qdrant://docs/7/payload")
+
+
+@pytest.mark.asyncio
+async def test_fetched_values_are_cached_and_unfetched_vectors_read_lazily():
+    """Test that large fields are served from cache and lazy vectors are fetched on read."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path))
+        if request.method == "GET":
+            config = {"params": {"vectors": {"image": {"size": 3}}}}
+            return httpx.Response(200, json={"result": {"config": config}})
+        body = json.loads(request.content)
+        assert body["with_vector"] == ["image"]
+        return httpx.Response(200, json={"result": [{"id": 7, "vector": {"image": [1, 2, 3]}}]})
+
+    resources = PointResources(_client(handler), inline_payload_bytes=10)
+    response = {"result": [{"id": 7, "payload": {"title": "x", "body": "y" * 50}, "vector": None}]}
+    await resources.externalize("docs", response, with_vector=True)
+    point = response["result"][0]
+
+    assert point["payload"]["title"] == "x"
+    assert point["payload"]["body"]["bytes"] == 52
+    assert point["vector"] == {"image": {"resource_uri": "qdrant://docs/7/vector/image", "size": 3}}
+    assert await resources.read(point["payload"]["body"]["resource_uri"]) == "y" * 50
+    assert requests == [("GET", "/collections/docs")]
+
+    assert await resources.read("qdrant://docs/7/vector/image") == [1, 2, 3]
+    await resources.read("qdrant://docs/7/vector/image")
+    assert len(requests) == 2
+
+    resources.observe("PUT", "/collections/docs/points", None, 0.01)
+    await resources.read("qdrant://docs/7/vector/image")
+    assert len(requests) == 3
@@ -0,0 +1,99 @@
+"""Tests for shard key routing and shard key management."""
+
+import json
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.database.collections import create_shard_key, delete_shard_key
+from qdrant_mcp.database.counts import CountCache
+from qdrant_mcp.database.payload import set_payload
+from qdrant_mcp.database.points import register_point_tools, shard_selector, upsert_points
+from qdrant_mcp.database.search import search_batch_points, search_points
+from qdrant_mcp.scheduler import ToolScheduler
+from qdrant_mcp.server import QdrantMCPServer
+
+
+def _client(requests: list) -> QdrantDatabaseClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content) if request.content else None
+        requests.append((request.method, request.url.path, body))
+        return httpx.Response(200, json={"result": {"count": len(requests)}, "status": "ok"})
+
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def test_shard_selector():
+    """Test that keys and key lists are accepted and other values rejected."""
+    assert shard_selector() == {}
+    assert shard_selector("tenant-a") == {"shard_key": "tenant-a"}
+    assert shard_selector([1, "b"]) == {"shard_key": [1, "b"]}
+    for invalid in ([], True, 1.5, {"key": "a"}):
+        with pytest.raises(ValueError, match="shard_key"):
+            shard_selector(invalid)
+
+
+@pytest.mark.asyncio
+async def test_shard_key_is_sent_on_writes_searches_and_batches():
+    """Test that a shard key reaches write, search and per-request batch bodies."""
+    requests: list = []
+    client = _client(requests)
+    await upsert_points(client, "docs", [{"id": 1, "vector": [0.1]}], shard_key="tenant-a")
+    await set_payload(client, "docs", {"a": 1}, [1], shard_key=["tenant-a", "tenant-b"])
+    await search_points(client, "docs", [0.1], shard_key="tenant-a")
+    await search_points(client, "docs", [0.1])
+    await search_batch_points(client, "docs", [{"vector": [0.1], "shard_key": 7}])
+
+    bodies = [body for _, _, body in requests]
+    assert bodies[0]["shard_key"] == "tenant-a"
+    assert bodies[1]["shard_key"] == ["tenant-a", "tenant-b"]
+    assert bodies[2]["shard_key"] == "tenant-a"
+    assert "shard_key" not in bodies[3]
+    assert bodies[4]["searches"][0]["shard_key"] == 7
+
+
+@pytest.mark.asyncio
+async def test_create_and_delete_shard_key():
+    """Test the shard key management requests."""
+    requests: list = []
+    client = _client(requests)
+    await create_shard_key(client, "docs", "tenant-a", shards_number=2, placement=[1, 2])
+    await delete_shard_key(client, "docs", "tenant-a")
+    assert requests == [
+        (
+            "PUT",
+            "/collections/docs/shards",
+            {"shard_key": "tenant-a", "shards_number": 2, "placement": [1, 2]},
+        ),
+        ("POST", "/collections/docs/shards/delete", {"shard_key": "tenant-a"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_counts_are_cached_per_shard_key():
+    """Test that counts of different shard keys are cached and requested apart."""
+    requests: list = []
+    cache = CountCache(_client(requests))
+    first = await cache.count("docs", shard_key="tenant-a")
+    assert (await cache.count("docs", shard_key="tenant-a"))["result"] == first["result"]
+    await cache.count("docs", shard_key="tenant-b")
+    await cache.count("docs")
+    assert [body.get("shard_key") for _, _, body in requests] == ["tenant-a", "tenant-b", None]
+
+
+@pytest.mark.asyncio
+async def test_delta_upsert_rejects_shard_key():
+    """Test that a delta upsert with a shard key fails before sending anything."""
+    requests: list = []
+    server = QdrantMCPServer("test", ToolScheduler())
+    register_point_tools(server, _client(requests), [])
+    upsert = server.tool_handlers["qdrant_db_points_upsert"]
+    points = [{"id": 1, "vector": [0.1]}]
+    with pytest.raises(ValueError, match="delta upserts do not support shard_key"):
+        await upsert({"collection_name": "docs", "points": points, "delta": True, "shard_key": 1})
+    assert requests == []
@@ -0,0 +1,119 @@
+"""Tests for streamed snapshot downloads and uploads."""
+
+import hashlib
+import os
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.database.snapshots import (
+    SnapshotChecksumError,
+    download_snapshot,
+    upload_snapshot,
+)
+
+DATA = bytes(range(256)) * 40
+CHECKSUM = hashlib.sha256(DATA).hexdigest()
+SNAPSHOT = {"name": "docs-1.snapshot", "size": len(DATA), "checksum": CHECKSUM}
+
+
+def _client(handler) -> QdrantDatabaseClient:
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def _server(requests: list, ranges: bool = True, data: bytes = DATA):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/collections/docs/snapshots":
+            return httpx.Response(200, json={"result": [SNAPSHOT]})
+        start = request.headers.get("Range", "bytes=0-")[len("bytes=") : -1]
+        if ranges and int(start):
+            return httpx.Response(206, content=data[int(start) :])
+        return httpx.Response(200, content=data)
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_download_verifies_checksum_and_renames(tmp_path):
+    """Test that a download is streamed to a partial file and renamed once verified."""
+    requests: list = []
+    path = str(tmp_path / "docs" / "docs-1.snapshot")
+    result = await download_snapshot(
+        _client(_server(requests)), "docs", "docs-1.snapshot", path, chunk_size=1000
+    )
+    assert open(path, "rb").read() == DATA
+    assert not os.path.exists(path + ".part")
+    assert result == {"path": path, "size": len(DATA), "checksum": CHECKSUM, "resumed_bytes": 0}
+
+
+@pytest.mark.asyncio
+async def test_download_resumes_partial_file(tmp_path):
+    """Test that a partial file is resumed with a Range request, or restarted if unsupported."""
+    path = str(tmp_path / "docs-1.snapshot")
+    for ranges, resumed in ((True, 3000), (False, 0)):
+        with open(path + ".part", "wb") as f:
+            f.write(DATA[:3000])
+        requests: list = []
+        result = await download_snapshot(
+            _client(_server(requests, ranges)), "docs", "docs-1.snapshot", path
+        )
+        assert requests[-1].headers["Range"] == "bytes=3000-"
+        assert result["resumed_bytes"] == resumed
+        assert open(path, "rb").read() == DATA
+
+
+@pytest.mark.asyncio
+async def test_download_checksum_mismatch_deletes_partial_file(tmp_path):
+    """Test that a corrupted download fails and is not kept for resuming."""
+    path = str(tmp_path / "docs-1.snapshot")
+    client = _client(_server([], data=DATA[:-1] + b"x"))
+    with pytest.raises(SnapshotChecksumError, match="does not match"):
+        await download_snapshot(client, "docs", "docs-1.snapshot", path)
+    assert not os.path.exists(path) and not os.path.exists(path + ".part")
+
+
+@pytest.mark.asyncio
+async def test_upload_streams_multipart_body_with_checksum(tmp_path):
+    """Test that the upload is a multipart body of known length with the file's checksum."""
+    path = tmp_path / "docs-1.snapshot"
+    path.write_bytes(DATA)
+    received = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        received["request"] = request
+        received["body"] = request.read()
+        return httpx.Response(200, json={"result": True, "status": "ok"})
+
+    result = await upload_snapshot(
+        _client(handler), "docs", str(path), priority="snapshot", chunk_size=1000
+    )
+    request, body = received["request"], received["body"]
+    assert result["result"] is True
+    assert request.url.path == "/collections/docs/snapshots/upload"
+    assert request.url.params["checksum"] == CHECKSUM
+    assert request.url.params["priority"] == "snapshot"
+    assert int(request.headers["Content-Length"]) == len(body)
+    boundary = request.headers["Content-Type"].split("boundary=")[1]
+    assert body.startswith(f"--{boundary}\r\n".encode())
+    assert b'name="snapshot"; filename="docs-1.snapshot"' in body
+    assert body.endswith(DATA + f"\r\n--{boundary}--\r\n".encode())
+
+
+@pytest.mark.asyncio
+async def test_download_of_complete_partial_file_sends_no_range_request(tmp_path):
+    """Test that a complete partial file is verified and renamed without fetching past its end."""
+    path = str(tmp_path / "docs-1.snapshot")
+    with open(path + ".part", "wb") as f:
+        f.write(DATA)
+    requests: list = []
+    result = await download_snapshot(
+        _client(_server(requests)), "docs", "docs-1.snapshot", path, checksum=CHECKSUM
+    )
+    assert [r.url.path for r in requests] == ["/collections/docs/snapshots"]
+    assert result["resumed_bytes"] == len(DATA) and open(path, "rb").read() == DATA
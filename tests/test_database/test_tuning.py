@@ -0,0 +1,75 @@
+"""Tests for search parameter tuning."""
+
+import json
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.database.tuning import recall_at_k, sample_points, tune_search_params
+
+
+def test_recall_at_k():
+    """Test recall@k over the first k IDs."""
+    assert recall_at_k([1, 2, 3], [1, 2, 4], 3) == pytest.approx(2 / 3)
+    assert recall_at_k([1, 2], [2, 1], 2) == 1.0
+
+
+@pytest.mark.asyncio
+async def test_tuner_recommends_smallest_ef_meeting_target():
+    """Test that the tuner stops at the first hnsw_ef reaching the target recall."""
+    searched_params = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if request.url.path.endswith("/query"):
+            assert body["query"] == {"sample": "random"}
+            points = [{"id": i, "vector": [float(i)]} for i in range(4)]
+            return httpx.Response(200, json={"result": {"points": points}})
+        params = body["searches"][0]["params"]
+        searched_params.append(params)
+        # Exact search and hnsw_ef >= 64 find IDs 10..12; smaller ef misses one
+        ids = [10, 11, 12] if params.get("exact") or params["hnsw_ef"] >= 64 else [10, 11, 99]
+        hits = [{"id": i, "score": 1.0} for i in ids]
+        return httpx.Response(200, json={"result": [hits for _ in body["searches"]]})
+
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    result = await tune_search_params(
+        client, "docs", target_recall=0.9, k=3, ef_candidates=[128, 32, 64, 256]
+    )
+
+    assert [m["params"]["hnsw_ef"] for m in result["measured"]] == [32, 64]
+    assert result["measured"][0]["recall@3"] == pytest.approx(2 / 3, abs=1e-4)
+    assert result["recommended"]["params"] == {"hnsw_ef": 64}
+    assert searched_params[0] == {"exact": True}
+
+
+@pytest.mark.asyncio
+async def test_sample_points_falls_back_to_reservoir_sampling():
+    """Test that servers without random sampling get a sample drawn from all point IDs."""
+    fetched = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if request.url.path.endswith("/query"):
+            return httpx.Response(400, json={"status": {"error": "unknown variant `sample`"}})
+        if request.url.path.endswith("/scroll"):
+            assert body["with_vector"] is False
+            points = [{"id": i} for i in range(100)]
+            return httpx.Response(200, json={"result": {"points": points}})
+        fetched.extend(body["ids"])
+        points = [{"id": i, "vector": [float(i)]} for i in body["ids"]]
+        return httpx.Response(200, json={"result": points})
+
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    points = await sample_points(client, "docs", 5)
+
+    assert len(points) == 5
+    assert len(set(fetched)) == 5
+    assert set(fetched) <= set(range(100))
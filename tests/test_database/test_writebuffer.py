@@ -0,0 +1,178 @@
+"""Tests for write-behind buffering of payload and vector updates."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.database.writebuffer import WriteBehindManager, coalesce
+
+
+def test_coalesce_merges_set_payload_on_same_points():
+    """Test that consecutive set_payload calls on the same points merge their payloads."""
+    pending = []
+    coalesce(pending, {"set_payload": {"payload": {"a": 1, "b": 1}, "points": [1, 2]}})
+    coalesce(pending, {"set_payload": {"payload": {"b": 2}, "points": [2, 1]}})
+    assert pending == [{"set_payload": {"payload": {"a": 1, "b": 2}, "points": [1, 2]}}]
+
+
+def test_coalesce_merges_identical_payload_across_points():
+    """Test that the same payload set on different points becomes one operation."""
+    pending = []
+    coalesce(pending, {"set_payload": {"payload": {"a": 1}, "points": [1]}})
+    coalesce(pending, {"set_payload": {"payload": {"a": 1}, "points": [2, 1]}})
+    assert pending == [{"set_payload": {"payload": {"a": 1}, "points": [1, 2]}}]
+
+
+def test_coalesce_preserves_order_across_kinds():
+    """Test that a delete between two sets prevents them from merging."""
+    pending = []
+    coalesce(pending, {"set_payload": {"payload": {"a": 1}, "points": [1]}})
+    coalesce(pending, {"delete_payload": {"keys": ["a"], "points": [1]}})
+    coalesce(pending, {"set_payload": {"payload": {"a": 2}, "points": [1]}})
+    assert [next(iter(op)) for op in pending] == ["set_payload", "delete_payload", "set_payload"]
+
+
+def test_coalesce_update_vectors_keeps_latest_per_point():
+    """Test that vector updates for the same point keep the latest vector."""
+    pending = []
+    coalesce(pending, {"update_vectors": {"points": [{"id": 1, "vector": {"a": [0.1]}}]}})
+    coalesce(
+        pending,
+        {
+            "update_vectors": {
+                "points": [{"id": 1, "vector": {"b": [0.2]}}, {"id": 2, "vector": [0.3]}]
+            }
+        },
+    )
+    assert pending == [
+        {
+            "update_vectors": {
+                "points": [
+                    {"id": 1, "vector": {"a": [0.1], "b": [0.2]}},
+                    {"id": 2, "vector": [0.3]},
+                ]
+            }
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_buffer_flushes_on_size_and_explicitly():
+    """Test that buffered writes are sent as one /points/batch request."""
+    batches = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/collections/docs/points/batch"
+        batches.append(json.loads(request.content)["operations"])
+        return httpx.Response(200, json={"result": [], "status": "ok"})
+
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    buffers = WriteBehindManager(client, max_ops=2, max_delay=60.0)
+    buffer = buffers.enable("docs")
+
+    status = await buffer.add({"set_payload": {"payload": {"a": 1}, "points": [1]}})
+    assert status["status"] == "buffered"
+    await buffer.add({"set_payload": {"payload": {"b": 1}, "points": [1]}})
+    assert batches == []
+
+    status = await buffer.add({"delete_payload": {"keys": ["c"], "points": [2]}})
+    assert status["status"] == "flushed"
+    assert len(batches) == 1
+    assert len(batches[0]) == 2
+
+    await buffer.add({"set_payload": {"payload": {"d": 1}, "points": [3]}})
+    await buffers.flush("docs")
+    assert len(batches) == 2
+    assert buffer.snapshot()["pending_operations"] == 0
+
+
+def _client(handler) -> QdrantDatabaseClient:
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_barrier_waits_for_timed_flush_in_flight():
+    """Test that an unbuffered write cannot overtake a batch that is still being sent."""
+    events = []
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        events.append("batch started")
+        await release.wait()
+        events.append("batch done")
+        return httpx.Response(200, json={"result": [], "status": "ok"})
+
+    buffers = WriteBehindManager(_client(handler), max_delay=0.0)
+    buffer = buffers.enable("docs")
+    await buffer.add({"set_payload": {"payload": {"a": 1}, "points": [1]}})
+    while not events:
+        await asyncio.sleep(0)
+    assert buffer.pending == []
+
+    barrier = asyncio.ensure_future(buffers.barrier("docs"))
+    await asyncio.sleep(0.01)
+    assert not barrier.done()
+    release.set()
+    await barrier
+    assert events == ["batch started", "batch done"]
+
+
+@pytest.mark.asyncio
+async def test_failed_timed_flush_is_requeued_and_reported():
+    """Test that writes of a failed timed flush are kept and the error reaches the next call."""
+    statuses = [500, 200]
+    batches = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        batches.append(json.loads(request.content)["operations"])
+        return httpx.Response(statuses.pop(0), json={"result": [], "status": "ok"})
+
+    buffers = WriteBehindManager(_client(handler), max_delay=0.0)
+    buffer = buffers.enable("docs")
+    await buffer.add({"set_payload": {"payload": {"a": 1}, "points": [1]}})
+    await asyncio.sleep(0.01)
+    assert len(buffer.pending) == 1
+
+    # The error is reported, but the new write is buffered all the same
+    with pytest.raises(httpx.HTTPStatusError):
+        await buffer.add({"delete_payload": {"keys": ["a"], "points": [2]}})
+    await buffer.add({"set_payload": {"payload": {"b": 1}, "points": [3]}})
+    await buffers.flush("docs")
+    assert batches[-1] == [
+        {"set_payload": {"payload": {"a": 1}, "points": [1]}},
+        {"delete_payload": {"keys": ["a"], "points": [2]}},
+        {"set_payload": {"payload": {"b": 1}, "points": [3]}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_disable_keeps_buffer_when_flush_fails():
+    """Test that a failed flush on disable keeps the writes and the buffer."""
+    statuses = [500, 200]
+    batches = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        batches.append(json.loads(request.content)["operations"])
+        return httpx.Response(statuses.pop(0), json={"result": [], "status": "ok"})
+
+    buffers = WriteBehindManager(_client(handler), max_delay=60.0)
+    buffer = buffers.enable("docs")
+    await buffer.add({"set_payload": {"payload": {"a": 1}, "points": [1]}})
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await buffers.disable("docs")
+    assert buffers.get("docs") is buffer and len(buffer.pending) == 1
+
+    await buffers.disable("docs")
+    assert buffers.get("docs") is None
+    assert batches == [[{"set_payload": {"payload": {"a": 1}, "points": [1]}}]] * 2
@@ -0,0 +1,77 @@
+"""Tests for deadline propagation and cancellation."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.breaker import CircuitBreakerRegistry
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.database.limiter import AdaptiveLimiter, ConcurrencyLimits
+from qdrant_mcp.deadline import DeadlineBudgets, DeadlineExceeded, deadline_scope, remaining
+from qdrant_mcp.scheduler import ToolScheduler
+
+
+def _hanging_client(started: asyncio.Event) -> QdrantDatabaseClient:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        started.set()
+        await asyncio.sleep(60)
+        return httpx.Response(200, json={})
+
+    client = QdrantDatabaseClient(
+        base_url="https://test.qdrant.io:6333",
+        api_key="test-key",
+        breakers=CircuitBreakerRegistry("https://test.qdrant.io:6333", min_calls=1),
+        limits=ConcurrencyLimits(read=AdaptiveLimiter("read"), write=AdaptiveLimiter("write")),
+    )
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def test_nested_scope_never_extends_deadline():
+    """Test that an inner scope cannot outlive the outer deadline."""
+    with deadline_scope(1.0):
+        with deadline_scope(100.0):
+            assert remaining() <= 1.0
+    assert remaining() is None
+
+
+def test_budgets_by_tool_class():
+    """Test that budgets come from the tool class unless overridden."""
+    scheduler = ToolScheduler(
+        budgets=DeadlineBudgets(read=1, write=2, long_running=3, overrides={"x": 4})
+    )
+    assert scheduler.budget_for("qdrant_db_points_search") == 1
+    assert scheduler.budget_for("qdrant_db_points_upsert") == 2
+    assert scheduler.budget_for("qdrant_db_index_create") == 3
+    assert scheduler.budget_for("x") == 4
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_request_without_tripping_breaker():
+    """Test that an expired deadline cancels the request and is not a server failure."""
+    client = _hanging_client(asyncio.Event())
+    scheduler = ToolScheduler(budgets=DeadlineBudgets(read=0.05))
+
+    async def handler(arguments):
+        return await client.get("/collections")
+
+    with pytest.raises(DeadlineExceeded):
+        await scheduler.run("qdrant_db_collections_list", {}, handler)
+    assert client.breakers.endpoint_breaker.snapshot()["calls_in_window"] == 0
+    assert client.limits.read.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_cancellation_releases_request():
+    """Test that cancelling a tool call cancels its in-flight request."""
+    started = asyncio.Event()
+    client = _hanging_client(started)
+    task = asyncio.ensure_future(client.get("/collections"))
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert client.limits.read.in_flight == 0
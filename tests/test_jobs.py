@@ -0,0 +1,154 @@
+"""Tests for background jobs."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.database.points import upsert_points_chunked
+from qdrant_mcp.jobs import (
+    CANCELLED,
+    FAILED,
+    QUEUED,
+    RUNNING,
+    SUCCEEDED,
+    JobManager,
+    JobNotFoundError,
+)
+from qdrant_mcp.scheduler import ToolScheduler
+from qdrant_mcp.server import QdrantMCPServer
+
+
+@pytest.mark.asyncio
+async def test_wait_false_calls_run_as_jobs():
+    """Test that a wait=false call returns a job that can be waited on."""
+    jobs = JobManager()
+    server = QdrantMCPServer("test", ToolScheduler(), jobs)
+    release = asyncio.Event()
+
+    @server.call_tool()
+    async def qdrant_db_index_create(arguments):
+        await release.wait()
+        return [{"type": "text", "text": arguments["field_name"]}]
+
+    response = await server._dispatch(
+        "qdrant_db_index_create", {"collection_name": "docs", "field_name": "city", "wait": False}
+    )
+    (job,) = jobs.list()
+    assert job.id in response[0]["text"]
+    job_id = job.id
+    assert (await jobs.wait(job_id, timeout=0.01)).finished is False
+
+    release.set()
+    job = await jobs.wait(job_id)
+    assert job.status == SUCCEEDED
+    assert job.result == [{"type": "text", "text": "city"}]
+
+
+@pytest.mark.asyncio
+async def test_wait_true_calls_run_in_the_foreground_without_wait():
+    """Test that wait=true runs the call directly and never passes wait to the handler."""
+    jobs = JobManager()
+    server = QdrantMCPServer("test", ToolScheduler(), jobs)
+    received = []
+
+    @server.call_tool()
+    async def qdrant_db_collections_create(arguments):
+        received.append(arguments)
+        return [{"type": "text", "text": "created"}]
+
+    arguments = {"collection_name": "docs", "vectors": {"size": 4}, "wait": True}
+    response = await server._dispatch("qdrant_db_collections_create", arguments)
+    assert response == [{"type": "text", "text": "created"}]
+    assert received == [{"collection_name": "docs", "vectors": {"size": 4}}]
+    assert jobs.list() == []
+
+
+@pytest.mark.asyncio
+async def test_jobs_are_queued_until_the_scheduler_starts_them():
+    """Test that a job behind an earlier write to its collection is reported as queued."""
+    jobs = JobManager()
+    server = QdrantMCPServer("test", ToolScheduler(), jobs)
+    release = asyncio.Event()
+
+    @server.call_tool()
+    async def qdrant_db_index_create(arguments):
+        await release.wait()
+        return [{"type": "text", "text": arguments["field_name"]}]
+
+    submitted = []
+    for field_name in ("city", "country"):
+        arguments = {"collection_name": "docs", "field_name": field_name, "wait": False}
+        await server._dispatch("qdrant_db_index_create", arguments)
+        submitted += [job for job in jobs.list() if job not in submitted]
+    await asyncio.sleep(0)
+    first, second = submitted
+    assert (first.status, second.status) == (RUNNING, QUEUED)
+    assert second.snapshot()["started_at"] is None
+
+    release.set()
+    await jobs.wait(second.id)
+    assert second.status == SUCCEEDED
+    assert second.started_at is not None
+
+
+@pytest.mark.asyncio
+async def test_jobs_can_be_cancelled_and_failures_are_recorded():
+    """Test job cancellation and failure reporting."""
+    jobs = JobManager()
+
+    async def forever():
+        await asyncio.sleep(60)
+
+    async def broken():
+        raise RuntimeError("boom")
+
+    running = jobs.submit("qdrant_db_points_upsert", {}, forever)
+    failing = jobs.submit("qdrant_db_points_upsert", {}, broken)
+    assert (await jobs.cancel(running.id)).status == CANCELLED
+    assert (await jobs.wait(failing.id)).status == FAILED
+    assert "boom" in failing.error
+
+
+@pytest.mark.asyncio
+async def test_finished_jobs_are_bounded():
+    """Test that only the most recent finished jobs are retained."""
+    jobs = JobManager(max_finished=2)
+
+    async def noop():
+        return None
+
+    submitted = [jobs.submit("qdrant_db_points_upsert", {}, noop) for _ in range(3)]
+    await asyncio.gather(*(job.task for job in submitted))
+    assert len(jobs.list()) == 2
+    with pytest.raises(JobNotFoundError):
+        jobs.get(submitted[0].id)
+
+
+@pytest.mark.asyncio
+async def test_chunked_upsert_reports_progress_and_operation_ids():
+    """Test that a job upsert is chunked, waits on the last chunk and tracks progress."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(
+            (len(json.loads(request.content)["points"]), request.url.params.get("wait"))
+        )
+        return httpx.Response(200, json={"result": {"operation_id": len(requests)}})
+
+    client = QdrantDatabaseClient(base_url="https://test.qdrant.io:6333", api_key="test-key")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    points = [{"id": i, "vector": [0.1]} for i in range(5)]
+    jobs = JobManager()
+    job = jobs.submit(
+        "qdrant_db_points_upsert", {}, lambda: upsert_points_chunked(client, "docs", points, 2)
+    )
+    await jobs.wait(job.id)
+
+    assert requests == [(2, None), (2, None), (1, "true")]
+    assert job.snapshot()["progress"] == {"done": 5, "total": 5}
+    assert job.operation_ids == [1, 2, 3]
@@ -0,0 +1,29 @@
+"""Tests for confining file arguments of tools to a directory."""
+
+import os
+
+import pytest
+
+from qdrant_mcp.paths import PathNotAllowedError, resolve_path
+
+
+def test_relative_and_contained_paths_resolve(tmp_path):
+    """Test that relative paths and absolute paths inside the directory are accepted."""
+    base = os.path.realpath(tmp_path)
+    assert resolve_path(base, "docs/a.snapshot") == os.path.join(base, "docs", "a.snapshot")
+    assert resolve_path(base, os.path.join(base, "b.json")) == os.path.join(base, "b.json")
+
+
+@pytest.mark.parametrize("path", ["../escape", "/etc/passwd", "docs/../../x", "."])
+def test_paths_outside_the_directory_are_rejected(tmp_path, path):
+    """Test that traversal, absolute paths elsewhere and the directory itself are rejected."""
+    with pytest.raises(PathNotAllowedError):
+        resolve_path(str(tmp_path / "base"), path)
+
+
+def test_symlinks_out_of_the_directory_are_rejected(tmp_path):
+    """Test that a link inside the directory cannot point outside it."""
+    (tmp_path / "base").mkdir()
+    os.symlink(tmp_path, tmp_path / "base" / "link")
+    with pytest.raises(PathNotAllowedError):
+        resolve_path(str(tmp_path / "base"), "link/secret")
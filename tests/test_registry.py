@@ -0,0 +1,107 @@
+"""Tests for lazy tool module loading and the tool manifest."""
+
+import subprocess
+import sys
+
+import pytest
+
+from qdrant_mcp.config import QdrantConfig
+from qdrant_mcp.database.client import QdrantDatabaseClient
+from qdrant_mcp.registry import (
+    TOOL_MODULES,
+    ArgumentValidator,
+    DatabaseComponents,
+    build_manifest,
+    load_manifest,
+    load_tool_module,
+)
+from qdrant_mcp.scheduler import ToolScheduler
+from qdrant_mcp.server import QdrantMCPServer
+
+# Total self import time of the package's own modules when importing the server
+IMPORT_BUDGET_US = 50_000
+
+
+def test_manifest_matches_registered_tools():
+    """Test that the manifest file is up to date (regenerate: python -m qdrant_mcp.registry)."""
+    assert load_manifest() == build_manifest()
+
+
+def test_load_tool_module_registers_manifest_tools():
+    """Test that loading a module registers a handler for each of its manifest tools."""
+    server = QdrantMCPServer("test", ToolScheduler())
+    config = QdrantConfig(url="http://test:6333", api_key="key")
+    client = QdrantDatabaseClient(base_url="http://test:6333", api_key="key")
+    load_tool_module("health", server, client, DatabaseComponents(config, client))
+    names = {entry["name"] for entry in load_manifest() if entry["module"] == "health"}
+    assert names and set(server.tool_handlers) == names
+
+
+@pytest.mark.asyncio
+async def test_tool_loader_runs_once_on_first_call():
+    """Test that a tool's loader runs on its first call and covers all its module's tools."""
+    server = QdrantMCPServer("test", ToolScheduler())
+    loads = []
+
+    def loader():
+        loads.append(1)
+
+        @server.call_tool()
+        async def first(arguments):
+            return "first"
+
+        @server.call_tool()
+        async def second(arguments):
+            return "second"
+
+    server.add_tool_loader(["first", "second"], loader)
+    assert loads == [] and server.tool_handlers == {}
+    assert await server._dispatch("second", {}) == "second"
+    assert await server._dispatch("first", {}) == "first"
+    assert loads == [1]
+    with pytest.raises(ValueError, match="Unknown tool"):
+        await server._dispatch("third", {})
+
+
+def test_server_import_time_budget():
+    """Test that importing the server loads no tool modules and stays within budget."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import qdrant_mcp.server"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    self_us = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            self_time, _, module = line[len("import time:") :].split("|")
+            if self_time.strip().isdigit():
+                self_us[module.strip()] = int(self_time)
+
+    # Point resources, served from startup, use the collection info helper
+    tool_modules = {
+        f"qdrant_mcp.database.{module}" for module, _, _ in TOOL_MODULES if module != "collections"
+    }
+    assert not tool_modules & set(self_us)
+    assert "qdrant_mcp.database.filters" not in self_us
+    own_us = sum(us for module, us in self_us.items() if module.startswith("qdrant_mcp"))
+    assert own_us < IMPORT_BUDGET_US
+
+
+def test_argument_validator_uses_models_and_manifest_schemas():
+    """Test that model tools use their TypeAdapter and other tools their manifest schema."""
+    validate = ArgumentValidator(load_manifest())
+    validate("qdrant_db_collections_get", {"collection_name": "docs"})
+    with pytest.raises(ValueError, match="'collection_name' is a required property"):
+        validate("qdrant_db_collections_get", {})
+    with pytest.raises(ValueError, match="points.0.vector"):
+        validate("qdrant_db_points_upsert", {"collection_name": "c", "points": [{"id": 1}]})
+
+
+def test_vector_sizes_are_shared_with_point_resources():
+    """Test that upload checks and point resources use one vector size cache."""
+    config = QdrantConfig(url="http://test:6333", api_key="key")
+    client = QdrantDatabaseClient(base_url="http://test:6333", api_key="key")
+    components = DatabaseComponents(config, client)
+    assert components.resources._sizes is components.vector_sizes
+    assert client.observers.count(components.vector_sizes.observe) == 1
@@ -0,0 +1,157 @@
+"""Tests for tool call scheduling."""
+
+import asyncio
+
+import pytest
+
+from qdrant_mcp.scheduler import ToolScheduler
+
+
+def _recorder(events, delay=0.01):
+    async def handler(arguments):
+        events.append(("start", arguments["id"]))
+        await asyncio.sleep(delay)
+        events.append(("end", arguments["id"]))
+        return arguments["id"]
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_writes_to_same_collection_run_in_order():
+    """Test that writes to one collection never overlap and keep submission order."""
+    scheduler = ToolScheduler()
+    events = []
+    handler = _recorder(events)
+    results = await asyncio.gather(
+        *(
+            scheduler.run("qdrant_db_points_upsert", {"collection_name": "a", "id": i}, handler)
+            for i in range(3)
+        )
+    )
+    assert results == [0, 1, 2]
+    assert events == [("start", 0), ("end", 0), ("start", 1), ("end", 1), ("start", 2), ("end", 2)]
+    assert scheduler.snapshot()["pending_writes"] == {}
+
+
+@pytest.mark.asyncio
+async def test_writes_to_different_collections_overlap():
+    """Test that writes to different collections run concurrently."""
+    scheduler = ToolScheduler()
+    events = []
+    handler = _recorder(events)
+    await asyncio.gather(
+        scheduler.run("qdrant_db_points_upsert", {"collection_name": "a", "id": 1}, handler),
+        scheduler.run("qdrant_db_points_upsert", {"collection_name": "b", "id": 2}, handler),
+    )
+    assert events[:2] == [("start", 1), ("start", 2)]
+
+
+@pytest.mark.asyncio
+async def test_migration_is_ordered_with_writes_to_its_target():
+    """Test that a migration queues behind writes to its target collection."""
+    scheduler = ToolScheduler()
+    events = []
+    handler = _recorder(events)
+    migration = {"source_collection": "a", "target_collection": "b", "id": 2}
+    await asyncio.gather(
+        scheduler.run("qdrant_db_points_upsert", {"collection_name": "b", "id": 1}, handler),
+        scheduler.run("qdrant_db_collections_migrate", migration, handler),
+    )
+    assert events == [("start", 1), ("end", 1), ("start", 2), ("end", 2)]
+
+
+@pytest.mark.asyncio
+async def test_reads_bypass_collection_queue():
+    """Test that reads run while a write to the same collection is in progress."""
+    scheduler = ToolScheduler()
+    events = []
+    await asyncio.gather(
+        scheduler.run(
+            "qdrant_db_points_upsert", {"collection_name": "a", "id": "w"}, _recorder(events, 0.05)
+        ),
+        scheduler.run(
+            "qdrant_db_points_search", {"collection_name": "a", "id": "r"}, _recorder(events)
+        ),
+    )
+    assert events.index(("end", "r")) < events.index(("end", "w"))
+
+
+@pytest.mark.asyncio
+async def test_in_flight_cap():
+    """Test that no more than max_in_flight calls execute at once."""
+    scheduler = ToolScheduler(max_in_flight=2)
+    peak = 0
+
+    async def handler(arguments):
+        nonlocal peak
+        peak = max(peak, scheduler.in_flight)
+        await asyncio.sleep(0.01)
+
+    await asyncio.gather(
+        *(
+            scheduler.run("qdrant_db_points_search", {"collection_name": "a"}, handler)
+            for _ in range(6)
+        )
+    )
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_server_dispatches_by_tool_name():
+    """Test that the server routes each call to the handler named after the tool."""
+    from qdrant_mcp.server import QdrantMCPServer
+
+    server = QdrantMCPServer("test", ToolScheduler())
+
+    @server.call_tool()
+    async def tool_a(arguments):
+        return "a"
+
+    @server.call_tool()
+    async def tool_b(arguments):
+        return "b"
+
+    assert await server._dispatch("tool_a", {}) == "a"
+    assert await server._dispatch("tool_b", {}) == "b"
+    with pytest.raises(ValueError, match="Unknown tool"):
+        await server._dispatch("tool_c", {})
+
+
+@pytest.mark.asyncio
+async def test_session_limits_cap_each_session():
+    """Test that one session's calls are capped without blocking other sessions."""
+    from qdrant_mcp.scheduler import SessionLimits
+
+    scheduler = ToolScheduler(max_in_flight=8)
+    limits = SessionLimits(max_in_flight=1)
+
+    class Session:
+        pass
+
+    sessions = [Session(), Session()]
+    running = {0: 0, 1: 0}
+    peaks = {0: 0, 1: 0}
+
+    def handler(session):
+        async def run(arguments):
+            running[session] += 1
+            peaks[session] = max(peaks[session], running[session])
+            await asyncio.sleep(0.01)
+            running[session] -= 1
+
+        return run
+
+    await asyncio.gather(
+        *(
+            scheduler.run(
+                "qdrant_db_points_search",
+                {"collection_name": "a"},
+                handler(i % 2),
+                limits.for_session(sessions[i % 2]),
+            )
+            for i in range(6)
+        )
+    )
+    assert peaks == {0: 1, 1: 1}
+    assert limits.snapshot()["sessions"] == 2
@@ -0,0 +1,92 @@
+"""Tests for the HTTP transport."""
+
+import httpx
+import pytest
+
+from qdrant_mcp.scheduler import SessionLimits, ToolScheduler
+from qdrant_mcp.server import QdrantMCPServer
+from qdrant_mcp.transport import http_app, is_loopback, serve_http
+
+HEADERS = {"Accept": "application/json, text/event-stream"}
+
+
+async def _open_session(client: httpx.AsyncClient) -> dict[str, str]:
+    response = await client.post(
+        "/mcp",
+        headers=HEADERS,
+        json={
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2025-03-26",
+                "capabilities": {},
+                "clientInfo": {"name": "test", "version": "0"},
+            },
+        },
+    )
+    assert response.status_code == 200
+    headers = {**HEADERS, "mcp-session-id": response.headers["mcp-session-id"]}
+    await client.post(
+        "/mcp", headers=headers, json={"jsonrpc": "2.0", "method": "notifications/initialized"}
+    )
+    return headers
+
+
+@pytest.mark.asyncio
+async def test_http_sessions_share_one_server():
+    """Test that concurrent HTTP sessions call the same handlers with separate limits."""
+    limits = SessionLimits(max_in_flight=2)
+    server = QdrantMCPServer("test", ToolScheduler(), session_limits=limits)
+    calls = []
+
+    @server.call_tool()
+    async def echo(arguments):
+        calls.append(arguments["n"])
+        return [{"type": "text", "text": str(arguments["n"])}]
+
+    app = http_app(server)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            sessions = [await _open_session(client), await _open_session(client)]
+            assert sessions[0]["mcp-session-id"] != sessions[1]["mcp-session-id"]
+            for n, headers in enumerate(sessions):
+                response = await client.post(
+                    "/mcp",
+                    headers=headers,
+                    json={
+                        "jsonrpc": "2.0",
+                        "id": 2,
+                        "method": "tools/call",
+                        "params": {"name": "echo", "arguments": {"n": n}},
+                    },
+                )
+                assert f'"text":"{n}"' in response.text
+
+    assert calls == [0, 1]
+    assert limits.snapshot()["max_in_flight_per_session"] == 2
+
+
+@pytest.mark.asyncio
+async def test_http_requires_bearer_token():
+    """Test that requests without the configured bearer token are rejected."""
+    app = http_app(QdrantMCPServer("test", ToolScheduler()), auth_token="s3cret")
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/mcp", headers=HEADERS, json={})
+            assert response.status_code == 401
+            response = await client.get("/sse", headers={"Authorization": "Bearer wrong"})
+            assert response.status_code == 401
+            client.headers["Authorization"] = "Bearer s3cret"
+            await _open_session(client)
+
+
+@pytest.mark.asyncio
+async def test_non_loopback_bind_requires_token():
+    """Test that the HTTP transport refuses to listen publicly without authentication."""
+    assert is_loopback("127.0.0.1") and is_loopback("::1") and is_loopback("localhost")
+    assert not is_loopback("0.0.0.0")
+    with pytest.raises(ValueError, match="without authentication"):
+        await serve_http(QdrantMCPServer("test", ToolScheduler()), "0.0.0.0", 0)